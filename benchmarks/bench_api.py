@@ -0,0 +1,443 @@
+"""
+API 부하/지연 시간 벤치마크
+합성 단어장(영어 단어 + 한국어 뜻)을 크기별로 만들고, 모든 주요 API를 차례로 호출하여
+경로별 p50/p95/p99 지연 시간, 처리량, 메모리(RSS)를 측정합니다.
+
+- 대상(--targets)
+  - client: Flask 테스트 클라이언트 (HTTP 없이 앱 코드만, 크기마다 별도 프로세스)
+  - gunicorn: 실제 gunicorn 프로세스에 HTTP keep-alive 연결 하나로 요청
+- 경로: 단어 목록/조회/검색(영어, 한국어)/추가/수정/삭제, 퀴즈(주관식, 객관식, 틀린 단어 집중),
+  정답 확인, 통계(상위 10개, 요약), 카테고리
+  전체 목록(/api/words, /api/stats 페이지 없이)은 단어 FULL_LIST_MAX_WORDS개 이하에서만 측정
+- 요청은 한 번에 하나씩 보내므로 처리량은 1 / 평균 지연 시간에 가깝습니다 (동시 접속은 bench_concurrency.py).
+- 같은 시드를 사용하므로 같은 크기면 매번 같은 단어장과 같은 요청 순서입니다.
+
+결과를 --output으로 JSON 파일에 저장해 두면, 다음에 --compare로 커밋 간 성능 차이를 확인할 수 있습니다.
+--fail-on-regression을 주면 느려진 경로가 있을 때 종료 코드 1로 끝납니다 (CI용).
+
+실행 방법:
+    python benchmarks/bench_api.py
+    python benchmarks/bench_api.py --sizes 1000 100000 1000000 --targets client
+    python benchmarks/bench_api.py --output bench_api.json
+    python benchmarks/bench_api.py --compare bench_api.json --fail-on-regression
+"""
+
+import argparse
+import http.client
+import json
+import os
+import platform
+import random
+import resource
+import shutil
+import subprocess
+import sys
+import time
+import urllib.parse
+from typing import Callable, Dict, List, Optional, Tuple
+
+from bench_common import HOST, ROOT_DIR, STARTUP_TIMEOUT, free_port, make_deck, percentile, start_gunicorn, write_deck
+
+# 상수 정의
+FULL_LIST_MAX_WORDS = 100_000  # 전체 목록 경로는 이 크기까지만 측정 (응답이 수십 MB가 됨)
+ANSWER_SAMPLE = 1000  # 정답 확인에 사용할 단어 수
+REGRESSION_THRESHOLD = 25.0  # 이보다 많이 느려지면(%) 회귀로 표시
+REQUEST_TIMEOUT = 120.0
+
+Request = Tuple[str, str, Optional[Dict]]  # (메서드, 경로, JSON 본문)
+
+
+class Scenario:
+    """측정할 경로 하나 (요청을 만드는 함수 + 측정 조건)"""
+
+    def __init__(self, name: str, build: Callable[["ScenarioContext"], Request],
+                 max_words: Optional[int] = None):
+        self.name = name
+        self.build = build
+        self.max_words = max_words
+
+
+class ScenarioContext:
+    """요청을 만들 때 필요한 단어 표본과 추가한 단어 목록"""
+
+    def __init__(self, words: List[str], answers: Dict[str, str], seed: int = 7):
+        self.rng = random.Random(seed)
+        self.words = words
+        self.answers = answers
+        self.answer_words = sorted(answers)
+        self.added: List[str] = []
+        self.counter = 0
+
+    def random_word(self) -> str:
+        return self.rng.choice(self.words)
+
+    def new_word(self) -> str:
+        self.counter += 1
+        word = f"benchword{self.counter}"
+        self.added.append(word)
+        return word
+
+
+def search_english(ctx: ScenarioContext) -> Request:
+    return "GET", f"/api/words/search?q={ctx.random_word()[:2]}&limit=20", None
+
+
+def search_korean(ctx: ScenarioContext) -> Request:
+    meaning = ctx.answers[ctx.rng.choice(ctx.answer_words)]
+    return "GET", f"/api/words/search?q={urllib.parse.quote(meaning[:2])}&limit=20", None
+
+
+def add_word(ctx: ScenarioContext) -> Request:
+    return "POST", "/api/words", {"english": ctx.new_word(), "korean": "벤치마크", "category": "업무"}
+
+
+def update_word(ctx: ScenarioContext) -> Request:
+    word = ctx.added[ctx.rng.randrange(len(ctx.added))]
+    return "PUT", f"/api/words/{word}", {"english": word, "korean": f"수정{ctx.rng.randint(0, 999)}"}
+
+
+def delete_word(ctx: ScenarioContext) -> Request:
+    return "DELETE", f"/api/words/{ctx.added.pop()}", None
+
+
+def check_answer(ctx: ScenarioContext) -> Request:
+    word = ctx.rng.choice(ctx.answer_words)
+    answer = ctx.answers[word] if ctx.rng.random() < 0.7 else "오답"
+    return "POST", "/api/quiz/check", {"word": word, "answer": answer, "type": "english_to_korean", "mode": "text"}
+
+
+SCENARIOS = [
+    Scenario("words_page", lambda ctx: ("GET", "/api/words?limit=50", None)),
+    Scenario("words_full", lambda ctx: ("GET", "/api/words", None), max_words=FULL_LIST_MAX_WORDS),
+    Scenario("word_get", lambda ctx: ("GET", f"/api/words/{ctx.random_word()}", None)),
+    Scenario("search_english", search_english),
+    Scenario("search_korean", search_korean),
+    Scenario("word_add", add_word),
+    Scenario("word_update", update_word),
+    Scenario("word_delete", delete_word),
+    Scenario("quiz_text", lambda ctx: ("POST", "/api/quiz", {"type": "english_to_korean", "mode": "text"})),
+    Scenario("quiz_multiple", lambda ctx: ("POST", "/api/quiz", {"type": "korean_to_english", "mode": "multiple"})),
+    Scenario("quiz_focus", lambda ctx: ("POST", "/api/quiz", {"type": "english_to_korean", "mode": "text",
+                                                              "focus_mode": True})),
+    Scenario("quiz_check", check_answer),
+    Scenario("stats_top", lambda ctx: ("GET", "/api/stats?top=10", None)),
+    Scenario("stats_full", lambda ctx: ("GET", "/api/stats", None), max_words=FULL_LIST_MAX_WORDS),
+    Scenario("stats_summary", lambda ctx: ("GET", "/api/stats/summary", None)),
+    Scenario("categories", lambda ctx: ("GET", "/api/categories", None)),
+]
+
+
+class ClientTarget:
+    """Flask 테스트 클라이언트로 요청 (HTTP/소켓 없이 앱 코드만 측정)"""
+
+    def __init__(self, app):
+        self.client = app.test_client()
+
+    def request(self, method: str, path: str, body: Optional[Dict]) -> int:
+        response = self.client.open(path, method=method, json=body)
+        response.get_data()
+        return response.status_code
+
+    def close(self) -> None:
+        pass
+
+
+class HttpTarget:
+    """gunicorn에 keep-alive 연결 하나로 요청 (끊기면 다시 연결)"""
+
+    def __init__(self, port: int):
+        self.port = port
+        self.connection = None
+
+    def request(self, method: str, path: str, body: Optional[Dict]) -> int:
+        payload = None
+        headers = {}
+        if body is not None:
+            payload = json.dumps(body, ensure_ascii=False).encode("utf-8")
+            headers["Content-Type"] = "application/json"
+        for attempt in range(2):
+            if self.connection is None:
+                self.connection = http.client.HTTPConnection(HOST, self.port, timeout=REQUEST_TIMEOUT)
+            try:
+                self.connection.request(method, path, body=payload, headers=headers)
+                response = self.connection.getresponse()
+                response.read()
+                return response.status
+            except (OSError, http.client.HTTPException):
+                self.close()
+                if attempt:
+                    raise
+        return 0
+
+    def close(self) -> None:
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+
+def run_scenarios(target, ctx: ScenarioContext, size: int, iterations: int, warmup: int) -> Dict[str, Dict]:
+    """
+    모든 경로를 차례로 측정
+
+    Args:
+        target: ClientTarget 또는 HttpTarget
+        ctx: 요청에 사용할 단어 표본
+        size: 단어장 크기 (max_words를 넘는 경로는 건너뜀)
+        iterations: 경로마다 측정할 요청 수
+        warmup: 경로마다 측정 전에 보내는 요청 수
+
+    Returns:
+        Dict[str, Dict]: {경로 이름: {"requests", "errors", "mean_ms", "p50_ms", "p95_ms", "p99_ms", "rps"}}
+    """
+    results = {}
+    for scenario in SCENARIOS:
+        if scenario.max_words is not None and size > scenario.max_words:
+            continue
+        for _ in range(warmup):
+            target.request(*scenario.build(ctx))
+        latencies = []
+        errors = 0
+        started = time.perf_counter()
+        for _ in range(iterations):
+            request = scenario.build(ctx)
+            request_started = time.perf_counter()
+            try:
+                status = target.request(*request)
+            except (OSError, http.client.HTTPException):
+                status = 0
+            latencies.append(time.perf_counter() - request_started)
+            if status >= 400 or status == 0:
+                errors += 1
+        elapsed = time.perf_counter() - started
+        results[scenario.name] = {
+            "requests": iterations,
+            "errors": errors,
+            "mean_ms": sum(latencies) / len(latencies) * 1000 if latencies else 0.0,
+            "p50_ms": percentile(latencies, 50) * 1000,
+            "p95_ms": percentile(latencies, 95) * 1000,
+            "p99_ms": percentile(latencies, 99) * 1000,
+            "rps": iterations / elapsed if elapsed > 0 else 0.0,
+        }
+    return results
+
+
+def make_context(vocabulary, words: List[str]) -> ScenarioContext:
+    """단어장에서 정답 확인용 표본을 골라 요청 문맥 만들기"""
+    rng = random.Random(11)
+    sample = rng.sample(words, min(ANSWER_SAMPLE, len(words)))
+    answers = {word: vocabulary[word]["korean"] for word in sample}
+    return ScenarioContext(words, answers)
+
+
+def read_status_kb(pid, field: str) -> Optional[int]:
+    """/proc/<pid>/status의 메모리 항목 (kB, 리눅스가 아니면 None)"""
+    try:
+        with open(f"/proc/{pid}/status", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith(field + ":"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def process_tree(pid: int) -> List[int]:
+    """프로세스와 모든 자식 프로세스 (gunicorn 마스터 + 워커)"""
+    pids = [pid]
+    for current in pids:
+        try:
+            with open(f"/proc/{current}/task/{current}/children", encoding="utf-8") as f:
+                pids.extend(int(child) for child in f.read().split())
+        except OSError:
+            pass
+    return pids
+
+
+def memory_usage(pids: List) -> Dict[str, Optional[float]]:
+    """
+    프로세스들의 현재/최대 RSS 합계 (MB)
+
+    /proc을 읽을 수 없으면 자기 프로세스의 최대 RSS(getrusage)만 돌려줍니다.
+    """
+    rss = [read_status_kb(pid, "VmRSS") for pid in pids]
+    peak = [read_status_kb(pid, "VmHWM") for pid in pids]
+    if any(value is None for value in rss):
+        if pids == ["self"]:
+            return {"rss_mb": None, "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024}
+        return {"rss_mb": None, "peak_rss_mb": None}
+    return {"rss_mb": sum(rss) / 1024, "peak_rss_mb": sum(peak) / 1024}
+
+
+def run_client_child(size: int, iterations: int, warmup: int) -> None:
+    """
+    (자식 프로세스) 현재 폴더의 데이터로 앱을 불러와 테스트 클라이언트로 측정하고 결과를 JSON으로 출력
+
+    크기마다 새 프로세스에서 실행하므로 RSS가 다른 크기의 영향을 받지 않습니다.
+    """
+    started = time.perf_counter()
+    import web_vocab_app  # bench_common이 저장소 루트를 import 경로에 추가해 둠
+    load_seconds = time.perf_counter() - started
+
+    vocabulary, _ = make_deck(size)
+    ctx = make_context(vocabulary, list(vocabulary))
+    del vocabulary
+    target = ClientTarget(web_vocab_app.app)
+    routes = run_scenarios(target, ctx, size, iterations, warmup)
+    web_vocab_app.flush_pending_writes()
+    result = {"load_seconds": load_seconds, **memory_usage(["self"]), "routes": routes}
+    print(json.dumps(result))
+
+
+def run_client(workdir: str, size: int, iterations: int, warmup: int) -> Dict:
+    """테스트 클라이언트 측정 (별도 프로세스)"""
+    completed = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--child", "--sizes", str(size),
+         "--iterations", str(iterations), "--warmup", str(warmup)],
+        cwd=workdir, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, check=True, text=True
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def run_gunicorn(workdir: str, vocabulary, size: int, iterations: int, warmup: int,
+                 workers: int, threads: int) -> Dict:
+    """실제 gunicorn 프로세스 측정"""
+    port = free_port()
+    started = time.perf_counter()
+    server = start_gunicorn(workdir, port, workers, threads,
+                            timeout=max(STARTUP_TIMEOUT, size / 5000))
+    load_seconds = time.perf_counter() - started
+    target = HttpTarget(port)
+    try:
+        routes = run_scenarios(target, make_context(vocabulary, list(vocabulary)), size, iterations, warmup)
+        memory = memory_usage(process_tree(server.pid))
+    finally:
+        target.close()
+        server.terminate()
+        server.wait(timeout=60)
+    return {"load_seconds": load_seconds, **memory, "routes": routes}
+
+
+def git_revision() -> Dict[str, Optional[str]]:
+    """측정한 코드의 커밋 (git이 없으면 None)"""
+    def git(*args) -> Optional[str]:
+        try:
+            return subprocess.run(["git", *args], cwd=ROOT_DIR, stdout=subprocess.PIPE,
+                                  stderr=subprocess.DEVNULL, check=True, text=True).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+    status = git("status", "--porcelain", "--untracked-files=no")
+    return {"commit": git("rev-parse", "HEAD"), "dirty": bool(status) if status is not None else None}
+
+
+def print_run(run: Dict) -> None:
+    memory = f"{run['rss_mb']:.0f}MB" if run.get("rss_mb") is not None else "-"
+    peak = f"{run['peak_rss_mb']:.0f}MB" if run.get("peak_rss_mb") is not None else "-"
+    print(f"\n[{run['target']}] 단어 {run['size']:,}개 | 불러오기 {run['load_seconds']:.2f}초 | "
+          f"RSS {memory} (최대 {peak})")
+    print("경로              p50(ms)   p95(ms)   p99(ms)  처리량(req/s)  오류")
+    for name, route in run["routes"].items():
+        print(f"{name:<15} {route['p50_ms']:>9.2f} {route['p95_ms']:>9.2f} {route['p99_ms']:>9.2f} "
+              f"{route['rps']:>14.1f} {route['errors']:>5}")
+
+
+def compare_results(previous: Dict, current: Dict, threshold: float) -> int:
+    """
+    이전 결과와 비교하여 경로별 p50/p99 변화 출력
+
+    Returns:
+        int: p50이 threshold(%)보다 느려진 경로 수
+    """
+    old_runs = {(run["target"], run["size"]): run for run in previous.get("runs", [])}
+    old_commit = (previous.get("meta", {}).get("commit") or "?")[:10]
+    print(f"\n이전 결과({old_commit})와 비교 (+는 느려짐, p50이 {threshold:.0f}% 이상 느려지면 표시)")
+    regressions = 0
+    for run in current["runs"]:
+        old_run = old_runs.get((run["target"], run["size"]))
+        if old_run is None:
+            continue
+        print(f"[{run['target']}] 단어 {run['size']:,}개")
+        for name, route in run["routes"].items():
+            old_route = old_run["routes"].get(name)
+            if old_route is None:
+                continue
+            changes = []
+            for key in ("p50_ms", "p99_ms"):
+                old_value = old_route[key]
+                changes.append((route[key] - old_value) / old_value * 100 if old_value > 0 else 0.0)
+            slower = changes[0] > threshold  # p99는 표본이 적어 흔들리므로 참고용
+            regressions += slower
+            print(f"  {name:<15} p50 {changes[0]:>+7.1f}%  p99 {changes[1]:>+7.1f}%{'  ← 느려짐' if slower else ''}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="API 부하/지연 시간 벤치마크")
+    parser.add_argument("--sizes", nargs="+", type=int, default=[1000, 10000, 100000],
+                        help="합성 단어장 크기 (예: 1000 10000 100000 1000000)")
+    parser.add_argument("--targets", nargs="+", default=["client", "gunicorn"], choices=["client", "gunicorn"])
+    parser.add_argument("--iterations", type=int, default=200, help="경로마다 측정할 요청 수")
+    parser.add_argument("--warmup", type=int, default=10, help="경로마다 측정 전에 보내는 요청 수")
+    parser.add_argument("--workers", type=int, default=1, help="gunicorn 워커 수")
+    parser.add_argument("--threads", type=int, default=8, help="gunicorn 워커당 스레드 수")
+    parser.add_argument("--output", help="결과를 저장할 JSON 파일")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON 파일")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD, help="회귀로 볼 지연 증가율 (%%)")
+    parser.add_argument("--fail-on-regression", action="store_true", help="느려진 경로가 있으면 종료 코드 1")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_client_child(args.sizes[0], args.iterations, args.warmup)
+        return
+
+    previous = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            previous = json.load(f)
+
+    results = {
+        "meta": {
+            **git_revision(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "iterations": args.iterations,
+            "warmup": args.warmup,
+            "workers": args.workers,
+            "threads": args.threads,
+        },
+        "runs": [],
+    }
+    print(f"경로마다 요청 {args.iterations}개 (준비 {args.warmup}개), 한 번에 하나씩")
+    for size in args.sizes:
+        vocabulary, quiz_stats = make_deck(size)
+        for target in args.targets:
+            # 쓰기 경로가 데이터를 바꾸므로 대상마다 새 데이터 폴더
+            workdir = write_deck(vocabulary, quiz_stats)
+            try:
+                if target == "client":
+                    run = run_client(workdir, size, args.iterations, args.warmup)
+                else:
+                    run = run_gunicorn(workdir, vocabulary, size, args.iterations, args.warmup,
+                                       args.workers, args.threads)
+            finally:
+                shutil.rmtree(workdir, ignore_errors=True)
+            run = {"target": target, "size": size, **run}
+            results["runs"].append(run)
+            print_run(run)
+        del vocabulary, quiz_stats
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {args.output}")
+
+    if previous is not None:
+        regressions = compare_results(previous, results, args.threshold)
+        if regressions and args.fail_on_regression:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""
+벤치마크 공통 도구
+합성 단어장 생성과, 임시 폴더에서 web_vocab_app을 불러오거나 gunicorn으로 띄우는 기능을 제공합니다.
+"""
+
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from typing import Dict, List, Optional, Tuple
+
+# 저장소 루트를 import 경로에 추가 (benchmarks/ 폴더에서 실행해도 동작하도록)
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+# 합성 한국어 뜻에 사용할 음절
+HANGUL_SYLLABLES = "가나다라마바사아자차카타파하고노도로모보소오조초코토포호구누두루무부수우주추쿠투푸후"
+CATEGORIES = ["동물", "음식", "일상", "여행", "학교", "업무", "감정", "자연"]
+HOST = "127.0.0.1"
+STARTUP_TIMEOUT = 60.0
+
+
+def make_word(i: int, rng: random.Random) -> str:
+    """겹치지 않는 합성 영어 단어"""
+    letters = "".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(3, 8)))
+    return f"{letters}{i}"
+
+
+def make_deck(size: int, seed: int = 42, with_stats: float = 0.5) -> Tuple[Dict[str, Dict], Dict[str, List[int]]]:
+    """
+    합성 단어장 생성
+
+    Args:
+        size: 단어 수
+        seed: 난수 시드 (같은 시드면 같은 단어장)
+        with_stats: 퀴즈 통계가 있는 단어 비율
+
+    Returns:
+        Tuple[Dict, Dict]: (vocabulary, quiz_stats)
+    """
+    rng = random.Random(seed)
+    vocabulary = {}
+    quiz_stats = {}
+    for i in range(size):
+        word = make_word(i, rng)
+        korean = "".join(rng.choice(HANGUL_SYLLABLES) for _ in range(rng.randint(2, 4)))
+        vocabulary[word] = {"korean": korean, "category": rng.choice(CATEGORIES)}
+        if rng.random() < with_stats:
+            quiz_stats[word] = [rng.randint(0, 20), rng.randint(0, 20)]
+    return vocabulary, quiz_stats
+
+
+def write_deck(vocabulary: Dict[str, Dict], quiz_stats: Dict[str, List[int]],
+               workdir: Optional[str] = None) -> str:
+    """
+    합성 단어장을 데이터 파일(vocabulary.json, quiz_stats.json)로 저장
+
+    Args:
+        workdir: 저장할 폴더 (없으면 새 임시 폴더)
+
+    Returns:
+        str: 데이터 폴더 경로
+    """
+    workdir = workdir or tempfile.mkdtemp(prefix="vocab_bench_")
+    for name, data in (("vocabulary.json", vocabulary), ("quiz_stats.json", quiz_stats)):
+        with open(os.path.join(workdir, name), "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+    return workdir
+
+
+def import_app(workdir: Optional[str] = None):
+    """
+    임시 폴더에서 web_vocab_app 불러오기
+
+    import 시점에 현재 폴더의 데이터 파일을 읽으므로,
+    실제 vocabulary.json을 건드리지 않도록 빈 임시 폴더(또는 workdir)로 이동한 뒤 불러옵니다.
+    """
+    workdir = workdir or tempfile.mkdtemp(prefix="vocab_bench_")
+    os.chdir(workdir)
+    import web_vocab_app
+    return web_vocab_app
+
+
+def install_deck(app_module, vocabulary: Dict[str, Dict], quiz_stats: Dict[str, List[int]]) -> float:
+    """
+    합성 단어장을 앱의 기본 단어장 메모리에 올리고 인덱스를 다시 만들기
+
+    Returns:
+        float: 인덱스 구성에 걸린 시간 (초)
+    """
+    started = time.perf_counter()
+    deck = app_module.decks.default
+    with deck.data_lock:
+        deck.vocabulary = vocabulary
+        deck.quiz_stats = quiz_stats
+        deck.rebuild_indexes()
+    return time.perf_counter() - started
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """정렬된 표본의 백분위수"""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind((HOST, 0))
+        return sock.getsockname()[1]
+
+
+def start_gunicorn(workdir: str, port: int, workers: int, threads: int, mode: str = "sync",
+                   timeout: float = STARTUP_TIMEOUT) -> subprocess.Popen:
+    """
+    gunicorn 실행 후 /api/status가 응답할 때까지 대기
+
+    Args:
+        workdir: 데이터 폴더 (gunicorn 작업 폴더)
+        mode: SERVER_MODE (sync 또는 async)
+        timeout: 시작을 기다릴 최대 시간 (초, 큰 단어장은 불러오는 데 오래 걸림)
+    """
+    env = dict(os.environ, SERVER_MODE=mode)
+    process = subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "-c", os.path.join(ROOT_DIR, "gunicorn.conf.py"),
+         "--pythonpath", ROOT_DIR, "-w", str(workers), "--threads", str(threads),
+         "-b", f"{HOST}:{port}", "--log-level", "warning", "--timeout", str(int(max(timeout, 30))),
+         "web_vocab_app:app"],
+        cwd=workdir, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"{mode} 서버가 종료되었습니다 (코드 {process.returncode})")
+        try:
+            with urllib.request.urlopen(f"http://{HOST}:{port}/api/status", timeout=1) as response:
+                status = json.load(response)
+            if status.get("server_mode") != mode:
+                process.kill()
+                raise RuntimeError(f"서버 모드가 다릅니다: {status.get('server_mode')}")
+            return process
+        except OSError:
+            time.sleep(0.2)
+    process.kill()
+    raise RuntimeError(f"{mode} 서버가 시작되지 않았습니다")
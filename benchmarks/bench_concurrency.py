@@ -0,0 +1,159 @@
+"""
+동시 접속 벤치마크 (동기 vs 비동기 서버 모드)
+gunicorn을 SERVER_MODE=sync(gthread)와 SERVER_MODE=async(gevent)로 각각 띄우고,
+동시 클라이언트 수를 바꿔 가며 읽기 API의 처리량과 지연 시간을 비교합니다.
+
+- 클라이언트마다 요청을 하나씩 연속으로 보냄 (단어 목록 페이지, 카테고리, 통계 상위 10개, 검색)
+- --streams개의 이벤트 스트림(/api/events)을 측정 내내 열어 둠 (오래 걸리는 연결)
+- --slow개의 느린 클라이언트가 요청 헤더를 1초에 한 줄씩 보냄 (끝내지 않음)
+- 요청마다 새 연결 (Connection: close)
+
+부하 생성기도 같은 컴퓨터에서 돌기 때문에 절대값보다 두 모드의 차이를 보세요.
+결과와 해석은 ASYNC_SERVER.md에 정리되어 있습니다. 비동기 모드는 `pip install gevent`가 필요합니다.
+
+실행 방법:
+    python benchmarks/bench_concurrency.py
+    python benchmarks/bench_concurrency.py --clients 1 50 500 --duration 10 --streams 8
+    python benchmarks/bench_concurrency.py --slow 20
+    python benchmarks/bench_concurrency.py --modes async --threads 2
+"""
+
+import argparse
+import asyncio
+import shutil
+import time
+
+from bench_common import HOST, free_port, make_deck, percentile, start_gunicorn, write_deck
+
+REQUEST_PATHS = [
+    "/api/words?limit=50",
+    "/api/categories",
+    "/api/stats?top=10",
+    "/api/words/search?q=ab&limit=20",
+]
+REQUEST_TIMEOUT = 30.0
+
+
+async def fetch(port: int, path: str) -> int:
+    """GET 요청 하나를 보내고 응답을 끝까지 읽은 뒤 상태 코드 반환"""
+    reader, writer = await asyncio.open_connection(HOST, port)
+    try:
+        writer.write(f"GET {path} HTTP/1.1\r\nHost: {HOST}\r\nConnection: close\r\n\r\n".encode())
+        await writer.drain()
+        data = await reader.read()
+        return int(data.split(b" ", 2)[1])
+    finally:
+        writer.close()
+
+
+async def hold_stream(port: int, opened: list) -> None:
+    """이벤트 스트림을 열어 두고 취소될 때까지 읽기"""
+    reader, writer = await asyncio.open_connection(HOST, port)
+    try:
+        writer.write(f"GET /api/events HTTP/1.1\r\nHost: {HOST}\r\n\r\n".encode())
+        await writer.drain()
+        status_line = await reader.readline()
+        opened.append(int(status_line.split(b" ", 2)[1]))
+        while await reader.read(4096):
+            pass
+    finally:
+        writer.close()
+
+
+async def hold_slow_client(port: int) -> None:
+    """요청 헤더를 조금씩 보내며 연결을 붙잡는 느린 클라이언트"""
+    reader, writer = await asyncio.open_connection(HOST, port)
+    try:
+        writer.write(f"GET /api/status HTTP/1.1\r\nHost: {HOST}\r\n".encode())
+        while True:
+            await writer.drain()
+            await asyncio.sleep(1)
+            writer.write(b"X-Slow: 1\r\n")
+    finally:
+        writer.close()
+
+
+async def client_loop(port: int, index: int, deadline: float, latencies: list, errors: list) -> None:
+    request_index = index
+    while time.monotonic() < deadline:
+        path = REQUEST_PATHS[request_index % len(REQUEST_PATHS)]
+        request_index += 1
+        started = time.perf_counter()
+        try:
+            status = await asyncio.wait_for(fetch(port, path), REQUEST_TIMEOUT)
+        except (OSError, asyncio.TimeoutError, ValueError, IndexError):
+            errors.append(path)
+            continue
+        if status == 200:
+            latencies.append(time.perf_counter() - started)
+        else:
+            errors.append(path)
+
+
+async def run_load(port: int, clients: int, duration: float, streams: int, slow: int) -> dict:
+    """
+    동시 클라이언트 clients개로 duration초 동안 요청
+
+    Returns:
+        dict: {"requests", "errors", "rps", "p50_ms", "p99_ms", "streams_open"}
+    """
+    opened: list = []
+    stream_tasks = [asyncio.ensure_future(hold_stream(port, opened)) for _ in range(streams)]
+    stream_tasks += [asyncio.ensure_future(hold_slow_client(port)) for _ in range(slow)]
+    await asyncio.sleep(1.5)  # 스트림과 느린 클라이언트가 자리를 잡을 때까지
+
+    latencies: list = []
+    errors: list = []
+    started = time.monotonic()
+    deadline = started + duration
+    await asyncio.gather(*(client_loop(port, i, deadline, latencies, errors) for i in range(clients)))
+    elapsed = time.monotonic() - started
+
+    for task in stream_tasks:
+        task.cancel()
+    await asyncio.gather(*stream_tasks, return_exceptions=True)
+    return {
+        "requests": len(latencies),
+        "errors": len(errors),
+        "rps": len(latencies) / elapsed,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "streams_open": sum(1 for status in opened if status == 200),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="동기/비동기 서버 모드 동시 접속 벤치마크")
+    parser.add_argument("--modes", nargs="+", default=["sync", "async"], choices=["sync", "async"])
+    parser.add_argument("--clients", nargs="+", type=int, default=[1, 50, 500])
+    parser.add_argument("--duration", type=float, default=10.0, help="동시 접속 수마다 측정 시간 (초)")
+    parser.add_argument("--streams", type=int, default=8, help="측정 중 열어 둘 이벤트 스트림 수")
+    parser.add_argument("--slow", type=int, default=0, help="측정 중 헤더를 천천히 보내는 클라이언트 수")
+    parser.add_argument("--words", type=int, default=5000, help="합성 단어장 크기")
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--threads", type=int, default=8, help="동기 모드 워커당 스레드 수")
+    args = parser.parse_args()
+
+    workdir = write_deck(*make_deck(args.words))
+    print(f"단어 {args.words:,}개, 워커 {args.workers}개, 동기 모드 스레드 {args.threads}개, "
+          f"이벤트 스트림 {args.streams}개, 느린 클라이언트 {args.slow}개, {args.duration:.0f}초씩")
+    print("모드   동시접속 | 처리량(req/s)   p50(ms)   p99(ms)  오류 | 열린 스트림")
+    try:
+        for mode in args.modes:
+            port = free_port()
+            server = start_gunicorn(workdir, port, args.workers, args.threads, mode)
+            try:
+                for clients in args.clients:
+                    result = asyncio.run(run_load(port, clients, args.duration, args.streams, args.slow))
+                    print(f"{mode:<6} {clients:>7,} | {result['rps']:>13.1f} {result['p50_ms']:>9.1f} "
+                          f"{result['p99_ms']:>9.1f} {result['errors']:>5} | "
+                          f"{result['streams_open']}/{args.streams}")
+            finally:
+                server.terminate()
+                server.wait(timeout=30)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
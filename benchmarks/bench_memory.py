@@ -0,0 +1,97 @@
+"""
+단어장 메모리 벤치마크 (딕셔너리 vs VocabStore)
+JSON 스냅샷에서 불러온 그대로의 딕셔너리 표현과 열 단위 VocabStore가
+단어장 + 퀴즈 통계를 담는 데 쓰는 파이썬 메모리를 tracemalloc으로 비교합니다.
+
+- 딕셔너리: {word: {"korean", "category"}} + {word: [correct, wrong]} (json.loads 결과)
+- VocabStore: 행 번호 딕셔너리 + 뜻 리스트 + 카테고리 번호/통계 array('I')
+
+단어 문자열과 뜻 문자열은 두 표현 모두 가지고 있으므로 차이는 단어마다의 객체 오버헤드입니다.
+
+실행 방법:
+    python benchmarks/bench_memory.py
+    python benchmarks/bench_memory.py 10000 100000
+"""
+
+import gc
+import json
+import random
+import sys
+import time
+import tracemalloc
+
+from bench_common import make_deck, percentile
+
+from vocab_store import VocabStore
+
+DEFAULT_SIZES = [10000, 100000, 1000000]
+LOOKUPS = 2000
+
+
+def load_json_deck(size: int) -> tuple:
+    """불러오기와 같은 조건을 만들기 위해 JSON 문자열로 직렬화한 뒤 다시 파싱"""
+    vocabulary, quiz_stats = make_deck(size)
+    return json.dumps(vocabulary, ensure_ascii=False), json.dumps(quiz_stats)
+
+
+def traced_mb(build) -> tuple:
+    """
+    build()가 만든 객체가 차지하는 메모리 측정
+
+    Returns:
+        tuple: (만든 객체, 메모리(MB))
+    """
+    gc.collect()
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    result = build()
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, (current - baseline) / (1024 * 1024)
+
+
+def lookup_us(vocabulary, quiz_stats, words: list) -> float:
+    """단어 데이터 + 통계 조회의 p50 지연 시간 (µs)"""
+    samples = []
+    for word in words:
+        started = time.perf_counter()
+        vocabulary[word].get("korean")
+        quiz_stats.get(word)
+        samples.append(time.perf_counter() - started)
+    return percentile(samples, 50) * 1e6
+
+
+def run(size: int) -> None:
+    vocabulary_text, stats_text = load_json_deck(size)
+
+    (vocabulary, quiz_stats), dict_mb = traced_mb(
+        lambda: (json.loads(vocabulary_text), json.loads(stats_text))
+    )
+    words = random.Random(1).sample(list(vocabulary), min(LOOKUPS, size))
+    dict_lookup = lookup_us(vocabulary, quiz_stats, words)
+    del vocabulary, quiz_stats
+
+    def build_store():
+        # JSON 파싱 결과는 변환 후 버리므로 VocabStore가 남기는 메모리만 측정됨
+        return VocabStore(json.loads(vocabulary_text), json.loads(stats_text))
+
+    store, store_mb = traced_mb(build_store)
+    store_lookup = lookup_us(store, store.stats, words)
+    del store
+
+    print(f"{size:>10,} | {dict_mb:>8.1f} {store_mb:>8.1f} {store_mb / dict_mb * 100:>5.0f}% | "
+          f"{dict_mb * 1024 * 1024 / size:>6.0f} {store_mb * 1024 * 1024 / size:>6.0f} | "
+          f"{dict_lookup:>5.2f} {store_lookup:>5.2f}")
+
+
+def main() -> None:
+    sizes = [int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES
+    print("단어 수     | 메모리(MB)              | 단어당(bytes) | 조회 p50(µs)")
+    print("            |   딕셔너리    Store 비율 | 딕셔너리 Store | 딕셔너리 Store")
+    for size in sizes:
+        run(size)
+
+
+if __name__ == "__main__":
+    main()
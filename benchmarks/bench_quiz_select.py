@@ -0,0 +1,97 @@
+"""
+퀴즈 문제 선택 벤치마크
+단어 수가 100개에서 100만 개로 늘어나도 문제 하나당 지연 시간이 일정한지 확인합니다.
+
+비교 대상:
+- 기존 방식: list(vocabulary.keys()) + 오답 후보 전체 복사 후 random.sample
+- 단어 풀: WordPool.choice() / WordPool.sample()
+- API: Flask 테스트 클라이언트로 POST /api/quiz (주관식/객관식/틀린 단어 집중 학습)
+
+실행 방법:
+    python benchmarks/bench_quiz_select.py
+    python benchmarks/bench_quiz_select.py 100 10000 1000000
+"""
+
+import random
+import sys
+import time
+
+from bench_common import import_app, install_deck, make_deck, percentile
+
+DEFAULT_SIZES = [100, 1000, 10000, 100000, 1000000]
+ROUNDS = 200
+
+
+def legacy_select(vocabulary) -> list:
+    """기존 get_quiz() + get_multiple_choice_quiz()의 선택 과정"""
+    words = list(vocabulary.keys())
+    word = random.choice(words)
+    words = list(vocabulary.keys())
+    wrong_words = [w for w in words if w != word]
+    return [word] + random.sample(wrong_words, min(3, len(wrong_words)))
+
+
+def legacy_focus_select(vocabulary, quiz_stats) -> str:
+    """기존 focus_mode 선택 과정 (매번 전체 정답률 계산 후 정렬)"""
+    words_with_stats = []
+    for word in vocabulary:
+        if word in quiz_stats:
+            correct, wrong = quiz_stats[word]
+            total = correct + wrong
+            if total > 0:
+                words_with_stats.append((word, correct / total * 100, wrong))
+    words_with_stats.sort(key=lambda x: (x[1], -x[2]))
+    return random.choice(words_with_stats[:max(1, len(words_with_stats) // 2)])[0]
+
+
+def pool_select(app) -> list:
+    """단어 풀을 사용한 선택 과정"""
+    word_pool = app.decks.default.word_pool
+    word = word_pool.choice()
+    return [word] + word_pool.sample(3, exclude=(word,))
+
+
+def measure(func, rounds: int) -> float:
+    """호출 한 번당 중앙값 지연 시간 (마이크로초)"""
+    samples = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started) * 1e6)
+    return percentile(samples, 50)
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES
+    app = import_app()
+    client = app.app.test_client()
+
+    line = "=" * 112
+    print(line)
+    print("퀴즈 문제 선택 벤치마크 (문제 하나당 중앙값, 마이크로초)")
+    print(line)
+    print(f"{'단어 수':>10} | {'기존 방식':>12} | {'단어 풀':>10} | {'API 주관식':>12} | {'API 객관식':>12}"
+          f" | {'기존 집중':>12} | {'API 집중':>12}")
+    print("-" * 112)
+
+    for size in sizes:
+        vocabulary, quiz_stats = make_deck(size)
+        install_deck(app, vocabulary, quiz_stats)
+
+        # 기존 방식은 큰 단어장에서 매우 느리므로 반복 횟수를 줄임
+        legacy_rounds = ROUNDS if size <= 100000 else 10
+        legacy = measure(lambda: legacy_select(vocabulary), legacy_rounds)
+        pool = measure(lambda: pool_select(app), ROUNDS)
+        api_text = measure(lambda: client.post('/api/quiz', json={"mode": "text"}), ROUNDS)
+        api_multiple = measure(lambda: client.post('/api/quiz', json={"mode": "multiple"}), ROUNDS)
+        legacy_focus = measure(lambda: legacy_focus_select(vocabulary, quiz_stats), legacy_rounds)
+        api_focus = measure(lambda: client.post('/api/quiz', json={"focus_mode": True}), ROUNDS)
+
+        print(f"{size:>10,} | {legacy:>12,.1f} | {pool:>10,.1f} | {api_text:>12,.1f} | {api_multiple:>12,.1f}"
+              f" | {legacy_focus:>12,.1f} | {api_focus:>12,.1f}")
+
+    print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+스냅샷 불러오기 벤치마크 (JSON vs 바이너리)
+같은 단어장을 JSON 스냅샷과 바이너리 스냅샷(vocabulary.bin)으로 저장한 뒤
+불러오기 시간, 불러온 데이터가 차지하는 파이썬 메모리(tracemalloc), 단어 조회 시간을 비교합니다.
+
+바이너리 형식의 단어 데이터는 mmap 페이지(여러 워커가 공유)에 있으므로 tracemalloc에 잡히지 않습니다.
+인덱스는 처음 쓸 때 만들므로, 목록/검색/퀴즈 요청은 처음 한 번 인덱스 구성 시간이 더해집니다 (bench_quiz_select.py 참고).
+
+실행 방법:
+    python benchmarks/bench_snapshot_load.py
+    python benchmarks/bench_snapshot_load.py 10000 200000
+"""
+
+import gc
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from bench_common import make_deck, percentile
+
+from vocab_storage import JournalStorage, write_json_atomic
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+LOOKUPS = 2000
+
+
+def make_storage(workdir: str) -> JournalStorage:
+    return JournalStorage(
+        {name: os.path.join(workdir, f"{name}.json") for name in ("vocabulary", "quiz_stats", "srs")},
+        journal_file=os.path.join(workdir, "journal.jsonl"),
+        binary_file=os.path.join(workdir, "vocabulary.bin")
+    )
+
+
+def measure_load(storage: JournalStorage) -> tuple:
+    """
+    Returns:
+        tuple: (불러오기 시간(초), 불러온 데이터의 메모리(MB), 불러온 컬렉션)
+    """
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    collections = storage.load()
+    elapsed = time.perf_counter() - started
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, current / (1024 * 1024), collections
+
+
+def measure_lookup(vocabulary, words: list) -> float:
+    """단어 하나 조회의 p50 지연 시간 (µs)"""
+    samples = []
+    for word in words:
+        started = time.perf_counter()
+        vocabulary[word]
+        samples.append(time.perf_counter() - started)
+    return percentile(samples, 50) * 1e6
+
+
+def run(size: int) -> None:
+    vocabulary, quiz_stats = make_deck(size)
+    workdir = tempfile.mkdtemp(prefix="vocab_bench_")
+    try:
+        storage = make_storage(workdir)
+        write_json_atomic(storage.files["vocabulary"], vocabulary, 0)
+        write_json_atomic(storage.files["quiz_stats"], quiz_stats, 0)
+        del vocabulary, quiz_stats
+
+        json_seconds, json_mb, collections = measure_load(storage)
+        words = random.Random(1).sample(list(collections["vocabulary"]), min(LOOKUPS, size))
+        json_lookup = measure_lookup(collections["vocabulary"], words)
+
+        storage.save_all(collections, binary=True)
+        del collections
+        binary_seconds, binary_mb, collections = measure_load(storage)
+        binary_lookup = measure_lookup(collections["vocabulary"], words)
+        del collections
+
+        json_size = sum(os.path.getsize(storage.files[name]) for name in ("vocabulary", "quiz_stats"))
+        binary_size = os.path.getsize(storage.binary_file)
+        print(f"{size:>9,} | {json_seconds * 1000:>9.1f} {binary_seconds * 1000:>9.1f} | "
+              f"{json_mb:>8.1f} {binary_mb:>8.1f} | {json_lookup:>7.2f} {binary_lookup:>7.2f} | "
+              f"{json_size / 1024:>8.0f} {binary_size / 1024:>8.0f}")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def main() -> None:
+    sizes = [int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES
+    print("단어 수    | 불러오기(ms)         | 메모리(MB)        | 조회 p50(µs)    | 파일(KB)")
+    print("           |      JSON  바이너리  |     JSON 바이너리 |    JSON  바이너리 |     JSON 바이너리")
+    for size in sizes:
+        run(size)
+
+
+if __name__ == "__main__":
+    main()
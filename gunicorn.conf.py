@@ -0,0 +1,58 @@
+"""
+gunicorn 설정
+명령줄 옵션(Procfile, Dockerfile)과 함께 사용되며, 현재 폴더의 이 파일을 gunicorn이 자동으로 읽습니다.
+
+SERVER_MODE 환경 변수로 워커 종류를 고릅니다.
+- sync (기본): 스레드 워커 (gthread, --threads 개수만큼 동시 요청)
+- async: gevent 워커 (요청/이벤트 스트림마다 그린렛, WORKER_CONNECTIONS개까지 동시 연결)
+  `pip install gevent`가 필요하며, 명령줄의 --threads는 무시됩니다.
+
+/metrics 지표(vocab_metrics.py)는 워커마다 PROMETHEUS_MULTIPROC_DIR 폴더에 기록하고 합쳐서 보여 줍니다.
+환경 변수가 없으면 실행할 때마다 임시 폴더를 만들고 종료할 때 지웁니다.
+"""
+
+import glob
+import os
+import shutil
+import sys
+import tempfile
+
+SERVER_MODE = os.environ.get("SERVER_MODE", "sync")
+
+if SERVER_MODE == "async":
+    worker_class = "gevent"
+    worker_connections = int(os.environ.get("WORKER_CONNECTIONS", 1000))
+
+# 워커가 prometheus_client를 불러오기 전에 설정되어야 하므로 워커를 띄우기 전(설정 파일)에 지정
+METRICS_DIR_CREATED = not os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+if METRICS_DIR_CREATED:
+    os.environ["PROMETHEUS_MULTIPROC_DIR"] = tempfile.mkdtemp(prefix="vocab_metrics_")
+METRICS_DIR = os.environ["PROMETHEUS_MULTIPROC_DIR"]
+
+
+def on_starting(server):
+    """이전 실행이 남긴 지표 파일 지우기 (재시작하면 누적 값도 0부터)"""
+    os.makedirs(METRICS_DIR, exist_ok=True)
+    for path in glob.glob(os.path.join(METRICS_DIR, "*.db")):
+        os.remove(path)
+
+
+def on_exit(server):
+    if METRICS_DIR_CREATED:
+        shutil.rmtree(METRICS_DIR, ignore_errors=True)
+
+
+def child_exit(server, worker):
+    """종료한 워커의 게이지 값 정리 (카운터/히스토그램은 합계에 남음)"""
+    try:
+        from prometheus_client import multiprocess
+    except ImportError:
+        return
+    multiprocess.mark_process_dead(worker.pid, METRICS_DIR)
+
+
+def worker_exit(server, worker):
+    """워커 종료 시 아직 저장하지 않은 퀴즈 채점 결과 저장 (write-behind)"""
+    app_module = sys.modules.get("web_vocab_app")
+    if app_module is not None:
+        app_module.flush_pending_writes()
@@ -1,3 +1,6 @@
+// 단어장 API 경로 (/decks/<단어장 ID> 화면이면 /api/decks/<단어장 ID>)
+const API_BASE = document.body.dataset.apiBase || '/api';
+
 /**
  * 탭 전환 함수
  * @param {string} tabName - 표시할 탭 이름 ('words', 'add', 'quiz', 'stats')
@@ -35,44 +38,121 @@ function showTab(tabName, buttonElement) {
     }
 }
 
+// 단어 목록 페이지 크기
+const WORDS_PAGE_SIZE = 200;
+// 현재 단어 목록 페이지 상태 (다음 페이지를 불러올 때 사용)
+let wordsPageState = { category: '', cursor: null };
+
 /**
- * 단어 목록을 서버에서 불러와 화면에 표시
+ * 단어 목록을 서버에서 불러와 화면에 표시 (첫 페이지)
  * @returns {Promise<void>}
  */
 async function loadWords() {
     const wordsList = document.getElementById('words-list');
     wordsList.innerHTML = '<p class="loading">로딩 중...</p>';
+    // 단어가 바뀌었을 수 있으므로 미리 받아 둔 퀴즈 문제 버리기
+    quizQueue = [];
     
     try {
-        const response = await fetch('/api/words');
-        const words = await response.json();
+        const page = await fetchWordPage('', null);
         
-        if (words.length === 0) {
+        if (page.words.length === 0) {
             wordsList.innerHTML = '<p class="empty-message">저장된 단어가 없습니다. 단어를 추가해보세요!</p>';
             return;
         }
         
-        displayWords(words);
+        displayWords(page.words, { total: page.total });
     } catch (error) {
         wordsList.innerHTML = '<p class="error-message">단어를 불러오는 중 오류가 발생했습니다.</p>';
         console.error('Error:', error);
     }
 }
 
+/**
+ * 단어 목록 한 페이지 가져오기 (영어 단어 사전 순)
+ * @param {string} category - 카테고리 필터 (빈 문자열이면 전체)
+ * @param {string|null} cursor - 이전 페이지의 마지막 단어
+ * @returns {Promise<{words: Array, next_cursor: string|null, total: number}>}
+ */
+async function fetchWordPage(category, cursor) {
+    let url = `${API_BASE}/words?limit=${WORDS_PAGE_SIZE}`;
+    if (category) {
+        url += `&category=${encodeURIComponent(category)}`;
+    }
+    if (cursor) {
+        url += `&cursor=${encodeURIComponent(cursor)}`;
+    }
+    
+    const response = await fetch(url);
+    const page = await response.json();
+    wordsPageState = { category, cursor: page.next_cursor };
+    return page;
+}
+
+/**
+ * 다음 페이지를 불러와 목록 뒤에 이어 붙이기
+ * @returns {Promise<void>}
+ */
+async function loadMoreWords() {
+    if (!wordsPageState.cursor) {
+        return;
+    }
+    
+    try {
+        const page = await fetchWordPage(wordsPageState.category, wordsPageState.cursor);
+        displayWords(page.words, { append: true, total: page.total });
+    } catch (error) {
+        console.error('Error:', error);
+    }
+}
+
 /**
  * 단어 목록을 화면에 표시하는 함수
  * @param {Array<{english: string, korean: string}>} words - 표시할 단어 배열
+ * @param {{append?: boolean, total?: number|null, paged?: boolean}} [options]
+ *        append: 기존 목록 뒤에 이어 붙이기, total: 전체 단어 수,
+ *        paged: false이면 '더 보기' 버튼 없이 표시 (검색 결과)
  */
-function displayWords(words) {
+function displayWords(words, { append = false, total = null, paged = true } = {}) {
     const wordsList = document.getElementById('words-list');
     
-    if (words.length === 0) {
+    // 이전 '더 보기' 버튼 제거
+    const moreButton = document.getElementById('load-more-words');
+    if (moreButton) {
+        moreButton.remove();
+    }
+    
+    if (!append && words.length === 0) {
         wordsList.innerHTML = '<p class="empty-message">검색 결과가 없습니다.</p>';
         return;
     }
     
-    wordsList.innerHTML = words.map(word => `
-        <div class="word-item">
+    const itemsHtml = words.map(wordItemHtml).join('');
+    
+    if (append) {
+        wordsList.insertAdjacentHTML('beforeend', itemsHtml);
+    } else {
+        wordsList.innerHTML = itemsHtml;
+    }
+    
+    // 다음 페이지가 있으면 '더 보기' 버튼 표시
+    if (paged && wordsPageState.cursor) {
+        wordsList.insertAdjacentHTML('beforeend',
+            '<button id="load-more-words" class="btn-refresh" onclick="loadMoreWords()">더 보기</button>');
+    }
+    
+    // 단어 개수 업데이트
+    document.getElementById('word-count').textContent = total !== null ? total : words.length;
+}
+
+/**
+ * 단어 한 개의 목록 항목 HTML
+ * @param {{english: string, korean: string, category?: string}} word
+ * @returns {string}
+ */
+function wordItemHtml(word) {
+    return `
+        <div class="word-item" data-word="${escapeHtml(word.english).replace(/"/g, '&quot;')}">
             <div class="word-content">
                 <div class="word-english">${escapeHtml(word.english)}</div>
                 <div class="word-korean">${escapeHtml(word.korean)}</div>
@@ -83,45 +163,57 @@ function displayWords(words) {
                 <button class="btn-delete" onclick="deleteWord('${escapeHtml(word.english)}')">삭제</button>
             </div>
         </div>
-    `).join('');
-    
-    // 단어 개수 업데이트
-    document.getElementById('word-count').textContent = words.length;
+    `;
 }
 
+// 검색 입력 디바운스 타이머
+let searchTimer = null;
+// 검색 결과 최대 개수 (서버에서 상위 N개만 반환)
+const SEARCH_LIMIT = 100;
+
 /**
  * 단어 검색 함수 (실시간 검색)
- * 검색어가 없으면 전체 목록을 표시
+ * 입력이 멈춘 뒤 서버 검색 API를 호출하고, 검색어가 없으면 전체 목록을 표시
+ */
+function searchWords() {
+    clearTimeout(searchTimer);
+    searchTimer = setTimeout(runSearch, 150);
+}
+
+/**
+ * 서버 검색 API 호출 (영어 접두사 / 한국어 뜻 부분 일치)
  * @returns {Promise<void>}
  */
-async function searchWords() {
+async function runSearch() {
     const searchInput = document.getElementById('search-input');
     const searchTerm = searchInput.value.trim().toLowerCase();
     const categoryFilter = document.getElementById('category-filter');
     const category = categoryFilter ? categoryFilter.value : '';
     const wordsList = document.getElementById('words-list');
     
+    // 검색어가 없으면 카테고리 필터만 적용한 목록 표시
+    if (!searchTerm) {
+        filterByCategory();
+        return;
+    }
+    
     wordsList.innerHTML = '<p class="loading">검색 중...</p>';
     
     try {
-        // 카테고리 필터 적용
-        let url = '/api/words';
+        let url = `${API_BASE}/words/search?q=${encodeURIComponent(searchTerm)}&limit=${SEARCH_LIMIT}`;
         if (category) {
-            url += `?category=${encodeURIComponent(category)}`;
+            url += `&category=${encodeURIComponent(category)}`;
         }
         
         const response = await fetch(url);
-        let words = await response.json();
+        const result = await response.json();
         
-        // 검색어로 필터링 (영어 또는 한글에 포함되는지 확인)
-        if (searchTerm) {
-            words = words.filter(word => 
-                word.english.toLowerCase().includes(searchTerm) || 
-                word.korean.includes(searchTerm)
-            );
+        // 입력이 바뀌었으면 이전 결과는 버림
+        if (searchInput.value.trim().toLowerCase() !== searchTerm) {
+            return;
         }
         
-        displayWords(words);
+        displayWords(result.words || [], { paged: false });
     } catch (error) {
         wordsList.innerHTML = '<p class="error-message">검색 중 오류가 발생했습니다.</p>';
         console.error('Error:', error);
@@ -143,7 +235,7 @@ document.getElementById('add-word-form').addEventListener('submit', async (e) =>
     }
     
     try {
-        const response = await fetch('/api/words', {
+        const response = await fetch(`${API_BASE}/words`, {
             method: 'POST',
             headers: {
                 'Content-Type': 'application/json',
@@ -157,12 +249,15 @@ document.getElementById('add-word-form').addEventListener('submit', async (e) =>
             messageDiv.innerHTML = `<p class="message success">${result.message}</p>`;
             document.getElementById('add-word-form').reset();
             
-            // 카테고리 목록 새로고침
-            loadCategories();
-            
-            // 단어 목록 탭이 활성화되어 있으면 새로고침
-            if (document.getElementById('words-tab').classList.contains('active')) {
-                loadWords();
+            // 변경 이벤트를 받고 있으면 목록은 이벤트로 갱신됨
+            if (!changeFeed.connected) {
+                // 카테고리 목록 새로고침
+                loadCategories();
+                
+                // 단어 목록 탭이 활성화되어 있으면 새로고침
+                if (document.getElementById('words-tab').classList.contains('active')) {
+                    loadWords();
+                }
             }
             
             // 검색창 초기화
@@ -201,7 +296,7 @@ function editWord(english, korean, category = '') {
 // 단어 업데이트 API 호출
 async function updateWord(oldEnglish, newEnglish, newKorean, newCategory = '') {
     try {
-        const response = await fetch(`/api/words/${encodeURIComponent(oldEnglish)}`, {
+        const response = await fetch(`${API_BASE}/words/${encodeURIComponent(oldEnglish)}`, {
             method: 'PUT',
             headers: {
                 'Content-Type': 'application/json',
@@ -217,8 +312,10 @@ async function updateWord(oldEnglish, newEnglish, newKorean, newCategory = '') {
         
         if (result.success) {
             alert(result.message);
-            loadCategories(); // 카테고리 목록 새로고침
-            loadWords(); // 단어 목록 새로고침
+            if (!changeFeed.connected) {
+                loadCategories(); // 카테고리 목록 새로고침
+                loadWords(); // 단어 목록 새로고침
+            }
         } else {
             alert(result.message);
         }
@@ -235,7 +332,7 @@ async function deleteWord(word) {
     }
     
     try {
-        const response = await fetch(`/api/words/${encodeURIComponent(word)}`, {
+        const response = await fetch(`${API_BASE}/words/${encodeURIComponent(word)}`, {
             method: 'DELETE'
         });
         
@@ -243,8 +340,10 @@ async function deleteWord(word) {
         
         if (result.success) {
             alert(result.message);
-            loadCategories(); // 카테고리 목록 새로고침
-            loadWords(); // 단어 목록 새로고침
+            if (!changeFeed.connected) {
+                loadCategories(); // 카테고리 목록 새로고침
+                loadWords(); // 단어 목록 새로고침
+            }
         } else {
             alert(result.message);
         }
@@ -257,11 +356,45 @@ async function deleteWord(word) {
 // 퀴즈 시작
 let currentQuiz = null;
 
+// 다음 복습 일정 표시 (간격 반복 모드)
+function formatNextReview(srs) {
+    if (!srs || !document.getElementById('srs-mode').checked) {
+        return '';
+    }
+    return ` | 다음 복습: ${srs.interval}일 후`;
+}
+
+// 미리 받아 둔 퀴즈 문제 (설정이 같으면 /api/quiz/batch 한 번으로 여러 문제를 가져옴)
+const QUIZ_PREFETCH_SIZE = 10;
+let quizQueue = [];
+let quizQueueKey = '';
+
+async function fetchNextQuiz(settings) {
+    const key = JSON.stringify(settings);
+    if (key !== quizQueueKey || quizQueue.length === 0) {
+        const response = await fetch(`${API_BASE}/quiz/batch`, {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify({ ...settings, count: QUIZ_PREFETCH_SIZE })
+        });
+        const result = await response.json();
+        if (!result.success) {
+            return result;
+        }
+        quizQueue = result.questions;
+        quizQueueKey = key;
+    }
+    return quizQueue.shift() || { success: false, message: '문제를 불러올 수 없습니다.' };
+}
+
 async function startQuiz() {
     const quizType = document.getElementById('quiz-type').value;
     const quizMode = document.getElementById('quiz-mode').value;
     const quizCategory = document.getElementById('quiz-category').value;
     const focusMode = document.getElementById('focus-mode').checked;
+    const srsMode = document.getElementById('srs-mode').checked;
     const quizArea = document.getElementById('quiz-area');
     const quizResult = document.getElementById('quiz-result');
     
@@ -269,21 +402,14 @@ async function startQuiz() {
     quizArea.innerHTML = '<p class="loading">문제를 불러오는 중...</p>';
     
     try {
-        const response = await fetch('/api/quiz', {
-            method: 'POST',
-            headers: {
-                'Content-Type': 'application/json',
-            },
-            body: JSON.stringify({ 
-                type: quizType, 
-                mode: quizMode, 
-                category: quizCategory,
-                focus_mode: focusMode 
-            })
+        const result = await fetchNextQuiz({
+            type: quizType, 
+            mode: quizMode, 
+            category: quizCategory,
+            focus_mode: focusMode,
+            srs_mode: srsMode
         });
         
-        const result = await response.json();
-        
         if (result.success) {
             currentQuiz = result;
             
@@ -405,7 +531,7 @@ async function checkAnswer(selectedIndex = null) {
             requestBody.correct_index = currentQuiz.correct_index;
         }
         
-        const response = await fetch('/api/quiz/check', {
+        const response = await fetch(`${API_BASE}/quiz/check`, {
             method: 'POST',
             headers: {
                 'Content-Type': 'application/json',
@@ -431,15 +557,15 @@ async function checkAnswer(selectedIndex = null) {
             if (result.is_correct) {
                 quizResult.innerHTML = `
                     <div class="quiz-result correct">
-                        ✓ 정답입니다! (정답: ${escapeHtml(result.correct_answer)})<br>
-                        <small>맞춘 횟수: ${result.stats[0]}회 | 틀린 횟수: ${result.stats[1]}회</small>
+                        ✓ 정답입니다!${result.match === 'typo' ? ' (오타 허용)' : ''} (정답: ${escapeHtml(result.correct_answer)})<br>
+                        <small>맞춘 횟수: ${result.stats[0]}회 | 틀린 횟수: ${result.stats[1]}회${formatNextReview(result.srs)}</small>
                     </div>
                 `;
             } else {
                 quizResult.innerHTML = `
                     <div class="quiz-result wrong">
                         ✗ 틀렸습니다. 정답은 "${escapeHtml(result.correct_answer)}" 입니다.<br>
-                        <small>맞춘 횟수: ${result.stats[0]}회 | 틀린 횟수: ${result.stats[1]}회</small>
+                        <small>맞춘 횟수: ${result.stats[0]}회 | 틀린 횟수: ${result.stats[1]}회${formatNextReview(result.srs)}</small>
                     </div>
                 `;
             }
@@ -459,16 +585,26 @@ async function checkAnswer(selectedIndex = null) {
 let accuracyChart = null;
 let summaryChart = null;
 
+// 통계 목록 페이지 크기
+const STATS_PAGE_SIZE = 100;
+// 통계 목록 페이지 상태 (다음 offset)
+let statsPageState = { offset: 0 };
+
 // 통계 로드
+// 서버가 미리 집계한 합계/상위 10개/첫 페이지만 받아 오며, 바뀌지 않았으면 브라우저 캐시를 사용 (ETag)
 async function loadStats() {
     const statsList = document.getElementById('stats-list');
     statsList.innerHTML = '<p class="loading">로딩 중...</p>';
     
     try {
-        const response = await fetch('/api/stats');
-        const stats = await response.json();
+        const [summaryResponse, topResponse] = await Promise.all([
+            fetch(`${API_BASE}/stats/summary`),
+            fetch(`${API_BASE}/stats?top=10`)
+        ]);
+        const summary = (await summaryResponse.json()).summary;
+        const topStats = (await topResponse.json()).stats;
         
-        if (stats.length === 0) {
+        if (summary.words === 0) {
             statsList.innerHTML = '<p class="empty-message">퀴즈 통계가 없습니다. 먼저 퀴즈를 해보세요!</p>';
             // 차트도 숨기기
             document.querySelector('.charts-container').style.display = 'none';
@@ -479,35 +615,65 @@ async function loadStats() {
         document.querySelector('.charts-container').style.display = 'grid';
         
         // 차트 생성
-        createCharts(stats);
+        createCharts(topStats, summary);
         
-        // 통계 목록 표시
-        statsList.innerHTML = stats.map(stat => `
-            <div class="stat-item">
-                <div class="stat-word">
-                    <div class="stat-word-english">${escapeHtml(stat.word)}</div>
-                    <div class="stat-word-korean">${escapeHtml(stat.korean)}</div>
-                </div>
-                <div class="stat-numbers">
-                    <div class="stat-accuracy">${stat.accuracy}%</div>
-                    <div class="stat-details">${stat.correct}정 / ${stat.wrong}오 (총 ${stat.total}회)</div>
-                </div>
-            </div>
-        `).join('');
+        // 통계 목록 첫 페이지 표시
+        statsPageState = { offset: 0 };
+        statsList.innerHTML = '';
+        await loadMoreStats();
     } catch (error) {
         statsList.innerHTML = '<p class="error-message">통계를 불러오는 중 오류가 발생했습니다.</p>';
         console.error('Error:', error);
     }
 }
 
-// 차트 생성 함수
-function createCharts(stats) {
+/**
+ * 통계 목록 다음 페이지를 불러와 이어 붙이기 (정답률 높은 순)
+ * @returns {Promise<void>}
+ */
+async function loadMoreStats() {
+    const statsList = document.getElementById('stats-list');
+    const response = await fetch(`${API_BASE}/stats?limit=${STATS_PAGE_SIZE}&offset=${statsPageState.offset}`);
+    const page = await response.json();
+    statsPageState = { offset: statsPageState.offset + page.stats.length };
+    
+    // 이전 '더 보기' 버튼 제거
+    const moreButton = document.getElementById('load-more-stats');
+    if (moreButton) {
+        moreButton.remove();
+    }
+    
+    statsList.insertAdjacentHTML('beforeend', page.stats.map(stat => `
+        <div class="stat-item">
+            <div class="stat-word">
+                <div class="stat-word-english">${escapeHtml(stat.word)}</div>
+                <div class="stat-word-korean">${escapeHtml(stat.korean)}</div>
+            </div>
+            <div class="stat-numbers">
+                <div class="stat-accuracy">${stat.accuracy}%</div>
+                <div class="stat-details">${stat.correct}정 / ${stat.wrong}오 (총 ${stat.total}회)</div>
+            </div>
+        </div>
+    `).join(''));
+    
+    // 남은 통계가 있으면 '더 보기' 버튼 표시
+    if (page.stats.length > 0 && statsPageState.offset < page.total) {
+        statsList.insertAdjacentHTML('beforeend',
+            '<button id="load-more-stats" class="btn-refresh" onclick="loadMoreStats()">더 보기</button>');
+    }
+}
+
+/**
+ * 차트 생성 함수
+ * @param {Array} topStats - 정답률 상위 단어 통계 (/api/stats?top=10)
+ * @param {{correct: number, wrong: number}} summary - 전체 합계 (/api/stats/summary)
+ */
+function createCharts(topStats, summary) {
     const isDark = document.body.classList.contains('dark');
     const textColor = isDark ? '#e0e0e0' : '#333';
     const gridColor = isDark ? '#3a3a4e' : '#e0e0e0';
     
     // 정답률 상위 10개 단어 차트
-    const topStats = [...stats].sort((a, b) => b.accuracy - a.accuracy).slice(0, 10);
     const accuracyCtx = document.getElementById('accuracy-chart').getContext('2d');
     
     // 기존 차트가 있으면 파괴
@@ -567,8 +733,8 @@ function createCharts(stats) {
     });
     
     // 전체 통계 요약 차트 (파이 차트)
-    const totalCorrect = stats.reduce((sum, s) => sum + s.correct, 0);
-    const totalWrong = stats.reduce((sum, s) => sum + s.wrong, 0);
+    const totalCorrect = summary.correct;
+    const totalWrong = summary.wrong;
     const summaryCtx = document.getElementById('summary-chart').getContext('2d');
     
     // 기존 차트가 있으면 파괴
@@ -673,7 +839,7 @@ function loadDarkMode() {
 // 카테고리 목록 로드
 async function loadCategories() {
     try {
-        const response = await fetch('/api/categories');
+        const response = await fetch(`${API_BASE}/categories`);
         const categories = await response.json();
         
         // 카테고리 필터 드롭다운 업데이트
@@ -710,31 +876,177 @@ async function filterByCategory() {
     const searchInput = document.getElementById('search-input');
     const searchTerm = searchInput ? searchInput.value.trim().toLowerCase() : '';
     
+    // 검색어가 있으면 서버 검색에 카테고리 필터를 함께 적용
+    if (searchTerm) {
+        runSearch();
+        return;
+    }
+    
     try {
-        let url = '/api/words';
-        if (category) {
-            url += `?category=${encodeURIComponent(category)}`;
-        }
-        
-        const response = await fetch(url);
-        let words = await response.json();
-        
-        // 검색어가 있으면 추가 필터링
-        if (searchTerm) {
-            words = words.filter(word => 
-                word.english.toLowerCase().includes(searchTerm) || 
-                word.korean.includes(searchTerm)
-            );
-        }
-        
-        displayWords(words);
+        const page = await fetchWordPage(category, null);
+        displayWords(page.words, { total: page.total });
     } catch (error) {
         console.error('필터링 오류:', error);
     }
 }
 
+// ---------- 실시간 변경 이벤트 (/api/events) ----------
+
+// 변경 이벤트 연결 상태 (version: 마지막으로 반영한 이벤트 번호)
+const changeFeed = { source: null, connected: false, version: null, retryTimer: null };
+// 스트림을 열 수 없을 때 /api/changes로 확인하는 간격
+const CHANGE_POLL_MS = 10000;
+// 통계 탭 새로고침 디바운스 타이머
+let statsRefreshTimer = null;
+
+/**
+ * 변경 이벤트 스트림 연결
+ * 끊기면 브라우저가 Last-Event-ID로 다시 연결하고, 서버가 그 사이의 이벤트를 이어서 보냄
+ */
+function connectChangeFeed() {
+    if (!window.EventSource || changeFeed.source) {
+        return;
+    }
+    
+    const source = new EventSource(`${API_BASE}/events`);
+    changeFeed.source = source;
+    
+    source.addEventListener('ready', (e) => {
+        changeFeed.connected = true;
+        changeFeed.version = JSON.parse(e.data).version;
+    });
+    source.addEventListener('change', (e) => {
+        applyChangeEvent(JSON.parse(e.data));
+    });
+    source.addEventListener('reset', (e) => {
+        // 서버가 이어서 보낼 수 없음 → 전체 다시 불러오기
+        changeFeed.version = JSON.parse(e.data).version;
+        reloadAfterReset();
+    });
+    source.onerror = () => {
+        changeFeed.connected = false;
+        if (source.readyState === EventSource.CLOSED) {
+            // 서버가 스트림을 거절함 (503 등) → 잠시 뒤 변경 사항을 확인하고 다시 연결
+            changeFeed.source = null;
+            clearTimeout(changeFeed.retryTimer);
+            changeFeed.retryTimer = setTimeout(pollChanges, CHANGE_POLL_MS);
+        }
+    };
+}
+
+/**
+ * 마지막 번호 이후의 변경 사항을 한 번 가져와 반영한 뒤 스트림 다시 연결
+ * @returns {Promise<void>}
+ */
+async function pollChanges() {
+    if (changeFeed.version !== null) {
+        try {
+            const response = await fetch(`${API_BASE}/changes?since=${changeFeed.version}`);
+            const result = await response.json();
+            if (result.reset) {
+                changeFeed.version = result.version;
+                reloadAfterReset();
+            } else {
+                result.events.forEach(applyChangeEvent);
+            }
+        } catch (error) {
+            console.error('변경 사항 확인 오류:', error);
+        }
+    }
+    connectChangeFeed();
+}
+
+/**
+ * 이벤트를 이어 받을 수 없을 때 화면의 목록 전체 다시 불러오기
+ */
+function reloadAfterReset() {
+    loadCategories();
+    if (document.getElementById('words-tab').classList.contains('active')) {
+        loadWords();
+    }
+    scheduleStatsRefresh();
+}
+
+/**
+ * 변경 이벤트 하나를 화면에 반영 (목록 전체를 다시 불러오지 않음)
+ * @param {{v: number, type: string, word: string, data?: Object, stats?: Array, categories?: boolean}} event
+ */
+function applyChangeEvent(event) {
+    changeFeed.version = event.v;
+    
+    if (event.type === 'stats') {
+        scheduleStatsRefresh();
+        return;
+    }
+    
+    // 단어가 바뀌었으므로 미리 받아 둔 퀴즈 문제 버리기
+    quizQueue = [];
+    if (event.categories) {
+        loadCategories();
+    }
+    patchWordList(event);
+    scheduleStatsRefresh();
+}
+
+/**
+ * 단어 목록 화면에서 바뀐 단어 하나만 추가/수정/삭제
+ * @param {{type: string, word: string, data?: {korean: string, category: string}}} event
+ */
+function patchWordList(event) {
+    const wordsList = document.getElementById('words-list');
+    const items = Array.from(wordsList.querySelectorAll('.word-item'));
+    const existing = items.find(item => item.dataset.word === event.word);
+    const countElement = document.getElementById('word-count');
+    const searchInput = document.getElementById('search-input');
+    const searching = searchInput && searchInput.value.trim() !== '';
+    const category = wordsPageState.category;
+    const matches = event.type !== 'word_removed' && (!category || event.data.category === category);
+    
+    if (existing && !matches) {
+        existing.remove();
+        countElement.textContent = Math.max(0, Number(countElement.textContent) - 1);
+        return;
+    }
+    if (existing) {
+        existing.outerHTML = wordItemHtml({ english: event.word, ...event.data });
+        return;
+    }
+    
+    // 검색 결과에는 새 단어를 끼워 넣지 않음 (검색 조건을 다시 확인해야 하므로)
+    if (!matches || searching) {
+        return;
+    }
+    countElement.textContent = Number(countElement.textContent) + 1;
+    // 아직 불러오지 않은 뒤쪽 페이지의 단어면 '더 보기'로 나중에 불러옴
+    if (wordsPageState.cursor && event.word > wordsPageState.cursor) {
+        return;
+    }
+    
+    const html = wordItemHtml({ english: event.word, ...event.data });
+    const next = items.find(item => item.dataset.word > event.word);
+    if (next) {
+        next.insertAdjacentHTML('beforebegin', html);
+    } else if (items.length > 0) {
+        items[items.length - 1].insertAdjacentHTML('afterend', html);
+    } else {
+        wordsList.innerHTML = html;
+    }
+}
+
+/**
+ * 통계 탭이 열려 있으면 잠시 뒤 한 번만 다시 불러오기 (바뀌지 않은 부분은 ETag 304)
+ */
+function scheduleStatsRefresh() {
+    if (!document.getElementById('stats-tab').classList.contains('active')) {
+        return;
+    }
+    clearTimeout(statsRefreshTimer);
+    statsRefreshTimer = setTimeout(loadStats, 500);
+}
+
 // 페이지 로드 시 단어 목록 자동 로드 및 다크 모드 설정 불러오기
 window.addEventListener('DOMContentLoaded', () => {
+    connectChangeFeed();
     loadWords();
     loadDarkMode();
     loadCategories();
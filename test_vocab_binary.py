@@ -0,0 +1,93 @@
+"""
+바이너리 스냅샷 테스트 (쓰기 → mmap 조회, OverlayMapping)
+`python -m pytest test_vocab_binary.py`
+"""
+
+import pytest
+
+from vocab_binary import BinaryDeck, OverlayMapping, write_deck
+
+VOCABULARY = {
+    "pear": {"korean": "배", "category": "과일"},
+    "apple": {"korean": "사과", "category": "과일"},
+    "zebra": {"korean": "얼룩말", "category": ""},
+    "café": {"korean": "카페", "category": "장소"},
+}
+
+
+@pytest.fixture
+def binary_deck(tmp_path):
+    path = tmp_path / "vocabulary.bin"
+    with open(path, "wb") as f:
+        assert write_deck(f, VOCABULARY, {"apple": [3, 1], "ghost": [9, 9]}) == 4
+    deck = BinaryDeck(str(path))
+    yield deck
+    deck.close()
+
+
+def test_round_trip_lookup(binary_deck):
+    """쓴 단어를 이진 탐색으로 그대로 읽고, 순회는 영어 단어 정렬 순서여야 함"""
+    assert len(binary_deck) == 4
+    for word, data in VOCABULARY.items():
+        assert word in binary_deck
+        assert binary_deck[word] == data
+    assert "banana" not in binary_deck and 42 not in binary_deck
+    with pytest.raises(KeyError):
+        binary_deck["banana"]
+    assert list(binary_deck) == sorted(VOCABULARY)
+    assert dict(binary_deck.items()) == VOCABULARY
+
+
+def test_stats_column(binary_deck):
+    """기록이 있는 단어의 통계만 읽히고, 단어장에 없는 단어의 통계는 저장하지 않아야 함"""
+    assert dict(binary_deck.stats.items()) == {"apple": [3, 1]}
+    assert len(binary_deck.stats) == 1
+    assert binary_deck.stats.get("pear") is None
+    assert "ghost" not in binary_deck.stats
+
+
+def test_truncated_file_rejected(tmp_path):
+    path = tmp_path / "vocabulary.bin"
+    with open(path, "wb") as f:
+        write_deck(f, VOCABULARY, {})
+    data = path.read_bytes()
+    path.write_bytes(data[:-3])
+    with pytest.raises(ValueError):
+        BinaryDeck(str(path))
+
+
+def test_overlay_override_and_delete(binary_deck):
+    """바뀐 값과 삭제가 기본 매핑을 가리고, 정렬 순서를 유지하며, 기본 파일은 그대로여야 함"""
+    overlay = OverlayMapping(binary_deck)
+    overlay["pear"] = {"korean": "서양배", "category": "과일"}
+    overlay["banana"] = {"korean": "바나나", "category": "과일"}
+    del overlay["zebra"]
+
+    assert overlay["pear"]["korean"] == "서양배"
+    assert "zebra" not in overlay
+    with pytest.raises(KeyError):
+        overlay["zebra"]
+    with pytest.raises(KeyError):
+        del overlay["zebra"]
+    assert len(overlay) == 4
+    assert list(overlay) == ["apple", "banana", "café", "pear"]
+    assert overlay.change_count == 3
+    assert binary_deck["pear"]["korean"] == "배" and "zebra" in binary_deck
+
+    # 삭제한 단어를 다시 추가하고, 추가한 단어를 삭제
+    overlay["zebra"] = {"korean": "말", "category": ""}
+    del overlay["banana"]
+    assert len(overlay) == 4
+    assert overlay["zebra"]["korean"] == "말"
+    assert list(overlay) == ["apple", "café", "pear", "zebra"]
+
+
+def test_overlay_copy_is_independent(binary_deck):
+    overlay = OverlayMapping(binary_deck)
+    overlay["kiwi"] = {"korean": "키위", "category": "과일"}
+    snapshot = overlay.copy()
+    del overlay["apple"]
+    overlay["kiwi"] = {"korean": "참다래", "category": "과일"}
+
+    assert snapshot["kiwi"]["korean"] == "키위" and "apple" in snapshot
+    assert len(snapshot) == 5 and len(overlay) == 4
@@ -0,0 +1,235 @@
+"""
+단어장 테스트 (write-behind 채점 결과, 인덱스, LRU 캐시와 메모리 크기 제한)
+`python -m pytest test_vocab_decks.py`
+"""
+
+import gc
+import json
+import os
+import weakref
+
+import pytest
+
+from vocab_decks import Deck, DeckCache
+from vocab_events import ChangeFeed
+from vocab_storage import CorruptSnapshotError, create_storage, make_set
+
+
+def open_deck_at(directory, deck_id="test", flush_interval=0.0, compact_threshold=1024 * 1024):
+    """directory의 저장소를 쓰는 단어장 (워커 하나에 해당, 불러오기 전)"""
+    directory = str(directory)
+    os.makedirs(directory, exist_ok=True)
+    storage = create_storage(
+        "journal",
+        {name: os.path.join(directory, f"{name}.json") for name in ("vocabulary", "quiz_stats", "srs")},
+        journal_file=os.path.join(directory, "vocab_journal.jsonl"),
+        compact_threshold=compact_threshold,
+        binary_file=os.path.join(directory, "vocabulary.bin")
+    )
+    return Deck(deck_id, storage, ChangeFeed(10), flush_interval=flush_interval)
+
+
+def load_deck_at(directory, **options):
+    deck = open_deck_at(directory, **options)
+    deck.load()
+    return deck
+
+
+def deck_opener(root):
+    """단어장 ID마다 root 아래 폴더를 쓰는 open_deck 함수"""
+    return lambda deck_id: open_deck_at(os.path.join(root, deck_id), deck_id)
+
+
+def add_words(deck, prefix, count):
+    deck.record_changes([make_set("vocabulary", f"{prefix}{i}", {"korean": "뜻", "category": ""})
+                         for i in range(count)])
+
+
+def grade(deck, word, is_correct=True, times=1):
+    graded = {"word": word, "is_correct": is_correct, "quality": 4 if is_correct else 1, "mode": "test"}
+    return deck.record_quiz_results([graded] * times)
+
+
+def wait_for_compaction(deck):
+    if deck.storage._compact_thread is not None:
+        deck.storage._compact_thread.join()
+
+
+def test_write_behind_coalesces_repeated_grades(tmp_path):
+    """같은 단어를 여러 번 채점하면 증가분이 합쳐져 통계/복습 상태가 한 줄씩만 기록되어야 함"""
+    deck = load_deck_at(tmp_path, flush_interval=60)
+    add_words(deck, "w", 2)
+    outcomes = grade(deck, "w0", times=3) + grade(deck, "w0", is_correct=False)
+    assert [stats for stats, _ in outcomes] == [[1, 0], [2, 0], [3, 0], [3, 1]]
+    assert deck.pending_stats == {"w0": [3, 1]}
+
+    assert deck.stats_flusher.flush()
+    status = deck.write_behind_status()
+    assert status["written"] == 2 and status["coalesced"] == 2 and status["pending_words"] == 0
+    with open(tmp_path / "vocab_journal.jsonl", encoding="utf-8") as f:
+        written = [json.loads(line)["c"] for line in f if '"vocabulary"' not in line]
+    assert written == ["quiz_stats", "srs"]
+    assert load_deck_at(tmp_path).quiz_stats["w0"] == [3, 1]
+    deck.close()
+
+
+@pytest.mark.parametrize("snapshot", ["compaction", "save"])
+def test_pending_results_not_counted_twice_after_snapshot(tmp_path, snapshot):
+    """
+    저장하지 않은 채점 결과가 든 스냅샷을 다른 워커가 불러와 같은 단어를 기록해도
+    이 워커가 저장할 때 증가분을 한 번 더 더하지 않아야 함
+    """
+    worker = load_deck_at(tmp_path, flush_interval=60,
+                          compact_threshold=1 if snapshot == "compaction" else 1024 * 1024)
+    add_words(worker, "w", 2)
+    wait_for_compaction(worker)
+    grade(worker, "w0", times=3)
+    if snapshot == "compaction":
+        add_words(worker, "x", 1)  # 관계없는 쓰기가 압축을 시작함
+        wait_for_compaction(worker)
+    else:
+        assert worker.save()
+    with open(tmp_path / "quiz_stats.json", encoding="utf-8") as f:
+        assert json.load(f)["w0"] == [3, 0]  # 스냅샷에 증가분이 들어감
+
+    other = load_deck_at(tmp_path)
+    assert other.quiz_stats["w0"] == [3, 0]
+    grade(other, "w0")  # 다른 워커가 [4, 0]을 기록
+    worker.refresh_if_changed()
+    assert worker.flush_pending_writes()
+    assert worker.quiz_stats["w0"] == [4, 0]
+    assert load_deck_at(tmp_path).quiz_stats["w0"] == [4, 0]
+
+
+def test_pending_results_survive_remote_write(tmp_path):
+    """다른 워커가 같은 단어를 기록한 뒤 저장해도 양쪽 채점 횟수가 모두 남아야 함"""
+    worker = load_deck_at(tmp_path, flush_interval=60)
+    add_words(worker, "w", 1)
+    other = load_deck_at(tmp_path)
+    grade(worker, "w0", times=2)
+    grade(other, "w0", is_correct=False)
+    worker.refresh_if_changed()
+    assert worker.quiz_stats["w0"] == [2, 1]
+    assert worker.flush_pending_writes()
+    assert load_deck_at(tmp_path).quiz_stats["w0"] == [2, 1]
+
+
+def test_snapshot_copies_store_once(tmp_path):
+    """압축용 복사본은 단어장과 통계가 한 복사본을 공유하고, 이후 변경과 독립이어야 함"""
+    deck = load_deck_at(tmp_path)
+    add_words(deck, "w", 3)
+    grade(deck, "w0")
+    snapshot = deck.snapshot()
+    assert snapshot["quiz_stats"]._store is snapshot["vocabulary"]
+    assert snapshot["vocabulary"] is not deck.vocabulary
+
+    add_words(deck, "x", 1)
+    grade(deck, "w0")
+    assert sorted(snapshot["vocabulary"]) == ["w0", "w1", "w2"]
+    assert snapshot["quiz_stats"] == {"w0": [1, 0]}
+    assert set(snapshot["srs"]) == {"w0"}
+
+
+def test_indexes_built_on_first_use(tmp_path):
+    """바이너리 스냅샷 단어장은 불러올 때 인덱스를 만들지 않고, 처음 쓸 때 바뀐 데이터까지 담아 만들어야 함"""
+    writer = load_deck_at(tmp_path)
+    writer.record_changes([make_set("vocabulary", word, {"korean": korean, "category": "과일"})
+                           for word, korean in (("apple", "사과"), ("pear", "배"))])
+    writer.close()
+    assert open_deck_at(tmp_path).storage.convert_snapshot(True)
+
+    deck = load_deck_at(tmp_path)
+    assert deck.storage.snapshot_format() == "binary"
+    assert deck.vocabulary["pear"]["korean"] == "배"
+    grade(deck, "apple")
+    deck.record_changes([make_set("vocabulary", "plum", {"korean": "자두", "category": "과일"})])
+    assert not any(deck.is_index_built(name) for name in ("search_index", "category_index", "stats_aggregate"))
+    unbuilt_bytes = deck.memory_bytes()
+
+    assert deck.search_index.search("자두") == ["plum"]
+    assert deck.category_index.count("과일") == 3
+    assert deck.stats_aggregate.get("apple")[:2] == (1, 0)
+    assert deck.memory_bytes() > unbuilt_bytes
+
+    # 만든 인덱스는 그 뒤의 변경을 점진적으로 반영
+    deck.record_changes([make_set("vocabulary", "fig", {"korean": "무화과", "category": "과일"})])
+    assert deck.category_index.count("과일") == 4
+    assert deck.search_index.search("무화과") == ["fig"]
+
+
+def test_budget_evicts_when_loaded_deck_grows(tmp_path):
+    """이미 불러온 단어장이 커져 크기 제한을 넘으면 오래 쓰지 않은 단어장을 내보내야 함"""
+    cache = DeckCache(deck_opener(str(tmp_path)), max_decks=10)
+    add_words(cache.get("a"), "a", 100)
+    add_words(cache.get("b"), "b", 100)
+    cache.max_bytes = cache.status()["bytes"] + cache.get("b").memory_bytes() // 2
+    assert cache.is_loaded("a") and cache.is_loaded("b")
+
+    b = cache.get("b")
+    add_words(b, "c", 100)  # 캐시에 있는 채로 커짐 (웹 앱은 요청이 끝난 뒤 확인)
+    cache.check_memory(b)
+    assert not cache.is_loaded("a") and cache.is_loaded("b")
+    status = cache.status()
+    assert status["evictions"] == 1 and status["bytes"] <= status["max_bytes"]
+
+    # 다시 불러온 단어장은 데이터를 그대로 가지고 있음
+    assert len(cache.get("a").vocabulary) == 100
+
+
+def test_budget_checked_on_cache_hit(tmp_path):
+    """check_memory()를 부르지 않았어도 다음에 get()으로 가져올 때 확인해야 함"""
+    cache = DeckCache(deck_opener(str(tmp_path)), max_decks=10)
+    add_words(cache.get("a"), "a", 100)
+    add_words(cache.get("b"), "b", 100)
+    cache.max_bytes = cache.status()["bytes"] + cache.get("b").memory_bytes() // 2
+    add_words(cache.get("b"), "c", 100)
+    cache.get("b")
+    assert not cache.is_loaded("a")
+
+
+def test_evicted_deck_releases_write_behind_thread(tmp_path):
+    """내보낸 단어장은 채점 결과를 저장하고, 그 뒤의 채점은 바로 기록하며, 저장 스레드가 붙잡지 않아야 함"""
+    cache = DeckCache(lambda deck_id: open_deck_at(tmp_path / deck_id, deck_id, flush_interval=60), max_decks=1)
+    deck = cache.get("a")
+    add_words(deck, "w", 1)
+    grade(deck, "w0")
+    thread = deck.stats_flusher._thread
+    cache.get("b")  # a를 내보냄
+    assert not cache.is_loaded("a")
+    assert deck.stats_flusher is None and not thread.is_alive()
+    assert not deck.pending_stats
+
+    grade(deck, "w0")  # 내보내기 전에 시작한 요청
+    assert not deck.pending_stats
+    assert load_deck_at(tmp_path / "a").quiz_stats["w0"] == [2, 0]
+
+    evicted = weakref.ref(deck)
+    del deck
+    gc.collect()
+    assert evicted() is None
+
+
+def test_unreadable_snapshot_leaves_deck_unloaded(tmp_path):
+    """모든 스냅샷 세대가 손상되었으면 빈 단어장으로 불러오지 않고 아무 파일도 덮어쓰지 않아야 함"""
+    writer = load_deck_at(tmp_path)
+    add_words(writer, "w", 5)
+    assert writer.save()
+    add_words(writer, "v", 5)
+    assert writer.save()
+    writer.close()
+    good_generation = (tmp_path / "vocabulary.json.1").read_bytes()
+    for name in ("vocabulary.json", "vocabulary.json.1"):
+        (tmp_path / name).write_text('{"w0": {"korean"', encoding="utf-8")
+    before = {name: (tmp_path / name).read_bytes() for name in os.listdir(tmp_path)}
+
+    cache = DeckCache(lambda deck_id: open_deck_at(tmp_path, deck_id))
+    for _ in range(2):  # 요청마다 다시 시도하고 계속 실패
+        with pytest.raises(CorruptSnapshotError):
+            cache.get("a")
+    deck = cache._decks["a"]
+    assert not deck.loaded and deck.memory_bytes() == 0
+    assert {name: (tmp_path / name).read_bytes() for name in os.listdir(tmp_path)} == before
+
+    # 정상 세대를 되살리면 다음 요청에서 불러옴
+    (tmp_path / "vocabulary.json.1").write_bytes(good_generation)
+    assert sorted(cache.get("a").vocabulary) == [f"w{i}" for i in range(5)]
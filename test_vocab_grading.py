@@ -0,0 +1,55 @@
+"""
+주관식 채점 테스트
+`python -m pytest test_vocab_grading.py`
+"""
+
+import pytest
+
+from vocab_grading import AnswerKeyCache, grade_text_answer
+
+
+@pytest.mark.parametrize("answer, expected", [
+    ("사과", "exact"),
+    ("사과나무", "exact"),
+    ("사과 (과일)", "exact"),
+    ("사과, 사과나무", "exact"),
+    ("사과나무 열매", None),
+    ("배", None),
+])
+def test_english_to_korean_accepts_any_meaning(answer, expected):
+    key = AnswerKeyCache().get("apple", "english_to_korean", "사과, 사과나무")
+    assert grade_text_answer(key, answer) == expected
+
+
+@pytest.mark.parametrize("headword, answer, expected", [
+    ("and/or", "and/or", "exact"),
+    ("and/or", "and or", "exact"),
+    ("and/or", "and", None),
+    ("and/or", "or", None),
+    ("input/output", "input", None),
+    ("input/output", "input/outptu", "typo"),
+    ("ice-cream", "Ice Cream", "exact"),
+])
+def test_korean_to_english_uses_whole_headword(headword, answer, expected):
+    """영어 단어는 구분자로 나누지 않으므로 일부만 쓰면 틀림"""
+    key = AnswerKeyCache().get(headword, "korean_to_english", headword)
+    assert grade_text_answer(key, answer) == expected
+
+
+@pytest.mark.parametrize("headword, answer, expected", [
+    ("house", "horse", None),
+    ("house", "mouse", None),
+    ("house", "hosue", None),  # 짧은 단어는 바꿔 쓴 것도 틀림
+    ("bread", "break", None),
+    ("receive", "recieve", None),
+    ("different", "diffrent", None),  # 글자 빠짐
+    ("different", "differemt", None),  # 다른 글자
+    ("different", "diffrerent", None),
+    ("different", "differnet", "typo"),
+    ("international", "internatoinal", "typo"),
+    ("international", "internatoinla", None),  # 두 번 바꿈
+])
+def test_korean_to_english_typos_only_transpositions(headword, answer, expected):
+    """영어 단어는 다른 실제 단어가 되기 쉬우므로 긴 단어에서 이웃한 두 글자 바꾸기 하나만 오타로 인정"""
+    key = AnswerKeyCache().get(headword, "korean_to_english", headword)
+    assert grade_text_answer(key, answer) == expected
@@ -0,0 +1,138 @@
+"""
+메모리 인덱스 테스트
+`python -m pytest test_vocab_index.py`
+"""
+
+import random
+from collections import Counter
+
+from vocab_index import CategoryIndex, SearchIndex, StatsAggregate, WeaknessRanking, WordPool
+
+
+def test_search_index_build_matches_incremental_add():
+    """한 번에 만든 인덱스와 하나씩 추가한 인덱스의 검색 결과가 같아야 함"""
+    rng = random.Random(1)
+    items = {f"w{rng.randrange(10 ** 6):06d}": rng.choice(["사과", "사과나무", "배", "바나나 우유"])
+             for _ in range(500)}
+    built = SearchIndex()
+    built.build(items.items())
+    added = SearchIndex()
+    for word, korean in items.items():
+        added.add(word, korean)
+
+    assert list(built.iter_after()) == sorted(items)
+    for query in ["w1", "w0", "사과", "나무", "바나나 우", "배"]:
+        assert built.search(query, limit=1000) == added.search(query, limit=1000)
+    # 만든 뒤에도 하나씩 추가/삭제 가능
+    built.add("aaa", "새 단어")
+    built.remove(next(iter(items)))
+    assert list(built.iter_after())[0] == "aaa"
+    assert len(built) == len(items)
+
+
+def test_stats_order_after_interleaved_updates():
+    """채점/삭제/조회가 섞여도 정답률 순서(같으면 사전 순)와 합계가 맞아야 함"""
+    rng = random.Random(2)
+    aggregate = StatsAggregate()
+    stats = {}
+    categories = {}
+    for step in range(3000):
+        word = f"w{rng.randrange(300):03d}"
+        if rng.random() < 0.1:
+            aggregate.remove(word)
+            stats.pop(word, None)
+        else:
+            correct, wrong = stats.get(word, (0, 0))
+            if rng.random() < 0.5:
+                correct += 1
+            else:
+                wrong += 1
+            stats[word] = (correct, wrong)
+            categories.setdefault(word, rng.choice(["a", "b"]))
+            aggregate.update(word, "뜻", categories[word], [correct, wrong])
+        if step % 97 == 0:
+            offset = rng.randrange(len(stats) + 1)
+            expected = sorted(stats, key=lambda w: (-StatsAggregate.bucket_for(*stats[w]), w))
+            assert aggregate.page(offset, 20) == expected[offset:offset + 20]
+
+    expected = sorted(stats, key=lambda w: (-StatsAggregate.bucket_for(*stats[w]), w))
+    assert aggregate.page() == expected
+    assert aggregate.page(ascending=True) == sorted(stats, key=lambda w: (StatsAggregate.bucket_for(*stats[w]), w))
+    in_a = [word for word in expected if categories[word] == "a"]
+    assert aggregate.page(category="a") == in_a
+    summary = aggregate.summary()
+    assert summary["correct"] == sum(c for c, _ in stats.values())
+    assert summary["wrong"] == sum(w for _, w in stats.values())
+
+
+def test_category_index_add_move_delete():
+    """단어를 추가/다른 카테고리로 옮기기/삭제하면 단어 수, 목록, 정렬 페이지가 바로 맞아야 함"""
+    index = CategoryIndex()
+    for word, category in [("pear", "과일"), ("apple", "과일"), ("dog", "동물"), ("memo", "")]:
+        index.add(word, category)
+    assert index.counts() == {"과일": 2, "동물": 1, "": 1}
+    assert index.categories() == ["과일", "동물"]  # 이름 없는 카테고리는 목록에서 제외
+    assert index.sorted_words("과일") == ["apple", "pear"]
+
+    # apple을 동물로 옮김 (Deck.apply_change()처럼 이전 카테고리에서 빼고 새 카테고리에 추가)
+    index.remove("apple", "과일")
+    index.add("apple", "동물")
+    assert index.sorted_words("과일") == ["pear"]
+    assert list(index.iter_after("동물", "apple")) == ["dog"]
+    assert set(index.pool("동물")) == {"apple", "dog"}
+
+    # 마지막 단어를 지우면 카테고리도 사라짐
+    index.remove("pear", "과일")
+    assert index.count("과일") == 0 and "과일" not in index.counts()
+    assert index.categories() == ["동물"]
+    assert len(index.pool("과일")) == 0 and index.sorted_words("과일") == []
+    index.remove("pear", "과일")  # 없는 단어 삭제는 무시
+
+
+def test_word_pool_uniform_after_delete():
+    """삭제로 자리를 옮긴 뒤에도 남은 단어만 고르게 뽑혀야 함"""
+    random.seed(3)
+    pool = WordPool(f"w{i}" for i in range(20))
+    for i in range(0, 20, 3):
+        pool.remove(f"w{i}")  # 마지막 단어가 빈자리로 옮겨짐
+    remaining = {f"w{i}" for i in range(20) if i % 3}
+    assert set(pool) == remaining and len(pool) == len(remaining)
+
+    draws = 26000
+    counts = Counter(pool.choice() for _ in range(draws))
+    assert set(counts) == remaining
+    expected = draws / len(remaining)
+    assert all(abs(count - expected) < expected * 0.1 for count in counts.values())
+
+    # sample()은 서로 다른 단어, exclude 제외
+    for _ in range(200):
+        picked = pool.sample(5, exclude=("w1",))
+        assert len(set(picked)) == 5 and "w1" not in picked and set(picked) <= remaining
+
+
+def test_weakness_ranking_follows_stats_changes():
+    """통계가 바뀌면 정답률 하위 절반(집중 학습 후보)이 바로 바뀌어야 함"""
+    ranking = WeaknessRanking()
+    stats = {"a": [9, 1], "b": [1, 9], "c": [5, 5], "d": [8, 2]}
+    for word, record in stats.items():
+        ranking.update(word, "x" if word in "ab" else "y", record)
+    ranking.update("e", "y", None)  # 기록 없는 단어는 순위에 없음
+    assert len(ranking) == 4
+    assert set(ranking.sample_weak(10)) == {"b", "c"}
+
+    # b를 계속 맞히고 a를 계속 틀리면 순위가 뒤집힘
+    ranking.update("b", "x", [20, 9])
+    ranking.update("a", "x", [9, 30])
+    assert set(ranking.sample_weak(10)) == {"a", "c"}
+    assert ranking.sample_weak(10, "x") == ["a"]
+    assert {ranking.pick_weak() for _ in range(50)} == {"a", "c"}
+
+    # 다른 카테고리로 옮기기와 삭제
+    ranking.update("a", "y", [9, 30])
+    assert ranking.sample_weak(10, "x") == ["b"]
+    assert ranking.sample_weak(10, "y") == ["a"]
+    ranking.remove("a")
+    ranking.update("c", "y", [0, 0])  # 기록이 지워짐
+    assert len(ranking) == 2
+    assert ranking.sample_weak(10) == ["b"]  # b 69%, d 80%
+    assert ranking.pick_weak("z") is None
@@ -0,0 +1,58 @@
+"""
+단어 가져오기/내보내기 테스트 (CSV, TSV, NDJSON)
+`python -m pytest test_vocab_io.py`
+"""
+
+import io
+
+import pytest
+
+import vocab_book
+from vocab_io import FORMATS, export_chunks, iter_import_rows
+
+WORDS = [
+    {"english": "apple", "korean": "사과, 사과나무", "category": "fruit"},
+    {"english": "say \"hi\"", "korean": "인사하다\t(구어)", "category": ""},
+    {"english": "line", "korean": "줄\n선", "category": "noun"},
+]
+
+
+@pytest.mark.parametrize("fmt", FORMATS)
+def test_export_import_round_trip(fmt):
+    """내보낸 파일을 다시 가져오면 쉼표, 따옴표, 탭, 줄바꿈이 든 값도 그대로여야 함"""
+    text = "".join(export_chunks([WORDS[:2], WORDS[2:]], fmt))
+    rows = list(iter_import_rows(io.StringIO(text, newline=""), fmt))
+    assert [word for _, word, _ in rows] == WORDS
+    assert all(error is None for _, _, error in rows)
+
+
+def test_import_reports_bad_rows():
+    text = "english,korean,category\napple,사과,fruit\n,뜻 없음\nbanana,,\n" + "x" * 101 + ",뜻\ncat,고양이\n"
+    rows = list(iter_import_rows(io.StringIO(text, newline=""), "csv"))
+    assert [(line, word["english"] if word else None) for line, word, _ in rows] == [
+        (2, "apple"), (3, None), (4, None), (5, None), (6, "cat")]
+    assert all(error for _, word, error in rows if word is None)
+
+
+def test_import_ndjson_bad_rows():
+    text = '{"english": "apple", "korean": "사과"}\n{not json}\n[1, 2]\n{"english": 1, "korean": "일"}\n'
+    rows = list(iter_import_rows(io.StringIO(text), "ndjson"))
+    assert rows[0][1] == {"english": "apple", "korean": "사과", "category": ""}
+    assert [(line, word) for line, word, _ in rows[1:]] == [(2, None), (3, None), (4, None)]
+
+
+def test_import_without_header_uses_column_order():
+    rows = list(iter_import_rows(io.StringIO("Apple, 사과 ,fruit\n", newline=""), "csv"))
+    assert rows == [(1, {"english": "apple", "korean": "사과", "category": "fruit"}, None)]
+
+
+def test_cli_import_malformed_csv(tmp_path, monkeypatch, capsys):
+    """읽을 수 없는 CSV(필드가 너무 긴 줄)는 메뉴를 끝내지 않고 오류만 출력해야 함"""
+    path = tmp_path / "words.csv"
+    path.write_text("apple,사과\nbig," + "x" * 200000 + "\n", encoding="utf-8")
+    monkeypatch.setattr(vocab_book, "vocabulary", {})
+    monkeypatch.setattr(vocab_book, "scheduler", vocab_book.SRSScheduler())
+    monkeypatch.setattr("builtins.input", lambda prompt="": str(path))
+    vocab_book.import_words()
+    assert "파일 읽기 실패" in capsys.readouterr().out
+    assert vocab_book.vocabulary == {"apple": "사과"}
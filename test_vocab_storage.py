@@ -0,0 +1,194 @@
+"""
+저장소 엔진 테스트 (여러 워커가 같은 폴더의 저장소를 쓰는 경우)
+`python -m pytest test_vocab_storage.py`
+"""
+
+import json
+import os
+
+import pytest
+
+from vocab_storage import (CorruptSnapshotError, FileLock, create_storage, fcntl, load_json_with_fallback,
+                           make_set, write_json_atomic)
+
+
+def open_storage(directory, offload=None):
+    """같은 폴더를 쓰는 저장소 (워커 하나에 해당)"""
+    return create_storage(
+        "journal",
+        {name: str(directory / f"{name}.json") for name in ("vocabulary", "quiz_stats", "srs")},
+        journal_file=str(directory / "vocab_journal.jsonl"),
+        compact_threshold=1024 * 1024 * 1024,
+        offload=offload
+    )
+
+
+def add_words(storage, state, prefix, count):
+    changes = [make_set("vocabulary", f"{prefix}{i}", {"korean": "뜻", "category": ""}) for i in range(count)]
+    for change in changes:
+        state[change["k"]] = change["val"]
+    with storage.lock():
+        assert storage.append(changes)
+
+
+def test_load_during_compaction_keeps_segment(tmp_path):
+    """압축 스레드가 load() 도중에 새 스냅샷을 쓰고 압축 중인 저널을 지워도 변경 사항이 남아야 함"""
+    writer = open_storage(tmp_path)
+    writer.load()
+    words = {}
+    add_words(writer, words, "w", 50)
+    assert writer._compact_lock.acquire(blocking=False)
+    with writer._file_lock, writer._lock:
+        writer._rotate()
+
+    reader = open_storage(tmp_path)
+    load_snapshots = reader._load_snapshots
+
+    def load_old_snapshot_then_compact():
+        collections = load_snapshots()  # 압축 전 스냅샷 (비어 있음)
+        writer._compact_worker({"vocabulary": dict(words), "quiz_stats": {}, "srs": {}})
+        return collections
+
+    reader._load_snapshots = load_old_snapshot_then_compact
+    assert len(reader.load()["vocabulary"]) == 50
+
+
+def compact(storage, state):
+    """저널을 압축하고 끝날 때까지 기다리기"""
+    with storage.lock():
+        assert storage.compact_async({"vocabulary": dict(state), "quiz_stats": {}, "srs": {}})
+    storage._compact_thread.join()
+
+
+def apply_read_changes(storage, collections):
+    """read_changes()로 따라잡기 (빠진 변경 사항이 있으면 실패)"""
+    changes = storage.read_changes()
+    assert changes is not None
+    for change in changes:
+        if change.get("op") != "base":
+            collections["vocabulary"][change["k"]] = change["val"]
+    return collections
+
+
+def test_read_changes_after_compaction_without_journal(tmp_path):
+    """저널이 없을 때 불러온 워커는 그 뒤의 압축을 알아채고 전체를 다시 불러와야 함"""
+    reader = open_storage(tmp_path)
+    reader.load()
+    writer = open_storage(tmp_path)
+    writer.load()
+    words = {}
+    add_words(writer, words, "w", 200)
+    compact(writer, words)
+    assert reader.read_changes() is None
+    assert len(reader.load()["vocabulary"]) == 200
+
+
+def test_read_changes_across_compactions(tmp_path):
+    """폴링 사이에 압축이 한 번이면 이어서 읽고, 두 번이면 전체를 다시 불러와야 함"""
+    writer = open_storage(tmp_path)
+    writer.load()
+    words = {}
+    add_words(writer, words, "a", 10)
+    reader = open_storage(tmp_path)
+    collections = reader.load()
+
+    add_words(writer, words, "b", 100)
+    compact(writer, words)
+    add_words(writer, words, "c", 5)
+    assert len(apply_read_changes(reader, collections)["vocabulary"]) == len(words) == 115
+
+    add_words(writer, words, "d", 100)
+    compact(writer, words)
+    add_words(writer, words, "e", 100)
+    compact(writer, words)
+    add_words(writer, words, "f", 5)
+    assert reader.read_changes() is None
+    collections = reader.load()
+    assert len(collections["vocabulary"]) == len(words) == 320
+
+    # 다시 불러온 뒤에는 평소처럼 이어서 읽음
+    add_words(writer, words, "g", 3)
+    assert len(apply_read_changes(reader, collections)["vocabulary"]) == 323
+
+
+def write_generations(path, count):
+    """버전 1..count를 차례로 저장 (path에는 count, path.1에는 count - 1 ...)"""
+    for version in range(1, count + 1):
+        write_json_atomic(str(path), {"version": version}, generations=3)
+
+
+def test_write_json_atomic_keeps_generations(tmp_path):
+    path = tmp_path / "vocabulary.json"
+    write_generations(path, 5)
+    assert [json.loads((tmp_path / name).read_text(encoding="utf-8"))["version"]
+            for name in ("vocabulary.json", "vocabulary.json.1", "vocabulary.json.2", "vocabulary.json.3")] == [5, 4, 3, 2]
+    assert sorted(os.listdir(tmp_path)) == ["vocabulary.json", "vocabulary.json.1", "vocabulary.json.2",
+                                            "vocabulary.json.3"]  # 임시 파일이 남지 않음
+
+
+def test_load_falls_back_to_previous_generation(tmp_path):
+    path = tmp_path / "vocabulary.json"
+    write_generations(path, 3)
+    path.write_text('{"version": 3, "trunc', encoding="utf-8")  # 쓰다 만 파일
+    assert load_json_with_fallback(str(path)) == {"version": 2}
+    (tmp_path / "vocabulary.json.1").write_bytes(b"\xff\xfe")
+    assert load_json_with_fallback(str(path)) == {"version": 1}
+    assert load_json_with_fallback(str(tmp_path / "missing.json")) is None
+
+
+def test_all_generations_corrupt_stops_load(tmp_path):
+    """모든 세대가 손상되었으면 빈 데이터 대신 예외를 올리고, 파일을 그대로 두어야 함"""
+    storage = open_storage(tmp_path)
+    storage.load()
+    add_words(storage, {}, "w", 10)
+    for word in ("a", "b", "c"):
+        storage.save_all({"vocabulary": {word: {"korean": "뜻", "category": ""}}, "quiz_stats": {}, "srs": {}})
+    for name in ("vocabulary.json", "vocabulary.json.1", "vocabulary.json.2"):
+        assert (tmp_path / name).exists()
+        (tmp_path / name).write_text("{", encoding="utf-8")
+    before = {name: (tmp_path / name).read_bytes() for name in os.listdir(tmp_path)}
+
+    with pytest.raises(CorruptSnapshotError):
+        open_storage(tmp_path).load()
+    with pytest.raises(CorruptSnapshotError):
+        load_json_with_fallback(str(tmp_path / "vocabulary.json"))
+    assert {name: (tmp_path / name).read_bytes() for name in os.listdir(tmp_path)} == before
+
+
+@pytest.mark.skipif(fcntl is None, reason="fcntl이 없는 플랫폼")
+def test_contended_file_lock_waits_through_offload(tmp_path):
+    """다른 프로세스가 잡은 잠금만 offload 함수에서 기다리고, 바로 잡히면 거치지 않아야 함"""
+    path = str(tmp_path / "journal.lock")
+    holder = FileLock(path)  # flock은 파일을 따로 열면 같은 프로세스 안에서도 배타적
+    calls = []
+
+    def offload(func, *args):
+        calls.append(func)
+        holder.release()
+        return func(*args)
+
+    waiter = FileLock(path, offload=offload)
+    holder.acquire()
+    waiter.acquire()
+    assert calls == [fcntl.flock]
+    waiter.release()
+    with waiter:
+        pass
+    assert calls == [fcntl.flock]
+
+
+def test_journal_writes_go_through_offload(tmp_path):
+    """비동기 모드에서 저널 추가와 스냅샷 쓰기는 offload 함수(네이티브 스레드 풀)에서 실행되어야 함"""
+    calls = []
+
+    def offload(func, *args):
+        calls.append(getattr(func, "__name__", ""))
+        return func(*args)
+
+    storage = open_storage(tmp_path, offload=offload)
+    storage.load()
+    words = {}
+    add_words(storage, words, "w", 2)
+    assert storage.save_all({"vocabulary": words})
+    assert "_write_and_flush" in calls and "_write_snapshot" in calls
+    assert sorted(open_storage(tmp_path).load()["vocabulary"]) == ["w0", "w1"]
@@ -0,0 +1,88 @@
+"""
+열 단위 단어장 저장소 테스트 (VocabStore, StatsView가 딕셔너리와 같게 동작하는지)
+`python -m pytest test_vocab_store.py`
+"""
+
+import pytest
+
+from vocab_store import COMPACT_MIN_HOLES, MAX_COUNT, VocabStore
+
+
+def word_data(korean, category=""):
+    return {"korean": korean, "category": category}
+
+
+def test_vocabulary_mapping_semantics():
+    """조회/수정/삭제와 순회 순서가 딕셔너리와 같아야 함"""
+    store = VocabStore({"apple": word_data("사과", "과일"), "dog": word_data("개", "동물")})
+    expected = {"apple": word_data("사과", "과일"), "dog": word_data("개", "동물")}
+    store["cat"] = expected["cat"] = word_data("고양이", "동물")
+    store["apple"] = expected["apple"] = word_data("사과나무", "식물")  # 수정은 순서 유지
+    del store["dog"]
+    del expected["dog"]
+
+    assert store == expected
+    assert list(store) == list(expected) == ["apple", "cat"]
+    assert list(store.items()) == list(expected.items())
+    assert len(store) == 2 and "dog" not in store
+    assert store.category("cat") == "동물"
+    assert store.get("dog") is None
+    with pytest.raises(KeyError):
+        store["dog"]
+    with pytest.raises(KeyError):
+        del store["dog"]
+
+
+def test_stats_mapping_semantics():
+    """통계는 단어장과 별개 컬렉션처럼 동작해야 함 (단어를 지워도 남고, 단어보다 먼저 들어올 수 있음)"""
+    store = VocabStore({"apple": word_data("사과")}, {"apple": [1, 2], "ghost": [5, 0]})
+    stats = store.stats
+    assert stats == {"apple": [1, 2], "ghost": [5, 0]}
+
+    store["ghost"] = word_data("유령")  # 먼저 들어온 통계가 열로 옮겨짐
+    stats["apple"] = [3, 2]
+    del store["apple"]
+    assert stats == {"ghost": [5, 0], "apple": [3, 2]}
+    assert len(stats) == 2
+
+    del stats["ghost"]
+    assert "ghost" not in stats and "ghost" in store
+    with pytest.raises(KeyError):
+        del stats["ghost"]
+
+
+@pytest.mark.parametrize("value", [[-1, 0], [MAX_COUNT + 1, 0], [1.5, 0], [1, 2, 3], True])
+def test_stats_outside_array_range_kept_as_is(value):
+    """배열에 담을 수 없는 값도 그대로 저장하고 돌려줘야 함"""
+    store = VocabStore({"apple": word_data("사과")})
+    store.stats["apple"] = value
+    assert store.stats["apple"] == value
+    store.stats["apple"] = [1, 1]
+    assert store.stats == {"apple": [1, 1]}
+
+
+def test_compaction_keeps_order_and_stats():
+    """삭제된 행이 많아져 열을 다시 만들어도 순서와 통계가 그대로여야 함"""
+    count = COMPACT_MIN_HOLES * 3
+    store = VocabStore(((f"w{i}", word_data(f"뜻{i}")) for i in range(count)),
+                       {f"w{i}": [i, 0] for i in range(0, count, 7)})
+    for i in range(count):
+        if i % 4:
+            del store[f"w{i}"]
+    assert len(store._words) < count  # 정리됨
+    kept = [f"w{i}" for i in range(0, count, 4)]
+    assert list(store) == kept
+    assert store[kept[-1]] == word_data(f"뜻{count - 4}")
+    assert store.stats["w28"] == [28, 0] and store.stats["w7"] == [7, 0]
+
+
+def test_copy_is_independent():
+    store = VocabStore({"apple": word_data("사과", "과일")}, {"apple": [1, 0]})
+    clone = store.copy()
+    store["apple"] = word_data("능금", "과일")
+    store.stats["apple"] = [9, 9]
+    store["pear"] = word_data("배")
+
+    assert clone == {"apple": word_data("사과", "과일")}
+    assert clone.stats == {"apple": [1, 0]}
+    assert store.stats.copy() == {"apple": [9, 9]}
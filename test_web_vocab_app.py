@@ -0,0 +1,282 @@
+"""
+웹 앱 테스트 (API, 채점)
+`python -m pytest test_web_vocab_app.py`
+"""
+
+import gzip
+import json
+
+import pytest
+
+import web_vocab_app
+from vocab_decks import Deck, DeckCache
+from vocab_events import ChangeFeed
+from vocab_storage import create_storage
+from web_vocab_app import grade_answer
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    """빈 작업 폴더(tmp_path)를 쓰는 테스트 클라이언트 (채점 결과는 바로 저장)"""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(web_vocab_app, "DECKS_DIR", str(tmp_path / "decks"))
+    monkeypatch.setattr(web_vocab_app, "STATS_FLUSH_INTERVAL", 0)
+    cache = DeckCache(web_vocab_app.open_deck)
+    monkeypatch.setattr(web_vocab_app, "decks", cache)
+    yield web_vocab_app.app.test_client()
+    for deck in cache.loaded():
+        deck.close()
+
+
+def add_word(client, english, korean, category="", api="/api"):
+    response = client.post(f"{api}/words", json={"english": english, "korean": korean, "category": category})
+    assert response.status_code == 200, response.get_json()
+
+
+@pytest.fixture
+def deck(tmp_path):
+    """단어 몇 개가 든 단어장 (채점 결과는 바로 저장)"""
+    words = {"apple": {"korean": "사과", "category": "fruit"}}
+    (tmp_path / "vocabulary.json").write_text(json.dumps(words, ensure_ascii=False), encoding="utf-8")
+    storage = create_storage(
+        "journal",
+        {name: str(tmp_path / f"{name}.json") for name in ("vocabulary", "quiz_stats", "srs")},
+        journal_file=str(tmp_path / "vocab_journal.jsonl")
+    )
+    deck = Deck("test", storage, ChangeFeed(10), flush_interval=0)
+    deck.load()
+    return deck
+
+
+@pytest.mark.parametrize("quality", [True, False, 6, -1, 2.5, "3"])
+def test_grade_answer_rejects_invalid_quality(deck, quality):
+    graded, message, status = grade_answer(deck, {"word": "apple", "answer": "사과", "quality": quality})
+    assert graded is None and status == 400
+
+
+def test_grade_answer_accepts_quality(deck):
+    graded, _, status = grade_answer(deck, {"word": "apple", "answer": "사과", "quality": 5})
+    assert status == 200 and graded["quality"] == 5 and graded["is_correct"]
+
+
+def test_unreadable_deck_returns_503(client, tmp_path, monkeypatch):
+    """모든 스냅샷 세대가 손상되었으면 빈 단어장 대신 503을 응답하고 파일을 덮어쓰지 않아야 함"""
+    add_word(client, "apple", "사과")
+    web_vocab_app.decks.default.save()
+    web_vocab_app.decks.default.close()
+    (tmp_path / "vocabulary.json").write_text("{", encoding="utf-8")
+    monkeypatch.setattr(web_vocab_app, "decks", DeckCache(web_vocab_app.open_deck))  # 새 워커
+
+    assert client.get("/api/words").status_code == 503
+    assert client.post("/api/words", json={"english": "pear", "korean": "배"}).status_code == 503
+    assert client.get("/").status_code == 503
+    assert (tmp_path / "vocabulary.json").read_text(encoding="utf-8") == "{"
+
+
+def fetch_pages(client, limit, between_pages=None, url="/api/words"):
+    """cursor를 따라 끝까지 읽은 단어 목록 (페이지 사이마다 between_pages(페이지 번호) 호출)"""
+    words, cursor, page = [], "", 0
+    while True:
+        body = client.get(url, query_string={"limit": limit, "cursor": cursor}).get_json()
+        words += [item["english"] for item in body["words"]]
+        if body["next_cursor"] is None:
+            return words
+        cursor = body["next_cursor"]
+        page += 1
+        if between_pages is not None:
+            between_pages(page)
+
+
+def test_cursor_pagination_stable_across_inserts(client):
+    """페이지를 읽는 사이에 단어가 추가되어도 기존 단어는 빠지거나 두 번 나오지 않아야 함"""
+    original = [f"w{i:02d}" for i in range(0, 40, 2)]
+    for word in original:
+        add_word(client, word, "뜻")
+
+    inserted = []
+
+    def insert(page):
+        # 이미 읽은 범위 앞과 아직 읽지 않은 범위에 하나씩
+        for word in (f"a{page}", f"w{page * 8 + 1:02d}"):
+            add_word(client, word, "새 뜻")
+            inserted.append(word)
+
+    words = fetch_pages(client, 5, insert)
+    assert len(words) == len(set(words))
+    assert words == sorted(words)
+    assert set(original) <= set(words)
+    assert not any(word.startswith("a") for word in words)  # 커서 앞에 추가된 단어는 다음 페이지에 없음
+    assert fetch_pages(client, 7) == sorted(original + inserted)
+
+
+def test_word_list_ndjson_stream(client):
+    for word in ("pear", "apple", "fig"):
+        add_word(client, word, "과일", "fruit")
+    response = client.get("/api/words", query_string={"format": "ndjson", "cursor": "apple"})
+    assert response.mimetype == "application/x-ndjson"
+    lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert [line["english"] for line in lines] == ["fig", "pear"]
+    assert lines[0] == {"english": "fig", "korean": "과일", "category": "fruit"}
+
+
+def test_check_batch_partial_failure(client):
+    """채점할 수 없는 답안은 그 결과만 실패로 표시하고, 나머지는 채점해 통계를 한 번씩 기록해야 함"""
+    add_word(client, "apple", "사과")
+    add_word(client, "pear", "배")
+    response = client.post("/api/quiz/check/batch", json={"answers": [
+        {"word": "apple", "answer": "사과"},
+        {"word": "ghost", "answer": "유령"},
+        {"word": "pear", "answer": "감"},
+        "not an answer",
+        {"word": "", "answer": "사과"},
+        {"word": "apple", "answer": "사과"},
+    ]})
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body["success"] and body["correct"] == 2 and body["wrong"] == 1
+    results = body["results"]
+    assert [result["success"] for result in results] == [True, False, True, False, False, True]
+    assert results[1]["message"] == "단어를 찾을 수 없습니다."
+    assert results[4]["message"] == "단어를 입력해주세요."
+    assert results[2]["is_correct"] is False and results[2]["correct_answer"] == "배"
+    assert results[5]["stats"] == [2, 0]
+
+    stats = {item["word"]: item for item in client.get("/api/stats").get_json()}
+    assert (stats["apple"]["correct"], stats["apple"]["wrong"]) == (2, 0)
+    assert (stats["pear"]["correct"], stats["pear"]["wrong"]) == (0, 1)
+    assert "ghost" not in stats
+
+
+@pytest.mark.parametrize("body", [{}, {"answers": []}, {"answers": "apple"}, {"answers": [{}] * 101}])
+def test_check_batch_rejects_bad_request(client, body):
+    assert client.post("/api/quiz/check/batch", json=body).status_code == 400
+
+
+def test_quiz_batch_distinct_words(client):
+    for word in ("apple", "pear", "fig"):
+        add_word(client, word, "과일")
+    body = client.post("/api/quiz/batch", json={"count": 10}).get_json()
+    assert body["count"] == 3
+    assert sorted(question["word"] for question in body["questions"]) == ["apple", "fig", "pear"]
+    assert client.post("/api/quiz/batch", json={"count": 0}).status_code == 400
+
+
+def test_word_list_etag_not_modified(client):
+    """단어장이 바뀌지 않았으면 같은 ETag로 304를, 바뀌면 새 본문을 돌려줘야 함"""
+    add_word(client, "apple", "사과")
+    first = client.get("/api/words")
+    tag = first.headers["ETag"]
+    assert first.status_code == 200 and first.headers["Cache-Control"] == "no-cache"
+
+    cached = client.get("/api/words", headers={"If-None-Match": tag})
+    assert cached.status_code == 304 and cached.headers["ETag"] == tag and not cached.data
+
+    add_word(client, "pear", "배")
+    changed = client.get("/api/words", headers={"If-None-Match": tag})
+    assert changed.status_code == 200 and changed.headers["ETag"] != tag
+    assert len(changed.get_json()) == 2
+
+
+def test_large_response_gzip_negotiation(client):
+    """COMPRESS_MIN_BYTES를 넘는 응답은 gzip을 받는 클라이언트에만 압축하고, 압축본 ETag로도 304여야 함"""
+    for i in range(60):
+        add_word(client, f"word{i:02d}", f"뜻{i}", "긴 카테고리 이름")
+    plain = client.get("/api/words")
+    assert "Content-Encoding" not in plain.headers and len(plain.data) >= web_vocab_app.COMPRESS_MIN_BYTES
+
+    packed = client.get("/api/words", headers={"Accept-Encoding": "gzip"})
+    assert packed.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in packed.headers["Vary"]
+    assert packed.headers["ETag"] == plain.headers["ETag"][:-1] + '-gzip"'
+    assert gzip.decompress(packed.data) == plain.data
+
+    cached = client.get("/api/words", headers={"Accept-Encoding": "gzip", "If-None-Match": packed.headers["ETag"]})
+    assert cached.status_code == 304 and cached.headers["ETag"] == packed.headers["ETag"]
+
+    small = client.get("/api/words/word01", headers={"Accept-Encoding": "gzip"})
+    assert "Content-Encoding" not in small.headers
+
+
+def read_sse(response):
+    """SSE 본문을 (이벤트 이름, 번호, 데이터) 목록으로"""
+    messages = []
+    for block in response.get_data(as_text=True).split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines() if not line.startswith(":"))
+        if "event" in fields:
+            messages.append((fields["event"], fields.get("id"), json.loads(fields["data"])))
+    return messages
+
+
+def test_changes_since_version(client):
+    add_word(client, "apple", "사과")
+    version = client.get("/api/changes", query_string={"since": 0}).get_json()["version"]
+    add_word(client, "pear", "배")
+    client.delete("/api/words/apple")
+
+    body = client.get("/api/changes", query_string={"since": version}).get_json()
+    assert [(event["type"], event["word"]) for event in body["events"]] == [("word_added", "pear"), ("word_removed", "apple")]
+    assert body["version"] == body["events"][-1]["v"]
+    latest = client.get("/api/changes", query_string={"since": body["version"]}).get_json()
+    assert latest == {"version": body["version"], "events": []}
+    assert client.get("/api/changes", query_string={"since": "x"}).status_code == 400
+
+
+def test_changes_reset_when_since_too_old(client):
+    """버퍼에서 밀려난 번호부터는 이어 보낼 수 없으므로 reset을 알려야 함"""
+    web_vocab_app.decks.default.change_feed.max_events = 2  # 기본 단어장은 이미 열려 있으므로 EVENTS_BUFFER 대신
+    for word in ("apple", "pear", "fig", "kiwi"):
+        add_word(client, word, "과일")
+    body = client.get("/api/changes", query_string={"since": 1}).get_json()
+    assert body["reset"] is True and body["events"] == [] and body["version"] >= 4
+
+
+def test_event_stream_replays_backlog(client, monkeypatch):
+    """since / Last-Event-ID 이후 이벤트를 먼저 보낸 뒤 ready를 보내고, 너무 오래된 번호면 reset을 보내야 함"""
+    monkeypatch.setattr(web_vocab_app, "EVENTS_STREAM_SECONDS", 0)
+    web_vocab_app.decks.default.change_feed.max_events = 3
+    add_word(client, "apple", "사과")
+    version = client.get("/api/changes", query_string={"since": 0}).get_json()["version"]
+    add_word(client, "pear", "배")
+    assert client.put("/api/words/apple", json={"english": "apple", "korean": "능금"}).status_code == 200
+
+    messages = read_sse(client.get("/api/events", query_string={"since": version}))
+    assert [(name, data.get("word")) for name, _, data in messages] == [
+        ("change", "pear"), ("change", "apple"), ("ready", None)]
+    assert messages[1][2]["type"] == "word_updated" and messages[1][2]["data"]["korean"] == "능금"
+    assert messages[-1][1] == messages[1][1] == str(messages[-1][2]["version"])
+
+    resumed = read_sse(client.get("/api/events", headers={"Last-Event-ID": messages[0][1]}))
+    assert [name for name, _, _ in resumed] == ["change", "ready"]
+
+    for word in ("fig", "kiwi", "plum"):
+        add_word(client, word, "과일")
+    reset = read_sse(client.get("/api/events", query_string={"since": version}))
+    assert [name for name, _, _ in reset] == ["reset", "ready"]
+    assert reset[0][2]["version"] == reset[1][2]["version"]
+
+
+def test_decks_are_isolated(client):
+    """기본 단어장(/api)과 이름 있는 단어장(/api/decks/<id>)은 단어, 통계, 변경 이벤트를 따로 가져야 함"""
+    assert client.get("/api/decks/alice/words").status_code == 404  # 만들기 전
+    assert client.post("/api/decks", json={"id": "alice"}).get_json()["api"] == "/api/decks/alice"
+    assert client.post("/api/decks", json={"id": "alice"}).status_code == 409
+    assert client.post("/api/decks", json={"id": "../x"}).status_code == 400
+
+    add_word(client, "apple", "사과")
+    add_word(client, "pear", "배", api="/api/decks/alice")
+    add_word(client, "apple", "능금", api="/api/decks/alice")  # 같은 단어도 따로
+    assert [item["english"] for item in client.get("/api/words").get_json()] == ["apple"]
+    assert {item["english"] for item in client.get("/api/decks/alice/words").get_json()} == {"apple", "pear"}
+    assert client.get("/api/decks/alice/words/apple").get_json()["korean"] == "능금"
+    assert client.get("/api/words/pear").status_code == 404
+
+    client.post("/api/decks/alice/quiz/check", json={"word": "apple", "answer": "능금"})
+    assert client.get("/api/stats").get_json() == []
+    assert [item["word"] for item in client.get("/api/decks/alice/stats").get_json()] == ["apple"]
+
+    changes = client.get("/api/changes", query_string={"since": 0}).get_json()["events"]
+    assert [event["word"] for event in changes] == ["apple"]
+
+    client.delete("/api/decks/alice/words/apple")
+    assert client.get("/api/words/apple").status_code == 200
+    assert {deck["id"] for deck in client.get("/api/decks").get_json()["decks"]} == {"alice"}
@@ -0,0 +1,65 @@
+"""
+비동기 서버 모드 (gevent) 도구
+SERVER_MODE=async로 gunicorn을 실행하면 gevent 워커가 요청마다 스레드 대신 그린렛을 사용합니다
+(gunicorn.conf.py 참고). 웹 앱 코드는 그대로이며, threading/socket/time.sleep 등은
+gevent가 협력형으로 바꿔 주므로 느린 클라이언트나 이벤트 스트림(SSE)이 워커를 붙잡지 않습니다.
+
+- is_async_mode(): gevent가 threading을 바꿔 놓은 상태인지 (gevent 워커 안에서 True)
+- run_in_thread(): 오래 걸리는 CPU/디스크 작업을 gevent의 네이티브 스레드 풀에서 실행
+  (스냅샷 압축처럼 이벤트 루프를 오래 막는 작업용, 동기 모드에서는 그냥 호출)
+- start_native_thread(), native_sleep(): 그린렛이 아닌 OS 스레드와 그 안에서 쓸 sleep
+  (요청 처리가 CPU를 붙잡고 있어도 정해진 간격으로 돌아야 하는 샘플링 프로파일러용)
+"""
+
+import threading
+import time
+from typing import Any, Callable
+
+try:
+    from gevent import monkey  # 선택 의존성 (비동기 모드에서만 필요)
+except ImportError:
+    monkey = None
+
+
+def is_async_mode() -> bool:
+    """gevent 워커 안에서 실행 중인지 (threading 모듈이 gevent로 바뀌었는지)"""
+    return monkey is not None and monkey.is_module_patched("threading")
+
+
+def run_in_thread(func: Callable, *args) -> Any:
+    """
+    함수를 네이티브 스레드에서 실행하고 결과 돌려받기
+
+    gevent 모드에서는 호출한 그린렛만 기다리고 다른 요청은 계속 처리됩니다.
+    func 안에서는 잠금(threading.Lock 등)을 쓰지 말아야 합니다 (gevent 잠금은 스레드 간에 안전하지 않음).
+
+    Args:
+        func: 실행할 함수
+        *args: func 인자
+    """
+    if not is_async_mode():
+        return func(*args)
+    import gevent
+    return gevent.get_hub().threadpool.apply(func, args)
+
+
+def start_native_thread(func: Callable, *args) -> None:
+    """
+    OS 스레드에서 func 실행 (데몬)
+
+    gevent 모드에서 threading.Thread는 그린렛이 되어 다른 요청이 양보할 때만 실행되므로,
+    원래의 스레드 생성 함수를 사용합니다. func 안에서는 gevent 잠금과 time.sleep 대신
+    native_sleep()을 써야 합니다.
+    """
+    if not is_async_mode():
+        threading.Thread(target=func, args=args, daemon=True).start()
+        return
+    monkey.get_original("_thread", "start_new_thread")(func, args)
+
+
+def native_sleep(seconds: float) -> None:
+    """start_native_thread()로 만든 스레드 안에서 쓰는 sleep (gevent 모드에서도 실제로 잠듦)"""
+    if is_async_mode():
+        monkey.get_original("time", "sleep")(seconds)
+    else:
+        time.sleep(seconds)
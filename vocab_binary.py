@@ -0,0 +1,348 @@
+"""
+단어장 바이너리 스냅샷 형식 (vocabulary.bin)
+JSON 스냅샷 대신 사용할 수 있는 압축된 읽기 전용 형식입니다.
+
+파일 전체를 파싱하지 않고 mmap으로 열어 필요한 단어만 이진 탐색으로 찾으므로,
+저장소 불러오기(JournalStorage.load())는 단어 수와 거의 무관하고, 단어 데이터 원본은
+워커마다 딕셔너리로 만들지 않고 여러 워커 프로세스가 같은 페이지를 공유합니다.
+
+검색/퀴즈/통계 인덱스(vocab_index.py)는 불러올 때가 아니라 각 인덱스를 처음 쓸 때(vocab_decks.DeckIndex)
+모든 단어를 한 번 읽어 워커마다 만듭니다. 단어 조회/추가/채점만 하는 워커는 인덱스 메모리를 쓰지 않고,
+목록/검색/퀴즈를 쓰면 그 인덱스 몫만큼은 JSON 스냅샷과 마찬가지로 단어 수에 비례합니다.
+
+파일 구성 (리틀 엔디언):
+    머리글   HEADER: 매직, 버전, 단어 수, 통계 수, 각 구역 위치, 파일 크기
+    색인     단어 수 × ENTRY: (문자열 위치, 영어/뜻/카테고리 바이트 길이), 영어 단어 정렬 순서
+    문자열   영어 + 뜻 + 카테고리 UTF-8 바이트를 이어 붙인 것
+    통계     단어 수 × STATS: (맞은 횟수, 틀린 횟수), 기록이 없으면 (-1, -1)
+
+UTF-8 바이트 순서는 유니코드 코드 포인트 순서와 같으므로, 파이썬 문자열 정렬 순서로 이진 탐색합니다.
+"""
+
+import heapq
+import mmap
+import struct
+from collections.abc import ItemsView, Mapping, MutableMapping, ValuesView
+from operator import itemgetter
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+MAGIC = b"VOCB"
+FORMAT_VERSION = 1
+# 매직, 버전, 단어 수, 통계 수, 색인 위치, 문자열 위치, 통계 위치, 파일 크기
+HEADER = struct.Struct("<4sIIIQQQQ")
+# 문자열 위치(문자열 구역 기준), 영어/뜻/카테고리 바이트 길이
+ENTRY = struct.Struct("<IHHH")
+WORD_HEAD = struct.Struct("<IH")  # ENTRY의 앞부분 (이진 탐색용)
+STATS = struct.Struct("<ii")
+MAX_FIELD_BYTES = 0xFFFF
+# 바이너리 파일 하나에 함께 저장하는 컬렉션 (나머지는 JSON 스냅샷)
+BINARY_COLLECTIONS = ("vocabulary", "quiz_stats")
+
+
+def write_deck(f: BinaryIO, vocabulary: Mapping, quiz_stats: Mapping) -> int:
+    """
+    단어장과 퀴즈 통계를 바이너리 형식으로 쓰기
+
+    단어장에 없는 단어의 통계는 저장하지 않습니다.
+
+    Args:
+        f: 바이너리 모드로 연 파일
+        vocabulary: {word: {"korean", "category"}}
+        quiz_stats: {word: [correct, wrong]}
+
+    Returns:
+        int: 저장한 단어 수
+
+    Raises:
+        ValueError: 필드 하나가 65535바이트를 넘는 경우
+    """
+    entries = bytearray()
+    strings = bytearray()
+    stats = bytearray()
+    stats_count = 0
+    items = sorted(vocabulary.items(), key=itemgetter(0))
+    for word, data in items:
+        fields = [
+            word.encode("utf-8"),
+            (data.get("korean") or "").encode("utf-8"),
+            (data.get("category") or "").encode("utf-8")
+        ]
+        if max(len(field) for field in fields) > MAX_FIELD_BYTES:
+            raise ValueError(f"단어 데이터가 너무 깁니다: {word}")
+        entries += ENTRY.pack(len(strings), *(len(field) for field in fields))
+        for field in fields:
+            strings += field
+        record = quiz_stats.get(word)
+        if record is None:
+            stats += STATS.pack(-1, -1)
+        else:
+            stats += STATS.pack(int(record[0]), int(record[1]))
+            stats_count += 1
+
+    index_offset = HEADER.size
+    strings_offset = index_offset + len(entries)
+    stats_offset = strings_offset + len(strings)
+    file_size = stats_offset + len(stats)
+    f.write(HEADER.pack(MAGIC, FORMAT_VERSION, len(items), stats_count,
+                        index_offset, strings_offset, stats_offset, file_size))
+    f.write(entries)
+    f.write(strings)
+    f.write(stats)
+    return len(items)
+
+
+class BinaryDeck(Mapping):
+    """
+    mmap으로 연 바이너리 단어장 ({word: {"korean", "category"}} 읽기 전용 매핑)
+
+    조회는 O(log n) 이진 탐색이고, 값은 읽을 때마다 새 딕셔너리로 만듭니다.
+    순회는 영어 단어 정렬 순서입니다. 퀴즈 통계는 stats 속성으로 읽습니다.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: 바이너리 파일 경로
+
+        Raises:
+            ValueError: 형식이 맞지 않거나 잘린 파일
+            OSError: 파일을 열 수 없는 경우
+        """
+        self.path = path
+        with open(path, "rb") as f:
+            # 빈 파일은 mmap이 ValueError를 냄
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._read_header()
+        except ValueError:
+            self._mm.close()
+            raise
+        self.stats = DeckStats(self)
+
+    def _read_header(self) -> None:
+        if len(self._mm) < HEADER.size:
+            raise ValueError(f"바이너리 단어장이 잘렸습니다: {self.path}")
+        (magic, version, count, stats_count, index_offset, strings_offset,
+         stats_offset, file_size) = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"바이너리 단어장 형식이 아닙니다: {self.path}")
+        if (file_size != len(self._mm) or index_offset + count * ENTRY.size != strings_offset
+                or stats_offset + count * STATS.size != file_size or strings_offset > stats_offset):
+            raise ValueError(f"바이너리 단어장이 손상되었습니다: {self.path}")
+        self._count = count
+        self._stats_count = stats_count
+        self._index_offset = index_offset
+        self._strings_offset = strings_offset
+        self._stats_offset = stats_offset
+
+    def close(self) -> None:
+        self._mm.close()
+
+    def _entry(self, i: int) -> Tuple[int, int, int, int]:
+        """i번째 단어의 (문자열 절대 위치, 영어/뜻/카테고리 길이)"""
+        offset, word_len, korean_len, category_len = ENTRY.unpack_from(
+            self._mm, self._index_offset + i * ENTRY.size
+        )
+        return self._strings_offset + offset, word_len, korean_len, category_len
+
+    def _word_bytes(self, i: int) -> bytes:
+        start, word_len, _, _ = self._entry(i)
+        return self._mm[start:start + word_len]
+
+    def _value(self, start: int, word_len: int, korean_len: int, category_len: int) -> Dict[str, str]:
+        korean_start = start + word_len
+        category_start = korean_start + korean_len
+        return {
+            "korean": self._mm[korean_start:category_start].decode("utf-8"),
+            "category": self._mm[category_start:category_start + category_len].decode("utf-8")
+        }
+
+    def find(self, word: Any) -> int:
+        """
+        단어의 색인 번호 (이진 탐색)
+
+        Returns:
+            int: 색인 번호, 없으면 -1
+        """
+        if not isinstance(word, str):
+            return -1
+        key = word.encode("utf-8")
+        mm = self._mm
+        unpack_from = WORD_HEAD.unpack_from
+        index_offset = self._index_offset
+        strings_offset = self._strings_offset
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            offset, word_len = unpack_from(mm, index_offset + mid * ENTRY.size)
+            start = strings_offset + offset
+            if mm[start:start + word_len] < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self._count and self._word_bytes(lo) == key:
+            return lo
+        return -1
+
+    def __getitem__(self, word: str) -> Dict[str, str]:
+        i = self.find(word)
+        if i < 0:
+            raise KeyError(word)
+        return self._value(*self._entry(i))
+
+    def __contains__(self, word: object) -> bool:
+        return self.find(word) >= 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[str]:
+        for i in range(self._count):
+            yield self._word_bytes(i).decode("utf-8")
+
+    def iter_items(self) -> Iterator[Tuple[str, Dict[str, str]]]:
+        """(단어, 데이터)를 정렬 순서로 (단어마다 이진 탐색하지 않음)"""
+        for i in range(self._count):
+            start, word_len, korean_len, category_len = self._entry(i)
+            yield (self._mm[start:start + word_len].decode("utf-8"),
+                   self._value(start, word_len, korean_len, category_len))
+
+    def items(self) -> ItemsView:
+        return IterItemsView(self)
+
+    def values(self) -> ValuesView:
+        return IterValuesView(self)
+
+    def stats_at(self, i: int) -> Optional[List[int]]:
+        """i번째 단어의 [맞은 횟수, 틀린 횟수] (기록이 없으면 None)"""
+        correct, wrong = STATS.unpack_from(self._mm, self._stats_offset + i * STATS.size)
+        return None if correct < 0 else [correct, wrong]
+
+
+class DeckStats(Mapping):
+    """바이너리 단어장의 퀴즈 통계 열 ({word: [correct, wrong]} 읽기 전용 매핑)"""
+
+    def __init__(self, deck: BinaryDeck):
+        self._deck = deck
+
+    def __getitem__(self, word: str) -> List[int]:
+        i = self._deck.find(word)
+        record = self._deck.stats_at(i) if i >= 0 else None
+        if record is None:
+            raise KeyError(word)
+        return record
+
+    def __len__(self) -> int:
+        return self._deck._stats_count
+
+    def __iter__(self) -> Iterator[str]:
+        for word, _ in self.iter_items():
+            yield word
+
+    def iter_items(self) -> Iterator[Tuple[str, List[int]]]:
+        deck = self._deck
+        for i in range(len(deck)):
+            record = deck.stats_at(i)
+            if record is not None:
+                yield deck._word_bytes(i).decode("utf-8"), record
+
+    def items(self) -> ItemsView:
+        return IterItemsView(self)
+
+    def values(self) -> ValuesView:
+        return IterValuesView(self)
+
+
+class OverlayMapping(MutableMapping):
+    """
+    읽기 전용 매핑 위에 바뀐 항목만 딕셔너리로 보관하는 매핑
+
+    저널을 재적용하거나 단어를 추가/삭제해도 기본 매핑(BinaryDeck 등)은 그대로 두고,
+    바뀐 값과 삭제된 키만 메모리에 둡니다. 기본 매핑이 정렬 순서로 순회하면 이 매핑도 정렬 순서입니다.
+    """
+
+    def __init__(self, base: Mapping, changes: Optional[Dict] = None, deleted: Optional[set] = None,
+                 length: Optional[int] = None):
+        self.base = base
+        self._changes: Dict = dict(changes or {})
+        self._deleted: set = set(deleted or ())  # 기본 매핑에 있지만 삭제된 키
+        self._len = len(base) if length is None else length
+
+    def __getitem__(self, key):
+        if key in self._changes:
+            return self._changes[key]
+        if key in self._deleted:
+            raise KeyError(key)
+        return self.base[key]
+
+    def __contains__(self, key: object) -> bool:
+        if key in self._changes:
+            return True
+        return key not in self._deleted and key in self.base
+
+    def __setitem__(self, key, value) -> None:
+        if key not in self._changes:
+            if key in self._deleted:
+                self._deleted.discard(key)
+                self._len += 1
+            elif key not in self.base:
+                self._len += 1
+        self._changes[key] = value
+
+    def __delitem__(self, key) -> None:
+        if key in self._changes:
+            del self._changes[key]
+            if key in self.base:
+                self._deleted.add(key)
+        elif key in self._deleted or key not in self.base:
+            raise KeyError(key)
+        else:
+            self._deleted.add(key)
+        self._len -= 1
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator:
+        for key, _ in self.iter_items():
+            yield key
+
+    def iter_items(self) -> Iterator[Tuple[Any, Any]]:
+        """기본 매핑과 바뀐 항목을 합쳐 (키, 값) 순회"""
+        changes = self._changes
+        deleted = self._deleted
+        base_items = self.base.items()
+        if changes or deleted:
+            base_items = ((key, value) for key, value in base_items
+                          if key not in changes and key not in deleted)
+        if not changes:
+            return iter(base_items)
+        return heapq.merge(base_items, sorted(changes.items(), key=itemgetter(0)), key=itemgetter(0))
+
+    def items(self) -> ItemsView:
+        return IterItemsView(self)
+
+    def values(self) -> ValuesView:
+        return IterValuesView(self)
+
+    def copy(self) -> "OverlayMapping":
+        """기본 매핑을 공유하는 얕은 복사 (바뀐 항목 수에만 비례)"""
+        return OverlayMapping(self.base, self._changes, self._deleted, self._len)
+
+    @property
+    def change_count(self) -> int:
+        """기본 매핑과 달라진 키 수"""
+        return len(self._changes) + len(self._deleted)
+
+
+class IterItemsView(ItemsView):
+    """매핑의 iter_items()로 순회하는 items() (키마다 다시 찾지 않음, vocab_store.py에서도 사용)"""
+
+    def __iter__(self):
+        return iter(self._mapping.iter_items())
+
+
+class IterValuesView(ValuesView):
+    def __iter__(self):
+        for _, value in self._mapping.iter_items():
+            yield value
@@ -1,20 +1,50 @@
 """
 영어 단어장 프로그램
-기본 기능: 단어 추가, 목록 보기, 파일 저장/불러오기, 퀴즈
+기본 기능: 단어 추가, 목록 보기, 파일 저장/불러오기, 퀴즈, 간격 반복 복습, 일괄 가져오기/내보내기
 """
 
-import json
+import csv
 import random
 import os
+import time
+
+from vocab_scheduler import SRSScheduler, review, quality_from_result
+from vocab_io import FORMATS, detect_format, iter_import_rows, export_chunks
+from vocab_storage import write_json_atomic, load_json_with_fallback
 
 # 단어장을 저장할 딕셔너리 (영어 단어: 한국어 뜻)
 vocabulary = {}
 # 퀴즈 통계를 저장할 딕셔너리 (영어 단어: [맞춘 횟수, 틀린 횟수])
 quiz_stats = {}
+# 간격 반복 복습 상태 (영어 단어: {interval, ease, reps, due})
+srs_state = {}
+# 다음에 복습할 단어를 찾는 복습 큐
+scheduler = SRSScheduler()
+# 파일을 읽지 못했는지 (손상된 파일을 빈 단어장으로 덮어쓰지 않도록 저장하지 않음)
+load_failed = False
 
 # 파일 이름
 VOCAB_FILE = "vocabulary.json"
 STATS_FILE = "quiz_stats.json"
+SRS_FILE = "srs_state.json"
+
+def rebuild_scheduler():
+    """단어장과 복습 상태로 복습 큐 다시 만들기"""
+    global scheduler
+    scheduler = SRSScheduler()
+    for word in vocabulary:
+        scheduler.update(word, "", srs_state.get(word))
+
+def record_result(word, is_correct):
+    """퀴즈 결과를 통계와 복습 일정에 반영"""
+    if word not in quiz_stats:
+        quiz_stats[word] = [0, 0]
+    if is_correct:
+        quiz_stats[word][0] += 1  # 맞춘 횟수 증가
+    else:
+        quiz_stats[word][1] += 1  # 틀린 횟수 증가
+    srs_state[word] = review(srs_state.get(word), quality_from_result(is_correct))
+    scheduler.update(word, "", srs_state[word])
 
 def add_word():
     """단어 추가 함수"""
@@ -23,6 +53,7 @@ def add_word():
     
     if english and korean:
         vocabulary[english] = korean
+        scheduler.update(english, "", srs_state.get(english))
         print(f"[OK] '{english}' 단어가 추가되었습니다!")
     else:
         print("[ERROR] 단어와 뜻을 모두 입력해주세요.")
@@ -60,18 +91,22 @@ def delete_word():
         del vocabulary[word]
         if word in quiz_stats:
             del quiz_stats[word]
+        srs_state.pop(word, None)
+        scheduler.remove(word)
         print(f"[OK] '{word}' 단어가 삭제되었습니다.")
     else:
         print(f"[ERROR] '{word}' 단어를 찾을 수 없습니다.")
 
 def save_to_file():
     """단어장을 파일에 저장하는 함수"""
+    if load_failed:
+        print("[ERROR] 파일을 불러오지 못해 저장하지 않습니다. 파일을 복구한 뒤 다시 불러오세요. (메뉴 9)")
+        return False
     try:
-        with open(VOCAB_FILE, 'w', encoding='utf-8') as f:
-            json.dump(vocabulary, f, ensure_ascii=False, indent=2)
-        
-        with open(STATS_FILE, 'w', encoding='utf-8') as f:
-            json.dump(quiz_stats, f, ensure_ascii=False, indent=2)
+        # 저장 도중 종료되어도 기존 파일이 깨지지 않음 (이전 파일은 .1, .2 ... 로 보관)
+        write_json_atomic(VOCAB_FILE, vocabulary)
+        write_json_atomic(STATS_FILE, quiz_stats)
+        write_json_atomic(SRS_FILE, srs_state)
         
         print(f"[OK] 파일 저장 완료! (단어: {len(vocabulary)}개)")
         return True
@@ -81,21 +116,30 @@ def save_to_file():
 
 def load_from_file():
     """파일에서 단어장을 불러오는 함수"""
-    global vocabulary, quiz_stats
+    global vocabulary, quiz_stats, srs_state, load_failed
     
     try:
-        if os.path.exists(VOCAB_FILE):
-            with open(VOCAB_FILE, 'r', encoding='utf-8') as f:
-                vocabulary = json.load(f)
+        # 파일이 손상되었으면 이전 세대(.1, .2 ...)를 불러옴
+        data = load_json_with_fallback(VOCAB_FILE)
+        if isinstance(data, dict):
+            vocabulary = data
             print(f"[OK] 단어장 불러오기 완료! (단어: {len(vocabulary)}개)")
         
-        if os.path.exists(STATS_FILE):
-            with open(STATS_FILE, 'r', encoding='utf-8') as f:
-                quiz_stats = json.load(f)
+        data = load_json_with_fallback(STATS_FILE)
+        if isinstance(data, dict):
+            quiz_stats = data
             print(f"[OK] 퀴즈 통계 불러오기 완료!")
         
+        data = load_json_with_fallback(SRS_FILE)
+        if isinstance(data, dict):
+            srs_state = data
+        
+        rebuild_scheduler()
+        load_failed = False
         return True
     except Exception as e:
+        # 모든 세대가 손상된 경우 등
+        load_failed = True
         print(f"[ERROR] 파일 불러오기 실패: {e}")
         return False
 
@@ -120,15 +164,11 @@ def quiz_english_to_korean():
     if user_answer == correct_answer:
         print(f"[OK] 정답입니다! '{word}' → '{correct_answer}'")
         # 통계 업데이트
-        if word not in quiz_stats:
-            quiz_stats[word] = [0, 0]
-        quiz_stats[word][0] += 1  # 맞춘 횟수 증가
+        record_result(word, True)
     else:
         print(f"[WRONG] 틀렸습니다. 정답은 '{correct_answer}' 입니다.")
         # 통계 업데이트
-        if word not in quiz_stats:
-            quiz_stats[word] = [0, 0]
-        quiz_stats[word][1] += 1  # 틀린 횟수 증가
+        record_result(word, False)
     
     print("="*40 + "\n")
 
@@ -154,18 +194,104 @@ def quiz_korean_to_english():
     if user_answer == correct_answer:
         print(f"[OK] 정답입니다! '{korean_meaning}' → '{correct_answer}'")
         # 통계 업데이트
-        if word not in quiz_stats:
-            quiz_stats[word] = [0, 0]
-        quiz_stats[word][0] += 1  # 맞춘 횟수 증가
+        record_result(word, True)
     else:
         print(f"[WRONG] 틀렸습니다. 정답은 '{correct_answer}' 입니다.")
         # 통계 업데이트
-        if word not in quiz_stats:
-            quiz_stats[word] = [0, 0]
-        quiz_stats[word][1] += 1  # 틀린 횟수 증가
+        record_result(word, False)
     
     print("="*40 + "\n")
 
+def quiz_review():
+    """간격 반복 복습 퀴즈 (복습 시각이 된 단어부터 영어 → 한글)"""
+    if not vocabulary:
+        print("[INFO] 퀴즈를 하려면 먼저 단어를 추가해주세요.")
+        return
+    
+    # 복습 큐에서 가장 먼저 복습할 단어 선택
+    word, due = scheduler.next_word()
+    correct_answer = vocabulary[word]
+    
+    print("\n" + "="*40)
+    print("복습 퀴즈 (간격 반복)")
+    print("="*40)
+    if due > time.time():
+        print("[INFO] 지금 복습할 단어가 없어 다음 복습 단어를 미리 냅니다.")
+    print(f"영어 단어: {word}")
+    
+    user_answer = input("한국어 뜻을 입력하세요: ").strip()
+    
+    if user_answer == correct_answer:
+        print(f"[OK] 정답입니다! '{word}' → '{correct_answer}'")
+        record_result(word, True)
+    else:
+        print(f"[WRONG] 틀렸습니다. 정답은 '{correct_answer}' 입니다.")
+        record_result(word, False)
+    
+    print(f"다음 복습: {srs_state[word]['interval']}일 후")
+    print("="*40 + "\n")
+
+def import_words():
+    """CSV/TSV/NDJSON 파일에서 단어 일괄 가져오기 (이미 있는 단어는 건너뜀)"""
+    path = input("가져올 파일 경로를 입력하세요: ").strip()
+    fmt = detect_format(path)
+    if fmt is None:
+        fmt = input(f"파일 형식을 입력하세요 ({'/'.join(FORMATS)}): ").strip().lower()
+    if fmt not in FORMATS:
+        print("[ERROR] 지원하지 않는 파일 형식입니다.")
+        return
+    
+    imported = 0
+    errors = 0
+    try:
+        with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+            for line_num, word, error_message in iter_import_rows(f, fmt):
+                if word is not None and word["english"] in vocabulary:
+                    error_message = f"'{word['english']}' 단어가 이미 존재합니다."
+                    word = None
+                if word is None:
+                    errors += 1
+                    print(f"[SKIP] {line_num}번째 줄: {error_message}")
+                    continue
+                vocabulary[word["english"]] = word["korean"]
+                scheduler.update(word["english"], "", srs_state.get(word["english"]))
+                imported += 1
+    except (OSError, UnicodeDecodeError, csv.Error) as e:
+        # 오류가 난 줄 전까지 읽은 단어는 이미 추가됨
+        print(f"[ERROR] 파일 읽기 실패: {e} (가져온 단어: {imported}개)")
+        return
+    
+    print(f"[OK] {imported}개 단어를 가져왔습니다. (건너뜀: {errors}개)")
+
+def export_words():
+    """단어장을 CSV/TSV/NDJSON 파일로 내보내기"""
+    path = input("내보낼 파일 경로를 입력하세요 (예: words.csv): ").strip()
+    fmt = detect_format(path)
+    if fmt is None:
+        print(f"[ERROR] 파일 확장자는 {', '.join(FORMATS)} 중 하나여야 합니다.")
+        return
+    
+    def chunks(size=500):
+        chunk = []
+        for english, value in vocabulary.items():
+            if isinstance(value, dict):
+                chunk.append({"english": english, "korean": value.get("korean", ""), "category": value.get("category", "")})
+            else:
+                chunk.append({"english": english, "korean": value, "category": ""})
+            if len(chunk) >= size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+    
+    try:
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            for text in export_chunks(chunks(), fmt):
+                f.write(text)
+        print(f"[OK] {len(vocabulary)}개 단어를 '{path}'에 내보냈습니다.")
+    except OSError as e:
+        print(f"[ERROR] 파일 쓰기 실패: {e}")
+
 def show_quiz_stats():
     """퀴즈 통계 보기"""
     if not quiz_stats:
@@ -203,10 +329,13 @@ def main_menu():
         print("7. 퀴즈 통계 보기")
         print("8. 파일 저장")
         print("9. 파일 불러오기")
+        print("10. 복습 퀴즈 (간격 반복)")
+        print("11. 단어 가져오기 (CSV/TSV/NDJSON)")
+        print("12. 단어 내보내기 (CSV/TSV/NDJSON)")
         print("0. 종료")
         print("="*40)
         
-        choice = input("선택하세요 (0-9): ").strip()
+        choice = input("선택하세요 (0-12): ").strip()
         
         if choice == "1":
             add_word()
@@ -226,6 +355,12 @@ def main_menu():
             save_to_file()
         elif choice == "9":
             load_from_file()
+        elif choice == "10":
+            quiz_review()
+        elif choice == "11":
+            import_words()
+        elif choice == "12":
+            export_words()
         elif choice == "0":
             # 종료 전에 파일 저장 확인
             if vocabulary:
@@ -235,7 +370,7 @@ def main_menu():
             print("[BYE] 프로그램을 종료합니다. 안녕히 가세요!")
             break
         else:
-            print("[ERROR] 잘못된 선택입니다. 0-9 중에서 선택해주세요.")
+            print("[ERROR] 잘못된 선택입니다. 0-12 중에서 선택해주세요.")
 
 # 프로그램 시작
 if __name__ == "__main__":
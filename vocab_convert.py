@@ -0,0 +1,59 @@
+"""
+스냅샷 형식 변환 도구
+JSON 스냅샷(vocabulary.json, quiz_stats.json)과 바이너리 스냅샷(vocabulary.bin)을 서로 변환합니다.
+
+저널까지 반영한 현재 상태 전체를 새 형식으로 저장하고 저널을 비우므로,
+웹 앱이 실행 중이어도 사용할 수 있습니다 (journal 저장소 전용).
+
+실행 방법:
+    python vocab_convert.py            # JSON → vocabulary.bin
+    python vocab_convert.py --to-json  # vocabulary.bin → JSON (vocabulary.bin 삭제)
+"""
+
+import logging
+import sys
+
+from vocab_storage import JournalStorage
+
+VOCAB_FILE = "vocabulary.json"
+STATS_FILE = "quiz_stats.json"
+SRS_FILE = "srs_state.json"
+JOURNAL_FILE = "vocab_journal.jsonl"
+BINARY_FILE = "vocabulary.bin"
+
+
+def convert(to_binary: bool = True) -> bool:
+    """
+    현재 폴더의 단어장 스냅샷 형식 바꾸기
+
+    Args:
+        to_binary: True면 바이너리, False면 JSON 형식으로
+
+    Returns:
+        bool: 변환 성공 여부
+    """
+    storage = JournalStorage(
+        {"vocabulary": VOCAB_FILE, "quiz_stats": STATS_FILE, "srs": SRS_FILE},
+        journal_file=JOURNAL_FILE,
+        binary_file=BINARY_FILE
+    )
+    return storage.convert_snapshot(binary=to_binary)
+
+
+def main() -> int:
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    args = sys.argv[1:]
+    if args not in ([], ["--to-json"]):
+        print(__doc__)
+        return 2
+    to_binary = not args
+    if not convert(to_binary):
+        print("[ERROR] 변환 실패")
+        return 1
+    target = BINARY_FILE if to_binary else f"{VOCAB_FILE}, {STATS_FILE}"
+    print(f"[OK] 변환 완료: {target}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,960 @@
+"""
+여러 단어장 (사용자/단어장별 데이터, 통계, 인덱스)
+한 서버에서 사용자마다, 또는 주제마다 따로 단어장을 두고 각자의 퀴즈 통계와 복습 일정을 관리합니다.
+
+- Deck: 단어장 하나의 메모리 데이터(단어, 통계, 복습 상태), 인덱스, 저장소, 변경 피드, write-behind
+  웹 앱의 데이터 함수(불러오기, 다른 워커 변경 반영, 변경 기록)는 모두 이 클래스의 메서드입니다.
+- DeckCache: 워커가 불러온 단어장 LRU 캐시
+  단어장은 요청이 처음 올 때 불러오고, max_decks개를 넘거나 단어장들의 추정 크기 합계가
+  max_bytes를 넘으면 가장 오래 쓰지 않은 단어장을 저장하지 않은 채점 결과를 저장한 뒤 내보냅니다.
+  워커 메모리는 전체 단어 수가 아니라 최근에 쓴 단어장 크기에 비례합니다. 기본 단어장은 내보내지 않습니다.
+
+검색/퀴즈/통계 인덱스는 불러올 때 만들지 않고 처음 쓸 때 만듭니다 (DeckIndex). 바이너리 스냅샷은 모든 단어를
+읽지 않고 열리므로, 단어 조회/추가/채점만 하는 단어장은 인덱스를 만들지 않습니다.
+
+단어장 크기는 단어/통계 수, 글자 수, 만든 인덱스로 추정합니다 (Deck.memory_bytes(), 측정값 기준의 대략적인 값).
+
+저장 위치 (샤드):
+    기본 단어장(default)     작업 폴더의 vocabulary.json, quiz_stats.json, vocab_journal.jsonl (또는 vocabulary.db)
+    이름 있는 단어장         DECKS_DIR/<단어장 ID>/ 아래에 같은 이름의 파일
+    단어장마다 저널/데이터베이스와 파일 잠금이 따로이므로 서로 다른 단어장의 쓰기는 기다리지 않습니다.
+"""
+
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager, nullcontext
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from vocab_events import ChangeFeed
+from vocab_grading import AnswerKeyCache
+from vocab_index import (SearchIndex, CategoryIndex, WordPool, WeaknessRanking, StatsAggregate,
+                         ContentChecksum)
+from vocab_metrics import CACHE_LOOKUPS, DECK_CACHE, DECK_CACHE_BYTES, LOAD_SECONDS, QUIZ_ANSWERS, SYNC_CHANGES
+from vocab_scheduler import SRSScheduler, review
+from vocab_binary import OverlayMapping
+from vocab_storage import BaseStorage, WriteBehindFlusher, apply_change, make_set
+from vocab_store import VocabStore
+
+logger = logging.getLogger(__name__)
+
+# 상수 정의
+DEFAULT_DECK = "default"  # 작업 폴더의 기존 데이터 파일을 쓰는 단어장 (/api/... 경로)
+DEFAULT_MAX_DECKS = 100  # 워커마다 메모리에 둘 이름 있는 단어장 수
+# 단어장 크기 추정 (tracemalloc으로 잰 값)
+WORD_BYTES = 200  # 열 단위 저장소의 단어 하나 (글자 제외, 바이너리 스냅샷은 바뀐 단어만)
+TEXT_CHAR_BYTES = 2  # 열 단위 저장소의 단어/뜻/카테고리 글자 하나
+RECORD_BYTES = 250  # 복습 기록 또는 바이너리 스냅샷 위에서 바뀐 통계 하나
+# 만든 인덱스의 단어 하나당 크기 (검색 인덱스는 여기에 글자 하나당 SEARCH_CHAR_BYTES)
+INDEX_WORD_BYTES = {
+    "search_index": 200,
+    "category_index": 70,
+    "word_pool": 80,
+    "weakness": 130,
+    "scheduler": 420,
+    "stats_aggregate": 110,
+    "vocab_checksum": 0,
+}
+SEARCH_CHAR_BYTES = 15
+# 단어장 ID: 소문자, 숫자, -, _ (폴더 이름과 URL에 그대로 쓰므로 제한)
+DECK_ID_PATTERN = re.compile(r"^[a-z0-9][a-z0-9_-]{0,63}$")
+
+
+def is_valid_deck_id(deck_id: str) -> bool:
+    """단어장 ID 형식 확인"""
+    return bool(DECK_ID_PATTERN.match(deck_id))
+
+
+def deck_directory(root: str, deck_id: str) -> str:
+    """
+    단어장 데이터 폴더
+
+    Args:
+        root: 이름 있는 단어장들의 상위 폴더 (DECKS_DIR)
+        deck_id: 단어장 ID
+
+    Returns:
+        str: 폴더 경로 (기본 단어장은 작업 폴더이므로 빈 문자열)
+    """
+    if deck_id == DEFAULT_DECK:
+        return ""
+    return os.path.join(root, deck_id)
+
+
+def list_deck_ids(root: str) -> List[str]:
+    """저장된 이름 있는 단어장 ID 목록 (사전 순)"""
+    try:
+        entries = list(os.scandir(root))
+    except OSError:
+        return []
+    return sorted(entry.name for entry in entries if entry.is_dir() and is_valid_deck_id(entry.name))
+
+
+def _text_chars(word: str, data: Dict) -> int:
+    return len(word) + len(data.get("korean", "")) + len(data.get("category", ""))
+
+
+def normalize_word_data(value) -> Dict:
+    """
+    단어 데이터를 {korean, category} 형식으로 변환
+    기존 형식({word: meaning})과 새 형식({word: {korean, category}}) 호환
+    """
+    if isinstance(value, str):
+        return {"korean": value, "category": ""}
+    if isinstance(value, dict):
+        return {
+            "korean": value.get("korean", ""),
+            "category": value.get("category", "")
+        }
+    return {"korean": "", "category": ""}
+
+
+class DeckIndex:
+    """
+    처음 읽을 때 만드는 Deck 인덱스 속성
+
+    Deck._build_<이름>()으로 전체 데이터에서 한 번 만들어 Deck._indexes에 두고, 그 뒤로는
+    apply_change()가 점진적으로 갱신합니다. 만들지 않은 인덱스는 갱신하지 않습니다.
+    """
+
+    def __set_name__(self, owner, name: str):
+        self.name = name
+
+    def __get__(self, deck: Optional["Deck"], owner=None):
+        if deck is None:
+            return self
+        index = deck._indexes.get(self.name)
+        if index is None:
+            index = deck.build_index(self.name)
+        return index
+
+
+class Deck:
+    """
+    단어장 하나의 데이터와 인덱스 (워커마다 하나씩)
+
+    데이터는 data_lock으로, 저장소 쓰기는 transaction()으로 보호합니다.
+    load()는 처음 쓸 때 DeckCache가 부르며, 그 전에는 빈 상태입니다.
+    """
+
+    # 메모리 인덱스 (처음 쓸 때 만들고 apply_change()에서 점진적으로 갱신)
+    search_index = DeckIndex()
+    category_index = DeckIndex()
+    word_pool = DeckIndex()  # 퀴즈용 O(1) 무작위 선택
+    weakness = DeckIndex()  # 틀린 단어 집중 학습용 정답률 순위
+    scheduler = DeckIndex()  # 간격 반복 복습 큐
+    stats_aggregate = DeckIndex()  # /api/stats 정답률 순서 + 합계
+    vocab_checksum = DeckIndex()  # 단어장 내용 체크섬 (/api/words, /api/categories ETag)
+
+    def __init__(self, deck_id: str, storage: BaseStorage, change_feed: ChangeFeed,
+                 refresh_interval: float = 0.0, flush_interval: float = 1.0, flush_max_pending: int = 200):
+        """
+        Args:
+            deck_id: 단어장 ID
+            storage: 이 단어장의 저장소 (create_storage())
+            change_feed: 변경 이벤트 피드 (/api/events)
+            refresh_interval: 다른 워커의 변경 사항 확인 주기 (초, 0이면 매번 확인)
+            flush_interval: 채점 결과 write-behind 저장 간격 (초, 0이면 채점마다 바로 저장)
+            flush_max_pending: 저장하지 않은 변경이 이만큼 쌓이면 바로 저장
+        """
+        self.deck_id = deck_id
+        self.storage = storage
+        self.change_feed = change_feed
+        self.refresh_interval = refresh_interval
+        # 불러온 뒤에는 열 단위 VocabStore와 그 통계 열, 바이너리 스냅샷이면 OverlayMapping
+        self.vocabulary: Dict[str, Dict] = {}  # {word: {"korean": meaning, "category": category}}
+        self.quiz_stats: Dict[str, List[int]] = {}  # {word: [correct_count, wrong_count]}
+        self.srs_state: Dict[str, Dict] = {}  # {word: {"interval", "ease", "reps", "due"}} (간격 반복 복습)
+        # 아직 저장하지 않은 채점 결과 (write-behind, 메모리의 quiz_stats/srs_state에는 이미 반영됨)
+        self.pending_stats: Dict[str, List[int]] = {}  # {word: [correct 증가분, wrong 증가분]}
+        self.pending_srs: Dict[str, Dict] = {}  # {word: 복습 상태}
+        self.stats_flusher: Optional[WriteBehindFlusher] = None
+        if flush_interval > 0:
+            self.stats_flusher = WriteBehindFlusher(self.flush_quiz_results, flush_interval, flush_max_pending)
+        self._indexes: Dict[str, object] = {}  # 만든 인덱스 ({속성 이름: 인덱스})
+        self.answer_keys = AnswerKeyCache()  # 주관식 채점용 정답 정규화 결과 (처음 채점할 때 계산)
+        # 여러 스레드(gunicorn --threads)가 동시에 데이터를 바꾸지 않도록 보호
+        self.data_lock = threading.RLock()
+        self.loaded = False
+        self.last_used = time.monotonic()
+        # 단어/뜻/카테고리 글자 수 합계 (memory_bytes(), 바이너리 스냅샷은 검색 인덱스를 만들 때 셈)
+        self.text_chars: Optional[int] = 0
+        # 메모리 캐시 상태 (/api/status에서 확인)
+        self.cache_stats = {
+            "load_seconds": 0.0,      # 마지막 전체 불러오기 소요 시간
+            "loaded_at": None,        # 마지막 전체 불러오기 시각 (epoch)
+            "full_loads": 0,          # 전체 불러오기 횟수
+            "version_checks": 0,      # 저장소 버전 확인 횟수
+            "refreshes": 0,           # 버전이 바뀌어 변경 사항을 반영한 횟수
+            "changes_applied": 0,     # 다른 워커에서 가져온 변경 사항 수
+            "last_refresh_at": None,  # 마지막 반영 시각 (epoch)
+            "data_version": 0,        # 메모리 데이터가 바뀔 때마다 증가 (이 워커 기준)
+        }
+        self._seen_version = None
+        self._last_version_check = 0.0
+
+    # ---------- 불러오기 ----------
+
+    def ensure_loaded(self) -> None:
+        """아직 불러오지 않았으면 불러오기 (여러 요청이 동시에 와도 한 번만)"""
+        if self.loaded:
+            return
+        with self.data_lock:
+            if not self.loaded:
+                self.load()
+
+    def load(self) -> None:
+        """
+        스냅샷 파일과 저널에서 단어장 및 통계 데이터 불러오기
+
+        저장소를 읽을 수 없으면(모든 스냅샷 세대가 손상 등) 빈 데이터로 시작하지 않고 불러오지 않은 상태로
+        두어, 기록과 압축이 실제 데이터를 덮어쓰지 않게 합니다. 다음 ensure_loaded()에서 다시 시도합니다.
+
+        Raises:
+            Exception: 저장소 불러오기 실패 (CorruptSnapshotError, OSError, sqlite3.Error 등)
+        """
+        started = time.perf_counter()
+        with self.data_lock:
+            try:
+                self._seen_version = self.storage.version()
+                collections = self.storage.load()
+            except Exception as e:
+                # 이미 불러온 상태였어도 따라잡지 못한 오래된 데이터이므로 쓰지 않음
+                self.loaded = False
+                logger.error(f"[{self.deck_id}] 데이터 불러오기 실패: {e}")
+                raise
+
+            # 바이너리 스냅샷이면 mmap 위의 OverlayMapping (이미 {korean, category} 형식)
+            vocabulary = collections.get("vocabulary", {})
+            quiz_stats = collections.get("quiz_stats", {})
+            text_chars = None
+            if isinstance(vocabulary, dict):
+                # 단어마다 딕셔너리를 두지 않도록 열 단위로 저장 (글자 수도 같이 셈)
+                text_chars = 0
+                raw = vocabulary
+
+                def normalized_items():
+                    nonlocal text_chars
+                    for word, value in raw.items():
+                        data = normalize_word_data(value)
+                        text_chars += _text_chars(word, data)
+                        yield word, data
+
+                vocabulary = VocabStore(normalized_items(), quiz_stats)
+                quiz_stats = vocabulary.stats
+            self.vocabulary = vocabulary
+            self.quiz_stats = quiz_stats
+            self.srs_state = collections.get("srs", {})
+            self._overlay_pending_results()
+            self.reset_indexes()
+            self.text_chars = text_chars
+            # 이전 이벤트와 이어지지 않으므로 연결된 클라이언트는 전체를 다시 불러옴
+            self.change_feed.reset(self.storage.seq)
+            self.loaded = True
+
+            LOAD_SECONDS.observe(time.perf_counter() - started)
+            self.cache_stats["load_seconds"] = round(time.perf_counter() - started, 4)
+            self.cache_stats["loaded_at"] = time.time()
+            self.cache_stats["full_loads"] += 1
+
+        logger.info(f"[{self.deck_id}] 단어장 불러오기 성공: {len(self.vocabulary)}개 단어 "
+                    f"({self.cache_stats['load_seconds']}초)")
+        logger.info(f"[{self.deck_id}] 통계 불러오기 성공: {len(self.quiz_stats)}개 기록")
+
+    def _overlay_pending_results(self) -> None:
+        """저장소에서 다시 불러온 값 위에 아직 저장하지 않은 채점 결과 덮어쓰기"""
+        for word in list(self.pending_stats):
+            if word not in self.vocabulary:
+                del self.pending_stats[word]
+                continue
+            correct, wrong = self.quiz_stats.get(word, [0, 0])
+            delta = self.pending_stats[word]
+            self.quiz_stats[word] = [correct + delta[0], wrong + delta[1]]
+        for word in list(self.pending_srs):
+            if word not in self.vocabulary:
+                del self.pending_srs[word]
+                continue
+            self.srs_state[word] = self.pending_srs[word]
+
+    def collections(self) -> Dict[str, Dict]:
+        """저장소 컬렉션 이름과 메모리 데이터 연결"""
+        return {"vocabulary": self.vocabulary, "quiz_stats": self.quiz_stats, "srs": self.srs_state}
+
+    # ---------- 인덱스 ----------
+
+    def reset_indexes(self) -> None:
+        """만든 인덱스 버리기 (불러오기 직후, 각 인덱스는 다음에 쓸 때 다시 만듦)"""
+        self._indexes = {}
+        self.answer_keys = AnswerKeyCache()
+        self.cache_stats["data_version"] += 1
+
+    def rebuild_indexes(self) -> None:
+        """전체 데이터로 모든 메모리 인덱스를 바로 다시 만들기 (벤치마크, 미리 데우기)"""
+        with self.data_lock:
+            self.reset_indexes()
+            for name in INDEX_WORD_BYTES:
+                self.build_index(name)
+
+    def build_index(self, name: str):
+        """
+        인덱스를 전체 데이터로 만들기 (DeckIndex 속성을 처음 읽을 때, 여러 스레드가 동시에 읽어도 한 번만)
+
+        Args:
+            name: 인덱스 속성 이름 (INDEX_WORD_BYTES의 키)
+
+        Returns:
+            만든 인덱스
+        """
+        with self.data_lock:
+            index = self._indexes.get(name)
+            if index is None:
+                started = time.perf_counter()
+                index = self._indexes[name] = getattr(self, f"_build_{name}")()
+                logger.debug(f"[{self.deck_id}] 인덱스 {name} 생성: {len(self.vocabulary)}개 단어 "
+                             f"({time.perf_counter() - started:.3f}초)")
+        return index
+
+    def is_index_built(self, name: str) -> bool:
+        return name in self._indexes
+
+    def _build_search_index(self) -> SearchIndex:
+        meanings = []
+        text_chars = 0
+        for word, data in self.vocabulary.items():
+            text_chars += _text_chars(word, data)
+            meanings.append((word, data.get("korean", "")))
+        self.text_chars = text_chars
+        index = SearchIndex()
+        index.build(meanings)
+        return index
+
+    def _build_category_index(self) -> CategoryIndex:
+        index = CategoryIndex()
+        for word, data in self.vocabulary.items():
+            index.add(word, data.get("category", ""))
+        return index
+
+    def _build_word_pool(self) -> WordPool:
+        return WordPool(self.vocabulary)
+
+    def _build_weakness(self) -> WeaknessRanking:
+        index = WeaknessRanking()
+        quiz_stats = self.quiz_stats
+        for word, data in self.vocabulary.items():
+            index.update(word, data.get("category", ""), quiz_stats.get(word))
+        return index
+
+    def _build_scheduler(self) -> SRSScheduler:
+        index = SRSScheduler()
+        srs_state = self.srs_state
+        for word, data in self.vocabulary.items():
+            index.update(word, data.get("category", ""), srs_state.get(word))
+        return index
+
+    def _build_stats_aggregate(self) -> StatsAggregate:
+        index = StatsAggregate()
+        quiz_stats = self.quiz_stats
+        for word, data in self.vocabulary.items():
+            index.update(word, data.get("korean", ""), data.get("category", ""), quiz_stats.get(word))
+        return index
+
+    def _build_vocab_checksum(self) -> ContentChecksum:
+        index = ContentChecksum()
+        for word, data in self.vocabulary.items():
+            index.add(word, data.get("korean", ""), data.get("category", ""))
+        return index
+
+    # ---------- 변경 반영 ----------
+
+    def apply_change(self, change: Dict, remote: bool = False) -> Optional[Dict]:
+        """
+        변경 사항 하나를 메모리 데이터와 만든 인덱스에 반영
+
+        이 워커의 변경(record_changes)과 다른 워커의 변경(sync) 모두 여기를 거칩니다.
+        아직 만들지 않은 인덱스는 처음 쓸 때 바뀐 데이터로 만들어지므로 건너뜁니다.
+
+        Args:
+            change: 변경 사항
+            remote: 다른 워커의 변경이면 True (아직 저장하지 않은 채점 결과를 그 위에 다시 반영)
+
+        Returns:
+            Optional[Dict]: 변경 이벤트 (번호 v는 저장한 뒤 붙임, 알릴 것이 없으면 None)
+        """
+        word = change.get("k")
+        indexes = self._indexes
+        self.cache_stats["data_version"] += 1
+        if change.get("c") in ("quiz_stats", "srs"):
+            change = self._overlay_pending_change(change, remote)
+        if change.get("c") == "quiz_stats":
+            apply_change(self.collections(), change)
+            if word not in self.vocabulary:
+                return None
+            data = self.vocabulary[word]
+            if "weakness" in indexes:
+                indexes["weakness"].update(word, data.get("category", ""), self.quiz_stats.get(word))
+            if "stats_aggregate" in indexes:
+                indexes["stats_aggregate"].update(word, data.get("korean", ""), data.get("category", ""),
+                                                  self.quiz_stats.get(word))
+            return {"type": "stats", "word": word, "stats": self.quiz_stats.get(word)}
+        if change.get("c") == "srs":
+            apply_change(self.collections(), change)
+            if word in self.vocabulary and "scheduler" in indexes:
+                indexes["scheduler"].update(word, self.vocabulary[word].get("category", ""),
+                                            self.srs_state.get(word))
+            return None
+        if change.get("c") != "vocabulary":
+            apply_change(self.collections(), change)
+            return None
+
+        old_data = self.vocabulary.get(word)
+        apply_change(self.collections(), change)
+
+        self.answer_keys.discard(word)
+        if old_data is not None:
+            if self.text_chars is not None:
+                self.text_chars -= _text_chars(word, old_data)
+            if "category_index" in indexes:
+                indexes["category_index"].remove(word, old_data.get("category", ""))
+            if "vocab_checksum" in indexes:
+                indexes["vocab_checksum"].discard(word, old_data.get("korean", ""), old_data.get("category", ""))
+        if change["op"] == "set":
+            korean, category = change["val"].get("korean", ""), change["val"].get("category", "")
+            if self.text_chars is not None:
+                self.text_chars += len(word) + len(korean) + len(category)
+            if "vocab_checksum" in indexes:
+                indexes["vocab_checksum"].add(word, korean, category)
+            if "search_index" in indexes:
+                indexes["search_index"].add(word, korean)
+            if "category_index" in indexes:
+                indexes["category_index"].add(word, category)
+            if "word_pool" in indexes:
+                indexes["word_pool"].add(word)
+            if "weakness" in indexes:
+                indexes["weakness"].update(word, category, self.quiz_stats.get(word))
+            if "scheduler" in indexes:
+                indexes["scheduler"].update(word, category, self.srs_state.get(word))
+            if "stats_aggregate" in indexes:
+                indexes["stats_aggregate"].update(word, korean, category, self.quiz_stats.get(word))
+        else:
+            for name in ("search_index", "word_pool", "weakness", "scheduler", "stats_aggregate"):
+                if name in indexes:
+                    indexes[name].remove(word)
+        return self._word_event(word, old_data, change.get("val") if change["op"] == "set" else None)
+
+    def _word_event(self, word: str, old_data: Optional[Dict], new_data: Optional[Dict]) -> Optional[Dict]:
+        """
+        단어 변경 이벤트 (카테고리가 새로 생기거나 비었으면 "categories": True)
+
+        카테고리 인덱스를 아직 만들지 않았으면 카테고리가 바뀔 때마다 True로 알립니다 (클라이언트가 목록을 다시 읽음).
+        """
+        if old_data is None and new_data is None:
+            return None
+        old_category = old_data.get("category", "") if old_data is not None else None
+        new_category = new_data.get("category", "") if new_data is not None else None
+        if new_data is None:
+            event = {"type": "word_removed", "word": word}
+        else:
+            event = {
+                "type": "word_added" if old_data is None else "word_updated",
+                "word": word,
+                "data": {"korean": new_data.get("korean", ""), "category": new_category}
+            }
+        category_index = self._indexes.get("category_index")
+        if old_category != new_category and (
+                category_index is None
+                or (old_category is not None and category_index.count(old_category) == 0)
+                or (new_category is not None and category_index.count(new_category) == 1)):
+            event["categories"] = True
+        return event
+
+    def _publish_events(self, changes: List[Dict], events: List[Optional[Dict]]) -> None:
+        """저장되어 번호(v)가 붙은 변경 사항의 이벤트를 변경 피드에 추가"""
+        numbered = []
+        for change, event in zip(changes, events):
+            if event is not None and "v" in change:
+                event["v"] = change["v"]
+                numbered.append(event)
+        self.change_feed.publish(numbered)
+
+    def _overlay_pending_change(self, change: Dict, remote: bool) -> Dict:
+        """
+        통계/복습 일정 변경에 아직 저장하지 않은 채점 결과 반영
+
+        삭제되면 저장하지 않은 결과도 버리고, 다른 워커가 저장한 값에는 증가분을 다시 더합니다.
+        """
+        word = change.get("k")
+        pending = self.pending_stats if change["c"] == "quiz_stats" else self.pending_srs
+        if word not in pending:
+            return change
+        if change["op"] == "del":
+            del pending[word]
+            return change
+        if not remote:
+            return change
+        if change["c"] == "srs":
+            return make_set("srs", word, pending[word])
+        correct, wrong = change["val"]
+        delta = pending[word]
+        return make_set("quiz_stats", word, [correct + delta[0], wrong + delta[1]])
+
+    def sync(self) -> None:
+        """
+        다른 워커 프로세스가 기록한 변경 사항을 메모리에 반영
+
+        따라잡을 수 없을 만큼 오래되었으면 전체를 다시 불러옵니다.
+        """
+        with self.data_lock:
+            changes = self.storage.read_changes()
+            if changes is None:
+                logger.info(f"[{self.deck_id}] 저장소 변경 로그를 따라잡을 수 없어 전체를 다시 불러옵니다.")
+                self.load()
+                return
+            events = []
+            for change in changes:
+                if change.get("c") == "vocabulary" and change["op"] == "set":
+                    change["val"] = normalize_word_data(change["val"])
+                events.append(self.apply_change(change, remote=True))
+            self._publish_events(changes, events)
+            if changes:
+                SYNC_CHANGES.inc(len(changes))
+                self.cache_stats["changes_applied"] += len(changes)
+                self.cache_stats["last_refresh_at"] = time.time()
+
+    def refresh_if_changed(self) -> bool:
+        """
+        저장소 버전이 바뀐 경우에만 다른 워커의 변경 사항 반영
+
+        버전 확인은 파일 stat 또는 PRAGMA 한 번이므로 매 요청마다 해도 가볍습니다.
+        refresh_interval을 설정하면 그 간격 안에서는 확인을 생략합니다.
+
+        Returns:
+            bool: 변경 사항을 반영했는지 여부
+        """
+        now = time.monotonic()
+        self.last_used = now
+        if self.refresh_interval and now - self._last_version_check < self.refresh_interval:
+            return False
+        self._last_version_check = now
+        self.cache_stats["version_checks"] += 1
+
+        version = self.storage.version()
+        if version is not None and version == self._seen_version:
+            CACHE_LOOKUPS.labels("data", "hit").inc()
+            return False
+
+        CACHE_LOOKUPS.labels("data", "miss").inc()
+        self.sync()
+        self._seen_version = version
+        self.cache_stats["refreshes"] += 1
+        return True
+
+    # ---------- 기록 ----------
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """
+        데이터 변경 구간 (스레드 + 프로세스 간 잠금)
+
+        잠금을 잡은 뒤 다른 워커의 변경 사항을 먼저 반영하므로,
+        안에서 하는 중복 확인이나 통계 증가가 최신 상태를 기준으로 이루어집니다.
+        """
+        with self.data_lock, self.storage.lock():
+            self.sync()
+            yield
+
+    def record_changes(self, changes: List[Dict]) -> bool:
+        """
+        변경 사항을 메모리에 반영하고 저널에 추가
+
+        저널이 기준 크기를 넘으면 백그라운드에서 스냅샷으로 압축합니다.
+
+        Args:
+            changes: make_set()/make_delete()로 만든 변경 사항 목록
+
+        Returns:
+            bool: 저장 성공 여부
+        """
+        with self.transaction():
+            events = [self.apply_change(change) for change in changes]
+
+            if not self.storage.append(changes):
+                return False
+            self._publish_events(changes, events)
+            self._compact_if_needed()
+
+        logger.debug(f"[{self.deck_id}] 변경 사항 {len(changes)}개 저장")
+        return True
+
+    def _compact_if_needed(self) -> None:
+        """
+        저널이 기준 크기를 넘었으면 백그라운드 압축 시작 (transaction() 안에서 호출)
+
+        스냅샷에는 메모리의 통계, 즉 저장하지 않은 채점 결과까지 들어갑니다. 증가분을 남겨 둔 채 압축하면
+        그 스냅샷을 불러온 다른 워커의 값 위에 증가분을 한 번 더 더하게 되므로, 채점 결과를 먼저 저널에
+        기록합니다 (flush_quiz_results()가 기록한 뒤 이 함수를 다시 불러 압축).
+        """
+        if not self.storage.needs_compaction():
+            return
+        if self.pending_stats or self.pending_srs:
+            # 실패하면(또는 close() 뒤라 저장 스레드가 없으면) 압축도 다음 기록 때로 미룸
+            if self.stats_flusher is not None:
+                self.stats_flusher.flush()
+            return
+        self.storage.compact_async(self.snapshot())
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """
+        백그라운드 압축에 넘길 데이터 복사본 (data_lock 안에서 호출)
+
+        값은 항상 통째로 교체되므로 얕은 복사로 충분합니다 (OverlayMapping은 바뀐 항목만 복사).
+        열 단위 저장소는 단어장과 통계가 같은 열 배열에 있으므로 한 번만 복사해 둘 다 그 복사본을 씁니다.
+
+        Returns:
+            Dict[str, Dict]: collections()와 같은 형식의 복사본
+        """
+        vocabulary = self.vocabulary.copy()
+        if isinstance(vocabulary, VocabStore) and self.quiz_stats is self.vocabulary.stats:
+            quiz_stats = vocabulary.stats
+        else:
+            quiz_stats = self.quiz_stats.copy()
+        return {"vocabulary": vocabulary, "quiz_stats": quiz_stats, "srs": self.srs_state.copy()}
+
+    def save(self) -> bool:
+        """
+        단어장 및 통계 데이터 전체를 스냅샷 파일에 저장 (저널 비우기)
+
+        저장하지 않은 채점 결과도 스냅샷에 들어가므로 저장에 성공하면 증가분을 비웁니다.
+
+        Returns:
+            bool: 저장 성공 여부
+        """
+        with self.transaction():
+            if self.storage.save_all(self.collections()):
+                self.pending_stats.clear()
+                self.pending_srs.clear()
+                logger.debug(f"[{self.deck_id}] 데이터 저장 성공")
+                return True
+            return False
+
+    def record_quiz_results(self, graded_list: List[Dict]) -> List[Tuple[List[int], Dict]]:
+        """
+        채점 결과를 통계와 복습 일정에 반영
+
+        write-behind가 켜져 있으면 메모리에만 반영하고 백그라운드에서 모아서 저장하며,
+        꺼져 있으면(flush_interval=0) 저널에 바로 한 번 기록합니다.
+        같은 단어가 여러 번 있으면 순서대로 누적합니다.
+
+        Args:
+            graded_list: 채점 결과 목록 ({word, is_correct, quality, mode})
+
+        Returns:
+            List[Tuple[List[int], Dict]]: 결과마다 반영 후의 ([맞춘 횟수, 틀린 횟수], 복습 상태)
+        """
+        outcomes = []
+        with self.data_lock:
+            # 내보낸 단어장(close() 뒤)은 write-behind 없이 바로 기록
+            write_behind = self.stats_flusher is not None
+            with (nullcontext() if write_behind else self.transaction()):
+                new_stats: Dict[str, List[int]] = {}
+                new_srs: Dict[str, Dict] = {}
+                for graded in graded_list:
+                    word = graded["word"]
+                    correct, wrong = new_stats.get(word) or self.quiz_stats.get(word, [0, 0])
+                    if graded["is_correct"]:
+                        correct += 1  # 맞춘 횟수
+                        logger.debug(f"퀴즈 정답: {word}")
+                    else:
+                        wrong += 1  # 틀린 횟수
+                        logger.debug(f"퀴즈 오답: {word}")
+                    new_stats[word] = [correct, wrong]
+                    QUIZ_ANSWERS.labels(graded["mode"], "correct" if graded["is_correct"] else "wrong").inc()
+                    new_srs[word] = review(new_srs.get(word) or self.srs_state.get(word), graded["quality"])
+                    outcomes.append((new_stats[word], new_srs[word]))
+                    if write_behind:
+                        # 저장할 때 다른 워커의 값에 다시 더할 증가분
+                        delta_correct, delta_wrong = self.pending_stats.get(word, [0, 0])
+                        if graded["is_correct"]:
+                            self.pending_stats[word] = [delta_correct + 1, delta_wrong]
+                        else:
+                            self.pending_stats[word] = [delta_correct, delta_wrong + 1]
+
+                changes = [make_set("quiz_stats", word, stats) for word, stats in new_stats.items()]
+                changes += [make_set("srs", word, state) for word, state in new_srs.items()]
+                if write_behind:
+                    for change in changes:
+                        self.apply_change(change)
+                    self.pending_srs.update(new_srs)
+                elif changes:
+                    self.record_changes(changes)
+
+            # 잠금 안에서 표시해야 close()가 멈춘 저장 스레드를 다시 시작시키지 않음
+            if write_behind and changes:
+                self.stats_flusher.mark(len(changes))
+        return outcomes
+
+    def flush_quiz_results(self) -> int:
+        """
+        write-behind로 모아 둔 채점 결과를 저장소에 기록 (백그라운드 스레드)
+
+        잠금을 잡고 다른 워커의 변경을 먼저 반영한 뒤(통계에는 증가분을 다시 더함)
+        현재 값을 기록하므로, 여러 워커가 같은 단어를 채점해도 횟수가 사라지지 않습니다.
+
+        Returns:
+            int: 기록한 변경 사항 수
+        """
+        with self.transaction():
+            if not self.pending_stats and not self.pending_srs:
+                return 0
+            saved_stats = dict(self.pending_stats)
+            saved_srs = dict(self.pending_srs)
+            changes = [make_set("quiz_stats", word, self.quiz_stats[word])
+                       for word in saved_stats if word in self.quiz_stats]
+            changes += [make_set("srs", word, self.srs_state[word])
+                        for word in saved_srs if word in self.srs_state]
+            self.pending_stats.clear()
+            self.pending_srs.clear()
+            if not self.record_changes(changes):
+                self.pending_stats.update(saved_stats)
+                self.pending_srs.update(saved_srs)
+                raise IOError("저널 기록 실패")
+        logger.debug(f"[{self.deck_id}] 채점 결과 {len(changes)}개 저장 (write-behind)")
+        return len(changes)
+
+    def flush_pending_writes(self) -> bool:
+        """
+        아직 저장하지 않은 채점 결과를 바로 저장 (워커 종료, 단어장 내보내기)
+
+        Returns:
+            bool: 저장 성공 여부
+        """
+        if self.stats_flusher is None:
+            return True
+        return self.stats_flusher.stop()
+
+    def close(self) -> bool:
+        """
+        캐시에서 내보낼 때 호출 (채점 결과 저장 후 파일 핸들/연결 닫기)
+
+        아직 이 단어장을 쓰고 있는 요청이 있으면 그 요청이 끝날 때까지 메모리에 남고,
+        그 사이의 쓰기는 저장소를 다시 열어 바로 기록합니다. write-behind 저장 스레드는 멈추고 떼어 내므로
+        스레드가 내보낸 단어장을 계속 붙잡지 않습니다.
+
+        Returns:
+            bool: 채점 결과 저장 성공 여부
+        """
+        with self.data_lock:
+            flusher, self.stats_flusher = self.stats_flusher, None
+        saved = flusher.stop() if flusher is not None else True
+        with self.data_lock:
+            self.storage.close()
+        return saved
+
+    # ---------- 상태 ----------
+
+    def write_behind_status(self) -> Dict:
+        """채점 결과 write-behind 상태 (합쳐진 기록 수 등)"""
+        if self.stats_flusher is None:
+            return {"enabled": False}
+        return dict(
+            self.stats_flusher.stats,
+            enabled=True,
+            interval=self.stats_flusher.interval,
+            max_pending=self.stats_flusher.max_pending,
+            pending=self.stats_flusher.pending,
+            pending_words=len(self.pending_stats)
+        )
+
+    def memory_bytes(self) -> int:
+        """
+        메모리 사용량 추정 (데이터와 만든 인덱스, 바이트)
+
+        단어/기록 수와 글자 수에 측정한 크기를 곱한 값이라 O(1)이며, 실제와 수십 % 다를 수 있습니다.
+        바이너리 스냅샷의 단어 데이터는 워커끼리 공유하는 mmap에 있으므로 바뀐 항목만 셉니다.
+
+        Returns:
+            int: 추정 크기 (불러오기 전이면 0)
+        """
+        if not self.loaded:
+            return 0
+        word_count = len(self.vocabulary)
+        text_chars = self.text_chars or 0
+        if isinstance(self.vocabulary, OverlayMapping):
+            size = self.vocabulary.change_count * WORD_BYTES
+            if isinstance(self.quiz_stats, OverlayMapping):
+                size += self.quiz_stats.change_count * RECORD_BYTES
+        else:
+            size = word_count * WORD_BYTES + text_chars * TEXT_CHAR_BYTES
+        size += len(self.srs_state) * RECORD_BYTES
+        for name in self._indexes:
+            size += word_count * INDEX_WORD_BYTES[name]
+        if "search_index" in self._indexes:
+            size += text_chars * SEARCH_CHAR_BYTES
+        return size
+
+    def index_sizes(self) -> Dict[str, int]:
+        """인덱스 항목 수 ({인덱스 이름: 항목 수}, /metrics, 아직 만들지 않은 인덱스는 0)"""
+        with self.data_lock:
+            indexes = self._indexes
+
+            def size(name: str) -> int:
+                return len(indexes[name]) if name in indexes else 0
+
+            return {
+                "words": len(self.vocabulary),
+                "quiz_stats": len(self.quiz_stats),
+                "srs": len(self.srs_state),
+                "search": size("search_index"),
+                "categories": len(indexes["category_index"].counts()) if "category_index" in indexes else 0,
+                "quiz_pool": size("word_pool"),
+                "weakness": size("weakness"),
+                "stats_order": size("stats_aggregate"),
+                "review_queue": size("scheduler"),
+                "answer_keys": len(self.answer_keys),
+                "events_buffered": self.change_feed.status()["buffered"],
+            }
+
+
+class DeckCache:
+    """
+    불러온 단어장 LRU 캐시 (워커마다 하나)
+
+    get()은 캐시에 없으면 open_deck()으로 만든 단어장을 불러오고, 이름 있는 단어장이 max_decks개를 넘거나
+    메모리에 둔 단어장(기본 단어장 포함)의 추정 크기 합계가 max_bytes를 넘으면 가장 오래 쓰지 않은
+    단어장부터 내보냅니다 (기본 단어장과 방금 요청한 단어장은 유지).
+    크기 제한은 새로 불러올 때와, 불러온 단어장의 크기가 바뀐 것을 check_memory()가 알았을 때 확인합니다.
+    불러오기와 내보내기(채점 결과 저장)는 캐시 잠금 밖에서 하므로 다른 단어장 요청을 막지 않습니다.
+    """
+
+    def __init__(self, open_deck: Callable[[str], Deck], max_decks: int = DEFAULT_MAX_DECKS, max_bytes: int = 0):
+        """
+        Args:
+            open_deck: 단어장 ID로 (불러오기 전의) Deck을 만드는 함수
+            max_decks: 메모리에 둘 이름 있는 단어장 수 (1 이상)
+            max_bytes: 메모리에 둘 단어장들의 추정 크기 합계 (바이트, 0이면 제한 없음)
+        """
+        self.open_deck = open_deck
+        self.max_decks = max(1, max_decks)
+        self.max_bytes = max(0, max_bytes)
+        self._sizes: Dict[str, int] = {}  # 마지막으로 크기 제한을 확인할 때의 단어장별 추정 크기
+        self._over_budget = False
+        self._decks: "OrderedDict[str, Deck]" = OrderedDict()  # 오래 쓰지 않은 순서
+        self._lock = threading.Lock()
+        self.default = open_deck(DEFAULT_DECK)
+        self.stats = {
+            "hits": 0,        # 이미 불러온 단어장 요청
+            "misses": 0,      # 새로 불러온 단어장
+            "evictions": 0,   # 내보낸 단어장 (개수 또는 크기 제한)
+        }
+
+    def get(self, deck_id: str) -> Deck:
+        """
+        단어장 가져오기 (처음이면 불러오기)
+
+        Args:
+            deck_id: 단어장 ID (존재 여부는 호출하는 쪽에서 확인)
+
+        Returns:
+            Deck: 불러온 단어장
+        """
+        if deck_id == DEFAULT_DECK:
+            self.default.ensure_loaded()
+            return self.default
+        evicted: List[Deck] = []
+        with self._lock:
+            deck = self._decks.get(deck_id)
+            if deck is not None:
+                self._decks.move_to_end(deck_id)
+                self._count("hits", "hit")
+            else:
+                deck = self.open_deck(deck_id)
+                self._decks[deck_id] = deck
+                self._count("misses", "miss")
+                while len(self._decks) > self.max_decks:
+                    evicted.append(self._decks.popitem(last=False)[1])
+                self._count("evictions", "eviction", len(evicted))
+        for old in evicted:
+            self._close(old)
+        if deck.loaded:
+            self.check_memory(deck)
+            return deck
+        deck.ensure_loaded()
+        # 크기는 불러온 뒤에야 알 수 있으므로 새로 불러올 때마다 확인
+        self._enforce_memory_budget(keep=deck_id)
+        return deck
+
+    def check_memory(self, deck: Deck) -> None:
+        """
+        단어장 크기가 지난번 확인 이후 바뀌었으면 크기 제한 다시 확인
+
+        단어 추가/가져오기나 다른 워커의 변경 반영으로 불러온 단어장이 커진 경우입니다.
+        다른 단어장을 내보내며 그 잠금을 잡으므로, 단어장 잠금(transaction()) 밖에서 호출해야 합니다
+        (웹 앱은 요청이 끝난 뒤, 그리고 get()의 캐시 적중 때).
+        """
+        if self.max_bytes and self._sizes.get(deck.deck_id) != deck.memory_bytes():
+            self._enforce_memory_budget(keep=deck.deck_id)
+
+    def _enforce_memory_budget(self, keep: str) -> None:
+        """추정 크기 합계가 max_bytes 이하가 될 때까지 오래 쓰지 않은 단어장 내보내기"""
+        evicted: List[Deck] = []
+        with self._lock:
+            total = self._total_bytes()
+            if self.max_bytes:
+                for deck_id in list(self._decks):
+                    if total <= self.max_bytes:
+                        break
+                    if deck_id == keep:
+                        continue
+                    deck = self._decks.pop(deck_id)
+                    total -= self._sizes.pop(deck_id, 0)
+                    evicted.append(deck)
+                self._count("evictions", "eviction", len(evicted))
+            DECK_CACHE_BYTES.set(total)
+            over_budget, self._over_budget = self._over_budget, total > self.max_bytes > 0
+        if self._over_budget and not over_budget:
+            logger.warning(f"[{keep}] 단어장 캐시 크기 제한 초과: 약 {total // 1024 // 1024}MB "
+                           f"(제한 {self.max_bytes // 1024 // 1024}MB, 기본 단어장과 요청한 단어장은 유지)")
+        for old in evicted:
+            self._close(old)
+
+    def _total_bytes(self) -> int:
+        """추정 크기 합계 (단어장별 크기를 기록해 둠, 캐시 잠금 안에서 호출)"""
+        self._sizes = {deck.deck_id: deck.memory_bytes() for deck in [self.default, *self._decks.values()]}
+        return sum(self._sizes.values())
+
+    def _count(self, key: str, result: str, amount: int = 1) -> None:
+        if amount:
+            self.stats[key] += amount
+            DECK_CACHE.labels(result).inc(amount)
+
+    def _close(self, deck: Deck) -> None:
+        if not deck.close():
+            logger.error(f"[{deck.deck_id}] 내보낸 단어장의 채점 결과 저장 실패")
+        logger.info(f"[{deck.deck_id}] 단어장을 메모리에서 내보냈습니다.")
+
+    def loaded(self) -> List[Deck]:
+        """메모리에 있는 단어장 (기본 단어장 포함)"""
+        with self._lock:
+            return [self.default] + list(self._decks.values())
+
+    def is_loaded(self, deck_id: str) -> bool:
+        if deck_id == DEFAULT_DECK:
+            return self.default.loaded
+        with self._lock:
+            return deck_id in self._decks
+
+    def flush_all(self) -> bool:
+        """모든 단어장의 저장하지 않은 채점 결과 저장 (워커 종료 시)"""
+        saved = True
+        for deck in self.loaded():
+            saved = deck.flush_pending_writes() and saved
+        return saved
+
+    def status(self) -> Dict:
+        with self._lock:
+            total = self._total_bytes()
+            DECK_CACHE_BYTES.set(total)
+            return dict(self.stats, loaded=len(self._decks), max_decks=self.max_decks,
+                        bytes=total, max_bytes=self.max_bytes)
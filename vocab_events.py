@@ -0,0 +1,163 @@
+"""
+단어장 변경 이벤트 피드 (Server-Sent Events)
+단어 추가/수정/삭제와 통계 변경을 작은 이벤트로 만들어, 열려 있는 탭/기기에 바로 보냅니다.
+
+이벤트에는 저장소 변경 번호(v)를 붙이므로 모든 워커에서 같은 순서와 번호입니다.
+워커마다 최근 이벤트를 일정 개수만 보관하며, 다시 연결한 클라이언트에는
+마지막으로 받은 번호 이후의 이벤트를 보내고, 너무 오래되었으면 전체를 다시 불러오라고(reset) 알립니다.
+
+이벤트 형식:
+    {"v": 번호, "type": "word_added" | "word_updated", "word": 단어, "data": {"korean", "category"}}
+    {"v": 번호, "type": "word_removed", "word": 단어}
+    {"v": 번호, "type": "stats", "word": 단어, "stats": [correct, wrong] 또는 null}
+    카테고리 목록이 바뀌었으면 "categories": true
+"""
+
+import json
+import threading
+from collections import deque
+from typing import Dict, List, Optional
+
+# 상수 정의
+DEFAULT_MAX_EVENTS = 1000  # 워커마다 보관하는 최근 이벤트 수
+DEFAULT_MAX_STREAMS = 4  # 워커마다 동시에 열어 둘 수 있는 이벤트 스트림 수 (모든 단어장 합계)
+
+
+def format_sse(event: str, data: Dict, event_id: Optional[int] = None) -> str:
+    """
+    SSE 메시지 한 개
+
+    Args:
+        event: 이벤트 이름 (EventSource.addEventListener 이름)
+        data: JSON으로 보낼 데이터
+        event_id: 이벤트 번호 (다시 연결할 때 Last-Event-ID로 돌아옴)
+    """
+    lines = [f"event: {event}"]
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"data: {json.dumps(data, ensure_ascii=False, separators=(',', ':'))}")
+    return "\n".join(lines) + "\n\n"
+
+
+class StreamSlots:
+    """
+    워커 전체의 동시 이벤트 스트림 수 제한
+
+    단어장마다 ChangeFeed가 있어도 스트림은 워커의 스레드/연결을 쓰므로 합쳐서 셉니다.
+    """
+
+    def __init__(self, max_streams: int = DEFAULT_MAX_STREAMS):
+        self.max_streams = max_streams
+        self.streams = 0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> bool:
+        """자리 확보 (max_streams를 넘으면 False)"""
+        with self._lock:
+            if self.streams >= self.max_streams:
+                return False
+            self.streams += 1
+            return True
+
+    def release(self) -> None:
+        with self._lock:
+            self.streams -= 1
+
+
+class ChangeFeed:
+    """
+    최근 변경 이벤트 버퍼 + 대기
+
+    publish()는 데이터 잠금 안에서 번호 순서대로 호출되고,
+    스트림 스레드는 wait_since()로 새 이벤트를 기다립니다.
+    """
+
+    def __init__(self, max_events: int = DEFAULT_MAX_EVENTS, max_streams: int = DEFAULT_MAX_STREAMS,
+                 slots: Optional[StreamSlots] = None):
+        """
+        Args:
+            max_events: 보관할 최근 이벤트 수
+            max_streams: 동시 스트림 수 (slots가 없을 때)
+            slots: 여러 피드가 함께 쓰는 스트림 자리 (워커 전체 제한)
+        """
+        self.max_events = max_events
+        self.slots = slots or StreamSlots(max_streams)
+        self._events: deque = deque()
+        self._cond = threading.Condition()
+        self.version = 0  # 마지막 이벤트(또는 불러온 시점)의 번호
+        self._floor = 0  # 이 번호 이후의 이벤트만 보관 중 (더 오래된 번호는 reset)
+        self.streams = 0
+        self.published = 0
+        self.resets = 0
+
+    def reset(self, version: int) -> None:
+        """전체를 다시 불러온 뒤 호출 (이전 이벤트는 이어 붙일 수 없음)"""
+        with self._cond:
+            self._events.clear()
+            self.version = self._floor = version
+            self.resets += 1
+            self._cond.notify_all()
+
+    def publish(self, events: List[Dict]) -> None:
+        """번호(v)가 붙은 이벤트 추가"""
+        if not events:
+            return
+        with self._cond:
+            for event in events:
+                if event["v"] <= self.version:
+                    continue  # 이미 보낸 번호 (다시 불러오기 직후 등)
+                self._events.append(event)
+                self.version = event["v"]
+                self.published += 1
+            while len(self._events) > self.max_events:
+                self._floor = self._events.popleft()["v"]
+            self._cond.notify_all()
+
+    def since(self, version: int) -> Optional[List[Dict]]:
+        """
+        version 이후의 이벤트
+
+        Returns:
+            Optional[List[Dict]]: 이벤트 목록, 버퍼보다 오래된 번호면 None (전체를 다시 불러와야 함)
+        """
+        with self._cond:
+            return self._since(version)
+
+    def _since(self, version: int) -> Optional[List[Dict]]:
+        if version < self._floor:
+            return None
+        if version >= self.version:
+            return []
+        return [event for event in self._events if event["v"] > version]
+
+    def wait_since(self, version: int, timeout: float) -> Optional[List[Dict]]:
+        """새 이벤트가 생기거나 timeout초가 지날 때까지 기다린 뒤 since(version)"""
+        with self._cond:
+            if self.version <= version and version >= self._floor:
+                self._cond.wait(timeout)
+            return self._since(version)
+
+    def open_stream(self) -> bool:
+        """스트림 자리 확보 (워커 전체가 max_streams를 넘으면 False)"""
+        if not self.slots.acquire():
+            return False
+        with self._cond:
+            self.streams += 1
+        return True
+
+    def close_stream(self) -> None:
+        with self._cond:
+            self.streams -= 1
+        self.slots.release()
+
+    def status(self) -> Dict:
+        with self._cond:
+            return {
+                "version": self.version,
+                "buffered": len(self._events),
+                "streams": self.streams,
+                "worker_streams": self.slots.streams,
+                "max_streams": self.slots.max_streams,
+                "published": self.published,
+                "resets": self.resets,
+            }
@@ -0,0 +1,244 @@
+"""
+주관식 퀴즈 채점 (뜻 여러 개, 띄어쓰기/문장 부호, 오타 허용)
+
+정답과 답안을 같은 방식으로 정규화하고 뜻 단위로 나눠 비교합니다.
+- 정규화: 유니코드 NFKC, 소문자, 괄호 속 설명 제거, 글자/숫자만 남김 (띄어쓰기, 문장 부호, ~ 무시)
+  예: "사과 (과일)" → "사과", "Ice-Cream" → "icecream"
+- 뜻 나누기: 쉼표, 세미콜론, 슬래시 등으로 구분 ("사과, 사과나무" → "사과", "사과나무")
+  답안의 뜻이 모두 정답의 뜻 중 하나와 맞으면 정답입니다 (하나만 써도 정답).
+  영어 단어(korean_to_english의 정답)는 "and/or", "input/output"처럼 구분자가 단어의 일부이므로
+  나누지 않고 전체로만 비교합니다.
+- 오타 허용: 정답의 뜻과 편집 거리(글자 추가/삭제/바꾸기, 이웃한 두 글자 바꾸기)가
+  뜻 길이 TYPO_CHARS 글자마다 1개, 최대 MAX_TYPOS개 이내이면 정답(오타)으로 봅니다.
+  한글은 자모로 나눠 비교하므로 "고양이"/"고양리"처럼 받침이나 모음 하나 틀린 것은 오타 1개입니다.
+  짧은 뜻("개", "cat", "사과")은 다른 단어가 되기 쉬우므로 정확히 맞아야 합니다.
+  영어 단어는 글자 하나만 바꿔도 다른 단어("house"/"horse")가 되므로, HEADWORD_TYPO_CHARS 글자 이상일 때
+  이웃한 두 글자를 바꿔 쓴 것 하나만 오타로 봅니다 ("differnet" → "different").
+
+정답 쪽 정규화 결과(AnswerKey)는 단어마다 AnswerKeyCache에 두므로,
+채점 비용은 단어장 크기와 무관하게 답안 길이(와 그 단어의 뜻 수)에 비례합니다.
+"""
+
+import re
+import unicodedata
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+# 상수 정의
+MAX_TYPOS = 2  # 허용하는 최대 오타 수
+TYPO_CHARS = 5  # 이 글자 수(한글은 자모 수)마다 오타 1개 허용
+HEADWORD_TYPO_CHARS = 8  # 영어 단어 정답은 이 글자 수 이상일 때만 이웃한 두 글자 바꾸기 1개 허용
+MEANING_SEPARATORS = re.compile(r"[,;/|·、，；\n]")
+NOTE_PATTERN = re.compile(r"\([^)]*\)|\[[^\]]*\]")  # 괄호 속 설명 (품사, 예문 등)
+
+# 한글 음절 → 자모 (호환 자모, 겹받침/겹모음은 한 글자)
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+JONGSEONG = ("", "ㄱ", "ㄲ", "ㄳ", "ㄴ", "ㄵ", "ㄶ", "ㄷ", "ㄹ", "ㄺ", "ㄻ", "ㄼ", "ㄽ", "ㄾ", "ㄿ", "ㅀ",
+             "ㅁ", "ㅂ", "ㅄ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ")
+
+
+def normalize_answer(text: str) -> str:
+    """
+    비교용 정규화 (소문자, 괄호 속 설명 제거, 글자/숫자만)
+
+    괄호를 빼면 아무것도 남지 않으면(예: "(명사)") 괄호 안의 글자도 씁니다.
+    """
+    text = unicodedata.normalize("NFKC", text).casefold()
+    stripped = NOTE_PATTERN.sub("", text)
+    key = "".join(ch for ch in stripped if ch.isalnum())
+    if not key:
+        key = "".join(ch for ch in text if ch.isalnum())
+    return key
+
+
+def split_meanings(text: str) -> List[str]:
+    """뜻 여러 개로 나눠 각각 정규화 (빈 뜻은 제외, 순서 유지)"""
+    meanings = []
+    for part in MEANING_SEPARATORS.split(unicodedata.normalize("NFKC", text)):
+        key = normalize_answer(part)
+        if key and key not in meanings:
+            meanings.append(key)
+    return meanings
+
+
+def decompose_hangul(text: str) -> str:
+    """한글 음절을 자모로 나누기 (다른 글자는 그대로, 예: "감" → "ㄱㅏㅁ")"""
+    if all(ord(ch) < HANGUL_BASE or ord(ch) > HANGUL_LAST for ch in text):
+        return text
+    letters = []
+    for ch in text:
+        code = ord(ch) - HANGUL_BASE
+        if 0 <= code <= HANGUL_LAST - HANGUL_BASE:
+            letters.append(CHOSEONG[code // 588])
+            letters.append(JUNGSEONG[code % 588 // 28])
+            letters.append(JONGSEONG[code % 28])
+        else:
+            letters.append(ch)
+    return "".join(letters)
+
+
+def allowed_typos(length: int) -> int:
+    """뜻 길이(자모 수)에 따른 허용 오타 수"""
+    return min(MAX_TYPOS, length // TYPO_CHARS)
+
+
+def is_transposition(a: str, b: str) -> bool:
+    """이웃한 두 글자만 바꿔 쓴 것인지 ("recieve"/"receive")"""
+    if len(a) != len(b):
+        return False
+    diff = [i for i, (x, y) in enumerate(zip(a, b)) if x != y]
+    return len(diff) == 2 and diff[1] == diff[0] + 1 and a[diff[0]] == b[diff[1]] and a[diff[1]] == b[diff[0]]
+
+
+def bounded_edit_distance(a: str, b: str, limit: int) -> int:
+    """
+    편집 거리 (추가/삭제/바꾸기/이웃한 두 글자 바꾸기), limit을 넘으면 계산을 멈춤
+
+    대각선에서 limit 이내의 칸만 계산하고, 한 줄의 최솟값이 limit을 넘으면 바로 끝내므로
+    O(len(a) * limit)입니다.
+
+    Args:
+        a, b: 비교할 문자열
+        limit: 관심 있는 최대 거리
+
+    Returns:
+        int: 편집 거리, limit을 넘으면 limit + 1
+    """
+    if a == b:
+        return 0
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    over = limit + 1
+    previous2: Optional[List[int]] = None
+    previous = [j if j <= limit else over for j in range(len(b) + 1)]
+    for i in range(1, len(a) + 1):
+        current = [over] * (len(b) + 1)
+        if i <= limit:
+            current[0] = i
+        start, end = max(1, i - limit), min(len(b), i + limit)
+        row_min = current[0]
+        for j in range(start, end + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if (previous2 is not None and i > 1 and j > 1
+                    and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]):
+                value = min(value, previous2[j - 2] + 1)
+            current[j] = min(value, over)
+            row_min = min(row_min, current[j])
+        if row_min > limit:
+            return over
+        previous2, previous = previous, current
+    return previous[len(b)]
+
+
+class AnswerKey:
+    """정답 하나의 정규화 결과 (뜻 목록, 자모로 나눈 형태, 허용 오타 수)"""
+
+    __slots__ = ("source", "meanings", "forms", "headword")
+
+    def __init__(self, answer: str, headword: bool = False):
+        """
+        Args:
+            answer: 정답
+            headword: 영어 단어 정답인지 (뜻으로 나누지 않고 전체로만 비교, 오타는 이웃한 두 글자 바꾸기만)
+        """
+        self.source = answer
+        self.headword = headword
+        meanings = [] if headword else split_meanings(answer)
+        whole = normalize_answer(answer)
+        if whole and whole not in meanings:
+            meanings.append(whole)  # 구분자를 빼고 붙여 쓴 전체 답 ("사과사과나무")
+        self.meanings: FrozenSet[str] = frozenset(meanings)
+        # (자모로 나눈 뜻, 허용 오타 수), 오타를 허용하지 않는 짧은 뜻은 제외
+        forms = []
+        for meaning in meanings:
+            letters = decompose_hangul(meaning)
+            if headword:
+                typos = 1 if len(letters) >= HEADWORD_TYPO_CHARS else 0
+            else:
+                typos = allowed_typos(len(letters))
+            if typos:
+                forms.append((letters, typos))
+        self.forms: Tuple[Tuple[str, int], ...] = tuple(forms)
+
+    def match(self, meaning: str) -> Optional[str]:
+        """
+        정규화한 답안 뜻 하나 확인
+
+        Returns:
+            Optional[str]: "exact"(정규화 후 같음), "typo"(오타 허용 범위), 틀렸으면 None
+        """
+        if meaning in self.meanings:
+            return "exact"
+        if self.forms:
+            letters = decompose_hangul(meaning)
+            for form, typos in self.forms:
+                if self.headword:
+                    if is_transposition(letters, form):
+                        return "typo"
+                elif bounded_edit_distance(letters, form, typos) <= typos:
+                    return "typo"
+        return None
+
+
+def grade_text_answer(key: AnswerKey, answer: str) -> Optional[str]:
+    """
+    주관식 답안 채점
+
+    Args:
+        key: 정답의 AnswerKey
+        answer: 사용자가 입력한 답
+
+    Returns:
+        Optional[str]: "exact", "typo"(하나라도 오타로 맞은 뜻이 있으면), 틀렸으면 None
+    """
+    whole = normalize_answer(answer)
+    if not whole:
+        return None
+    if whole in key.meanings:
+        return "exact"
+    if key.match(whole) == "typo":  # 나누지 않은 정답 전체에 오타 ("input/outptu")
+        return "typo"
+    result = "exact"
+    meanings = split_meanings(answer)
+    for meaning in meanings:
+        matched = key.match(meaning)
+        if matched is None:
+            return None
+        if matched == "typo":
+            result = "typo"
+    return result
+
+
+class AnswerKeyCache:
+    """
+    단어별 AnswerKey 캐시 (단어장마다 하나, 처음 채점할 때 계산)
+
+    정답 글자가 바뀌면 다시 계산하므로 단어가 바뀔 때 discard()를 부르지 않아도 틀리지는 않지만,
+    지운 단어의 항목이 남지 않도록 단어 변경 때 discard()를 부릅니다.
+    """
+
+    def __init__(self):
+        self._keys: Dict[Tuple[str, str], AnswerKey] = {}
+
+    def get(self, word: str, direction: str, answer: str) -> AnswerKey:
+        """
+        Args:
+            word: 단어
+            direction: 퀴즈 방향 (english_to_korean, korean_to_english)
+            answer: 그 방향의 정답
+        """
+        key = self._keys.get((word, direction))
+        if key is None or key.source != answer:
+            key = AnswerKey(answer, headword=direction == "korean_to_english")
+            self._keys[(word, direction)] = key
+        return key
+
+    def discard(self, word: str) -> None:
+        for direction in ("english_to_korean", "korean_to_english"):
+            self._keys.pop((word, direction), None)
+
+    def __len__(self) -> int:
+        return len(self._keys)
@@ -0,0 +1,138 @@
+"""
+HTTP 응답 압축 / 정적 파일 지문
+읽기 API와 정적 파일 응답을 작게 만들고, 다시 방문할 때 내려받을 것이 거의 없도록 돕는 도구입니다.
+
+- choose_encoding(): Accept-Encoding에서 사용할 압축 방식 고르기 (brotli > gzip)
+- compress(): 본문 압축 (brotli는 `pip install brotli`가 되어 있을 때만)
+- encoded_etag(): 압축한 응답의 ETag (압축 방식마다 다른 강한 ETag)
+- StaticFingerprints: 정적 파일 내용 해시 (script.js?v=<해시> 형식 URL용)
+
+웹 앱(web_vocab_app.py)의 after_request 훅에서 사용합니다.
+"""
+
+import gzip
+import hashlib
+import os
+import threading
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import brotli  # 선택 의존성 (없으면 gzip만 사용)
+except ImportError:
+    brotli = None
+
+# 상수 정의
+COMPRESS_MIN_BYTES = 1024  # 이보다 작은 본문은 압축하지 않음
+COMPRESSIBLE_MIMETYPES = (
+    "application/json",
+    "application/javascript",
+    "text/javascript",
+    "text/css",
+    "text/html",
+    "text/plain",
+    "text/csv",
+    "text/tab-separated-values",
+    "application/x-ndjson",
+)
+GZIP_LEVEL = 6
+GZIP_LEVEL_BEST = 9
+BROTLI_QUALITY = 4  # 요청마다 압축하는 API 응답용 (속도 우선)
+BROTLI_QUALITY_BEST = 11  # 한 번만 압축해 두는 정적 파일용
+FINGERPRINT_LENGTH = 12
+
+
+def available_encodings() -> List[str]:
+    """지원하는 압축 방식 (선호 순서)"""
+    return ["br", "gzip"] if brotli is not None else ["gzip"]
+
+
+def choose_encoding(accept_encodings) -> Optional[str]:
+    """
+    요청의 Accept-Encoding에 맞는 압축 방식 고르기
+
+    Args:
+        accept_encodings: werkzeug request.accept_encodings
+
+    Returns:
+        Optional[str]: 'br', 'gzip', 또는 None (압축하지 않음)
+    """
+    for encoding in available_encodings():
+        if accept_encodings[encoding] > 0:
+            return encoding
+    return None
+
+
+def is_compressible(mimetype: Optional[str]) -> bool:
+    return mimetype in COMPRESSIBLE_MIMETYPES
+
+
+def compress(data: bytes, encoding: str, best: bool = False) -> bytes:
+    """
+    본문 압축
+
+    Args:
+        data: 원본 본문
+        encoding: 'br' 또는 'gzip'
+        best: 최대 압축 (정적 파일처럼 결과를 재사용할 때)
+    """
+    if encoding == "br":
+        return brotli.compress(data, quality=BROTLI_QUALITY_BEST if best else BROTLI_QUALITY)
+    # mtime=0: 같은 본문이면 같은 바이트 (강한 ETag와 일치)
+    return gzip.compress(data, compresslevel=GZIP_LEVEL_BEST if best else GZIP_LEVEL, mtime=0)
+
+
+def encoded_etag(tag: str, encoding: str) -> str:
+    """압축한 응답의 ETag (원본과 바이트가 다르므로 다른 값)"""
+    return f"{tag}-{encoding}"
+
+
+def etag_variants(tag: str) -> List[str]:
+    """원본 + 압축 방식별 ETag (If-None-Match 비교용)"""
+    return [tag] + [encoded_etag(tag, encoding) for encoding in available_encodings()]
+
+
+class StaticFingerprints:
+    """
+    정적 파일 내용 해시 캐시
+
+    파일의 수정 시각과 크기가 같으면 다시 읽지 않습니다.
+    압축한 본문도 (파일, 해시, 압축 방식)별로 한 번만 만들어 둡니다.
+    """
+
+    def __init__(self, folder: str):
+        self.folder = folder
+        self._lock = threading.Lock()
+        self._fingerprints: Dict[str, Tuple[int, int, str]] = {}  # {filename: (mtime_ns, size, 해시)}
+        self._compressed: Dict[Tuple[str, str, str], bytes] = {}
+
+    def fingerprint(self, filename: str) -> Optional[str]:
+        """파일 내용 해시 앞부분 (파일이 없으면 None)"""
+        path = os.path.join(self.folder, filename)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        with self._lock:
+            cached = self._fingerprints.get(filename)
+            if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+                return cached[2]
+        with open(path, "rb") as f:
+            digest = hashlib.blake2b(f.read(), digest_size=16).hexdigest()[:FINGERPRINT_LENGTH]
+        with self._lock:
+            self._fingerprints[filename] = (stat.st_mtime_ns, stat.st_size, digest)
+        return digest
+
+    def compressed(self, filename: str, fingerprint: str, encoding: str) -> bytes:
+        """파일 본문을 압축한 결과 (처음 한 번만 압축)"""
+        key = (filename, fingerprint, encoding)
+        with self._lock:
+            body = self._compressed.get(key)
+        if body is None:
+            with open(os.path.join(self.folder, filename), "rb") as f:
+                body = compress(f.read(), encoding, best=True)
+            with self._lock:
+                # 파일이 바뀌어 지문이 달라진 이전 압축본은 버림
+                for old_key in [k for k in self._compressed if k[0] == filename and k[1] != fingerprint]:
+                    del self._compressed[old_key]
+                self._compressed[key] = body
+        return body
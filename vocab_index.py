@@ -0,0 +1,656 @@
+"""
+단어장 메모리 인덱스
+단어 추가/수정/삭제 시 점진적으로 갱신되어, 요청마다 전체 단어장을 훑지 않도록 합니다.
+"""
+
+import hashlib
+import random
+from bisect import bisect_left, bisect_right, insort
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+
+CHECKSUM_MASK = 0xFFFFFFFFFFFFFFFF
+
+
+def content_hash(*fields) -> int:
+    """필드들의 64비트 해시 (워커/프로세스가 달라도 같은 값)"""
+    key = "\x00".join(str(field) for field in fields).encode("utf-8")
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "little")
+
+
+class ContentChecksum:
+    """
+    순서와 무관한 내용 체크섬 (항목 해시의 합)
+
+    항목을 추가/삭제할 때마다 더하고 빼므로 전체를 다시 훑지 않습니다.
+    내용이 같으면 어느 워커에서 계산해도 같은 값이라 ETag로 쓸 수 있습니다.
+    """
+
+    def __init__(self):
+        self.value = 0
+
+    def add(self, *fields) -> None:
+        self.value = (self.value + content_hash(*fields)) & CHECKSUM_MASK
+
+    def discard(self, *fields) -> None:
+        """add()에 넘겼던 것과 같은 필드로 호출"""
+        self.value = (self.value - content_hash(*fields)) & CHECKSUM_MASK
+
+
+class WordPool:
+    """
+    무작위 선택용 단어 풀
+
+    배열 + {단어: 위치} 맵으로 구성되어 추가/삭제/무작위 선택이 모두 O(1)입니다.
+    삭제할 때는 마지막 원소를 빈자리로 옮깁니다(swap-remove).
+    """
+
+    def __init__(self, words: Iterable[str] = ()):
+        self._items: List[str] = []
+        self._pos: Dict[str, int] = {}
+        for word in words:
+            self.add(word)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, word: str) -> bool:
+        return word in self._pos
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __getitem__(self, index: int) -> str:
+        return self._items[index]
+
+    def add(self, word: str) -> None:
+        if word in self._pos:
+            return
+        self._pos[word] = len(self._items)
+        self._items.append(word)
+
+    def remove(self, word: str) -> None:
+        i = self._pos.pop(word, None)
+        if i is None:
+            return
+        last = self._items.pop()
+        if i < len(self._items):
+            self._items[i] = last
+            self._pos[last] = i
+
+    def choice(self) -> str:
+        """무작위 단어 하나 (비어 있으면 IndexError)"""
+        return self._items[random.randrange(len(self._items))]
+
+    def sample(self, k: int, exclude: Iterable[str] = ()) -> List[str]:
+        """
+        exclude에 없는 서로 다른 단어 최대 k개를 무작위로 선택
+
+        후보가 풀의 절반 이상이면 무작위 위치를 골라 거르는 방식으로 O(k)에 끝나고,
+        후보가 적을 때만 후보 목록을 만듭니다.
+
+        Args:
+            k: 선택할 개수
+            exclude: 제외할 단어
+
+        Returns:
+            List[str]: 선택된 단어 (후보가 k개보다 적으면 후보 전체)
+        """
+        excluded = {word for word in exclude if word in self._pos}
+        available = len(self._items) - len(excluded)
+        if available <= 0:
+            return []
+        if available <= k * 2 or available * 2 < len(self._items):
+            candidates = [word for word in self._items if word not in excluded]
+            return random.sample(candidates, min(k, len(candidates)))
+
+        chosen: List[str] = []
+        seen = set(excluded)
+        while len(chosen) < k:
+            word = self._items[random.randrange(len(self._items))]
+            if word not in seen:
+                seen.add(word)
+                chosen.append(word)
+        return chosen
+
+
+class SearchIndex:
+    """
+    단어 검색 인덱스
+
+    - 영어 단어: 정렬된 키 배열 + 이진 탐색으로 접두사 검색
+    - 한국어 뜻: 1-gram/2-gram 역색인으로 부분 문자열 검색
+    """
+
+    def __init__(self):
+        self._keys: List[str] = []              # 정렬된 영어 단어
+        self._meanings: Dict[str, str] = {}     # {word: 정규화된 뜻}
+        self._grams: Dict[str, Set[str]] = {}   # {n-gram: 뜻에 포함된 단어 집합}
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    @staticmethod
+    def _ngrams(text: str) -> Set[str]:
+        """1-gram과 2-gram 집합 (공백 제외)"""
+        grams = {ch for ch in text if not ch.isspace()}
+        grams.update(text[i:i + 2] for i in range(len(text) - 1) if not text[i:i + 2].isspace())
+        return grams
+
+    def build(self, items: Iterable[Tuple[str, str]]) -> None:
+        """
+        전체 단어로 한 번에 만들기 (불러오기 직후)
+
+        단어마다 insort하면 O(n²)이므로 키를 모두 붙인 뒤 한 번만 정렬합니다.
+
+        Args:
+            items: (영어 단어, 한국어 뜻) 목록 (단어 중복 없음)
+        """
+        self._keys = []
+        self._meanings = {}
+        self._grams = {}
+        for word, korean in items:
+            self._keys.append(word)
+            meaning = korean.lower()
+            self._meanings[word] = meaning
+            for gram in self._ngrams(meaning):
+                self._grams.setdefault(gram, set()).add(word)
+        self._keys.sort()
+
+    def add(self, word: str, korean: str) -> None:
+        """단어 추가 (이미 있으면 뜻만 갱신)"""
+        if word in self._meanings:
+            self.remove(word)
+        insort(self._keys, word)
+        meaning = korean.lower()
+        self._meanings[word] = meaning
+        for gram in self._ngrams(meaning):
+            self._grams.setdefault(gram, set()).add(word)
+
+    def remove(self, word: str) -> None:
+        """단어 제거"""
+        meaning = self._meanings.pop(word, None)
+        if meaning is None:
+            return
+        i = bisect_left(self._keys, word)
+        if i < len(self._keys) and self._keys[i] == word:
+            del self._keys[i]
+        for gram in self._ngrams(meaning):
+            words = self._grams.get(gram)
+            if words is not None:
+                words.discard(word)
+                if not words:
+                    del self._grams[gram]
+
+    def iter_prefix(self, prefix: str):
+        """접두사로 시작하는 영어 단어를 사전 순으로 반환"""
+        i = bisect_left(self._keys, prefix)
+        while i < len(self._keys) and self._keys[i].startswith(prefix):
+            yield self._keys[i]
+            i += 1
+
+    def iter_after(self, cursor: str = ""):
+        """cursor 다음 단어부터 사전 순으로 반환 (페이지네이션용)"""
+        i = bisect_right(self._keys, cursor) if cursor else 0
+        while i < len(self._keys):
+            yield self._keys[i]
+            i += 1
+
+    def meaning_matches(self, query: str) -> Set[str]:
+        """뜻에 query가 포함된 단어 집합 (n-gram 교집합 후 확인)"""
+        grams = self._ngrams(query) if len(query) < 2 else {
+            query[i:i + 2] for i in range(len(query) - 1) if not query[i:i + 2].isspace()
+        }
+        if not grams:
+            return set()
+        candidate_sets = sorted((self._grams.get(gram, set()) for gram in grams), key=len)
+        candidates = set(candidate_sets[0])
+        for other in candidate_sets[1:]:
+            candidates &= other
+            if not candidates:
+                break
+        return {word for word in candidates if query in self._meanings[word]}
+
+    def search(self, query: str, limit: int = 50,
+               accept: Optional[Callable[[str], bool]] = None) -> List[str]:
+        """
+        영어 접두사 일치 → 한국어 뜻 부분 일치 순서로 최대 limit개 반환
+
+        Args:
+            query: 검색어
+            limit: 최대 결과 수 (찾는 즉시 멈춤)
+            accept: 결과에 포함할지 판단하는 함수 (예: 카테고리 필터)
+
+        Returns:
+            List[str]: 영어 단어 목록
+        """
+        query = query.strip().lower()
+        if not query:
+            return []
+
+        results: List[str] = []
+        seen: Set[str] = set()
+
+        def push(word: str) -> bool:
+            if word in seen or (accept is not None and not accept(word)):
+                return len(results) < limit
+            seen.add(word)
+            results.append(word)
+            return len(results) < limit
+
+        for word in self.iter_prefix(query):
+            if not push(word):
+                return results
+        for word in sorted(self.meaning_matches(query)):
+            if not push(word):
+                return results
+        return results
+
+
+class CategoryIndex:
+    """
+    카테고리 → 단어 풀 인덱스
+
+    카테고리별 단어 수를 바로 알 수 있고, 카테고리 필터링 시 전체 단어장을 훑지 않습니다.
+    카테고리 안에서의 무작위 선택도 WordPool이므로 O(1)입니다.
+    페이지네이션용 정렬 목록은 처음 요청될 때 만들고, 해당 카테고리가 바뀌면 버립니다.
+    """
+
+    def __init__(self):
+        self._words: Dict[str, WordPool] = {}       # {category: 단어 풀}
+        self._sorted: Dict[str, List[str]] = {}     # {category: 정렬된 단어 목록 (캐시)}
+
+    def add(self, word: str, category: str) -> None:
+        pool = self._words.get(category)
+        if pool is None:
+            pool = self._words[category] = WordPool()
+        pool.add(word)
+        self._sorted.pop(category, None)
+
+    def remove(self, word: str, category: str) -> None:
+        words = self._words.get(category)
+        if words is None:
+            return
+        words.remove(word)
+        if not words:
+            del self._words[category]
+        self._sorted.pop(category, None)
+
+    def count(self, category: str) -> int:
+        """카테고리에 속한 단어 수"""
+        return len(self._words.get(category, ()))
+
+    def counts(self) -> Dict[str, int]:
+        """{category: 단어 수} (빈 카테고리 포함)"""
+        return {category: len(words) for category, words in self._words.items()}
+
+    def categories(self) -> List[str]:
+        """이름이 있는 카테고리 목록 (정렬, 앞뒤 공백 제거)"""
+        return sorted({category.strip() for category in self._words if category.strip()})
+
+    def pool(self, category: str) -> WordPool:
+        """카테고리에 속한 단어 풀 (수정하지 말 것, 없으면 빈 풀)"""
+        return self._words.get(category) or WordPool()
+
+    def sorted_words(self, category: str) -> List[str]:
+        """카테고리에 속한 단어의 정렬 목록"""
+        cached = self._sorted.get(category)
+        if cached is None:
+            cached = sorted(self._words.get(category, ()))
+            self._sorted[category] = cached
+        return cached
+
+    def iter_after(self, category: str, cursor: str = ""):
+        """카테고리 안에서 cursor 다음 단어부터 사전 순으로 반환"""
+        words = self.sorted_words(category)
+        i = bisect_right(words, cursor) if cursor else 0
+        while i < len(words):
+            yield words[i]
+            i += 1
+
+
+class AccuracyIndex:
+    """
+    정답률 구간 인덱스
+
+    정답률을 0.1% 단위 구간(0~1000)으로 나누고 구간마다 WordPool을 둡니다.
+    단어 이동은 O(1)이고, 하위 N번째 단어 찾기는 구간 크기만 훑으므로 단어 수와 무관합니다.
+    """
+
+    BUCKETS = 1001
+
+    def __init__(self):
+        self._buckets: List[Optional[WordPool]] = [None] * self.BUCKETS
+        self._sizes: List[int] = [0] * self.BUCKETS
+        self._bucket_of: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._bucket_of)
+
+    def __contains__(self, word: str) -> bool:
+        return word in self._bucket_of
+
+    @staticmethod
+    def bucket_for(correct: int, wrong: int) -> Optional[int]:
+        """정답률 구간 번호 (기록이 없으면 None)"""
+        total = correct + wrong
+        if total <= 0:
+            return None
+        return int(round(correct * 1000 / total))
+
+    def set(self, word: str, correct: int, wrong: int) -> None:
+        """단어의 통계 갱신 (기록이 없으면 제거)"""
+        bucket = self.bucket_for(correct, wrong)
+        if self._bucket_of.get(word) == bucket:
+            return
+        self.remove(word)
+        if bucket is None:
+            return
+        pool = self._buckets[bucket]
+        if pool is None:
+            pool = self._buckets[bucket] = WordPool()
+        pool.add(word)
+        self._sizes[bucket] += 1
+        self._bucket_of[word] = bucket
+
+    def remove(self, word: str) -> None:
+        bucket = self._bucket_of.pop(word, None)
+        if bucket is None:
+            return
+        self._buckets[bucket].remove(word)
+        self._sizes[bucket] -= 1
+
+    def nth_lowest(self, n: int) -> str:
+        """정답률 낮은 순으로 n번째(0부터) 단어 (같은 구간 안의 순서는 임의)"""
+        for bucket, size in enumerate(self._sizes):
+            if n < size:
+                return self._buckets[bucket][n]
+            n -= size
+        raise IndexError(n)
+
+    def pick_lowest(self, fraction: float = 0.5) -> Optional[str]:
+        """
+        정답률 하위 fraction 안에서 무작위 단어 하나
+
+        Returns:
+            Optional[str]: 단어 (통계가 있는 단어가 없으면 None)
+        """
+        if not self._bucket_of:
+            return None
+        limit = max(1, int(len(self._bucket_of) * fraction))
+        return self.nth_lowest(random.randrange(limit))
+
+    def sample_lowest(self, k: int, fraction: float = 0.5) -> List[str]:
+        """정답률 하위 fraction 안에서 서로 다른 단어 최대 k개"""
+        if not self._bucket_of:
+            return []
+        limit = max(1, int(len(self._bucket_of) * fraction))
+        return [self.nth_lowest(n) for n in random.sample(range(limit), min(k, limit))]
+
+
+class WeaknessRanking:
+    """
+    틀린 단어 집중 학습용 정답률 순위 (전체 + 카테고리별)
+
+    퀴즈 통계가 바뀔 때마다 update()로 O(1) 갱신되므로,
+    문제를 낼 때 전체 단어를 정렬할 필요가 없습니다.
+    """
+
+    def __init__(self):
+        self._all = AccuracyIndex()
+        self._by_category: Dict[str, AccuracyIndex] = {}
+        self._category_of: Dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._all)
+
+    def update(self, word: str, category: str, stats: Optional[List[int]]) -> None:
+        """
+        단어의 카테고리/통계 반영
+
+        Args:
+            word: 단어
+            category: 단어의 카테고리
+            stats: [맞춘 횟수, 틀린 횟수] (없으면 None)
+        """
+        if stats is None or sum(stats) <= 0:
+            self.remove(word)
+            return
+        if self._category_of.get(word, category) != category:
+            self.remove(word)
+        correct, wrong = stats
+        self._all.set(word, correct, wrong)
+        index = self._by_category.get(category)
+        if index is None:
+            index = self._by_category[category] = AccuracyIndex()
+        index.set(word, correct, wrong)
+        self._category_of[word] = category
+
+    def remove(self, word: str) -> None:
+        category = self._category_of.pop(word, None)
+        if category is None:
+            return
+        self._all.remove(word)
+        index = self._by_category.get(category)
+        if index is not None:
+            index.remove(word)
+            if not len(index):
+                del self._by_category[category]
+
+    def pick_weak(self, category: Optional[str] = None) -> Optional[str]:
+        """정답률 하위 50% 중 무작위 단어 (카테고리 지정 가능, 없으면 None)"""
+        if category:
+            index = self._by_category.get(category)
+            return index.pick_lowest() if index is not None else None
+        return self._all.pick_lowest()
+
+    def sample_weak(self, k: int, category: Optional[str] = None) -> List[str]:
+        """정답률 하위 50% 중 서로 다른 단어 최대 k개 (카테고리 지정 가능)"""
+        if category:
+            index = self._by_category.get(category)
+            return index.sample_lowest(k) if index is not None else []
+        return self._all.sample_lowest(k)
+
+
+class AccuracyOrder:
+    """
+    정답률 순서 목록 (정답률 구간별로 단어를 사전 순 정렬)
+
+    구간은 AccuracyIndex와 같은 0.1% 단위입니다. 아직 정렬하지 않은 구간(처음 만들 때)은 끝에 붙였다가
+    처음 조회하거나 지울 때 한 번 정렬하고, 그 뒤로는 insort/이진 탐색 삭제로 정렬 상태를 유지합니다.
+    채점마다 구간 전체를 다시 정렬하지 않으므로 단어가 몰린 0%, 100% 구간도 변경은 이진 탐색 + 이동입니다.
+    """
+
+    def __init__(self):
+        self._buckets: List[Optional[List[str]]] = [None] * AccuracyIndex.BUCKETS
+        self._dirty: Set[int] = set()  # 정렬이 필요한 구간
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _sorted(self, bucket: int) -> List[str]:
+        words = self._buckets[bucket]
+        if bucket in self._dirty:
+            words.sort()
+            self._dirty.discard(bucket)
+        return words
+
+    def add(self, word: str, bucket: int) -> None:
+        words = self._buckets[bucket]
+        if words is None:
+            words = self._buckets[bucket] = []
+            self._dirty.add(bucket)
+        if bucket in self._dirty:
+            words.append(word)
+        else:
+            insort(words, word)
+        self._count += 1
+
+    def remove(self, word: str, bucket: int) -> None:
+        words = self._sorted(bucket)
+        i = bisect_left(words, word)
+        if i < len(words) and words[i] == word:
+            del words[i]
+            self._count -= 1
+
+    def page(self, offset: int, limit: int, ascending: bool = False) -> List[str]:
+        """
+        정답률 순서로 offset번째부터 최대 limit개 (같은 정답률이면 사전 순)
+
+        Args:
+            offset: 건너뛸 개수
+            limit: 최대 개수
+            ascending: True면 정답률 낮은 순
+        """
+        words: List[str] = []
+        order = range(len(self._buckets)) if ascending else range(len(self._buckets) - 1, -1, -1)
+        for bucket in order:
+            if len(words) >= limit:
+                break
+            size = len(self._buckets[bucket] or ())
+            if offset >= size:
+                offset -= size
+                continue
+            bucket_words = self._sorted(bucket)
+            words.extend(bucket_words[offset:offset + limit - len(words)])
+            offset = 0
+        return words
+
+
+class StatsAggregate:
+    """
+    퀴즈 통계 집계 (/api/stats 용, 전체 + 카테고리별)
+
+    통계나 단어 데이터가 바뀔 때마다 update()로 갱신되는 정답률 순서 목록과 합계입니다.
+    요청마다 전체 통계를 훑어 정렬하지 않고, 상위/하위 K개와 페이지는 구간 수 + K에 비례합니다.
+
+    checksum은 단어별 내용의 해시 합이므로 순서와 무관하게 내용이 같으면 같은 값입니다.
+    여러 워커가 같은 데이터를 가지고 있으면 같은 ETag가 나옵니다.
+    """
+
+    def __init__(self):
+        # {word: (correct, wrong, korean, category, 구간, 해시)}
+        self._entries: Dict[str, Tuple[int, int, str, str, int, int]] = {}
+        self._all = AccuracyOrder()
+        self._by_category: Dict[str, AccuracyOrder] = {}
+        self._totals: Dict[str, List[int]] = {}  # {category: [단어 수, 맞은 횟수, 틀린 횟수]}
+        self.checksum = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, word: str) -> bool:
+        return word in self._entries
+
+    @staticmethod
+    def bucket_for(correct: int, wrong: int) -> int:
+        """정답률 구간 번호 (푼 적이 없으면 0)"""
+        bucket = AccuracyIndex.bucket_for(correct, wrong)
+        return 0 if bucket is None else bucket
+
+    def update(self, word: str, korean: str, category: str, stats: Optional[List[int]]) -> None:
+        """
+        단어의 통계/뜻/카테고리 반영
+
+        Args:
+            word: 단어
+            korean: 뜻
+            category: 카테고리
+            stats: [맞춘 횟수, 틀린 횟수] (없으면 집계에서 제외)
+        """
+        if stats is None:
+            self.remove(word)
+            return
+        correct, wrong = int(stats[0]), int(stats[1])
+        current = self._entries.get(word)
+        if current is not None and current[:4] == (correct, wrong, korean, category):
+            return
+        bucket = self.bucket_for(correct, wrong)
+        entry_hash = content_hash(word, korean, category, correct, wrong)
+        if current is not None and current[3] == category and current[4] == bucket:
+            # 같은 구간이면 순서 목록은 그대로 두고 합계와 해시만 갱신 (0% 단어를 또 틀린 경우 등)
+            totals = self._totals[category]
+            totals[1] += correct - current[0]
+            totals[2] += wrong - current[1]
+            self.checksum = (self.checksum - current[5] + entry_hash) & CHECKSUM_MASK
+            self._entries[word] = (correct, wrong, korean, category, bucket, entry_hash)
+            return
+        self.remove(word)
+        self._entries[word] = (correct, wrong, korean, category, bucket, entry_hash)
+        self._all.add(word, bucket)
+        order = self._by_category.get(category)
+        if order is None:
+            order = self._by_category[category] = AccuracyOrder()
+        order.add(word, bucket)
+        totals = self._totals.setdefault(category, [0, 0, 0])
+        totals[0] += 1
+        totals[1] += correct
+        totals[2] += wrong
+        self.checksum = (self.checksum + entry_hash) & CHECKSUM_MASK
+
+    def remove(self, word: str) -> None:
+        entry = self._entries.pop(word, None)
+        if entry is None:
+            return
+        correct, wrong, _, category, bucket, entry_hash = entry
+        self._all.remove(word, bucket)
+        order = self._by_category[category]
+        order.remove(word, bucket)
+        totals = self._totals[category]
+        totals[0] -= 1
+        totals[1] -= correct
+        totals[2] -= wrong
+        if not len(order):
+            del self._by_category[category]
+            del self._totals[category]
+        self.checksum = (self.checksum - entry_hash) & CHECKSUM_MASK
+
+    def get(self, word: str) -> Optional[Tuple[int, int, str, str]]:
+        """단어의 (맞은 횟수, 틀린 횟수, 뜻, 카테고리), 없으면 None"""
+        entry = self._entries.get(word)
+        return entry[:4] if entry is not None else None
+
+    def count(self, category: Optional[str] = None) -> int:
+        """통계가 있는 단어 수 (전체 또는 카테고리별)"""
+        if category is None:
+            return len(self._entries)
+        return self._totals.get(category, [0])[0]
+
+    def page(self, offset: int = 0, limit: Optional[int] = None, category: Optional[str] = None,
+             ascending: bool = False) -> List[str]:
+        """
+        정답률 높은 순(ascending=True면 낮은 순)으로 offset번째부터 최대 limit개 단어
+
+        Args:
+            offset: 건너뛸 개수
+            limit: 최대 개수 (없으면 끝까지)
+            category: 카테고리 (없으면 전체)
+            ascending: 정답률 낮은 순 여부
+        """
+        order = self._all if category is None else self._by_category.get(category)
+        if order is None:
+            return []
+        if limit is None:
+            limit = len(order)
+        return order.page(offset, limit, ascending)
+
+    def summary(self, category: Optional[str] = None) -> Dict[str, int]:
+        """
+        합계 (전체 또는 카테고리별)
+
+        Returns:
+            Dict[str, int]: {"words", "correct", "wrong", "total"}
+        """
+        if category is None:
+            words = len(self._entries)
+            correct = sum(totals[1] for totals in self._totals.values())
+            wrong = sum(totals[2] for totals in self._totals.values())
+        else:
+            words, correct, wrong = self._totals.get(category, [0, 0, 0])
+        return {"words": words, "correct": correct, "wrong": wrong, "total": correct + wrong}
+
+    def categories(self) -> Dict[str, Dict[str, int]]:
+        """카테고리별 합계 ({category: summary()})"""
+        return {category: self.summary(category) for category in sorted(self._totals)}
+
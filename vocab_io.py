@@ -0,0 +1,168 @@
+"""
+단어장 가져오기/내보내기 (CSV, TSV, NDJSON)
+파일 전체를 메모리에 올리지 않고 한 줄씩 읽고, 묶음 단위로 씁니다.
+
+가져오기 형식:
+- CSV/TSV: english, korean, category 열 (첫 줄이 머리글이면 열 이름으로, 아니면 순서대로 읽음)
+- NDJSON: 한 줄에 하나씩 {"english": ..., "korean": ..., "category": ...}
+"""
+
+import csv
+import io
+import json
+import os
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+FORMATS = ("csv", "tsv", "ndjson")
+FIELDS = ["english", "korean", "category"]
+DELIMITERS = {"csv": ",", "tsv": "\t"}
+MIMETYPES = {
+    "csv": "text/csv",
+    "tsv": "text/tab-separated-values",
+    "ndjson": "application/x-ndjson"
+}
+
+
+def validate_word_input(english: str, korean: str) -> Tuple[bool, Optional[str]]:
+    """
+    단어 입력값 검증
+
+    Args:
+        english: 영어 단어
+        korean: 한국어 뜻
+
+    Returns:
+        Tuple[bool, Optional[str]]: (검증 성공 여부, 에러 메시지)
+    """
+    if not english or not english.strip():
+        return False, "영어 단어를 입력해주세요."
+    if not korean or not korean.strip():
+        return False, "한국어 뜻을 입력해주세요."
+    if len(english) > 100:
+        return False, "영어 단어는 100자 이하여야 합니다."
+    if len(korean) > 200:
+        return False, "한국어 뜻은 200자 이하여야 합니다."
+    return True, None
+
+
+def detect_format(filename: str = "", content_type: str = "") -> Optional[str]:
+    """
+    파일 이름 확장자 또는 Content-Type으로 형식 추측
+
+    Returns:
+        Optional[str]: 'csv', 'tsv', 'ndjson' 또는 None
+    """
+    extension = os.path.splitext(filename or "")[1].lower().lstrip(".")
+    if extension in ("jsonl", "json"):
+        extension = "ndjson"
+    if extension in FORMATS:
+        return extension
+    content_type = (content_type or "").split(";")[0].strip().lower()
+    for fmt, mimetype in MIMETYPES.items():
+        if content_type == mimetype:
+            return fmt
+    if content_type in ("application/jsonl", "application/json-lines"):
+        return "ndjson"
+    return None
+
+
+def normalize_row(english, korean, category) -> Tuple[Optional[Dict], Optional[str]]:
+    """
+    가져온 한 줄을 단어 데이터로 변환하고 검증
+
+    Returns:
+        Tuple[Optional[Dict], Optional[str]]: ({english, korean, category}, None) 또는 (None, 에러 메시지)
+    """
+    if not all(isinstance(value, str) for value in (english, korean, category)):
+        return None, "english, korean, category는 문자열이어야 합니다."
+    english = english.strip().lower()
+    korean = korean.strip()
+    is_valid, error_message = validate_word_input(english, korean)
+    if not is_valid:
+        return None, error_message
+    return {"english": english, "korean": korean, "category": category.strip()}, None
+
+
+def _iter_delimited(lines: Iterable[str], delimiter: str) -> Iterator[Tuple[int, Optional[Dict], Optional[str]]]:
+    reader = csv.reader(lines, delimiter=delimiter)
+    columns = None
+    for row in reader:
+        if not row or not any(cell.strip() for cell in row):
+            continue
+        if columns is None:
+            columns = [cell.strip().lower() for cell in row]
+            if "english" in columns and "korean" in columns:
+                continue  # 머리글
+            columns = FIELDS
+        values = dict(zip(columns, row))
+        word, error_message = normalize_row(
+            values.get("english", ""), values.get("korean", ""), values.get("category", "")
+        )
+        yield reader.line_num, word, error_message
+
+
+def _iter_ndjson(lines: Iterable[str]) -> Iterator[Tuple[int, Optional[Dict], Optional[str]]]:
+    for line_num, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            item = json.loads(line)
+        except json.JSONDecodeError:
+            yield line_num, None, "JSON 형식이 올바르지 않습니다."
+            continue
+        if not isinstance(item, dict):
+            yield line_num, None, "한 줄에 JSON 객체 하나가 있어야 합니다."
+            continue
+        word, error_message = normalize_row(
+            item.get("english", ""), item.get("korean", ""), item.get("category", "")
+        )
+        yield line_num, word, error_message
+
+
+def iter_import_rows(lines: Iterable[str], fmt: str) -> Iterator[Tuple[int, Optional[Dict], Optional[str]]]:
+    """
+    가져올 파일을 한 줄씩 읽어 검증
+
+    Args:
+        lines: 텍스트 줄 (파일 객체 등, CSV는 newline='' 로 연 것)
+        fmt: 'csv', 'tsv' 또는 'ndjson'
+
+    Returns:
+        Iterator: (줄 번호, 단어 데이터 또는 None, 에러 메시지 또는 None)
+    """
+    if fmt == "ndjson":
+        return _iter_ndjson(lines)
+    if fmt in DELIMITERS:
+        return _iter_delimited(lines, DELIMITERS[fmt])
+    raise ValueError(f"지원하지 않는 형식입니다: {fmt}")
+
+
+def export_chunks(chunks: Iterable[List[Dict]], fmt: str) -> Iterator[str]:
+    """
+    단어 묶음을 내보내기 형식의 문자열로 변환 (묶음마다 하나씩)
+
+    Args:
+        chunks: [{english, korean, category}, ...] 묶음들
+        fmt: 'csv', 'tsv' 또는 'ndjson'
+
+    Returns:
+        Iterator[str]: 내보낼 텍스트 조각 (CSV/TSV는 머리글부터)
+    """
+    if fmt == "ndjson":
+        for chunk in chunks:
+            yield "".join(json.dumps(word, ensure_ascii=False) + "\n" for word in chunk)
+        return
+    if fmt not in DELIMITERS:
+        raise ValueError(f"지원하지 않는 형식입니다: {fmt}")
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, delimiter=DELIMITERS[fmt], lineterminator="\n")
+    writer.writerow(FIELDS)
+    for chunk in chunks:
+        for word in chunk:
+            writer.writerow([word.get(field, "") for field in FIELDS])
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
@@ -0,0 +1,135 @@
+"""
+Prometheus 지표 (/metrics)
+요청 처리 시간, 저장/불러오기 시간과 기록한 바이트 수, 퀴즈 채점 수, 캐시 적중, 인덱스 크기를 모읍니다.
+
+- prometheus_client가 설치되어 있을 때만 동작합니다 (`pip install prometheus_client`).
+  없으면 지표 객체는 아무 일도 하지 않고 /metrics는 503을 돌려줍니다.
+- PROMETHEUS_MULTIPROC_DIR 환경 변수가 있으면 멀티프로세스 모드입니다.
+  워커마다 그 폴더의 mmap 파일에 기록하고, /metrics를 받은 워커가 모든 워커의 값을 합쳐서 보여 줍니다.
+  gunicorn.conf.py가 워커를 띄우기 전에 폴더를 만들어 설정하고 종료한 워커의 파일을 정리합니다.
+  환경 변수는 prometheus_client를 불러오기 전에 있어야 합니다.
+- 기록은 값 하나를 더하는 정도라 운영 중에도 켜 둘 수 있습니다.
+
+지표 (모두 vocab_ 접두어):
+    http_request_duration_seconds{method, route}      요청 처리 시간 (스트리밍 응답은 본문 전까지)
+    http_requests_total{method, route, status}        응답 수
+    load_duration_seconds                             단어장 하나의 전체 불러오기 시간 (Deck.load)
+    sync_changes_total                                다른 워커에서 가져온 변경 사항 수
+    storage_write_duration_seconds{operation}         저장 시간 (append: 저널/로그 추가, snapshot: 전체 저장, compact: 압축)
+    storage_write_bytes{operation}                    한 번에 기록한 바이트 수
+    quiz_answers_total{mode, result}                  채점한 답안 수
+    cache_lookups_total{cache, result}                캐시 확인 (etag: 조건부 요청, data: 메모리 데이터 최신 여부)
+    index_size{index}                                 인덱스 항목 수 (/metrics 요청 때 갱신)
+    deck_cache_total{result}                          단어장 캐시 (hit: 이미 불러옴, miss: 새로 불러옴, eviction: 내보냄)
+    deck_cache_bytes                                  워커들이 메모리에 둔 단어장의 추정 크기 합계
+"""
+
+import os
+from typing import Dict, Tuple
+
+try:
+    import prometheus_client  # 선택 의존성 (없으면 지표 수집 안 함)
+    from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram, multiprocess
+except ImportError:
+    prometheus_client = None
+
+# 상수 정의
+MULTIPROC_ENV = "PROMETHEUS_MULTIPROC_DIR"
+PREFIX = "vocab"
+# 대부분의 API는 1ms 안팎이므로 기본 버킷(5ms부터)보다 촘촘하게
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+STORAGE_BUCKETS = (0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0)
+LOAD_BUCKETS = (0.01, 0.05, 0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+BYTES_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216, 67108864, 268435456)
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class _NoopMetric:
+    """prometheus_client가 없을 때 쓰는 빈 지표"""
+
+    def labels(self, *args, **kwargs) -> "_NoopMetric":
+        return self
+
+    def inc(self, amount: float = 1) -> None:
+        pass
+
+    def observe(self, amount: float) -> None:
+        pass
+
+    def set(self, value: float) -> None:
+        pass
+
+
+def is_enabled() -> bool:
+    """지표를 수집하는지 (prometheus_client 설치 여부)"""
+    return prometheus_client is not None
+
+
+def is_multiprocess() -> bool:
+    """여러 워커의 지표를 합치는 모드인지"""
+    return is_enabled() and bool(os.environ.get(MULTIPROC_ENV))
+
+
+if prometheus_client is not None:
+    REQUEST_SECONDS = Histogram(f"{PREFIX}_http_request_duration_seconds", "요청 처리 시간",
+                                ["method", "route"], buckets=LATENCY_BUCKETS)
+    REQUESTS = Counter(f"{PREFIX}_http_requests_total", "응답 수", ["method", "route", "status"])
+    LOAD_SECONDS = Histogram(f"{PREFIX}_load_duration_seconds", "전체 불러오기 시간", buckets=LOAD_BUCKETS)
+    SYNC_CHANGES = Counter(f"{PREFIX}_sync_changes_total", "다른 워커에서 가져온 변경 사항 수")
+    STORAGE_SECONDS = Histogram(f"{PREFIX}_storage_write_duration_seconds", "저장 시간",
+                                ["operation"], buckets=STORAGE_BUCKETS)
+    STORAGE_BYTES = Histogram(f"{PREFIX}_storage_write_bytes", "한 번에 기록한 바이트 수",
+                              ["operation"], buckets=BYTES_BUCKETS)
+    QUIZ_ANSWERS = Counter(f"{PREFIX}_quiz_answers_total", "채점한 답안 수", ["mode", "result"])
+    CACHE_LOOKUPS = Counter(f"{PREFIX}_cache_lookups_total", "캐시 확인", ["cache", "result"])
+    # 워커마다 같은 데이터를 가지므로 가장 최근에 기록한(= /metrics를 받은) 워커의 값
+    INDEX_SIZE = Gauge(f"{PREFIX}_index_size", "인덱스 항목 수", ["index"],
+                       multiprocess_mode="livemostrecent")
+    DECK_CACHE = Counter(f"{PREFIX}_deck_cache_total", "단어장 캐시 확인", ["result"])
+    # 워커마다 다른 단어장을 가지므로 살아 있는 워커의 합계
+    DECK_CACHE_BYTES = Gauge(f"{PREFIX}_deck_cache_bytes", "메모리에 둔 단어장의 추정 크기",
+                             multiprocess_mode="livesum")
+else:
+    REQUEST_SECONDS = REQUESTS = LOAD_SECONDS = SYNC_CHANGES = STORAGE_SECONDS = STORAGE_BYTES = \
+        QUIZ_ANSWERS = CACHE_LOOKUPS = INDEX_SIZE = DECK_CACHE = DECK_CACHE_BYTES = _NoopMetric()
+
+
+def observe_request(method: str, route: str, status: int, seconds: float) -> None:
+    """
+    요청 하나 기록
+
+    Args:
+        method: HTTP 메서드
+        route: URL 규칙 (예: /api/words/<word>, 단어마다 늘어나지 않도록 실제 경로 대신)
+        status: 응답 상태 코드
+        seconds: 처리 시간
+    """
+    REQUEST_SECONDS.labels(method, route).observe(seconds)
+    REQUESTS.labels(method, route, str(status)).inc()
+
+
+def observe_storage(operation: str, seconds: float, nbytes: int) -> None:
+    """저장소 쓰기 하나 기록 (저장소의 observer로 전달)"""
+    STORAGE_SECONDS.labels(operation).observe(seconds)
+    STORAGE_BYTES.labels(operation).observe(nbytes)
+
+
+def set_index_sizes(sizes: Dict[str, int]) -> None:
+    """인덱스 크기 갱신 ({인덱스 이름: 항목 수})"""
+    for name, size in sizes.items():
+        INDEX_SIZE.labels(name).set(size)
+
+
+def render() -> Tuple[bytes, str]:
+    """
+    Prometheus 텍스트 형식 지표
+
+    Returns:
+        Tuple[bytes, str]: (본문, Content-Type)
+    """
+    if is_multiprocess():
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = prometheus_client.REGISTRY
+    return prometheus_client.generate_latest(registry), CONTENT_TYPE
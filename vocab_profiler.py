@@ -0,0 +1,294 @@
+"""
+샘플링 프로파일러
+운영 중인 워커가 느려졌을 때 어디서 시간을 쓰는지(jsonify, 스냅샷 저장, 퀴즈 단어 선택 등) 확인하는 도구입니다.
+
+- SamplingProfiler: 정해진 시간 동안 별도 OS 스레드가 interval초마다 모든 스레드의 스택을 읽어 셉니다.
+  함수 호출마다 훅을 거는 cProfile과 달리 요청 처리 코드는 그대로 실행되므로 실제 트래픽에 켜 둘 수 있습니다.
+  결과는 워커마다 파일 하나로 저장합니다.
+  - collapsed: "바깥;...;안쪽 횟수" 줄 형식 (flamegraph.pl, speedscope, inferno에서 불꽃 그래프로)
+  - pstats: `python -m pstats 파일` 또는 snakeviz로 열 수 있는 형식 (호출 수 대신 샘플 수)
+- ProfileTrigger: 한 워커가 받은 프로파일 요청을 파일로 남겨 다른 워커도 같은 구간을 기록하게 함
+- start_request_profile(), save_request_profile(): 요청 하나를 cProfile로 기록
+  (모든 함수 호출을 세므로 느리지만 짧은 요청도 빠짐없이 보임)
+
+대기 중인 스레드(요청을 기다리는 스레드 등)의 스택은 기본적으로 빼고 셉니다.
+샘플러도 GIL을 잡아야 스택을 읽을 수 있으므로, GIL을 놓는 지점(파일 stat, 소켓 쓰기 등)에
+샘플이 실제보다 많이 잡힐 수 있습니다. 순수 파이썬 계산은 GIL 전환 간격(5ms)마다 고르게 잡힙니다.
+"""
+
+import cProfile
+import json
+import marshal
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+from vocab_async import native_sleep, start_native_thread
+
+# 상수 정의
+DEFAULT_INTERVAL = 0.01  # 샘플 간격 (초, 100Hz)
+MAX_SECONDS = 300  # 한 번에 기록할 수 있는 최대 시간
+FORMATS = ("collapsed", "pstats")
+EXTENSIONS = {"collapsed": "collapsed", "pstats": "prof"}
+# 가장 안쪽 프레임이 이 파일에 있으면 대기 중인 스레드로 보고 제외 (잠금/큐 대기, select, 소켓 읽기, 스레드 풀)
+IDLE_FILES = ("/threading.py", "/selectors.py", "/socket.py", "/queue.py", "/ssl.py", "/concurrent/futures/thread.py")
+TRIGGER_FILE = ".trigger"
+TRIGGER_CHECK_INTERVAL = 1.0  # 다른 워커의 프로파일 요청 확인 간격 (초)
+
+Frame = Tuple[str, int, str]  # (파일, 함수 시작 줄, 함수 이름) - pstats 키와 같은 형식
+
+
+def _short_path(filename: str) -> str:
+    """불꽃 그래프 이름용 짧은 경로 (폴더/파일)"""
+    parts = filename.replace("\\", "/").rsplit("/", 2)
+    return "/".join(parts[-2:])
+
+
+def output_path(directory: str, prefix: str, fmt: str) -> str:
+    """워커와 시각이 들어간 결과 파일 경로 (profile-<pid>-<시각>.collapsed 등)"""
+    now = time.time()
+    stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(now)) + f".{int(now * 1000) % 1000:03d}"
+    return os.path.join(directory, f"{prefix}-{os.getpid()}-{stamp}.{EXTENSIONS[fmt]}")
+
+
+def write_collapsed(path: str, samples: Dict[Tuple[Frame, ...], int]) -> None:
+    """collapsed 스택 형식으로 저장 (바깥 함수부터, 세미콜론으로 구분)"""
+    lines = []
+    for stack, count in sorted(samples.items(), key=lambda item: -item[1]):
+        names = [f"{name} ({_short_path(filename)}:{line})" for filename, line, name in stack]
+        lines.append(f"{';'.join(names)} {count}\n")
+    with open(path, "w", encoding="utf-8") as f:
+        f.writelines(lines)
+
+
+def write_pstats(path: str, samples: Dict[Tuple[Frame, ...], int], interval: float) -> None:
+    """
+    샘플을 pstats 형식으로 저장
+
+    자체 시간(tt)은 가장 안쪽에 있던 샘플 수, 누적 시간(ct)은 스택에 있던 샘플 수에 interval을 곱한 값이고,
+    호출 수 자리에는 샘플 수를 씁니다.
+    """
+    stats: Dict[Frame, List[Any]] = {}
+    for stack, count in samples.items():
+        seconds = count * interval
+        for frame in set(stack):  # 재귀 호출은 한 번만
+            entry = stats.setdefault(frame, [0, 0, 0.0, 0.0, {}])
+            entry[0] += count
+            entry[1] += count
+            entry[3] += seconds
+        stats[stack[-1]][2] += seconds
+        for caller, callee in zip(stack, stack[1:]):
+            callers = stats[callee][4]
+            nc, cc, tt, ct = callers.get(caller, (0, 0, 0.0, 0.0))
+            callers[caller] = (nc + count, cc + count, tt, ct + seconds)
+    with open(path, "wb") as f:
+        marshal.dump({frame: tuple(entry) for frame, entry in stats.items()}, f)
+
+
+class SamplingProfiler:
+    """
+    구간 샘플링 프로파일러 (워커마다 하나)
+
+    start()로 시작하면 seconds초 뒤(또는 stop()) 결과 파일을 쓰고 끝납니다.
+    샘플은 샘플러 스레드만 다루므로 잠금 없이 기록합니다.
+    """
+
+    def __init__(self, directory: str, interval: float = DEFAULT_INTERVAL):
+        self.directory = directory
+        self.interval = interval
+        self._start_lock = threading.Lock()
+        self._running = False
+        self._stop = False
+        self.started_at: Optional[float] = None
+        self.until: Optional[float] = None
+        self.format: Optional[str] = None
+        self.samples = 0  # 이번 구간의 스택 샘플 수
+        self.last_file: Optional[str] = None
+        self.last_error: Optional[str] = None
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def start(self, seconds: float, fmt: str = "collapsed", include_idle: bool = False) -> bool:
+        """
+        기록 시작
+
+        Args:
+            seconds: 기록할 시간 (MAX_SECONDS까지)
+            fmt: 'collapsed' 또는 'pstats'
+            include_idle: 대기 중인 스레드의 스택도 셀지
+
+        Returns:
+            bool: 시작했는지 여부 (이미 기록 중이면 False)
+        """
+        if fmt not in FORMATS:
+            raise ValueError(f"지원하지 않는 형식입니다: {fmt}")
+        seconds = min(max(float(seconds), self.interval), MAX_SECONDS)
+        with self._start_lock:
+            if self._running:
+                return False
+            self._running = True
+            self._stop = False
+            self.started_at = time.time()
+            self.until = self.started_at + seconds
+            self.format = fmt
+            self.samples = 0
+        start_native_thread(self._run, time.monotonic() + seconds, fmt, include_idle)
+        return True
+
+    def stop(self) -> None:
+        """기록을 일찍 끝내기 (결과 파일은 샘플러 스레드가 씀)"""
+        self._stop = True
+
+    def _run(self, deadline: float, fmt: str, include_idle: bool) -> None:
+        samples: Counter = Counter()
+        try:
+            while not self._stop and time.monotonic() < deadline:
+                self._sample(samples, include_idle)
+                native_sleep(self.interval)
+            os.makedirs(self.directory, exist_ok=True)
+            path = output_path(self.directory, "profile", fmt)
+            if fmt == "pstats":
+                write_pstats(path, samples, self.interval)
+            else:
+                write_collapsed(path, samples)
+            self.last_file = path
+            self.last_error = None
+        except Exception as e:
+            self.last_error = str(e)
+        finally:
+            self._running = False
+
+    def _sample(self, samples: Counter, include_idle: bool) -> None:
+        """모든 스레드의 현재 스택 하나씩 세기"""
+        # 자기 스레드는 프레임으로 구분 (gevent 모드에서는 threading.get_ident()가 그린렛 번호)
+        own_frame = sys._getframe()
+        for frame in sys._current_frames().values():
+            if frame is own_frame:
+                continue
+            if not include_idle and frame.f_code.co_filename.replace("\\", "/").endswith(IDLE_FILES):
+                continue
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append((code.co_filename, code.co_firstlineno, code.co_name))
+                frame = frame.f_back
+            stack.reverse()
+            samples[tuple(stack)] += 1
+            self.samples += 1
+
+    def status(self) -> Dict:
+        return {
+            "running": self._running,
+            "format": self.format,
+            "started_at": self.started_at,
+            "until": self.until,
+            "interval": self.interval,
+            "samples": self.samples,
+            "last_file": os.path.basename(self.last_file) if self.last_file else None,
+            "last_error": self.last_error,
+        }
+
+    def list_files(self) -> List[Dict]:
+        """저장된 결과 파일 목록 (최근 것부터)"""
+        try:
+            names = [name for name in os.listdir(self.directory) if not name.startswith(".")]
+        except OSError:
+            return []
+        files = []
+        for name in names:
+            try:
+                stat = os.stat(os.path.join(self.directory, name))
+            except OSError:
+                continue
+            files.append({"name": name, "size": stat.st_size, "modified": stat.st_mtime})
+        return sorted(files, key=lambda item: -item["modified"])
+
+
+class ProfileTrigger:
+    """
+    워커 간 프로파일 요청 전달 (요청 파일의 수정 시각 확인)
+
+    요청 처리 전에 poll()을 불러도 TRIGGER_CHECK_INTERVAL초에 한 번만 stat 합니다.
+    """
+
+    def __init__(self, directory: str):
+        self.path = os.path.join(directory, TRIGGER_FILE)
+        self._seen_id: Optional[str] = None
+        self._seen_mtime: Optional[int] = None
+        self._last_check = 0.0
+
+    def publish(self, trigger_id: str, until: float, fmt: str, include_idle: bool) -> None:
+        """모든 워커에 until(epoch)까지 기록하라고 알리기 (요청한 워커는 이미 시작한 상태)"""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"id": trigger_id, "until": until, "format": fmt, "include_idle": include_idle}, f)
+        os.replace(tmp_path, self.path)
+        self._seen_id = trigger_id
+
+    def poll(self) -> Optional[Dict]:
+        """
+        아직 따르지 않은 요청이 있으면 돌려주기
+
+        Returns:
+            Optional[Dict]: {"id", "until", "format", "include_idle"}, 없거나 이미 끝났으면 None
+        """
+        now = time.monotonic()
+        if now - self._last_check < TRIGGER_CHECK_INTERVAL:
+            return None
+        self._last_check = now
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+        except OSError:
+            return None
+        if mtime == self._seen_mtime:
+            return None
+        self._seen_mtime = mtime
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                trigger = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if trigger.get("id") == self._seen_id or trigger.get("until", 0) <= time.time():
+            return None
+        self._seen_id = trigger.get("id")
+        return trigger
+
+
+def start_request_profile() -> Optional[cProfile.Profile]:
+    """
+    현재 스레드의 요청 하나를 cProfile로 기록 시작
+
+    Returns:
+        Optional[cProfile.Profile]: 프로파일러, 다른 프로파일러가 이미 켜져 있으면 None
+    """
+    profile = cProfile.Profile()
+    try:
+        profile.enable()
+    except ValueError:  # 파이썬 3.12부터는 프로세스에 하나만 켤 수 있음
+        return None
+    return profile
+
+
+def save_request_profile(profile: cProfile.Profile, directory: str, name: str) -> str:
+    """
+    요청 프로파일을 끝내고 pstats 파일로 저장
+
+    Args:
+        profile: start_request_profile()의 결과
+        directory: 결과 폴더
+        name: 파일 이름에 넣을 이름 (엔드포인트 등)
+
+    Returns:
+        str: 결과 파일 경로
+    """
+    profile.disable()
+    os.makedirs(directory, exist_ok=True)
+    path = output_path(directory, f"request-{name}", "pstats")
+    profile.dump_stats(path)
+    return path
@@ -0,0 +1,221 @@
+"""
+간격 반복 복습 스케줄러 (SM-2)
+단어별 복습 간격, 난이도(ease), 다음 복습 시각을 관리합니다.
+
+복습 상태 형식 (srs_state.json, 저장소의 "srs" 컬렉션):
+    {word: {"interval": 복습 간격(일), "ease": 난이도 계수, "reps": 연속 정답 횟수, "due": 다음 복습 시각(epoch)}}
+
+다음 복습 시각 순서의 우선순위 큐(heapq)를 유지하므로,
+"다음에 복습할 단어"를 찾는 데 전체 단어를 훑지 않고 O(log n)이면 됩니다.
+"""
+
+import heapq
+import itertools
+import time
+from typing import Dict, List, Optional, Tuple
+
+# SM-2 기본값
+DEFAULT_EASE = 2.5
+MIN_EASE = 1.3
+DAY_SECONDS = 24 * 60 * 60
+PASS_QUALITY = 3     # 이 점수 이상이면 기억한 것으로 봄
+CORRECT_QUALITY = 4  # 퀴즈 정답일 때 점수
+WRONG_QUALITY = 1    # 퀴즈 오답일 때 점수
+TYPO_QUALITY = 3     # 오타를 허용해 정답으로 본 경우 (정답이지만 덜 확실하게 기억)
+
+
+def new_state() -> Dict:
+    """처음 복습하는 단어의 상태 (바로 복습 대상)"""
+    return {"interval": 0.0, "ease": DEFAULT_EASE, "reps": 0, "due": 0.0}
+
+
+def quality_from_result(is_correct: bool, typo: bool = False) -> int:
+    """퀴즈 정답 여부(와 오타 허용 여부)를 SM-2 점수(0-5)로 변환"""
+    if not is_correct:
+        return WRONG_QUALITY
+    return TYPO_QUALITY if typo else CORRECT_QUALITY
+
+
+def review(state: Optional[Dict], quality: int, now: Optional[float] = None) -> Dict:
+    """
+    SM-2 알고리즘으로 복습 결과 반영
+
+    Args:
+        state: 현재 복습 상태 (없으면 새 단어)
+        quality: 기억 정도 0-5 (3 이상이면 정답)
+        now: 복습 시각 (epoch, 기본값은 현재 시각)
+
+    Returns:
+        Dict: 새 복습 상태 (기존 상태는 바꾸지 않음)
+    """
+    if now is None:
+        now = time.time()
+    quality = max(0, min(5, int(quality)))
+    current = dict(new_state(), **(state or {}))
+    ease = float(current["ease"])
+    reps = int(current["reps"])
+
+    if quality < PASS_QUALITY:
+        # 틀리면 처음부터 다시 (난이도는 유지)
+        reps = 0
+        interval = 1.0
+    else:
+        reps += 1
+        if reps == 1:
+            interval = 1.0
+        elif reps == 2:
+            interval = 6.0
+        else:
+            interval = round(float(current["interval"]) * ease, 2)
+        ease = max(MIN_EASE, ease + 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02))
+
+    return {
+        "interval": interval,
+        "ease": round(ease, 4),
+        "reps": reps,
+        "due": round(now + interval * DAY_SECONDS, 3)
+    }
+
+
+class DueQueue:
+    """
+    다음 복습 시각 순서의 우선순위 큐
+
+    일정이 바뀌면 새 항목을 넣고 이전 항목은 꺼낼 때 건너뜁니다(지연 삭제).
+    오래된 항목이 너무 많이 쌓이면 힙을 다시 만듭니다.
+    """
+
+    def __init__(self):
+        self._heap: List[Tuple[float, int, str]] = []
+        self._due: Dict[str, Tuple[float, int]] = {}
+        self._counter = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._due)
+
+    def __contains__(self, word: str) -> bool:
+        return word in self._due
+
+    def push(self, word: str, due: float) -> None:
+        """단어 추가 또는 일정 변경 (O(log n))"""
+        current = self._due.get(word)
+        if current is not None and current[0] == due:
+            return
+        entry = (due, next(self._counter))
+        self._due[word] = entry
+        heapq.heappush(self._heap, (entry[0], entry[1], word))
+        if len(self._heap) > 2 * len(self._due) + 64:
+            self._rebuild()
+
+    def remove(self, word: str) -> None:
+        self._due.pop(word, None)
+
+    def peek(self) -> Optional[Tuple[str, float]]:
+        """
+        가장 먼저 복습할 단어
+
+        Returns:
+            Optional[Tuple[str, float]]: (단어, 복습 시각) 또는 None
+        """
+        heap = self._heap
+        while heap:
+            due, order, word = heap[0]
+            if self._due.get(word) == (due, order):
+                return word, due
+            heapq.heappop(heap)  # 바뀌었거나 삭제된 일정
+        return None
+
+    def pop(self) -> Optional[Tuple[str, float]]:
+        """가장 먼저 복습할 단어를 큐에서 꺼내기"""
+        item = self.peek()
+        if item is not None:
+            heapq.heappop(self._heap)
+            del self._due[item[0]]
+        return item
+
+    def peek_many(self, n: int) -> List[Tuple[str, float]]:
+        """
+        먼저 복습할 단어 최대 n개 (큐는 그대로, O(n log N))
+
+        Returns:
+            List[Tuple[str, float]]: (단어, 복습 시각) 목록
+        """
+        items = []
+        while len(items) < n:
+            item = self.peek()
+            if item is None:
+                break
+            items.append((item, heapq.heappop(self._heap)))
+        for _, entry in items:
+            heapq.heappush(self._heap, entry)
+        return [item for item, _ in items]
+
+    def _rebuild(self) -> None:
+        self._heap = [(due, order, word) for word, (due, order) in self._due.items()]
+        heapq.heapify(self._heap)
+
+
+class SRSScheduler:
+    """
+    단어장 전체 + 카테고리별 복습 큐
+
+    복습 기록이 없는 단어는 복습 시각 0(바로 복습)으로 추가한 순서대로 나옵니다.
+    """
+
+    def __init__(self):
+        self._all = DueQueue()
+        self._by_category: Dict[str, DueQueue] = {}
+        self._category_of: Dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._all)
+
+    def update(self, word: str, category: str, state: Optional[Dict]) -> None:
+        """
+        단어의 카테고리/복습 상태 반영
+
+        Args:
+            word: 단어
+            category: 단어의 카테고리
+            state: 복습 상태 (없으면 새 단어)
+        """
+        if self._category_of.get(word, category) != category:
+            self.remove(word)
+        due = float(state.get("due", 0.0)) if state else 0.0
+        self._all.push(word, due)
+        queue = self._by_category.get(category)
+        if queue is None:
+            queue = self._by_category[category] = DueQueue()
+        queue.push(word, due)
+        self._category_of[word] = category
+
+    def remove(self, word: str) -> None:
+        category = self._category_of.pop(word, None)
+        if category is None:
+            return
+        self._all.remove(word)
+        queue = self._by_category.get(category)
+        if queue is not None:
+            queue.remove(word)
+            if not len(queue):
+                del self._by_category[category]
+
+    def next_word(self, category: Optional[str] = None) -> Optional[Tuple[str, float]]:
+        """
+        다음에 복습할 단어 (아직 복습 시각 전이라도 가장 이른 단어를 반환)
+
+        Args:
+            category: 카테고리 (없으면 전체)
+
+        Returns:
+            Optional[Tuple[str, float]]: (단어, 복습 시각) 또는 None
+        """
+        if category:
+            queue = self._by_category.get(category)
+            return queue.peek() if queue is not None else None
+        return self._all.peek()
+
+    def next_words(self, n: int, category: Optional[str] = None) -> List[Tuple[str, float]]:
+        """다음에 복습할 단어 최대 n개 (복습 시각 순서)"""
+        queue = self._by_category.get(category) if category else self._all
+        return queue.peek_many(n) if queue is not None else []
@@ -0,0 +1,1210 @@
+"""
+단어장 저장소 엔진
+단어장(vocab_decks.Deck)의 불러오기/저장 뒤에서 동작하는 교체 가능한 저장소 계층입니다.
+
+- JournalStorage: JSON 스냅샷 + 추가 전용 저널 (파일 잠금으로 프로세스 간 보호)
+  바이너리 스냅샷(vocabulary.bin, vocab_binary.py)이 있으면 단어장과 통계는 그 파일을 mmap으로 엽니다.
+- SQLiteStorage: SQLite(WAL 모드) 키-값 테이블 + 변경 로그
+
+두 저장소 모두 변경 사항에 증가하는 번호(v)를 붙여 기록하므로,
+여러 gunicorn 워커가 read_changes()로 다른 워커의 변경 사항을 따라잡을 수 있습니다.
+
+스냅샷 JSON 파일은 write_json_atomic()으로 임시 파일에 쓰고 fsync한 뒤 이름을 바꿔 교체하며,
+이전 스냅샷을 파일명.1, 파일명.2 ... 로 보관합니다. 불러올 때 파일이 손상되었으면
+가장 최근의 정상 세대를 사용합니다 (load_json_with_fallback()). 바이너리 스냅샷도 같은 방식입니다.
+모든 세대가 손상되었으면 CorruptSnapshotError로 불러오기를 중단합니다 (빈 데이터로 덮어쓰지 않도록).
+
+변경 사항 형식:
+    {"v": 번호, "op": "set", "c": 컬렉션, "k": 키, "val": 값}
+    {"v": 번호, "op": "del", "c": 컬렉션, "k": 키}
+    {"v": 번호, "op": "base"}   # 압축 후 새 저널의 시작 번호
+"""
+
+import json
+import os
+import shutil
+import sqlite3
+import threading
+import time
+import logging
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional, Tuple, Any
+
+from vocab_binary import BINARY_COLLECTIONS, BinaryDeck, OverlayMapping, write_deck
+
+try:
+    import fcntl  # POSIX 전용 (Windows에서는 단일 프로세스로만 실행)
+except ImportError:
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# 상수 정의
+JOURNAL_FILE = "vocab_journal.jsonl"
+DB_FILE = "vocabulary.db"
+COMPACT_THRESHOLD_BYTES = 1024 * 1024  # 1MB
+LOG_KEEP_ROWS = 10000  # SQLite 변경 로그 보관 개수
+SNAPSHOT_GENERATIONS = 3  # 보관할 이전 스냅샷 수
+
+
+class CorruptSnapshotError(Exception):
+    """스냅샷 파일과 보관한 이전 세대를 모두 읽을 수 없음"""
+
+
+def make_set(collection: str, key: str, value: Any) -> Dict:
+    """값 저장 변경 사항 생성"""
+    return {"op": "set", "c": collection, "k": key, "val": value}
+
+
+def make_delete(collection: str, key: str) -> Dict:
+    """값 삭제 변경 사항 생성"""
+    return {"op": "del", "c": collection, "k": key}
+
+
+def apply_change(collections: Dict[str, Dict], change: Dict) -> None:
+    """
+    변경 사항 하나를 컬렉션 딕셔너리에 반영
+
+    Args:
+        collections: {컬렉션 이름: 데이터 딕셔너리}
+        change: make_set()/make_delete()로 만든 변경 사항
+    """
+    target = collections.get(change.get("c"))
+    if target is None:
+        return
+    if change["op"] == "set":
+        target[change["k"]] = change["val"]
+    elif change["op"] == "del":
+        target.pop(change["k"], None)
+
+
+def encode_change(change: Dict) -> str:
+    """변경 사항을 저널 한 줄로 직렬화 (공백 없는 compact JSON)"""
+    return json.dumps(change, ensure_ascii=False, separators=(',', ':')) + "\n"
+
+
+def generation_path(path: str, generation: int) -> str:
+    """이전 세대 스냅샷 경로 (1이 가장 최근)"""
+    return f"{path}.{generation}"
+
+
+def _rotate_generations(path: str, generations: int) -> None:
+    """현재 파일을 path.1로 보관하고 기존 세대를 하나씩 밀어냄 (가장 오래된 세대는 삭제)"""
+    for generation in range(generations - 1, 0, -1):
+        older = generation_path(path, generation)
+        if os.path.exists(older):
+            os.replace(older, generation_path(path, generation + 1))
+    newest = generation_path(path, 1)
+    if os.path.exists(newest):
+        os.remove(newest)
+    try:
+        # 하드 링크면 복사 없이 보관되고, 교체하는 동안에도 path가 항상 존재함
+        os.link(path, newest)
+    except OSError:
+        shutil.copy2(path, newest)
+
+
+def _write_and_flush(f, data: str) -> None:
+    f.write(data)
+    f.flush()
+
+
+def _fsync_directory(directory: str) -> None:
+    """이름 바꾸기가 디스크에 기록되도록 폴더 fsync (POSIX 전용)"""
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def write_file_atomic(path: str, write: Callable[[Any], Any], generations: int = SNAPSHOT_GENERATIONS,
+                      binary: bool = False) -> None:
+    """
+    파일을 원자적으로 저장 (임시 파일에 쓰기 → fsync → 이름 바꾸기)
+
+    쓰는 도중 프로세스가 죽거나 다른 프로세스가 읽어도 path에는 항상
+    이전 파일 또는 새 파일 전체가 있습니다. 기존 파일은 generations개까지 보관합니다.
+
+    Args:
+        path: 저장할 파일 경로
+        write: 열린 임시 파일에 내용을 쓰는 함수
+        generations: 보관할 이전 세대 수 (0이면 보관하지 않음)
+        binary: 바이너리 모드로 열지 여부
+
+    Raises:
+        OSError: 저장 실패 (기존 파일은 그대로 남음)
+    """
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with (open(tmp_path, 'wb') if binary else open(tmp_path, 'w', encoding='utf-8')) as f:
+            write(f)
+            f.flush()
+            os.fsync(f.fileno())
+        if generations > 0 and os.path.exists(path):
+            _rotate_generations(path, generations)
+        os.replace(tmp_path, path)
+        _fsync_directory(os.path.dirname(os.path.abspath(path)))
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def write_json_atomic(path: str, data: Any, generations: int = SNAPSHOT_GENERATIONS) -> None:
+    """
+    JSON 파일을 원자적으로 저장 (write_file_atomic() 참고)
+
+    Args:
+        path: 저장할 파일 경로
+        data: JSON으로 저장할 데이터
+        generations: 보관할 이전 세대 수 (0이면 보관하지 않음)
+    """
+    write_file_atomic(path, lambda f: json.dump(data, f, ensure_ascii=False, indent=2), generations)
+
+
+def write_deck_atomic(path: str, vocabulary: Dict, quiz_stats: Dict,
+                      generations: int = SNAPSHOT_GENERATIONS) -> None:
+    """단어장과 퀴즈 통계를 바이너리 스냅샷으로 원자적으로 저장"""
+    write_file_atomic(path, lambda f: write_deck(f, vocabulary, quiz_stats), generations, binary=True)
+
+
+def _read_json(path: str) -> Any:
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def load_with_fallback(path: str, read: Callable[[str], Any],
+                       generations: int = SNAPSHOT_GENERATIONS) -> Optional[Any]:
+    """
+    파일 불러오기 (손상되었으면 가장 최근의 정상 세대 사용)
+
+    파일이 있는데 모든 세대가 손상되었으면 빈 데이터로 시작하지 않고 예외를 올립니다.
+    빈 데이터로 시작하면 다음 저장이 남은 세대까지 밀어내며 실제 데이터를 덮어쓰기 때문입니다.
+    파일은 그대로 두므로 정상 세대를 되살리면 다음 불러오기에서 사용합니다.
+
+    Args:
+        path: 불러올 파일 경로
+        read: 파일 경로를 받아 데이터를 돌려주는 함수 (손상되었으면 ValueError/OSError)
+        generations: 확인할 이전 세대 수
+
+    Returns:
+        Optional[Any]: 데이터 (파일과 이전 세대가 하나도 없으면 None)
+
+    Raises:
+        CorruptSnapshotError: 읽을 수 있는 세대가 없음
+    """
+    candidates = [path] + [generation_path(path, n) for n in range(1, generations + 1)]
+    existing = [candidate for candidate in candidates if os.path.exists(candidate)]
+    for candidate in existing:
+        try:
+            data = read(candidate)
+        except (ValueError, OSError) as e:  # JSONDecodeError, UnicodeDecodeError 포함
+            logger.error(f"파일 손상 ({candidate}): {e}")
+            continue
+        if candidate != path:
+            logger.warning(f"'{path}' 대신 이전 세대 '{candidate}'를 불러왔습니다.")
+        return data
+
+    if existing:
+        raise CorruptSnapshotError(f"읽을 수 있는 '{path}' 세대가 없습니다: {', '.join(existing)}")
+    return None
+
+
+def load_json_with_fallback(path: str, generations: int = SNAPSHOT_GENERATIONS) -> Optional[Any]:
+    """JSON 파일 불러오기 (손상되었으면 가장 최근의 정상 세대 사용, load_with_fallback() 참고)"""
+    return load_with_fallback(path, _read_json, generations)
+
+
+class FileLock:
+    """
+    프로세스 간 배타 잠금 (fcntl.flock 기반 권고 잠금)
+
+    스레드 간에도 배타적입니다. reentrant=True이면 같은 스레드에서 다시 잡을 수 있고,
+    False이면 잡은 스레드와 다른 스레드에서 해제할 수 있습니다.
+    """
+
+    def __init__(self, path: str, reentrant: bool = True, offload: Optional[Callable] = None):
+        """
+        Args:
+            path: 잠금 파일 경로
+            reentrant: 같은 스레드에서 다시 잡을 수 있는지
+            offload: 다른 프로세스가 잡고 있어 기다려야 할 때 flock을 실행할 함수
+                     (예: vocab_async.run_in_thread, 기다리는 동안 이벤트 루프를 막지 않음)
+        """
+        self.path = path
+        self.offload = offload
+        self._thread_lock = threading.RLock() if reentrant else threading.Lock()
+        self._depth = 0
+        self._fd = None
+
+    def acquire(self, blocking: bool = True) -> bool:
+        if not self._thread_lock.acquire(blocking):
+            return False
+        if self._depth == 0 and fcntl is not None:
+            self._fd = open(self.path, 'a')
+            try:
+                self._flock(blocking)
+            except OSError:
+                self._fd.close()
+                self._fd = None
+                self._thread_lock.release()
+                return False
+        self._depth += 1
+        return True
+
+    def _flock(self, blocking: bool) -> None:
+        if not blocking:
+            fcntl.flock(self._fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return
+        if self.offload is None:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            return
+        try:
+            # 대부분은 바로 잡히므로 스레드 풀을 거치지 않음
+            fcntl.flock(self._fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            self.offload(fcntl.flock, self._fd, fcntl.LOCK_EX)
+
+    def release(self) -> None:
+        self._depth -= 1
+        if self._depth == 0 and self._fd is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+            self._fd.close()
+            self._fd = None
+        self._thread_lock.release()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
+
+
+class BaseStorage:
+    """
+    저장소 공통 인터페이스
+
+    사용 순서:
+        collections = storage.load()
+        with storage.lock():
+            for change in storage.read_changes() or []: ...   # 다른 프로세스 변경 따라잡기
+            storage.append(changes)
+    """
+
+    # 쓰기마다 observer(operation, seconds, nbytes) 호출 (operation: append, snapshot, compact)
+    observer: Optional[Callable[[str, float, int], None]] = None
+
+    def _observe(self, operation: str, started: float, nbytes: int) -> None:
+        """쓰기 지표 알리기 (vocab_metrics.observe_storage 등)"""
+        if self.observer is not None:
+            self.observer(operation, time.perf_counter() - started, nbytes)
+
+    def load(self) -> Dict[str, Dict]:
+        """전체 데이터 불러오기 ({컬렉션 이름: 데이터})"""
+        raise NotImplementedError
+
+    def append(self, changes: List[Dict]) -> bool:
+        """변경 사항 기록 (lock() 안에서 호출)"""
+        raise NotImplementedError
+
+    def read_changes(self) -> Optional[List[Dict]]:
+        """
+        마지막으로 읽은 이후 다른 프로세스가 기록한 변경 사항
+
+        Returns:
+            Optional[List[Dict]]: 변경 사항 목록, 따라잡을 수 없으면 None (load() 필요)
+        """
+        raise NotImplementedError
+
+    def version(self) -> Any:
+        """
+        저장소 변경 여부를 빠르게 확인하기 위한 값
+
+        값이 이전과 같으면 read_changes()를 건너뛸 수 있습니다.
+        """
+        return None
+
+    @contextmanager
+    def lock(self):
+        """프로세스 간 쓰기 잠금"""
+        yield
+
+    def needs_compaction(self) -> bool:
+        return False
+
+    def compact_async(self, collections: Dict[str, Dict]) -> bool:
+        return False
+
+    def save_all(self, collections: Dict[str, Dict]) -> bool:
+        """전체 상태를 한 번에 저장 (lock() 안에서 호출)"""
+        raise NotImplementedError
+
+    def snapshot_format(self) -> Optional[str]:
+        """스냅샷 파일 형식 ('json', 'binary', 스냅샷을 쓰지 않으면 None)"""
+        return None
+
+    def close(self) -> None:
+        """파일 핸들/연결 닫기 (다시 쓰면 필요할 때 다시 엶)"""
+
+
+class JournalStorage(BaseStorage):
+    """
+    저널 기반 저장소
+
+    스냅샷 파일(컬렉션별 JSON) + 저널 파일로 구성됩니다.
+    쓰기 비용은 변경된 항목 크기에만 비례하고, 전체 단어 수와는 무관합니다.
+
+    binary_file이 있으면 vocabulary/quiz_stats 스냅샷은 JSON 대신 그 파일을 사용합니다.
+    불러올 때는 mmap으로 열어 OverlayMapping으로 감싸고, 압축할 때도 바이너리로 씁니다.
+    형식은 파일이 있는지로 정하므로 여러 워커가 항상 같은 형식을 사용합니다 (vocab_convert.py로 전환).
+    """
+
+    def __init__(self, files: Dict[str, str], journal_file: str = JOURNAL_FILE,
+                 compact_threshold: int = COMPACT_THRESHOLD_BYTES,
+                 generations: int = SNAPSHOT_GENERATIONS,
+                 binary_file: Optional[str] = None,
+                 offload: Optional[Callable] = None,
+                 observer: Optional[Callable[[str, float, int], None]] = None):
+        """
+        Args:
+            files: {컬렉션 이름: 스냅샷 파일 경로}
+            journal_file: 저널 파일 경로
+            compact_threshold: 압축을 시작할 저널 크기 (bytes)
+            generations: 보관할 이전 스냅샷 수
+            binary_file: 바이너리 스냅샷 경로 (없으면 JSON만 사용)
+            offload: 디스크 쓰기(저널 추가, 스냅샷)와 파일 잠금 대기를 실행할 함수
+                     (offload(func, *args), 예: vocab_async.run_in_thread)
+            observer: 쓰기마다 호출할 함수 (operation, 걸린 시간, 기록한 바이트 수)
+        """
+        self.observer = observer
+        self.files = files
+        self.generations = generations
+        self.binary_file = binary_file
+        self.offload = offload
+        self.journal_file = journal_file
+        self.compacting_file = journal_file + ".compacting"
+        self.compact_threshold = compact_threshold
+        self.seq = 0  # 마지막 변경 번호
+        self._journal = None
+        self._reader = None  # 다른 프로세스의 변경 사항을 따라 읽는 핸들
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        self._file_lock = FileLock(journal_file + ".lock", offload=offload)
+        # 압축 스레드가 해제하므로 재진입 불가 잠금 사용
+        self._compact_lock = FileLock(journal_file + ".compact.lock", reentrant=False, offload=offload)
+        self._unread: List[Dict] = []  # append() 중에 읽었지만 아직 전달하지 않은 변경 사항
+        self._resume_at: Optional[Tuple[int, int]] = None  # close() 때 읽던 저널의 (inode, 위치)
+        self._missed = False  # append() 중에 따라잡지 못한 변경 사항이 있었는지 (다음 read_changes()에서 전체 다시 불러오기)
+        self._compact_thread: Optional[threading.Thread] = None
+
+    # ---------- 불러오기 ----------
+
+    def _load_snapshot(self, path: str) -> Dict:
+        """
+        스냅샷 파일 하나 불러오기
+
+        손상되었으면 이전 세대를 사용합니다. 이 경우 그 사이에 압축된 변경 사항은
+        저널에 없으므로 복구되지 않습니다. 파일이 없으면 빈 딕셔너리이고,
+        모든 세대가 손상되었으면 CorruptSnapshotError입니다.
+        """
+        data = load_json_with_fallback(path, self.generations)
+        return data if isinstance(data, dict) else {}
+
+    def uses_binary_snapshot(self) -> bool:
+        """바이너리 스냅샷 파일이 있는지 (있으면 단어장/통계 스냅샷은 바이너리 형식)"""
+        return self.binary_file is not None and os.path.exists(self.binary_file)
+
+    def snapshot_format(self) -> str:
+        return "binary" if self.uses_binary_snapshot() else "json"
+
+    def _load_snapshots(self) -> Dict[str, Any]:
+        """
+        컬렉션별 스냅샷 불러오기
+
+        바이너리 스냅샷이 있으면 vocabulary/quiz_stats는 mmap 위의 OverlayMapping입니다.
+        바이너리 파일의 모든 세대를 읽을 수 없으면 CorruptSnapshotError입니다
+        (변환 전의 오래된 JSON 스냅샷으로 대신하지 않음).
+        """
+        deck = None
+        if self.uses_binary_snapshot():
+            deck = load_with_fallback(self.binary_file, BinaryDeck, self.generations)
+        collections = {}
+        for name, path in self.files.items():
+            if deck is not None and name == "vocabulary":
+                collections[name] = OverlayMapping(deck)
+            elif deck is not None and name == "quiz_stats":
+                collections[name] = OverlayMapping(deck.stats)
+            else:
+                collections[name] = self._load_snapshot(path)
+        return collections
+
+    def _parse_line(self, line: str) -> Optional[Dict]:
+        if not line.strip():
+            return None
+        try:
+            change = json.loads(line)
+        except json.JSONDecodeError:
+            # 쓰는 도중 중단된 줄은 무시
+            logger.warning(f"저널의 손상된 줄을 건너뜁니다: {self.journal_file}")
+            return None
+        self.seq = max(self.seq, change.get("v", 0))
+        return change
+
+    def _replay(self, f, collections: Dict[str, Dict]) -> int:
+        """
+        열린 저널 파일을 처음부터 다시 적용
+
+        Returns:
+            int: 적용한 변경 사항 개수
+        """
+        if f is None:
+            return 0
+        count = 0
+        for line in f:
+            change = self._parse_line(line)
+            if change is not None:
+                apply_change(collections, change)
+                count += 1
+        return count
+
+    @staticmethod
+    def _open_if_exists(path: str):
+        try:
+            return open(path, 'r', encoding='utf-8')
+        except FileNotFoundError:
+            return None
+
+    def load(self) -> Dict[str, Dict]:
+        """
+        스냅샷을 불러온 뒤 저널을 재적용하여 최신 상태 복원
+
+        Returns:
+            Dict[str, Dict]: {컬렉션 이름: 데이터}
+        """
+        with self._file_lock, self._lock:
+            self._close_journal()
+            self.seq = 0
+            self._unread = []
+            self._resume_at = None
+            self._missed = False
+            # 압축 도중의 저널은 스냅샷보다 먼저 열어 둠. 다른 워커의 압축 스레드는 파일 잠금 없이
+            # 새 스냅샷으로 교체하고 이 파일을 지우므로, 이전 스냅샷을 읽은 뒤 파일이 지워져도
+            # 열어 둔 핸들로 끝까지 읽을 수 있음 (새 스냅샷을 읽었으면 중복 적용이지만 멱등이라 안전)
+            segment = self._open_if_exists(self.compacting_file)
+            try:
+                collections = self._load_snapshots()
+                replayed = self._replay(segment, collections)
+            finally:
+                if segment is not None:
+                    segment.close()
+            # 압축 시작(저널 교체)은 파일 잠금 안에서만 하므로 저널은 불러오는 동안 바뀌지 않음
+            journal = self._open_if_exists(self.journal_file)
+            if journal is not None:
+                with journal:
+                    replayed += self._replay(journal, collections)
+            self._open_reader(at_end=True)
+            logger.info(f"저널 재적용: {replayed}개 변경 사항")
+
+            # 다른 프로세스가 압축 중이 아니라면 중단된 압축 복구
+            if os.path.exists(self.compacting_file) and self._compact_lock.acquire(blocking=False):
+                try:
+                    logger.warning("중단된 압축을 복구합니다.")
+                    self._write_snapshot(collections)
+                    os.remove(self.compacting_file)
+                finally:
+                    self._compact_lock.release()
+
+            return collections
+
+    # ---------- 다른 프로세스 변경 따라잡기 ----------
+
+    def _check_fork(self) -> None:
+        """
+        gunicorn --preload로 fork된 경우 파일 핸들을 새로 열기
+
+        부모 프로세스와 파일 위치를 공유하지 않도록 읽던 위치에서 다시 엽니다.
+        """
+        if self._pid == os.getpid():
+            return
+        self._pid = os.getpid()
+        self._journal = None
+        if self._reader is not None:
+            position = self._reader.tell()
+            self._reader = open(self._reader.name, 'r', encoding='utf-8')
+            self._reader.seek(position)
+
+    def _open_reader(self, at_end: bool) -> None:
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+        if os.path.exists(self.journal_file):
+            self._reader = open(self.journal_file, 'r', encoding='utf-8')
+            if at_end:
+                self._reader.seek(0, os.SEEK_END)
+
+    def _drain_reader(self, changes: List[Dict]) -> None:
+        """읽기 핸들에서 완성된 줄만 읽기 (쓰는 중인 마지막 줄은 다음에)"""
+        while True:
+            pos = self._reader.tell()
+            line = self._reader.readline()
+            if not line:
+                return
+            if not line.endswith("\n"):
+                self._reader.seek(pos)
+                return
+            change = self._parse_line(line)
+            if change is not None:
+                changes.append(change)
+
+    def _starts_after_seq(self) -> bool:
+        """
+        새로 연 저널이 이 프로세스가 읽은 번호 다음부터 시작하지 않는지
+
+        다른 워커가 그 사이 압축을 두 번 했거나, 저널이 없을 때 불러온 뒤 압축이 있었으면
+        빠진 변경 사항은 스냅샷에만 있으므로 전체를 다시 불러와야 합니다.
+        """
+        position = self._reader.tell()
+        line = self._reader.readline()
+        self._reader.seek(position)
+        if not line.endswith("\n"):
+            return False
+        try:
+            first = json.loads(line)
+        except json.JSONDecodeError:
+            return False
+        # base는 "다음 번호는 v + 1"이라는 뜻
+        expected = first.get("v", 0) if first.get("op") == "base" else first.get("v", 0) - 1
+        return expected > self.seq
+
+    def _catch_up(self, changes: List[Dict]) -> bool:
+        """
+        읽기 핸들을 따라 다른 프로세스의 변경 사항 읽기 (저널이 교체되었으면 남은 줄을 읽은 뒤 새 파일로 전환)
+
+        Returns:
+            bool: 빠짐없이 읽었는지 (False면 전체를 다시 불러와야 함)
+        """
+        if self._reader is None:
+            self._open_reader(at_end=False)
+            if self._reader is None:
+                return True
+            if self._starts_after_seq():
+                return False
+        self._drain_reader(changes)
+
+        # 압축/전체 저장으로 저널 파일이 교체되었으면 새 파일로 전환
+        try:
+            replaced = os.stat(self.journal_file).st_ino != os.fstat(self._reader.fileno()).st_ino
+        except OSError:
+            replaced = False
+        if replaced:
+            self._open_reader(at_end=False)
+            if self._reader is not None:
+                if self._starts_after_seq():
+                    return False
+                self._drain_reader(changes)
+        return True
+
+    def read_changes(self) -> Optional[List[Dict]]:
+        with self._lock:
+            self._check_fork()
+            changes, self._unread = self._unread, []
+            if self._missed:
+                self._missed = False
+                return None
+            if self._reader is None and self._resume_at is not None:
+                resume, self._resume_at = self._resume_at, None
+                self._open_reader(at_end=False)
+                if self._reader is not None:
+                    if os.fstat(self._reader.fileno()).st_ino != resume[0]:
+                        return None  # 닫아 둔 사이 저널이 교체됨 (압축) → 전체를 다시 불러와야 함
+                    self._reader.seek(resume[1])
+            if not self._catch_up(changes):
+                return None
+        return changes
+
+    def journal_version(self):
+        """저널 파일의 (inode, 크기) - 변경 여부를 빠르게 확인하는 용도"""
+        try:
+            st = os.stat(self.journal_file)
+            return st.st_ino, st.st_size
+        except OSError:
+            return None
+
+    def version(self) -> Any:
+        return self.journal_version()
+
+    # ---------- 쓰기 ----------
+
+    @contextmanager
+    def lock(self):
+        with self._file_lock:
+            yield
+
+    def _open_journal(self):
+        if self._journal is None:
+            self._journal = open(self.journal_file, 'a', encoding='utf-8')
+        return self._journal
+
+    def _close_journal(self) -> None:
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+
+    def close(self) -> None:
+        """저널 쓰기/읽기 핸들 닫기 (진행 중인 압축은 끝날 때까지 기다림)"""
+        if self._compact_thread is not None:
+            self._compact_thread.join()
+        with self._lock:
+            self._close_journal()
+            if self._reader is not None:
+                # 다시 열 때 이어서 읽도록 위치 기억
+                self._resume_at = (os.fstat(self._reader.fileno()).st_ino, self._reader.tell())
+                self._reader.close()
+                self._reader = None
+
+    def append(self, changes: List[Dict]) -> bool:
+        """
+        변경 사항을 저널 끝에 추가
+
+        Args:
+            changes: 변경 사항 목록 (한 번의 write로 기록)
+
+        Returns:
+            bool: 저장 성공 여부
+        """
+        if not changes:
+            return True
+        started = time.perf_counter()
+        try:
+            with self._file_lock, self._lock:
+                self._check_fork()
+                # 아직 읽지 않은 다른 프로세스의 변경 사항을 먼저 읽어 번호를 맞춤
+                # (빠진 변경 사항이 있어도 번호는 base 줄로 맞춰지므로 기록은 하고, 다음 read_changes()에서 다시 불러옴)
+                if not self._catch_up(self._unread):
+                    self._missed = True
+                    self._drain_reader(self._unread)
+
+                # 다른 프로세스가 저널을 교체했을 수 있으므로 현재 파일에 기록
+                current = self.journal_version()
+                if self._journal is not None and \
+                        (current is None or os.fstat(self._journal.fileno()).st_ino != current[0]):
+                    self._close_journal()
+                lines = []
+                for change in changes:
+                    self.seq += 1
+                    change["v"] = self.seq
+                    lines.append(encode_change(change))
+                data = "".join(lines)
+                self._run(_write_and_flush, self._open_journal(), data)
+                # 자신이 쓴 줄은 다시 읽지 않음
+                self._open_reader(at_end=True)
+            if self.observer is not None:
+                self._observe("append", started, len(data.encode("utf-8")))
+            return True
+        except (IOError, OSError) as e:
+            logger.error(f"저널 기록 실패: {e}")
+            return False
+
+    def _run(self, func: Callable, *args) -> Any:
+        """
+        디스크 쓰기 실행 (offload가 있으면 그 함수로)
+
+        비동기 모드에서는 write/fsync가 이벤트 루프(gevent)를 막지 않도록 네이티브 스레드에서 실행합니다.
+        func는 잠금을 잡지 않아야 합니다 (호출한 쪽이 이미 잡고 있음).
+        """
+        if self.offload is not None:
+            return self.offload(func, *args)
+        return func(*args)
+
+    def journal_size(self) -> int:
+        """현재 저널 크기 (bytes)"""
+        try:
+            return os.path.getsize(self.journal_file)
+        except OSError:
+            return 0
+
+    def needs_compaction(self) -> bool:
+        """저널이 압축 기준 크기를 넘었는지 확인"""
+        return self.journal_size() >= self.compact_threshold and not self.is_compacting()
+
+    def is_compacting(self) -> bool:
+        """이 프로세스에서 백그라운드 압축이 진행 중인지 확인"""
+        return self._compact_thread is not None and self._compact_thread.is_alive()
+
+    # ---------- 압축 ----------
+
+    def _write_snapshot(self, collections: Dict[str, Dict], binary: Optional[bool] = None) -> int:
+        """
+        컬렉션별 스냅샷 파일을 원자적으로 교체 (이전 세대 보관)
+
+        Args:
+            collections: 저장할 데이터
+            binary: 바이너리 형식 여부 (None이면 현재 파일 형식 유지)
+
+        Returns:
+            int: 기록한 바이트 수
+        """
+        if binary is None:
+            binary = self.uses_binary_snapshot()
+        written = []
+        if binary:
+            write_deck_atomic(self.binary_file, collections.get("vocabulary", {}),
+                              collections.get("quiz_stats", {}), self.generations)
+            written.append(self.binary_file)
+        for name, path in self.files.items():
+            if binary and name in BINARY_COLLECTIONS:
+                continue
+            data = collections.get(name, {})
+            if not isinstance(data, dict):
+                data = dict(data.items())  # 바이너리 형식에서 불러온 OverlayMapping
+            write_json_atomic(path, data, self.generations)
+            written.append(path)
+        return sum(os.path.getsize(path) for path in written)
+
+    def _write_base_journal(self, path: str) -> None:
+        """시작 번호만 담긴 새 저널 파일 생성 (새 inode로 교체)"""
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(encode_change({"v": self.seq, "op": "base"}))
+        os.replace(tmp_path, path)
+
+    def _rotate(self) -> None:
+        """현재 저널을 압축용 파일로 옮기고 새 저널 시작"""
+        self._close_journal()
+        if os.path.exists(self.compacting_file) and os.path.exists(self.journal_file):
+            # 이전 압축이 실패해 남은 파일이 있으면 덮어쓰지 않고 이어 붙임
+            with open(self.journal_file, 'r', encoding='utf-8') as src, \
+                    open(self.compacting_file, 'a', encoding='utf-8') as dst:
+                dst.write(src.read())
+        elif os.path.exists(self.journal_file):
+            os.replace(self.journal_file, self.compacting_file)
+        self._write_base_journal(self.journal_file)
+        self._open_reader(at_end=True)
+
+    def _compact_worker(self, collections: Dict[str, Dict]) -> None:
+        # 파일 잠금은 잡지 않음: save_all()은 파일 잠금을 잡은 채 압축이 끝나기를 기다리므로 교착 상태가 됨.
+        # 대신 load()가 압축 중인 저널을 스냅샷보다 먼저 열어 둠
+        started = time.perf_counter()
+        try:
+            nbytes = self._run(self._write_snapshot, collections)
+            os.remove(self.compacting_file)
+            self._observe("compact", started, nbytes)
+            logger.info("저널 압축 완료")
+        except Exception as e:
+            # 압축 파일이 남아 있으므로 다음 load()에서 복구됨
+            logger.error(f"저널 압축 실패: {e}")
+        finally:
+            self._compact_lock.release()
+
+    def compact_async(self, collections: Dict[str, Dict]) -> bool:
+        """
+        백그라운드 스레드에서 저널을 스냅샷으로 압축 (lock() 안에서 호출)
+
+        Args:
+            collections: 현재 상태의 복사본 (호출자가 데이터 잠금을 잡은 상태에서 만들어야 함)
+
+        Returns:
+            bool: 압축을 시작했는지 여부
+        """
+        # 다른 프로세스가 압축 중이면 건너뜀
+        if self.is_compacting() or not self._compact_lock.acquire(blocking=False):
+            return False
+        try:
+            with self._file_lock, self._lock:
+                self._rotate()
+        except Exception as e:
+            self._compact_lock.release()
+            logger.error(f"저널 교체 실패: {e}")
+            return False
+        self._compact_thread = threading.Thread(
+            target=self._compact_worker, args=(collections,), daemon=True
+        )
+        self._compact_thread.start()
+        return True
+
+    def save_all(self, collections: Dict[str, Dict], binary: Optional[bool] = None) -> bool:
+        """
+        전체 상태를 스냅샷으로 즉시 저장하고 저널 비우기
+
+        Args:
+            collections: 저장할 데이터
+            binary: 스냅샷 형식 바꾸기 (True: 바이너리, False: JSON, None: 현재 형식 유지)
+
+        Returns:
+            bool: 저장 성공 여부
+        """
+        try:
+            if self._compact_thread is not None:
+                self._compact_thread.join()
+            started = time.perf_counter()
+            with self._compact_lock, self._file_lock, self._lock:
+                nbytes = self._run(self._write_snapshot, collections, binary)
+                if binary is False and self.uses_binary_snapshot():
+                    # 이전 세대(.1, .2 ...)는 백업으로 남겨 둠
+                    os.remove(self.binary_file)
+                self._close_journal()
+                self._write_base_journal(self.journal_file)
+                if os.path.exists(self.compacting_file):
+                    os.remove(self.compacting_file)
+                self._open_reader(at_end=True)
+            self._observe("snapshot", started, nbytes)
+            return True
+        except (IOError, OSError) as e:
+            logger.error(f"스냅샷 저장 실패: {e}")
+            return False
+
+    def convert_snapshot(self, binary: bool) -> bool:
+        """
+        현재 상태 전체를 다른 스냅샷 형식으로 저장 (JSON ↔ 바이너리)
+
+        잠금을 잡은 채 불러오고 저장하므로 실행 중인 워커가 있어도 변경 사항을 잃지 않습니다.
+        다른 워커도 다음 압축부터는 파일이 있는지를 보고 새 형식으로 저장합니다.
+
+        Args:
+            binary: True면 바이너리, False면 JSON 형식으로
+
+        Returns:
+            bool: 저장 성공 여부
+        """
+        if self.binary_file is None:
+            raise ValueError("binary_file이 설정되지 않았습니다.")
+        with self.lock():
+            collections = self.load()
+            return self.save_all(collections, binary=binary)
+
+
+class SQLiteStorage(BaseStorage):
+    """
+    SQLite(WAL 모드) 저장소
+
+    kv 테이블에 현재 상태를, log 테이블에 최근 변경 사항을 보관합니다.
+    WAL 모드에서는 읽기가 쓰기를 막지 않으므로 여러 워커가 동시에 사용할 수 있습니다.
+    """
+
+    def __init__(self, db_file: str = DB_FILE, import_files: Optional[Dict[str, str]] = None,
+                 log_keep_rows: int = LOG_KEEP_ROWS,
+                 observer: Optional[Callable[[str, float, int], None]] = None):
+        """
+        Args:
+            db_file: 데이터베이스 파일 경로
+            import_files: 데이터베이스가 비어 있을 때 가져올 JSON 파일 {컬렉션 이름: 경로}
+            log_keep_rows: 보관할 변경 로그 개수
+            observer: 쓰기마다 호출할 함수 (operation, 걸린 시간, 기록한 JSON 바이트 수)
+        """
+        self.observer = observer
+        self.db_file = db_file
+        self.import_files = import_files or {}
+        self.log_keep_rows = log_keep_rows
+        self.seq = 0
+        self._conn = None
+        self._pid = None
+        self._lock = threading.RLock()
+        self._depth = 0
+
+    def _connection(self) -> sqlite3.Connection:
+        # gunicorn이 fork한 뒤에는 워커마다 새 연결 사용
+        if self._conn is None or self._pid != os.getpid():
+            conn = sqlite3.connect(self.db_file, timeout=30, check_same_thread=False,
+                                   isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS kv ("
+                "c TEXT NOT NULL, k TEXT NOT NULL, val TEXT NOT NULL, PRIMARY KEY (c, k))"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS log (v INTEGER PRIMARY KEY AUTOINCREMENT, change TEXT NOT NULL)"
+            )
+            self._conn = conn
+            self._pid = os.getpid()
+        return self._conn
+
+    def _import_json(self, conn: sqlite3.Connection) -> None:
+        """처음 실행 시 기존 JSON 파일 가져오기 (손상되었으면 이전 세대)"""
+        for name, path in self.import_files.items():
+            data = load_json_with_fallback(path)
+            if not isinstance(data, dict):
+                continue
+            conn.executemany(
+                "INSERT OR REPLACE INTO kv (c, k, val) VALUES (?, ?, ?)",
+                ((name, key, json.dumps(value, ensure_ascii=False)) for key, value in data.items())
+            )
+            logger.info(f"JSON 가져오기 완료 ({path}): {len(data)}개")
+
+    def close(self) -> None:
+        """데이터베이스 연결 닫기"""
+        with self._lock:
+            if self._conn is not None and self._pid == os.getpid() and self._depth == 0:
+                self._conn.close()
+                self._conn = None
+
+    def version(self) -> Any:
+        """다른 연결이 커밋하면 바뀌는 PRAGMA data_version 값"""
+        with self._lock:
+            return self._connection().execute("PRAGMA data_version").fetchone()[0]
+
+    def load(self) -> Dict[str, Dict]:
+        with self.lock():
+            conn = self._connection()
+            if conn.execute("SELECT COUNT(*) FROM kv").fetchone()[0] == 0:
+                self._import_json(conn)
+            collections: Dict[str, Dict] = {name: {} for name in self.import_files}
+            for c, k, val in conn.execute("SELECT c, k, val FROM kv"):
+                collections.setdefault(c, {})[k] = json.loads(val)
+            self.seq = conn.execute("SELECT COALESCE(MAX(v), 0) FROM log").fetchone()[0]
+            return collections
+
+    @contextmanager
+    def lock(self):
+        """BEGIN IMMEDIATE로 데이터베이스 쓰기 잠금 (재진입 가능)"""
+        with self._lock:
+            conn = self._connection()
+            if self._depth == 0:
+                conn.execute("BEGIN IMMEDIATE")
+            self._depth += 1
+            try:
+                yield
+            except BaseException:
+                self._depth -= 1
+                if self._depth == 0:
+                    conn.execute("ROLLBACK")
+                raise
+            else:
+                self._depth -= 1
+                if self._depth == 0:
+                    conn.execute("COMMIT")
+
+    def read_changes(self) -> Optional[List[Dict]]:
+        with self._lock:
+            conn = self._connection()
+            rows = conn.execute(
+                "SELECT v, change FROM log WHERE v > ? ORDER BY v", (self.seq,)
+            ).fetchall()
+            if not rows:
+                return []
+            if rows[0][0] != self.seq + 1:
+                # 오래된 로그가 정리되어 따라잡을 수 없음
+                return None
+            changes = []
+            for v, text in rows:
+                change = json.loads(text)
+                change["v"] = v
+                changes.append(change)
+            self.seq = rows[-1][0]
+            return changes
+
+    def append(self, changes: List[Dict]) -> bool:
+        if not changes:
+            return True
+        started = time.perf_counter()
+        nbytes = 0
+        try:
+            with self.lock():
+                conn = self._connection()
+                for change in changes:
+                    encoded = json.dumps(change, ensure_ascii=False)
+                    nbytes += len(encoded.encode("utf-8"))
+                    cur = conn.execute("INSERT INTO log (change) VALUES (?)", (encoded,))
+                    change["v"] = cur.lastrowid
+                    if change["op"] == "set":
+                        value = json.dumps(change["val"], ensure_ascii=False)
+                        nbytes += len(value.encode("utf-8"))
+                        conn.execute(
+                            "INSERT OR REPLACE INTO kv (c, k, val) VALUES (?, ?, ?)",
+                            (change["c"], change["k"], value)
+                        )
+                    elif change["op"] == "del":
+                        conn.execute("DELETE FROM kv WHERE c = ? AND k = ?", (change["c"], change["k"]))
+                self.seq = changes[-1]["v"]
+                if any(change["v"] % 1000 == 0 for change in changes):
+                    conn.execute("DELETE FROM log WHERE v <= ?", (self.seq - self.log_keep_rows,))
+            self._observe("append", started, nbytes)
+            return True
+        except sqlite3.Error as e:
+            logger.error(f"SQLite 기록 실패: {e}")
+            return False
+
+    def save_all(self, collections: Dict[str, Dict]) -> bool:
+        started = time.perf_counter()
+        nbytes = 0
+
+        def rows(name: str, data: Dict):
+            nonlocal nbytes
+            for key, value in data.items():
+                encoded = json.dumps(value, ensure_ascii=False)
+                nbytes += len(encoded.encode("utf-8"))
+                yield name, key, encoded
+
+        try:
+            with self.lock():
+                conn = self._connection()
+                conn.execute("DELETE FROM kv")
+                for name, data in collections.items():
+                    conn.executemany("INSERT INTO kv (c, k, val) VALUES (?, ?, ?)", rows(name, data))
+                # 다른 워커가 전체를 다시 불러오도록 로그를 비움
+                conn.execute("DELETE FROM log")
+                cur = conn.execute("INSERT INTO log (change) VALUES (?)", ('{"op":"base"}',))
+                self.seq = cur.lastrowid
+            self._observe("snapshot", started, nbytes)
+            return True
+        except sqlite3.Error as e:
+            logger.error(f"SQLite 저장 실패: {e}")
+            return False
+
+
+class WriteBehindFlusher:
+    """
+    모아 둔 변경을 백그라운드 스레드에서 저장 (write-behind)
+
+    mark()로 표시한 변경이 max_pending개에 이르거나, 첫 변경 후 interval초가 지나면
+    flush_func를 호출합니다. 그 사이의 여러 변경은 한 번의 기록으로 합쳐집니다.
+    """
+
+    def __init__(self, flush_func: Callable[[], int], interval: float = 1.0, max_pending: int = 200):
+        """
+        Args:
+            flush_func: 모아 둔 변경을 저장하고 기록한 항목 수를 반환하는 함수 (실패 시 예외)
+            interval: 첫 변경 후 저장까지 최대 대기 시간 (초)
+            max_pending: 이 개수만큼 쌓이면 바로 저장
+        """
+        self.flush_func = flush_func
+        self.interval = interval
+        self.max_pending = max(1, max_pending)
+        self._cond = threading.Condition()
+        self._pending = 0
+        self._first_pending_at: Optional[float] = None
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        self._stopped = False
+        self.stats = {
+            "updates": 0,             # mark()로 표시한 변경 수
+            "flushes": 0,             # 저장 횟수
+            "written": 0,             # 실제로 기록한 항목 수
+            "coalesced": 0,           # 합쳐져서 기록을 아낀 변경 수 (updates - written)
+            "errors": 0,              # 저장 실패 횟수
+            "last_flush_at": None,    # 마지막 저장 시각 (epoch)
+            "last_flush_seconds": 0.0
+        }
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def mark(self, count: int = 1) -> None:
+        """저장할 변경이 생겼음을 표시 (호출자가 데이터 잠금을 잡고 있어도 됨)"""
+        with self._cond:
+            self._ensure_thread()
+            self._pending += count
+            self.stats["updates"] += count
+            if self._first_pending_at is None:
+                self._first_pending_at = time.monotonic()
+            if self._pending >= self.max_pending:
+                self._cond.notify()
+
+    def _ensure_thread(self) -> None:
+        # fork(gunicorn --preload) 후에는 부모의 스레드가 없으므로 새로 시작
+        if self._thread is not None and self._pid == os.getpid() and self._thread.is_alive():
+            return
+        self._stopped = False
+        self._pid = os.getpid()
+        self._thread = threading.Thread(target=self._run, name="write-behind", daemon=True)
+        self._thread.start()
+
+    def _due(self) -> bool:
+        if self._pending == 0:
+            return False
+        return self._pending >= self.max_pending or \
+            time.monotonic() - self._first_pending_at >= self.interval
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._stopped and not self._due():
+                    timeout = None
+                    if self._pending:
+                        timeout = max(0.0, self.interval - (time.monotonic() - self._first_pending_at))
+                    self._cond.wait(timeout)
+                if self._stopped:
+                    return
+            self.flush()
+
+    def flush(self) -> bool:
+        """
+        모아 둔 변경을 지금 저장
+
+        Returns:
+            bool: 성공 여부 (실패하면 다음 주기에 다시 시도)
+        """
+        with self._cond:
+            pending = self._pending
+            self._pending = 0
+            self._first_pending_at = None
+        if not pending:
+            return True
+
+        started = time.perf_counter()
+        try:
+            written = self.flush_func()
+        except Exception as e:
+            logger.error(f"write-behind 저장 실패: {e}")
+            with self._cond:
+                self._pending += pending
+                if self._first_pending_at is None:
+                    self._first_pending_at = time.monotonic()
+                self.stats["errors"] += 1
+            return False
+
+        with self._cond:
+            self.stats["flushes"] += 1
+            self.stats["written"] += written
+            self.stats["coalesced"] = self.stats["updates"] - self.stats["written"] - self._pending
+            self.stats["last_flush_at"] = time.time()
+            self.stats["last_flush_seconds"] = round(time.perf_counter() - started, 4)
+        return True
+
+    def stop(self, timeout: float = 5.0) -> bool:
+        """백그라운드 스레드를 멈추고 남은 변경 저장 (종료 시)"""
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread() and self._pid == os.getpid():
+            thread.join(timeout)
+        return self.flush()
+
+
+def create_storage(kind: str, files: Dict[str, str], journal_file: str = JOURNAL_FILE,
+                   db_file: str = DB_FILE,
+                   compact_threshold: int = COMPACT_THRESHOLD_BYTES,
+                   generations: int = SNAPSHOT_GENERATIONS,
+                   binary_file: Optional[str] = None,
+                   offload: Optional[Callable] = None,
+                   observer: Optional[Callable[[str, float, int], None]] = None) -> BaseStorage:
+    """
+    설정에 맞는 저장소 생성
+
+    Args:
+        kind: 'journal' (기본값) 또는 'sqlite'
+        files: {컬렉션 이름: JSON 스냅샷 파일 경로}
+        journal_file: 저널 파일 경로 (journal)
+        db_file: 데이터베이스 파일 경로 (sqlite)
+        compact_threshold: 저널 압축 기준 크기 (journal)
+        generations: 보관할 이전 스냅샷 수 (journal)
+        binary_file: 바이너리 스냅샷 경로, 파일이 있으면 그 형식을 사용 (journal)
+        offload: 디스크 쓰기와 파일 잠금 대기를 실행할 함수 (journal, 비동기 모드에서 네이티브 스레드로)
+        observer: 쓰기마다 호출할 함수 (operation, 걸린 시간, 기록한 바이트 수)
+
+    Returns:
+        BaseStorage: 저장소 인스턴스
+    """
+    if kind == "sqlite":
+        return SQLiteStorage(db_file, import_files=files, observer=observer)
+    if kind != "journal":
+        logger.warning(f"알 수 없는 저장소 종류 '{kind}', journal을 사용합니다.")
+    return JournalStorage(files, journal_file=journal_file, compact_threshold=compact_threshold,
+                          generations=generations, binary_file=binary_file, offload=offload,
+                          observer=observer)
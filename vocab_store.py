@@ -0,0 +1,234 @@
+"""
+열 단위 단어장 저장소 (VocabStore)
+단어마다 딕셔너리와 통계 리스트를 따로 만들지 않고, 열(column)별 배열에 나눠 저장합니다.
+
+- 영어 단어 → 행 번호 딕셔너리
+- 뜻: 문자열 리스트
+- 카테고리: 같은 문자열을 한 번만 저장하고 행에는 번호만 (array('I'))
+- 퀴즈 통계: 맞은/틀린 횟수 array('I') + 기록 여부 bytearray
+
+바깥에서는 지금과 같은 {word: {"korean", "category"}} / {word: [correct, wrong]} 매핑으로 보이므로,
+JSON 응답과 저장 형식은 그대로입니다. 값은 읽을 때마다 새 딕셔너리/리스트로 만듭니다.
+"""
+
+from array import array
+from collections.abc import ItemsView, Mapping, MutableMapping, ValuesView
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from vocab_binary import IterItemsView, IterValuesView
+
+MAX_COUNT = 0xFFFFFFFF  # array('I')에 담을 수 있는 최댓값
+COMPACT_MIN_HOLES = 1024  # 삭제된 행이 이보다 많고 절반을 넘으면 열을 다시 만듦
+
+
+def _fits_counts(value: Any) -> bool:
+    """[correct, wrong] 형식이고 array('I')에 담을 수 있는 값인지"""
+    if not isinstance(value, (list, tuple)) or len(value) != 2:
+        return False
+    return all(type(count) is int and 0 <= count <= MAX_COUNT for count in value)
+
+
+class VocabStore(MutableMapping):
+    """
+    열 단위로 저장하는 단어장 ({word: {"korean", "category"}} 매핑)
+
+    순회 순서는 딕셔너리처럼 추가한 순서입니다. 삭제한 행은 비워 두었다가
+    빈 행이 많아지면 한 번에 정리합니다. 퀴즈 통계는 stats 속성(StatsView)으로 읽고 씁니다.
+    """
+
+    def __init__(self, vocabulary: Union[Mapping, Iterable[Tuple[str, Mapping]]] = (),
+                 quiz_stats: Optional[Mapping] = None):
+        """
+        Args:
+            vocabulary: {word: {"korean", "category"}} 또는 (word, data) 쌍
+            quiz_stats: {word: [correct, wrong]}
+        """
+        self._rows: Dict[str, int] = {}
+        self._words: List[Optional[str]] = []  # 삭제된 행은 None
+        self._korean: List[Optional[str]] = []
+        self._category_ids = array('I')
+        self._categories: List[str] = []
+        self._category_ids_by_name: Dict[str, int] = {}
+        self._correct = array('I')
+        self._wrong = array('I')
+        self._has_stats = bytearray()
+        self._stats_count = 0
+        # 단어장에 없는 단어나 배열에 담을 수 없는 값의 통계
+        self._extra_stats: Dict[str, Any] = {}
+        self.stats = StatsView(self)
+        self.update(vocabulary)
+        if quiz_stats:
+            self.stats.update(quiz_stats.items())
+
+    # ---------- 단어 ----------
+
+    def _category_id(self, category: str) -> int:
+        category_id = self._category_ids_by_name.get(category)
+        if category_id is None:
+            category_id = self._category_ids_by_name[category] = len(self._categories)
+            self._categories.append(category)
+        return category_id
+
+    def __getitem__(self, word: str) -> Dict[str, str]:
+        row = self._rows[word]
+        return {"korean": self._korean[row], "category": self._categories[self._category_ids[row]]}
+
+    def __contains__(self, word: object) -> bool:
+        return word in self._rows
+
+    def __setitem__(self, word: str, data: Mapping) -> None:
+        korean = data.get("korean", "")
+        category_id = self._category_id(data.get("category", ""))
+        row = self._rows.get(word)
+        if row is not None:
+            self._korean[row] = korean
+            self._category_ids[row] = category_id
+            return
+        row = self._rows[word] = len(self._words)
+        self._words.append(word)
+        self._korean.append(korean)
+        self._category_ids.append(category_id)
+        self._correct.append(0)
+        self._wrong.append(0)
+        self._has_stats.append(0)
+        # 단어보다 먼저 들어온 통계는 배열로 옮김
+        if word in self._extra_stats and _fits_counts(self._extra_stats[word]):
+            self.stats[word] = self._extra_stats.pop(word)
+
+    def __delitem__(self, word: str) -> None:
+        row = self._rows.pop(word)
+        if self._has_stats[row]:
+            # 통계는 별도 컬렉션이므로 단어를 지워도 남겨 둠 (딕셔너리 두 개일 때와 같은 동작)
+            self._extra_stats[word] = [self._correct[row], self._wrong[row]]
+            self._has_stats[row] = 0
+            self._stats_count -= 1
+        self._words[row] = None
+        self._korean[row] = None
+        holes = len(self._words) - len(self._rows)
+        if holes > COMPACT_MIN_HOLES and holes * 2 > len(self._words):
+            self._compact()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __iter__(self) -> Iterator[str]:
+        for word in self._words:
+            if word is not None:
+                yield word
+
+    def iter_items(self) -> Iterator[Tuple[str, Dict[str, str]]]:
+        """(단어, 데이터)를 추가한 순서로 (단어마다 다시 찾지 않음)"""
+        categories = self._categories
+        for word, korean, category_id in zip(self._words, self._korean, self._category_ids):
+            if word is not None:
+                yield word, {"korean": korean, "category": categories[category_id]}
+
+    def items(self) -> ItemsView:
+        return IterItemsView(self)
+
+    def values(self) -> ValuesView:
+        return IterValuesView(self)
+
+    def category(self, word: str) -> str:
+        """단어의 카테고리 (딕셔너리를 만들지 않음)"""
+        return self._categories[self._category_ids[self._rows[word]]]
+
+    def _compact(self) -> None:
+        """삭제된 행을 빼고 열을 다시 만들기 (순서 유지)"""
+        keep = [row for row, word in enumerate(self._words) if word is not None]
+        self._words = [self._words[row] for row in keep]
+        self._korean = [self._korean[row] for row in keep]
+        self._category_ids = array('I', (self._category_ids[row] for row in keep))
+        self._correct = array('I', (self._correct[row] for row in keep))
+        self._wrong = array('I', (self._wrong[row] for row in keep))
+        self._has_stats = bytearray(self._has_stats[row] for row in keep)
+        self._rows = {word: row for row, word in enumerate(self._words)}
+
+    def copy(self) -> "VocabStore":
+        """독립된 복사본 (열 배열 단위로 복사하므로 딕셔너리 복사보다 빠름)"""
+        clone = VocabStore()
+        clone._rows = dict(self._rows)
+        clone._words = list(self._words)
+        clone._korean = list(self._korean)
+        clone._category_ids = array('I', self._category_ids)
+        clone._categories = list(self._categories)
+        clone._category_ids_by_name = dict(self._category_ids_by_name)
+        clone._correct = array('I', self._correct)
+        clone._wrong = array('I', self._wrong)
+        clone._has_stats = bytearray(self._has_stats)
+        clone._stats_count = self._stats_count
+        clone._extra_stats = dict(self._extra_stats)
+        return clone
+
+
+class StatsView(MutableMapping):
+    """VocabStore의 퀴즈 통계 열 ({word: [correct, wrong]} 매핑)"""
+
+    def __init__(self, store: VocabStore):
+        self._store = store
+
+    def __getitem__(self, word: str) -> List[int]:
+        store = self._store
+        row = store._rows.get(word)
+        if row is not None and store._has_stats[row]:
+            return [store._correct[row], store._wrong[row]]
+        return store._extra_stats[word]
+
+    def __contains__(self, word: object) -> bool:
+        store = self._store
+        row = store._rows.get(word)
+        if row is not None and store._has_stats[row]:
+            return True
+        return word in store._extra_stats
+
+    def __setitem__(self, word: str, value: List[int]) -> None:
+        store = self._store
+        row = store._rows.get(word)
+        if row is None or not _fits_counts(value):
+            if row is not None and store._has_stats[row]:
+                store._has_stats[row] = 0
+                store._stats_count -= 1
+            store._extra_stats[word] = value
+            return
+        store._correct[row] = value[0]
+        store._wrong[row] = value[1]
+        if not store._has_stats[row]:
+            store._has_stats[row] = 1
+            store._stats_count += 1
+            store._extra_stats.pop(word, None)
+
+    def __delitem__(self, word: str) -> None:
+        store = self._store
+        row = store._rows.get(word)
+        if row is not None and store._has_stats[row]:
+            store._has_stats[row] = 0
+            store._stats_count -= 1
+        else:
+            del store._extra_stats[word]
+
+    def __len__(self) -> int:
+        return self._store._stats_count + len(self._store._extra_stats)
+
+    def __iter__(self) -> Iterator[str]:
+        for word, _ in self.iter_items():
+            yield word
+
+    def iter_items(self) -> Iterator[Tuple[str, List[int]]]:
+        """(단어, [맞은 횟수, 틀린 횟수]) - 단어장 순서, 그다음 단어장에 없는 단어"""
+        store = self._store
+        for word, has_stats, correct, wrong in zip(store._words, store._has_stats,
+                                                   store._correct, store._wrong):
+            if has_stats:
+                yield word, [correct, wrong]
+        yield from list(store._extra_stats.items())
+
+    def items(self) -> ItemsView:
+        return IterItemsView(self)
+
+    def values(self) -> ValuesView:
+        return IterValuesView(self)
+
+    def copy(self) -> "StatsView":
+        """독립된 복사본 (단어장 열도 함께 복사, 단어장도 필요하면 VocabStore.copy().stats를 쓸 것)"""
+        return self._store.copy().stats
+
@@ -9,12 +9,33 @@
 - 다크 모드 지원
 """
 
-from flask import Flask, render_template, request, jsonify
-import json
+from flask import Flask, Response, g, render_template, request, jsonify, send_from_directory
+import csv
+import hmac
+import io
 import random
 import os
 import logging
-from typing import Dict, List, Tuple, Optional
+import atexit
+import time
+from typing import Callable, Dict, List, Tuple, Optional
+
+from vocab_storage import create_storage, make_set, make_delete
+from vocab_index import WordPool
+from vocab_scheduler import quality_from_result
+from vocab_grading import grade_text_answer
+from vocab_decks import (DEFAULT_DECK, DEFAULT_MAX_DECKS, Deck, DeckCache, deck_directory,
+                         is_valid_deck_id, list_deck_ids)
+from vocab_io import (FORMATS, MIMETYPES, validate_word_input, detect_format,
+                      iter_import_rows, export_chunks)
+from vocab_events import ChangeFeed, StreamSlots, format_sse
+from vocab_async import is_async_mode, run_in_thread
+from vocab_http import (COMPRESS_MIN_BYTES, StaticFingerprints, choose_encoding, compress,
+                        encoded_etag, etag_variants, is_compressible)
+from vocab_metrics import (CACHE_LOOKUPS, is_enabled as metrics_enabled, is_multiprocess, observe_request,
+                           observe_storage, render as render_metrics, set_index_sizes)
+from vocab_profiler import (FORMATS as PROFILE_FORMATS, ProfileTrigger, SamplingProfiler,
+                            save_request_profile, start_request_profile)
 
 # Flask 앱 초기화
 app = Flask(__name__)
@@ -29,140 +50,451 @@ logger = logging.getLogger(__name__)
 # 상수 정의
 VOCAB_FILE = "vocabulary.json"
 STATS_FILE = "quiz_stats.json"
+SRS_FILE = "srs_state.json"
+JOURNAL_FILE = "vocab_journal.jsonl"
+BINARY_FILE = "vocabulary.bin"  # 있으면 단어장/통계 스냅샷을 mmap으로 읽음 (vocab_convert.py로 생성)
+DB_FILE = "vocabulary.db"
+STORAGE_BACKEND = os.environ.get('VOCAB_STORAGE', 'journal')  # 'journal' or 'sqlite'
+# 이름 있는 단어장(사용자/주제별) 폴더, 단어장마다 하위 폴더에 같은 이름의 데이터 파일 (vocab_decks.py)
+DECKS_DIR = os.environ.get('DECKS_DIR', 'decks')
+# 워커마다 메모리에 둘 이름 있는 단어장 수 (넘으면 가장 오래 쓰지 않은 단어장을 내보냄)
+DECK_CACHE_SIZE = int(os.environ.get('DECK_CACHE_SIZE', DEFAULT_MAX_DECKS))
+# 워커마다 메모리에 둘 단어장들의 추정 크기 합계 (바이트, 0이면 개수로만 제한)
+DECK_CACHE_MAX_BYTES = int(os.environ.get('DECK_CACHE_MAX_BYTES', 0))
+# gunicorn gevent 워커(SERVER_MODE=async)에서 실행 중인지 (gunicorn.conf.py)
+ASYNC_MODE = is_async_mode()
+JOURNAL_COMPACT_BYTES = int(os.environ.get('JOURNAL_COMPACT_BYTES', 1024 * 1024))
+SNAPSHOT_GENERATIONS = int(os.environ.get('SNAPSHOT_GENERATIONS', 3))  # 보관할 이전 스냅샷 수
+# 다른 워커의 변경 사항 확인 주기 (초, 0이면 매 요청마다 확인)
+DATA_REFRESH_INTERVAL = float(os.environ.get('DATA_REFRESH_INTERVAL', 0))
+# 퀴즈 통계 write-behind: 첫 채점 후 최대 몇 초 뒤에 저장할지 (0이면 채점마다 바로 저장)
+STATS_FLUSH_INTERVAL = float(os.environ.get('STATS_FLUSH_INTERVAL', 1.0))
+# 저장하지 않은 변경이 이만큼 쌓이면 시간과 관계없이 바로 저장
+STATS_FLUSH_MAX_PENDING = int(os.environ.get('STATS_FLUSH_MAX_PENDING', 200))
+WORDS_MAX_LIMIT = 1000
+WORDS_STREAM_CHUNK = 500
+SEARCH_DEFAULT_LIMIT = 50
+SEARCH_MAX_LIMIT = 200
+QUIZ_BATCH_DEFAULT = 10
+QUIZ_BATCH_MAX = 100
+STATS_MAX_LIMIT = 1000
+STATIC_MAX_AGE = 365 * 24 * 3600  # 지문(?v=해시)이 붙은 정적 파일 캐시 기간 (1년)
+# 변경 이벤트 스트림 (/api/events)
+EVENTS_BUFFER = int(os.environ.get('EVENTS_BUFFER', 1000))  # 다시 연결할 때 이어 보낼 수 있는 최근 이벤트 수
+# 워커당 동시 스트림 수 (동기 모드는 스레드 수보다 적게, 비동기 모드는 스트림이 그린렛이므로 넉넉히)
+EVENTS_MAX_STREAMS = int(os.environ.get('EVENTS_MAX_STREAMS', 500 if ASYNC_MODE else 4))
+EVENTS_STREAM_SECONDS = float(os.environ.get('EVENTS_STREAM_SECONDS', 60))  # 스트림 하나의 최대 길이 (끝나면 자동 재연결)
+EVENTS_POLL_INTERVAL = 1.0  # 다른 워커의 변경 사항 확인 주기 (초)
+EVENTS_HEARTBEAT_SECONDS = 15  # 프록시가 연결을 끊지 않도록 보내는 주석 간격
+EVENTS_RETRY_MS = 3000  # 브라우저 재연결 대기 시간
+IMPORT_MAX_ERRORS = 100  # 가져오기 응답에 담는 오류 줄 수
+# 관리자 API(/api/admin/...)와 X-Profile 헤더에 필요한 토큰 (없으면 관리자 기능 비활성)
+ADMIN_TOKEN = os.environ.get('ADMIN_TOKEN', '')
+# 샘플링 프로파일러 (vocab_profiler.py)
+PROFILE_DIR = os.path.abspath(os.environ.get('PROFILE_DIR', 'profiles'))  # 결과 파일 폴더 (워커마다 파일 하나)
+PROFILE_SECONDS = float(os.environ.get('PROFILE_SECONDS', 0))  # 0보다 크면 워커 시작부터 이 시간 동안 기록
+PROFILE_FORMAT = os.environ.get('PROFILE_FORMAT', 'collapsed')  # 'collapsed' (불꽃 그래프) 또는 'pstats'
+PROFILE_INTERVAL = float(os.environ.get('PROFILE_INTERVAL', 0.01))  # 샘플 간격 (초)
+PROFILE_DEFAULT_SECONDS = 30
 DEFAULT_PORT = 5000
 FALLBACK_PORT = 5001
 
-# 전역 변수
-vocabulary: Dict[str, Dict] = {}  # {word: {"korean": meaning, "category": category}}
-quiz_stats: Dict[str, List[int]] = {}  # {word: [correct_count, wrong_count]}
 CATEGORIES_FILE = "categories.json"
 
-def load_data() -> None:
+# 운영 중 프로파일링 (구간 샘플링은 관리자 API나 PROFILE_SECONDS, 요청 하나는 X-Profile 헤더)
+profiler = SamplingProfiler(PROFILE_DIR, PROFILE_INTERVAL)
+profile_trigger = ProfileTrigger(PROFILE_DIR)  # 다른 워커가 받은 프로파일 요청
+
+# 정적 파일 내용 해시 (url_for('static')에 ?v=해시를 붙여 오래 캐시)
+static_files = StaticFingerprints(app.static_folder)
+
+# 이벤트 스트림 자리 (모든 단어장의 스트림을 합쳐 워커당 EVENTS_MAX_STREAMS개)
+stream_slots = StreamSlots(EVENTS_MAX_STREAMS)
+
+def open_deck(deck_id: str) -> Deck:
     """
-    파일에서 단어장 및 통계 데이터 불러오기
+    단어장 만들기 (불러오기 전, DeckCache가 처음 쓸 때 호출)
+    
+    저장소는 단어장 폴더(기본 단어장은 작업 폴더)의 파일을 쓰며,
+    VOCAB_STORAGE 환경 변수로 종류를 고르고 여러 워커 프로세스가 공유합니다.
     
+    Args:
+        deck_id: 단어장 ID
+        
     Returns:
-        None
+        Deck: 단어장
+    """
+    directory = deck_directory(DECKS_DIR, deck_id)
+    storage = create_storage(
+        STORAGE_BACKEND,
+        {
+            "vocabulary": os.path.join(directory, VOCAB_FILE),
+            "quiz_stats": os.path.join(directory, STATS_FILE),
+            "srs": os.path.join(directory, SRS_FILE)
+        },
+        journal_file=os.path.join(directory, JOURNAL_FILE),
+        db_file=os.path.join(directory, DB_FILE),
+        compact_threshold=JOURNAL_COMPACT_BYTES,
+        generations=SNAPSHOT_GENERATIONS,
+        binary_file=os.path.join(directory, BINARY_FILE),
+        offload=run_in_thread if ASYNC_MODE else None,
+        observer=observe_storage  # 저장 시간/바이트 수 지표 (/metrics)
+    )
+    return Deck(
+        deck_id,
+        storage,
+        ChangeFeed(EVENTS_BUFFER, slots=stream_slots),  # 변경 이벤트 (/api/events)
+        refresh_interval=DATA_REFRESH_INTERVAL,
+        flush_interval=STATS_FLUSH_INTERVAL,
+        flush_max_pending=STATS_FLUSH_MAX_PENDING
+    )
+
+# 단어장 캐시 (기본 단어장 + 최근에 쓴 이름 있는 단어장, DECK_CACHE_SIZE개와 DECK_CACHE_MAX_BYTES 이내)
+decks = DeckCache(open_deck, DECK_CACHE_SIZE, DECK_CACHE_MAX_BYTES)
+
+# 단어장 API 엔드포인트 (요청 전에 단어장을 불러와 g.deck에 둠)
+deck_endpoints = set()
+
+def deck_route(rule: str, **options) -> Callable:
     """
-    global vocabulary, quiz_stats
-    vocabulary = {}
-    quiz_stats = {}
+    단어장 API 등록
     
-    # 단어장 데이터 로드
+    같은 뷰 함수를 기본 단어장(/api<rule>)과 이름 있는 단어장(/api/decks/<deck_id><rule>)에
+    모두 연결합니다. 뷰 함수는 g.deck으로 요청한 단어장을 씁니다.
+    
+    Args:
+        rule: /api 뒤의 경로 (예: '/words')
+        **options: app.add_url_rule() 옵션 (methods 등)
+    """
+    def decorator(func: Callable) -> Callable:
+        app.add_url_rule(f'/api{rule}', view_func=func, **options)
+        app.add_url_rule(f'/api/decks/<deck_id>{rule}', view_func=func, **options)
+        deck_endpoints.add(func.__name__)
+        return func
+    return decorator
+
+def deck_exists(deck_id: str) -> bool:
+    """단어장이 만들어져 있는지 (기본 단어장은 항상 있음)"""
+    if deck_id == DEFAULT_DECK:
+        return True
+    return is_valid_deck_id(deck_id) and os.path.isdir(deck_directory(DECKS_DIR, deck_id))
+
+def deck_not_found(deck_id: str) -> Tuple[Response, int]:
+    return jsonify({"success": False, "message": f"'{deck_id}' 단어장을 찾을 수 없습니다."}), 404
+
+def open_deck_for_request(deck_id: str) -> Tuple[Optional[Deck], Optional[Tuple[Response, int]]]:
+    """
+    단어장을 가져와(처음이면 불러오기) 다른 워커의 변경 사항 반영
+    
+    저장소를 읽을 수 없으면(모든 스냅샷 세대가 손상 등) 단어장은 불러오지 않은 채로 남고,
+    읽을 수 있게 될 때까지 503을 응답합니다 (빈 단어장으로 기록해 데이터를 덮어쓰지 않도록).
+    
+    Returns:
+        Tuple[Optional[Deck], Optional[Tuple[Response, int]]]: (단어장, None) 또는 (None, 오류 응답)
+    """
+    if not deck_exists(deck_id):
+        return None, deck_not_found(deck_id)
     try:
-        if os.path.exists(VOCAB_FILE):
-            with open(VOCAB_FILE, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                # 기존 형식({word: meaning})과 새 형식({word: {korean, category}}) 호환
-                for word, value in data.items():
-                    if isinstance(value, str):
-                        # 기존 형식: {word: meaning} -> {word: {korean: meaning, category: ""}}
-                        vocabulary[word] = {"korean": value, "category": ""}
-                    elif isinstance(value, dict):
-                        # 새 형식: {word: {korean: meaning, category: category}}
-                        vocabulary[word] = {
-                            "korean": value.get("korean", ""),
-                            "category": value.get("category", "")
-                        }
-            logger.info(f"단어장 불러오기 성공: {len(vocabulary)}개 단어")
-        else:
-            logger.info("단어장 파일이 없습니다. 새로 생성합니다.")
-    except json.JSONDecodeError as e:
-        logger.error(f"단어장 JSON 파싱 오류: {e}")
-        vocabulary = {}
+        deck = decks.get(deck_id)
+        deck.refresh_if_changed()
     except Exception as e:
-        logger.error(f"단어장 불러오기 실패: {e}")
-        vocabulary = {}
+        logger.error(f"[{deck_id}] 단어장을 불러올 수 없습니다: {e}")
+        return None, (jsonify({"success": False, "message": "단어장 데이터를 불러올 수 없습니다. 관리자에게 문의해주세요."}), 503)
+    return deck, None
+
+def init_data() -> None:
+    """
+    워커 시작 시 기본 단어장을 한 번 불러오기
     
-    # 통계 데이터 로드
+    모듈 import 시점에 호출되므로 gunicorn(web_vocab_app:app)의 각 워커도
+    첫 요청 전에 데이터가 준비됩니다. 이름 있는 단어장은 처음 요청이 올 때 불러옵니다.
+    """
+    if PROFILE_SECONDS > 0 and not profiler.running:
+        # 불러오기부터 기록 (워커마다 결과 파일 하나)
+        profiler.start(PROFILE_SECONDS, PROFILE_FORMAT)
+    first_load = not decks.default.loaded
+    if first_load:
+        atexit.register(flush_pending_writes)
     try:
-        if os.path.exists(STATS_FILE):
-            with open(STATS_FILE, 'r', encoding='utf-8') as f:
-                quiz_stats = json.load(f)
-            logger.info(f"통계 불러오기 성공: {len(quiz_stats)}개 기록")
-        else:
-            logger.info("통계 파일이 없습니다. 새로 생성합니다.")
-    except json.JSONDecodeError as e:
-        logger.error(f"통계 JSON 파싱 오류: {e}")
-        quiz_stats = {}
-    except Exception as e:
-        logger.error(f"통계 불러오기 실패: {e}")
-        quiz_stats = {}
+        decks.default.load()
+    except Exception:
+        # 불러오지 않은 상태로 두고 요청이 올 때 다시 시도 (그동안 단어장 API는 503)
+        logger.error("기본 단어장을 불러오지 못했습니다. 불러올 수 있을 때까지 단어장 API는 503을 응답합니다.")
 
-def save_data() -> bool:
+def flush_pending_writes() -> bool:
     """
-    단어장 및 통계 데이터를 파일에 저장
+    불러온 모든 단어장의 저장하지 않은 채점 결과를 바로 저장 (프로세스 종료 시)
+    
+    atexit과 gunicorn의 worker_exit 훅(gunicorn.conf.py)에서 호출됩니다.
     
     Returns:
         bool: 저장 성공 여부
     """
-    try:
-        # 단어장 저장
-        with open(VOCAB_FILE, 'w', encoding='utf-8') as f:
-            json.dump(vocabulary, f, ensure_ascii=False, indent=2)
-        
-        # 통계 저장
-        with open(STATS_FILE, 'w', encoding='utf-8') as f:
-            json.dump(quiz_stats, f, ensure_ascii=False, indent=2)
-        
-        logger.debug("데이터 저장 성공")
-        return True
-    except IOError as e:
-        logger.error(f"파일 저장 IO 오류: {e}")
-        return False
-    except Exception as e:
-        logger.error(f"파일 저장 실패: {e}")
-        return False
+    return decks.flush_all()
+
+@app.before_request
+def start_request_timer() -> None:
+    """요청 처리 시간 측정 시작 (다른 워커의 변경 사항 반영 시간 포함)"""
+    g.request_started = time.perf_counter()
+
+@app.before_request
+def start_profiling() -> None:
+    """다른 워커가 요청한 구간 프로파일 따르기, X-Profile 헤더가 있으면 이 요청만 cProfile로 기록"""
+    if not ADMIN_TOKEN:
+        return
+    trigger = profile_trigger.poll()
+    if trigger is not None and trigger.get("format") in PROFILE_FORMATS:
+        profiler.start(trigger["until"] - time.time(), trigger["format"], bool(trigger.get("include_idle")))
+    if request.headers.get('X-Profile') and is_admin_request():
+        g.request_profile = start_request_profile()
+
+@app.teardown_request
+def stop_request_profile(error: Optional[BaseException] = None) -> None:
+    """처리 중 예외로 after_request를 건너뛴 요청의 프로파일러 끄기"""
+    profile = g.pop('request_profile', None)
+    if profile is not None:
+        profile.disable()
+
+@app.url_value_preprocessor
+def pop_deck_id(endpoint: Optional[str], values: Optional[Dict]) -> None:
+    """URL의 단어장 ID를 뷰 함수 인자 대신 g.deck_id에 두기"""
+    if values and 'deck_id' in values:
+        g.deck_id = values.pop('deck_id')
+
+@app.before_request
+def open_request_deck() -> Optional[Tuple[Response, int]]:
+    """단어장 API 요청이면 단어장을 가져오고(처음이면 불러오기) 다른 워커의 변경 사항 반영"""
+    if request.endpoint not in deck_endpoints:
+        return None
+    deck, error = open_deck_for_request(g.get('deck_id', DEFAULT_DECK))
+    if error is not None:
+        return error
+    g.deck = deck
+    return None
+
+@app.after_request
+def check_deck_memory(response: Response) -> Response:
+    """요청 중에 단어장이 커졌으면(단어 추가, 다른 워커의 변경 반영) 단어장 캐시 크기 제한 확인"""
+    deck = g.get('deck')
+    if deck is not None:
+        decks.check_memory(deck)
+    return response
+
+@app.url_defaults
+def add_static_fingerprint(endpoint: str, values: Dict) -> None:
+    """url_for('static', filename=...)에 내용 해시(?v=) 붙이기 (파일이 바뀌면 URL도 바뀜)"""
+    if endpoint == 'static' and 'filename' in values and 'v' not in values:
+        fingerprint = static_files.fingerprint(values['filename'])
+        if fingerprint:
+            values['v'] = fingerprint
+
+@app.after_request
+def finish_response(response: Response) -> Response:
+    """정적 파일 캐시 헤더, 응답 압축, 처리 시간 지표, 요청 프로파일 저장"""
+    set_static_cache_headers(response)
+    response = compress_response(response)
+    started = g.get('request_started')
+    if started is not None:
+        # 경로 대신 URL 규칙(/api/words/<word>)으로 묶어 지표 종류가 단어 수만큼 늘지 않도록
+        route = request.url_rule.rule if request.url_rule is not None else "unmatched"
+        observe_request(request.method, route, response.status_code, time.perf_counter() - started)
+    profile = g.pop('request_profile', None)
+    if profile is not None:
+        path = save_request_profile(profile, PROFILE_DIR, request.endpoint or "unmatched")
+        response.headers['X-Profile-File'] = os.path.basename(path)
+    return response
+
+def set_static_cache_headers(response: Response) -> None:
+    """
+    정적 파일 Cache-Control
+    
+    현재 내용 해시와 같은 ?v=가 붙은 URL은 내용이 바뀌지 않으므로 오래 캐시하고,
+    그 외(지문 없음, 이전 지문)는 매번 확인하도록 합니다.
+    """
+    if request.endpoint != 'static' or response.status_code not in (200, 304):
+        return
+    version = request.args.get('v')
+    if version and version == static_files.fingerprint(request.view_args.get('filename', '')):
+        response.headers['Cache-Control'] = f'public, max-age={STATIC_MAX_AGE}, immutable'
+    else:
+        response.headers['Cache-Control'] = 'no-cache'
+
+def compress_response(response: Response) -> Response:
+    """
+    큰 텍스트 응답을 brotli/gzip으로 압축 (Accept-Encoding 기준)
+    
+    스트리밍 응답(NDJSON, 내보내기)과 COMPRESS_MIN_BYTES보다 작은 응답은 그대로 둡니다.
+    ETag는 압축 방식별로 바꾸고(태그-gzip), 그 ETag로 다시 요청하면 304를 돌려줍니다.
+    """
+    is_static = request.endpoint == 'static'
+    if (response.status_code != 200 or 'Content-Encoding' in response.headers
+            or not is_compressible(response.mimetype) or (response.is_streamed and not is_static)):
+        return response
+    length = response.content_length if is_static else len(response.get_data())
+    if length is None or length < COMPRESS_MIN_BYTES:
+        return response
+    
+    response.vary.add('Accept-Encoding')
+    encoding = choose_encoding(request.accept_encodings)
+    if encoding is None:
+        return response
+    
+    tag, weak = response.get_etag()
+    if tag and not weak:
+        tag = encoded_etag(tag, encoding)
+        if request.if_none_match.contains(tag):
+            not_modified = Response(status=304)
+            not_modified.set_etag(tag)
+            not_modified.vary.add('Accept-Encoding')
+            not_modified.headers['Cache-Control'] = response.headers.get('Cache-Control', 'no-cache')
+            response.close()
+            return not_modified
+    
+    if is_static:
+        filename = request.view_args.get('filename', '')
+        body = static_files.compressed(filename, static_files.fingerprint(filename), encoding)
+        response.close()  # 열어 둔 파일 닫기
+        response.direct_passthrough = False
+    else:
+        body = compress(response.get_data(), encoding)
+    response.set_data(body)
+    response.headers['Content-Encoding'] = encoding
+    if tag and not weak:
+        response.set_etag(tag)
+    return response
 
 # 메인 페이지
 @app.route('/')
+@app.route('/decks/<deck_id>')
 def index():
-    """메인 페이지"""
+    """메인 페이지 (/decks/<deck_id>는 이름 있는 단어장을 여는 같은 화면)"""
+    deck_id = g.get('deck_id', DEFAULT_DECK)
+    deck, error = open_deck_for_request(deck_id)
+    if error is not None:
+        return error
     return render_template('index.html', 
-                         word_count=len(vocabulary),
-                         stats_count=len(quiz_stats))
+                         word_count=len(deck.vocabulary),
+                         stats_count=len(deck.quiz_stats),
+                         deck_id=deck_id,
+                         api_base='/api' if deck_id == DEFAULT_DECK else f'/api/decks/{deck_id}')
 
-# 단어 목록 API
-@app.route('/api/words', methods=['GET'])
-def get_words():
-    """모든 단어 가져오기"""
-    category = request.args.get('category', None)
-    words_list = []
+def word_to_dict(deck: Deck, word: str) -> Dict:
+    """API 응답용 단어 데이터"""
+    data = deck.vocabulary[word]
+    return {
+        "english": word,
+        "korean": data.get("korean", ""),
+        "category": data.get("category", "")
+    }
+
+def collect_words(deck: Deck, category: Optional[str], cursor: str, limit: int) -> List[Dict]:
+    """
+    영어 단어 사전 순으로 cursor 다음부터 최대 limit개 수집
     
-    for eng, data in vocabulary.items():
-        word_data = {
-            "english": eng,
-            "korean": data.get("korean", ""),
-            "category": data.get("category", "")
-        }
-        # 카테고리 필터링
-        if category is None or category == "" or word_data["category"] == category:
-            words_list.append(word_data)
+    Args:
+        deck: 단어장
+        category: 카테고리 필터 (None 또는 빈 문자열이면 전체)
+        cursor: 이전 페이지의 마지막 단어 (빈 문자열이면 처음부터)
+        limit: 최대 개수
+        
+    Returns:
+        List[Dict]: 단어 데이터 목록
+    """
+    words_list = []
+    with deck.data_lock:
+        if category:
+            words = deck.category_index.iter_after(category, cursor)
+        else:
+            words = deck.search_index.iter_after(cursor)
+        for word in words:
+            words_list.append(word_to_dict(deck, word))
+            if len(words_list) >= limit:
+                break
+    return words_list
+
+def count_words(deck: Deck, category: Optional[str]) -> int:
+    """전체 또는 카테고리별 단어 수"""
+    if not category:
+        return len(deck.vocabulary)
+    return deck.category_index.count(category)
+
+def iter_word_chunks(deck: Deck, category: Optional[str], cursor: str):
+    """
+    단어를 WORDS_STREAM_CHUNK개씩 묶어 내보내는 제너레이터
     
-    return jsonify(words_list)
+    묶음마다 잠금을 잡고 가져오므로 전체 목록을 메모리에 만들지 않습니다.
+    """
+    while True:
+        chunk = collect_words(deck, category, cursor, WORDS_STREAM_CHUNK)
+        if not chunk:
+            return
+        yield chunk
+        cursor = chunk[-1]["english"]
 
-def validate_word_input(english: str, korean: str) -> Tuple[bool, Optional[str]]:
+def stream_words_ndjson(deck: Deck, category: Optional[str], cursor: str):
+    """단어를 한 줄에 하나씩(NDJSON) 내보내는 제너레이터"""
+    return export_chunks(iter_word_chunks(deck, category, cursor), "ndjson")
+
+# 단어 목록 API
+@deck_route('/words', methods=['GET'])
+def get_words():
     """
-    단어 입력값 검증
+    단어 목록 가져오기
     
-    Args:
-        english: 영어 단어
-        korean: 한국어 뜻
+    Query Parameters:
+        category: 카테고리 필터 (선택)
+        limit: 페이지 크기 (지정하면 영어 단어 사전 순 페이지 응답)
+        cursor: 이전 응답의 next_cursor (다음 페이지)
+        format: 'ndjson'이면 전체 목록을 한 줄씩 스트리밍
         
     Returns:
-        Tuple[bool, Optional[str]]: (검증 성공 여부, 에러 메시지)
-    """
-    if not english or not english.strip():
-        return False, "영어 단어를 입력해주세요."
-    if not korean or not korean.strip():
-        return False, "한국어 뜻을 입력해주세요."
-    if len(english) > 100:
-        return False, "영어 단어는 100자 이하여야 합니다."
-    if len(korean) > 200:
-        return False, "한국어 뜻은 200자 이하여야 합니다."
-    return True, None
-
-@app.route('/api/words', methods=['POST'])
+        JSON: 단어 배열 (limit/cursor가 없을 때),
+              또는 {"words": [...], "next_cursor": str|null, "total": int}
+    """
+    deck = g.deck
+    category = request.args.get('category', None)
+    cursor = request.args.get('cursor', '')
+    
+    if request.args.get('format') == 'ndjson':
+        return Response(stream_words_ndjson(deck, category, cursor), mimetype='application/x-ndjson')
+    
+    limit_arg = request.args.get('limit')
+    if limit_arg is None and not cursor:
+        # 기존 형식: 전체 목록 배열
+        def build_all() -> Response:
+            if category:
+                # 카테고리 인덱스로 해당 카테고리 단어만 조회
+                words_list = [word_to_dict(deck, w) for w in deck.category_index.sorted_words(category)]
+            else:
+                words_list = [word_to_dict(deck, w) for w in deck.vocabulary]
+            return jsonify(words_list)
+        
+        with deck.data_lock:
+            return conditional_response(words_etag(deck), build_all)
+    
+    try:
+        limit = min(max(int(limit_arg or WORDS_MAX_LIMIT), 1), WORDS_MAX_LIMIT)
+    except ValueError:
+        return jsonify({"success": False, "message": "limit은 숫자여야 합니다."}), 400
+    
+    def build_page() -> Response:
+        # 한 개 더 가져와서 다음 페이지가 있는지 확인
+        words_list = collect_words(deck, category, cursor, limit + 1)
+        next_cursor = None
+        if len(words_list) > limit:
+            words_list = words_list[:limit]
+            next_cursor = words_list[-1]["english"]
+        
+        return jsonify({
+            "words": words_list,
+            "next_cursor": next_cursor,
+            "total": count_words(deck, category)
+        })
+    
+    with deck.data_lock:
+        return conditional_response(words_etag(deck), build_page)
+
+@deck_route('/words', methods=['POST'])
 def add_word():
     """
     단어 추가 API
@@ -190,16 +522,18 @@ def add_word():
         if not is_valid:
             return jsonify({"success": False, "message": error_message}), 400
         
-        # 중복 확인
-        if english in vocabulary:
-            return jsonify({"success": False, "message": f"'{english}' 단어가 이미 존재합니다."}), 409
+        deck = g.deck
+        with deck.transaction():
+            # 중복 확인
+            if english in deck.vocabulary:
+                return jsonify({"success": False, "message": f"'{english}' 단어가 이미 존재합니다."}), 409
+            
+            # 단어 추가
+            saved = deck.record_changes([
+                make_set("vocabulary", english, {"korean": korean, "category": category})
+            ])
         
-        # 단어 추가
-        vocabulary[english] = {
-            "korean": korean,
-            "category": category
-        }
-        if save_data():
+        if saved:
             logger.info(f"단어 추가 성공: {english}")
             return jsonify({"success": True, "message": f"'{english}' 단어가 추가되었습니다!"})
         else:
@@ -209,7 +543,7 @@ def add_word():
         logger.error(f"단어 추가 오류: {e}")
         return jsonify({"success": False, "message": "서버 오류가 발생했습니다."}), 500
 
-@app.route('/api/words/<word>', methods=['DELETE'])
+@deck_route('/words/<word>', methods=['DELETE'])
 def delete_word(word: str):
     """
     단어 삭제 API
@@ -226,17 +560,20 @@ def delete_word(word: str):
         if not word:
             return jsonify({"success": False, "message": "단어를 입력해주세요."}), 400
         
-        if word not in vocabulary:
-            return jsonify({"success": False, "message": "단어를 찾을 수 없습니다."}), 404
-        
-        # 단어 삭제
-        del vocabulary[word]
-        
-        # 통계도 함께 삭제
-        if word in quiz_stats:
-            del quiz_stats[word]
+        deck = g.deck
+        with deck.transaction():
+            if word not in deck.vocabulary:
+                return jsonify({"success": False, "message": "단어를 찾을 수 없습니다."}), 404
+            
+            # 단어 삭제 (통계와 복습 상태도 함께 삭제)
+            changes = [make_delete("vocabulary", word)]
+            if word in deck.quiz_stats:
+                changes.append(make_delete("quiz_stats", word))
+            if word in deck.srs_state:
+                changes.append(make_delete("srs", word))
+            saved = deck.record_changes(changes)
         
-        if save_data():
+        if saved:
             logger.info(f"단어 삭제 성공: {word}")
             return jsonify({"success": True, "message": f"'{word}' 단어가 삭제되었습니다!"})
         else:
@@ -246,7 +583,7 @@ def delete_word(word: str):
         logger.error(f"단어 삭제 오류: {e}")
         return jsonify({"success": False, "message": "서버 오류가 발생했습니다."}), 500
 
-@app.route('/api/words/<word>', methods=['PUT'])
+@deck_route('/words/<word>', methods=['PUT'])
 def update_word(word: str):
     """
     단어 수정 API
@@ -279,39 +616,38 @@ def update_word(word: str):
         if not is_valid:
             return jsonify({"success": False, "message": error_message}), 400
         
-        if word not in vocabulary:
-            return jsonify({"success": False, "message": "단어를 찾을 수 없습니다."}), 404
-        
-        # 기존 카테고리 유지 (카테고리가 제공되지 않은 경우)
-        if not new_category:
-            new_category = vocabulary[word].get("category", "")
-        
-        # 단어가 변경된 경우
-        if new_english != word:
-            # 새 단어가 이미 존재하는지 확인
-            if new_english in vocabulary and new_english != word:
-                return jsonify({"success": False, "message": f"'{new_english}' 단어가 이미 존재합니다."}), 409
+        deck = g.deck
+        with deck.transaction():
+            if word not in deck.vocabulary:
+                return jsonify({"success": False, "message": "단어를 찾을 수 없습니다."}), 404
             
-            # 기존 단어 삭제
-            del vocabulary[word]
+            # 기존 카테고리 유지 (카테고리가 제공되지 않은 경우)
+            if not new_category:
+                new_category = deck.vocabulary[word].get("category", "")
             
-            # 통계 이전
-            if word in quiz_stats:
-                quiz_stats[new_english] = quiz_stats.pop(word)
+            new_data = {"korean": new_korean, "category": new_category}
             
-            # 새 단어 추가
-            vocabulary[new_english] = {
-                "korean": new_korean,
-                "category": new_category
-            }
-        else:
-            # 단어는 같고 뜻/카테고리만 변경
-            vocabulary[word] = {
-                "korean": new_korean,
-                "category": new_category
-            }
+            # 단어가 변경된 경우
+            if new_english != word:
+                # 새 단어가 이미 존재하는지 확인
+                if new_english in deck.vocabulary and new_english != word:
+                    return jsonify({"success": False, "message": f"'{new_english}' 단어가 이미 존재합니다."}), 409
+                
+                # 기존 단어 삭제 후 새 단어 추가, 통계/복습 상태 이전
+                changes = [make_delete("vocabulary", word), make_set("vocabulary", new_english, new_data)]
+                if word in deck.quiz_stats:
+                    changes.append(make_set("quiz_stats", new_english, deck.quiz_stats[word]))
+                    changes.append(make_delete("quiz_stats", word))
+                if word in deck.srs_state:
+                    changes.append(make_set("srs", new_english, deck.srs_state[word]))
+                    changes.append(make_delete("srs", word))
+            else:
+                # 단어는 같고 뜻/카테고리만 변경
+                changes = [make_set("vocabulary", word, new_data)]
+            
+            saved = deck.record_changes(changes)
         
-        if save_data():
+        if saved:
             logger.info(f"단어 수정 성공: {word} -> {new_english}")
             return jsonify({"success": True, "message": f"단어가 수정되었습니다!"})
         else:
@@ -321,131 +657,392 @@ def update_word(word: str):
         logger.error(f"단어 수정 오류: {e}")
         return jsonify({"success": False, "message": "서버 오류가 발생했습니다."}), 500
 
+# 단어 일괄 가져오기 API
+@deck_route('/words/import', methods=['POST'])
+def import_words():
+    """
+    단어 일괄 가져오기 API (CSV, TSV, NDJSON)
+    
+    요청 본문(또는 multipart의 'file' 필드)을 한 줄씩 읽어 검증한 뒤,
+    올바른 단어를 한 번의 변경(저널 기록 한 번)으로 추가합니다.
+    
+    Query Parameters:
+        format: 'csv', 'tsv', 'ndjson' (없으면 파일 이름/Content-Type으로 추측)
+        overwrite: '1'이면 이미 있는 단어의 뜻/카테고리를 덮어씀 (기본은 건너뜀)
+        
+    Returns:
+        JSON: {"success", "imported", "error_count", "errors": [{"line", "message"}] (처음 100개)}
+    """
+    try:
+        if request.mimetype.startswith('multipart/'):
+            upload = request.files.get('file')
+            if upload is None:
+                return jsonify({"success": False, "message": "'file' 필드가 없습니다."}), 400
+            binary_stream, filename = upload.stream, upload.filename
+        else:
+            binary_stream, filename = request.stream, ""
+        
+        fmt = request.args.get('format') or detect_format(filename, request.mimetype)
+        if fmt not in FORMATS:
+            return jsonify({"success": False, "message": "format은 csv, tsv, ndjson 중 하나여야 합니다."}), 400
+        overwrite = request.args.get('overwrite') == '1'
+        
+        # 업로드를 한 줄씩 읽으며 검증 (잠금 없이)
+        errors: List[Dict] = []
+        error_count = 0
+        rows: Dict[str, Tuple[int, Dict]] = {}
+        lines = io.TextIOWrapper(binary_stream, encoding='utf-8-sig', newline='')
+        try:
+            for line_num, word, error_message in iter_import_rows(lines, fmt):
+                if word is not None and word["english"] in rows and not overwrite:
+                    word, error_message = None, f"'{word['english']}' 단어가 파일 안에서 중복됩니다."
+                if word is None:
+                    error_count += 1
+                    if len(errors) < IMPORT_MAX_ERRORS:
+                        errors.append({"line": line_num, "message": error_message})
+                    continue
+                rows[word["english"]] = (line_num, word)
+        except (UnicodeDecodeError, csv.Error) as e:
+            return jsonify({"success": False, "message": f"파일을 읽을 수 없습니다: {e}"}), 400
+        
+        # 검증된 단어를 한 번에 기록
+        deck = g.deck
+        with deck.transaction():
+            changes = []
+            for english, (line_num, word) in rows.items():
+                if english in deck.vocabulary and not overwrite:
+                    error_count += 1
+                    if len(errors) < IMPORT_MAX_ERRORS:
+                        errors.append({"line": line_num, "message": f"'{english}' 단어가 이미 존재합니다."})
+                    continue
+                changes.append(make_set("vocabulary", english, {"korean": word["korean"], "category": word["category"]}))
+            saved = deck.record_changes(changes) if changes else True
+        
+        if not saved:
+            return jsonify({"success": False, "message": "파일 저장에 실패했습니다."}), 500
+        
+        logger.info(f"단어 가져오기: {len(changes)}개 추가, {error_count}개 건너뜀")
+        return jsonify({
+            "success": True,
+            "imported": len(changes),
+            "error_count": error_count,
+            "errors": errors
+        })
+        
+    except Exception as e:
+        logger.error(f"단어 가져오기 오류: {e}")
+        return jsonify({"success": False, "message": "서버 오류가 발생했습니다."}), 500
+
+# 단어 내보내기 API
+@deck_route('/words/export', methods=['GET'])
+def export_words():
+    """
+    단어장 내보내기 (묶음 단위 스트리밍)
+    
+    Query Parameters:
+        format: 'csv' (기본), 'tsv', 'ndjson'
+        category: 카테고리 필터 (선택)
+    """
+    fmt = request.args.get('format', 'csv').lower()
+    if fmt not in FORMATS:
+        return jsonify({"success": False, "message": "format은 csv, tsv, ndjson 중 하나여야 합니다."}), 400
+    category = request.args.get('category', None)
+    
+    response = Response(export_chunks(iter_word_chunks(g.deck, category, ''), fmt), mimetype=MIMETYPES[fmt])
+    response.headers['Content-Disposition'] = f'attachment; filename=vocabulary.{fmt}'
+    return response
+
+# 단어 검색 API (영어 접두사 / 한국어 뜻 부분 일치)
+@deck_route('/words/search', methods=['GET'])
+def search_words():
+    """
+    인덱스를 사용한 단어 검색
+    
+    Query Parameters:
+        q: 검색어
+        category: 카테고리 필터 (선택)
+        limit: 최대 결과 수 (기본 50, 최대 200)
+        
+    Returns:
+        JSON: {"success": True, "words": [...], "has_more": bool}
+    """
+    query = request.args.get('q', '')
+    category = request.args.get('category', '')
+    try:
+        limit = min(max(int(request.args.get('limit', SEARCH_DEFAULT_LIMIT)), 1), SEARCH_MAX_LIMIT)
+    except ValueError:
+        return jsonify({"success": False, "message": "limit은 숫자여야 합니다."}), 400
+    
+    deck = g.deck
+    accept = None
+    if category:
+        accept = lambda w: deck.vocabulary[w].get("category", "") == category
+    
+    def build() -> Response:
+        matches = deck.search_index.search(query, limit + 1, accept)
+        words_list = [word_to_dict(deck, w) for w in matches[:limit]]
+        return jsonify({"success": True, "words": words_list, "has_more": len(matches) > limit})
+    
+    with deck.data_lock:
+        return conditional_response(words_etag(deck), build)
+
 # 단어 검색 API
-@app.route('/api/words/<word>', methods=['GET'])
+@deck_route('/words/<word>', methods=['GET'])
 def search_word(word):
     """단어 검색"""
     word = word.lower()
-    if word in vocabulary:
-        data = vocabulary[word]
-        return jsonify({
-            "success": True, 
-            "english": word, 
-            "korean": data.get("korean", ""),
-            "category": data.get("category", "")
-        })
-    else:
-        return jsonify({"success": False, "message": "단어를 찾을 수 없습니다."}), 404
+    deck = g.deck
+    
+    def build() -> Response:
+        if word in deck.vocabulary:
+            data = deck.vocabulary[word]
+            return jsonify({
+                "success": True, 
+                "english": word, 
+                "korean": data.get("korean", ""),
+                "category": data.get("category", "")
+            })
+        else:
+            response = jsonify({"success": False, "message": "단어를 찾을 수 없습니다."})
+            response.status_code = 404
+            return response
+    
+    with deck.data_lock:
+        return conditional_response(words_etag(deck), build)
 
 # 퀴즈 문제 가져오기 API
-@app.route('/api/quiz', methods=['POST'])
+@deck_route('/quiz', methods=['POST'])
 def get_quiz():
     """퀴즈 문제 생성"""
     data = request.get_json()
     quiz_type = data.get('type', 'english_to_korean')  # 'english_to_korean' or 'korean_to_english'
     quiz_mode = data.get('mode', 'text')  # 'text' (주관식) or 'multiple' (객관식)
     focus_mode = data.get('focus_mode', False)  # True면 틀린 단어만 선택
+    srs_mode = data.get('srs_mode', False)  # True면 간격 반복 복습 순서로 선택
     
-    if not vocabulary:
+    deck = g.deck
+    if not deck.vocabulary:
         return jsonify({"success": False, "message": "퀴즈를 하려면 먼저 단어를 추가해주세요."}), 400
     
-    # 단어 선택
-    words = list(vocabulary.keys())
-    
-    # 카테고리 필터링
-    quiz_category = data.get('category', None)
-    if quiz_category and quiz_category != "":
-        words = [w for w in words if vocabulary[w].get("category", "") == quiz_category]
-        if not words:
+    with deck.data_lock:
+        # 단어 선택 (단어 풀에서 O(1) 무작위 선택, 카테고리는 카테고리별 풀 사용)
+        quiz_category = data.get('category', None)
+        words = quiz_word_pool(deck, quiz_category)
+        if words is None:
             return jsonify({"success": False, "message": f"'{quiz_category}' 카테고리에 단어가 없습니다."}), 400
+        
+        srs_info = None
+        if srs_mode:
+            word, due = deck.scheduler.next_word(quiz_category)
+            srs_info = srs_quiz_info(deck, word, due)
+        else:
+            word = select_quiz_word(deck, words, focus_mode, quiz_category)
+        quiz = build_quiz(deck, word, quiz_type, quiz_mode, srs_info)
     
-    # 틀린 단어 집중 학습 모드
-    if focus_mode:
-        # 정답률이 낮은 단어 우선 선택 (틀린 횟수가 많은 단어)
-        words_with_stats = []
-        for word in words:
-            if word in quiz_stats:
-                correct, wrong = quiz_stats[word]
-                total = correct + wrong
-                if total > 0:
-                    accuracy = (correct / total) * 100
-                    # 정답률이 낮거나 틀린 횟수가 많은 단어 우선
-                    words_with_stats.append((word, accuracy, wrong))
-        
-        if words_with_stats:
-            # 정답률 낮은 순으로 정렬 (같으면 틀린 횟수 많은 순)
-            words_with_stats.sort(key=lambda x: (x[1], -x[2]))
-            # 하위 50% 중에서 랜덤 선택 (너무 제한적이지 않게)
-            bottom_half = words_with_stats[:max(1, len(words_with_stats) // 2)]
-            word = random.choice(bottom_half)[0]
+    return jsonify(quiz)
+
+# 퀴즈 문제 여러 개 가져오기 API
+@deck_route('/quiz/batch', methods=['POST'])
+def get_quiz_batch():
+    """
+    퀴즈 문제 여러 개를 한 번에 생성 (서로 다른 단어)
+    
+    Request Body:
+        {
+            "count": 문제 수 (기본 10, 최대 100),
+            "type", "mode", "category", "focus_mode", "srs_mode": POST /api/quiz와 같음
+        }
+        
+    Returns:
+        JSON: {"success": true, "count": 문제 수, "questions": [문제, ...]}
+        후보 단어가 count보다 적으면 후보 수만큼만 반환합니다.
+    """
+    data = request.get_json() or {}
+    quiz_type = data.get('type', 'english_to_korean')
+    quiz_mode = data.get('mode', 'text')
+    focus_mode = data.get('focus_mode', False)
+    srs_mode = data.get('srs_mode', False)
+    
+    try:
+        count = int(data.get('count', QUIZ_BATCH_DEFAULT))
+    except (ValueError, TypeError):
+        return jsonify({"success": False, "message": "count는 정수여야 합니다."}), 400
+    if count < 1:
+        return jsonify({"success": False, "message": "count는 1 이상이어야 합니다."}), 400
+    count = min(count, QUIZ_BATCH_MAX)
+    
+    deck = g.deck
+    if not deck.vocabulary:
+        return jsonify({"success": False, "message": "퀴즈를 하려면 먼저 단어를 추가해주세요."}), 400
+    
+    with deck.data_lock:
+        quiz_category = data.get('category', None)
+        words = quiz_word_pool(deck, quiz_category)
+        if words is None:
+            return jsonify({"success": False, "message": f"'{quiz_category}' 카테고리에 단어가 없습니다."}), 400
+        
+        if srs_mode:
+            picked = [(word, srs_quiz_info(deck, word, due))
+                      for word, due in deck.scheduler.next_words(count, quiz_category)]
         else:
-            # 통계가 없는 단어 중에서 선택
-            word = random.choice(words)
-    else:
-        # 일반 모드: 랜덤 선택
-        word = random.choice(words)
+            picked = [(word, None) for word in select_quiz_words(deck, words, count, focus_mode, quiz_category)]
+        questions = [build_quiz(deck, word, quiz_type, quiz_mode, srs_info) for word, srs_info in picked]
+    
+    return jsonify({"success": True, "count": len(questions), "questions": questions})
+
+def quiz_word_pool(deck: Deck, category: Optional[str]) -> Optional[WordPool]:
+    """
+    퀴즈 후보 단어 풀
     
+    Args:
+        deck: 단어장
+        category: 카테고리 (없으면 전체)
+        
+    Returns:
+        Optional[WordPool]: 단어 풀 (카테고리에 단어가 없으면 None)
+    """
+    if category and category != "":
+        words = deck.category_index.pool(category)
+        return words if words else None
+    return deck.word_pool
+
+def build_quiz(deck: Deck, word: str, quiz_type: str, quiz_mode: str, srs_info: Optional[Dict] = None) -> Dict:
+    """
+    단어 하나로 문제 만들기
+    
+    Args:
+        deck: 단어장
+        word: 문제 단어
+        quiz_type: 'english_to_korean' or 'korean_to_english'
+        quiz_mode: 'text' (주관식) or 'multiple' (객관식)
+        srs_info: 간격 반복 복습 정보 (srs_mode인 경우)
+        
+    Returns:
+        Dict: 응답 데이터
+    """
     # 객관식 문제 생성
     if quiz_mode == 'multiple':
-        return get_multiple_choice_quiz(word, quiz_type)
+        quiz = get_multiple_choice_quiz(deck, word, quiz_type)
     
     # 주관식 문제 생성
-    word_data = vocabulary[word]
-    korean = word_data.get("korean", "")
-    
-    if quiz_type == 'english_to_korean':
-        return jsonify({
+    elif quiz_type == 'english_to_korean':
+        quiz = {
             "success": True,
             "type": "english_to_korean",
             "mode": "text",
             "word": word,
             "question": f"'{word}'의 한국어 뜻은?",
-            "correct_answer": korean
-        })
+            "correct_answer": deck.vocabulary[word].get("korean", "")
+        }
     else:  # korean_to_english
-        return jsonify({
+        quiz = {
             "success": True,
             "type": "korean_to_english",
             "mode": "text",
             "word": word,
-            "question": f"'{korean}'의 영어 단어는?",
+            "question": f"'{deck.vocabulary[word].get('korean', '')}'의 영어 단어는?",
             "correct_answer": word
-        })
+        }
+    
+    if srs_info is not None:
+        quiz["srs"] = srs_info
+    return quiz
+
+def select_quiz_word(deck: Deck, words: WordPool, focus_mode: bool, category: Optional[str] = None) -> str:
+    """
+    퀴즈 단어 선택
+    
+    Args:
+        deck: 단어장
+        words: 후보 단어 풀 (전체 또는 카테고리)
+        focus_mode: True면 정답률이 낮은 단어 우선
+        category: 카테고리 (focus_mode에서 카테고리별 순위 사용)
+        
+    Returns:
+        str: 선택된 단어
+    """
+    # 틀린 단어 집중 학습 모드
+    if focus_mode:
+        # 정답률 하위 50% 중에서 랜덤 선택 (미리 유지되는 정답률 순위 사용)
+        word = deck.weakness.pick_weak(category)
+        if word is not None:
+            return word
+        # 통계가 없는 단어 중에서 선택
+        return words.choice()
+    
+    # 일반 모드: 랜덤 선택
+    return words.choice()
 
-def get_multiple_choice_quiz(correct_word: str, quiz_type: str) -> Dict:
+def select_quiz_words(deck: Deck, words: WordPool, count: int, focus_mode: bool,
+                      category: Optional[str] = None) -> List[str]:
+    """
+    서로 다른 퀴즈 단어 여러 개 선택
+    
+    focus_mode에서 정답률 하위 50% 단어가 count보다 적으면 나머지는 무작위로 채웁니다.
+    
+    Args:
+        deck: 단어장
+        words: 후보 단어 풀 (전체 또는 카테고리)
+        count: 단어 수
+        focus_mode: True면 정답률이 낮은 단어 우선
+        category: 카테고리 (focus_mode에서 카테고리별 순위 사용)
+        
+    Returns:
+        List[str]: 선택된 단어 (후보가 적으면 count개보다 적을 수 있음)
+    """
+    selected = deck.weakness.sample_weak(count, category) if focus_mode else []
+    if len(selected) < count:
+        selected += words.sample(count - len(selected), exclude=selected)
+    return selected
+
+def srs_quiz_info(deck: Deck, word: str, due: float) -> Dict:
+    """
+    간격 반복 복습 문제에 붙는 복습 정보
+    
+    복습 큐에서 가장 이른 단어를 고르므로, 복습 시각이 된 단어가 없으면
+    is_due가 False인 단어를 미리 냅니다.
+    """
+    state = deck.srs_state.get(word)
+    return {
+        "due": due,
+        "is_due": due <= time.time(),
+        "is_new": state is None,
+        "interval": state.get("interval", 0.0) if state else 0.0,
+        "reps": state.get("reps", 0) if state else 0
+    }
+
+def get_multiple_choice_quiz(deck: Deck, correct_word: str, quiz_type: str) -> Dict:
     """
     4지선다 객관식 문제 생성
     
     Args:
+        deck: 단어장
         correct_word: 정답 단어
         quiz_type: 'english_to_korean' or 'korean_to_english'
         
     Returns:
-        JSON 응답 데이터
+        Dict: 응답 데이터
     """
-    words = list(vocabulary.keys())
-    
-    # 정답 1개 + 오답 3개 선택
-    wrong_words = [w for w in words if w != correct_word]
-    if len(wrong_words) < 3:
+    with deck.data_lock:
+        # 정답 1개 + 오답 3개 선택 (단어장 전체를 복사하지 않고 풀에서 뽑음)
+        wrong_choices = deck.word_pool.sample(3, exclude=(correct_word,))
         # 단어가 4개 미만이면 오답을 반복 사용
-        while len(wrong_words) < 3:
-            wrong_words.append(random.choice(words))
-    
-    wrong_choices = random.sample(wrong_words, min(3, len(wrong_words)))
-    
-    # 선택지 생성
-    correct_word_data = vocabulary[correct_word]
-    correct_korean = correct_word_data.get("korean", "")
+        while len(wrong_choices) < 3:
+            wrong_choices.append(deck.word_pool.choice())
+        
+        # 선택지 생성
+        correct_word_data = deck.vocabulary[correct_word]
+        correct_korean = correct_word_data.get("korean", "")
+        wrong_meanings = [deck.vocabulary[w].get("korean", "") for w in wrong_choices]
     
     if quiz_type == 'english_to_korean':
         # 영어 → 한글: 정답은 correct_word의 뜻, 오답은 다른 단어들의 뜻
         correct_answer = correct_korean
-        wrong_answers = [vocabulary[w].get("korean", "") for w in wrong_choices]
+        wrong_answers = wrong_meanings
         choices = [correct_answer] + wrong_answers
         random.shuffle(choices)  # 선택지 섞기
         
-        return jsonify({
+        return {
             "success": True,
             "type": "english_to_korean",
             "mode": "multiple",
@@ -454,7 +1051,7 @@ def get_multiple_choice_quiz(correct_word: str, quiz_type: str) -> Dict:
             "correct_answer": correct_answer,
             "choices": choices,
             "correct_index": choices.index(correct_answer)
-        })
+        }
     else:  # korean_to_english
         # 한글 → 영어: 정답은 correct_word, 오답은 다른 단어들
         correct_answer = correct_word
@@ -462,7 +1059,7 @@ def get_multiple_choice_quiz(correct_word: str, quiz_type: str) -> Dict:
         choices = [correct_answer] + wrong_answers
         random.shuffle(choices)  # 선택지 섞기
         
-        return jsonify({
+        return {
             "success": True,
             "type": "korean_to_english",
             "mode": "multiple",
@@ -471,9 +1068,9 @@ def get_multiple_choice_quiz(correct_word: str, quiz_type: str) -> Dict:
             "correct_answer": correct_answer,
             "choices": choices,
             "correct_index": choices.index(correct_answer)
-        })
+        }
 
-@app.route('/api/quiz/check', methods=['POST'])
+@deck_route('/quiz/check', methods=['POST'])
 def check_quiz():
     """
     퀴즈 정답 확인 API
@@ -484,127 +1081,590 @@ def check_quiz():
             "answer": "사용자 답" (주관식) or 선택한 인덱스 (객관식),
             "type": "english_to_korean" or "korean_to_english",
             "mode": "text" (주관식) or "multiple" (객관식),
-            "correct_index": 정답 인덱스 (객관식인 경우)
+            "correct_index": 정답 인덱스 (객관식인 경우),
+            "quality": 기억 정도 0-5 (선택, 없으면 정답 4 / 오답 1)
         }
         
     Returns:
-        JSON: 정답 여부 및 통계
+        JSON: 정답 여부, 통계 및 다음 복습 일정
     """
     try:
         data = request.get_json()
         if not data:
             return jsonify({"success": False, "message": "요청 데이터가 없습니다."}), 400
         
-        word = data.get('word', '').lower().strip()
-        user_answer = data.get('answer', '')
-        quiz_type = data.get('type', 'english_to_korean')
-        quiz_mode = data.get('mode', 'text')
-        correct_index = data.get('correct_index', None)
+        deck = g.deck
+        graded, error_message, status = grade_answer(deck, data)
+        if graded is None:
+            return jsonify({"success": False, "message": error_message}), status
         
-        if not word:
-            return jsonify({"success": False, "message": "단어를 입력해주세요."}), 400
+        # 통계 및 복습 일정 업데이트 (값은 새 값으로 교체하여 저널에 기록)
+        (stats, new_srs), = deck.record_quiz_results([graded])
         
-        if word not in vocabulary:
-            return jsonify({"success": False, "message": "단어를 찾을 수 없습니다."}), 404
+        return jsonify({
+            "success": True,
+            "is_correct": graded["is_correct"],
+            "correct_answer": graded["correct_answer"],
+            "match": graded["match"],
+            "stats": stats,
+            "srs": new_srs
+        })
         
-        # 객관식 정답 확인
-        if quiz_mode == 'multiple':
-            if correct_index is None:
-                return jsonify({"success": False, "message": "정답 인덱스가 없습니다."}), 400
-            
-            try:
-                user_index = int(user_answer)
-                is_correct = user_index == correct_index
-            except (ValueError, TypeError):
-                return jsonify({"success": False, "message": "잘못된 답안입니다."}), 400
-        else:
-            # 주관식 정답 확인
-            if not user_answer:
-                return jsonify({"success": False, "message": "답을 입력해주세요."}), 400
-            
-            word_data = vocabulary[word]
-            if quiz_type == 'english_to_korean':
-                correct_answer = word_data.get("korean", "")
-                is_correct = user_answer.strip() == correct_answer
-            else:  # korean_to_english
-                correct_answer = word
-                is_correct = user_answer.lower().strip() == correct_answer.lower()
-        
-        # 통계 초기화 (없는 경우)
-        if word not in quiz_stats:
-            quiz_stats[word] = [0, 0]
-        
-        # 통계 업데이트
-        if is_correct:
-            quiz_stats[word][0] += 1  # 맞춘 횟수
-            logger.debug(f"퀴즈 정답: {word}")
-        else:
-            quiz_stats[word][1] += 1  # 틀린 횟수
-            logger.debug(f"퀴즈 오답: {word}")
+    except Exception as e:
+        logger.error(f"퀴즈 정답 확인 오류: {e}")
+        return jsonify({"success": False, "message": "서버 오류가 발생했습니다."}), 500
+
+@deck_route('/quiz/check/batch', methods=['POST'])
+def check_quiz_batch():
+    """
+    퀴즈 정답 여러 개를 한 번에 확인 (통계는 한 번에 기록)
+    
+    Request Body:
+        {"answers": [POST /api/quiz/check 요청 본문, ...]} (최대 100개)
         
-        save_data()
+    Returns:
+        JSON: {"success": true, "results": [결과, ...], "correct": 정답 수, "wrong": 오답 수}
+        채점할 수 없는 답안은 해당 결과에만 "success": false와 "message"가 들어갑니다.
+    """
+    try:
+        data = request.get_json()
+        answers = data.get('answers') if isinstance(data, dict) else None
+        if not isinstance(answers, list) or not answers:
+            return jsonify({"success": False, "message": "answers 목록이 없습니다."}), 400
+        if len(answers) > QUIZ_BATCH_MAX:
+            return jsonify({"success": False, "message": f"답안은 한 번에 최대 {QUIZ_BATCH_MAX}개까지 확인할 수 있습니다."}), 400
         
-        # 정답 정보 반환
-        word_data = vocabulary[word]
-        if quiz_type == 'english_to_korean':
-            correct_answer = word_data.get("korean", "")
-        else:
-            correct_answer = word
+        deck = g.deck
+        results: List[Dict] = []
+        graded_list = []
+        for item in answers:
+            graded, error_message, _ = grade_answer(deck, item if isinstance(item, dict) else {})
+            if graded is None:
+                results.append({"success": False, "message": error_message})
+            else:
+                results.append({"success": True, "word": graded["word"]})
+                graded_list.append((len(results) - 1, graded))
+        
+        # 모든 통계/복습 일정 변경을 저널에 한 번에 기록
+        outcomes = deck.record_quiz_results([graded for _, graded in graded_list])
+        for (index, graded), (stats, new_srs) in zip(graded_list, outcomes):
+            results[index].update({
+                "is_correct": graded["is_correct"],
+                "correct_answer": graded["correct_answer"],
+                "match": graded["match"],
+                "stats": stats,
+                "srs": new_srs
+            })
         
+        correct_count = sum(1 for _, graded in graded_list if graded["is_correct"])
         return jsonify({
             "success": True,
-            "is_correct": is_correct,
-            "correct_answer": correct_answer,
-            "stats": quiz_stats[word]
+            "results": results,
+            "correct": correct_count,
+            "wrong": len(graded_list) - correct_count
         })
         
     except Exception as e:
-        logger.error(f"퀴즈 정답 확인 오류: {e}")
+        logger.error(f"퀴즈 일괄 정답 확인 오류: {e}")
         return jsonify({"success": False, "message": "서버 오류가 발생했습니다."}), 500
 
+def grade_answer(deck: Deck, data: Dict) -> Tuple[Optional[Dict], Optional[str], int]:
+    """
+    답안 하나 채점 (저장은 하지 않음)
+    
+    Args:
+        deck: 단어장
+        data: POST /api/quiz/check 요청 본문
+        
+    Returns:
+        Tuple[Optional[Dict], Optional[str], int]:
+            ({word, is_correct, correct_answer, quality, mode, match}, None, 200) 또는 (None, 오류 메시지, 상태 코드)
+            match는 주관식에서 "exact"(띄어쓰기/문장 부호를 빼면 같음), "typo"(오타 허용), 틀렸으면 None
+    """
+    word = str(data.get('word', '')).lower().strip()
+    user_answer = data.get('answer', '')
+    quiz_type = data.get('type', 'english_to_korean')
+    quiz_mode = data.get('mode', 'text')
+    correct_index = data.get('correct_index', None)
+    
+    if not word:
+        return None, "단어를 입력해주세요.", 400
+    
+    word_data = deck.vocabulary.get(word)
+    if word_data is None:
+        return None, "단어를 찾을 수 없습니다.", 404
+    
+    if quiz_type == 'english_to_korean':
+        correct_answer = word_data.get("korean", "")
+    else:  # korean_to_english
+        correct_answer = word
+    
+    # 객관식 정답 확인
+    if quiz_mode == 'multiple':
+        if correct_index is None:
+            return None, "정답 인덱스가 없습니다.", 400
+        
+        try:
+            user_index = int(user_answer)
+            is_correct = user_index == correct_index
+            match = "exact" if is_correct else None
+        except (ValueError, TypeError):
+            return None, "잘못된 답안입니다.", 400
+    else:
+        # 주관식 정답 확인
+        if not user_answer or not isinstance(user_answer, str):
+            return None, "답을 입력해주세요.", 400
+        
+        # 뜻 여러 개, 띄어쓰기/문장 부호, 오타 허용 (vocab_grading.py)
+        direction = 'english_to_korean' if quiz_type == 'english_to_korean' else 'korean_to_english'
+        answer_key = deck.answer_keys.get(word, direction, correct_answer)
+        match = grade_text_answer(answer_key, user_answer)
+        is_correct = match is not None
+    
+    quality = data.get('quality')
+    if quality is None:
+        quality = quality_from_result(is_correct, typo=match == "typo")
+    elif isinstance(quality, bool) or not isinstance(quality, int) or not 0 <= quality <= 5:
+        return None, "quality는 0-5 사이의 정수여야 합니다.", 400
+    
+    return {
+        "word": word,
+        "is_correct": is_correct,
+        "correct_answer": correct_answer,
+        "quality": quality,
+        "mode": "multiple" if quiz_mode == 'multiple' else "text",
+        "match": match
+    }, None, 200
+
+def conditional_response(tag: str, build: Callable[[], Response]) -> Response:
+    """
+    ETag 조건부 응답
+    
+    If-None-Match가 ETag와 같으면 본문을 만들지 않고 304를, 아니면 build()의 응답을 돌려줍니다.
+    Cache-Control: no-cache이므로 브라우저는 매번 확인하되 바뀌지 않았으면 캐시를 씁니다.
+    
+    Args:
+        tag: ETag 값 (따옴표 없이)
+        build: 응답을 만드는 함수
+    """
+    # 압축한 응답의 ETag(태그-gzip 등)도 같은 내용으로 인정
+    matched = next((variant for variant in etag_variants(tag) if request.if_none_match.contains(variant)), None)
+    if matched is not None:
+        CACHE_LOOKUPS.labels("etag", "hit").inc()
+        response = Response(status=304)
+        response.set_etag(matched)
+        response.vary.add('Accept-Encoding')
+    else:
+        CACHE_LOOKUPS.labels("etag", "miss").inc()
+        response = build()
+        response.set_etag(tag)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+def stats_etag(deck: Deck) -> str:
+    """퀴즈 통계 ETag (내용 해시이므로 같은 데이터를 가진 워커끼리 같음)"""
+    return f"stats-{deck.stats_aggregate.checksum:016x}"
+
+def words_etag(deck: Deck) -> str:
+    """단어장 ETag (단어 목록, 검색, 카테고리 응답 공통)"""
+    return f"words-{deck.vocab_checksum.value:016x}"
+
+def accuracy_percent(correct: int, total: int) -> float:
+    return round(correct / total * 100, 1) if total > 0 else 0
+
+def stats_item(deck: Deck, word: str) -> Dict:
+    """API 응답용 단어별 통계"""
+    correct, wrong, korean, category = deck.stats_aggregate.get(word)
+    total = correct + wrong
+    return {
+        "word": word,
+        "korean": korean,
+        "category": category,
+        "correct": correct,
+        "wrong": wrong,
+        "total": total,
+        "accuracy": accuracy_percent(correct, total)
+    }
+
+def parse_stats_page(args) -> Tuple[int, Optional[int], bool]:
+    """
+    /api/stats 페이지 매개변수 해석
+    
+    Returns:
+        Tuple[int, Optional[int], bool]: (offset, limit, 정답률 낮은 순 여부)
+    
+    Raises:
+        ValueError: 숫자가 아닌 값
+    """
+    if 'bottom' in args:
+        return 0, min(max(int(args['bottom']), 0), STATS_MAX_LIMIT), True
+    if 'top' in args:
+        return 0, min(max(int(args['top']), 0), STATS_MAX_LIMIT), False
+    if 'limit' in args or 'offset' in args:
+        limit = min(max(int(args.get('limit') or STATS_MAX_LIMIT), 1), STATS_MAX_LIMIT)
+        return max(int(args.get('offset') or 0), 0), limit, False
+    return 0, None, False
+
 # 통계 API
-@app.route('/api/stats', methods=['GET'])
+@deck_route('/stats', methods=['GET'])
 def get_stats():
-    """퀴즈 통계 가져오기"""
-    stats_list = []
+    """
+    퀴즈 통계 가져오기 (정답률 높은 순, 같으면 영어 단어 사전 순)
     
-    for word, stats in quiz_stats.items():
-        if word not in vocabulary:
-            continue  # 단어가 삭제된 경우 스킵
-        
-        correct, wrong = stats
-        total = correct + wrong
-        accuracy = (correct / total * 100) if total > 0 else 0
+    미리 정렬해 둔 집계(stats_aggregate)에서 필요한 만큼만 꺼내며,
+    통계가 바뀌지 않았으면(If-None-Match) 304를 돌려줍니다.
+    
+    Query Parameters:
+        category: 카테고리 필터 (선택)
+        top: 정답률 상위 K개
+        bottom: 정답률 하위 K개 (낮은 순)
+        limit, offset: 페이지
         
-        word_data = vocabulary[word]
-        stats_list.append({
-            "word": word,
-            "korean": word_data.get("korean", "?"),
-            "category": word_data.get("category", ""),
-            "correct": correct,
-            "wrong": wrong,
-            "total": total,
-            "accuracy": round(accuracy, 1)
+    Returns:
+        JSON: 통계 배열 (매개변수가 없을 때),
+              또는 {"stats": [...], "total": int, "offset": int, "limit": int}
+    """
+    category = request.args.get('category') or None
+    try:
+        offset, limit, ascending = parse_stats_page(request.args)
+    except ValueError:
+        return jsonify({"success": False, "message": "top, bottom, limit, offset은 숫자여야 합니다."}), 400
+    
+    deck = g.deck
+    
+    def build() -> Response:
+        stats_list = [
+            stats_item(deck, word)
+            for word in deck.stats_aggregate.page(offset, limit, category, ascending)
+        ]
+        if limit is None:
+            return jsonify(stats_list)
+        return jsonify({
+            "stats": stats_list,
+            "total": deck.stats_aggregate.count(category),
+            "offset": offset,
+            "limit": limit
         })
     
-    # 정답률 순으로 정렬
-    stats_list.sort(key=lambda x: x['accuracy'], reverse=True)
+    with deck.data_lock:
+        return conditional_response(stats_etag(deck), build)
+
+@deck_route('/stats/summary', methods=['GET'])
+def get_stats_summary():
+    """
+    퀴즈 통계 합계 (전체 + 카테고리별, 단어별 통계를 훑지 않음)
+    
+    Returns:
+        JSON: {"summary": {"words", "correct", "wrong", "total", "accuracy"},
+               "categories": {카테고리: 같은 형식}}
+    """
+    def with_accuracy(summary: Dict) -> Dict:
+        summary["accuracy"] = accuracy_percent(summary["correct"], summary["total"])
+        return summary
+    
+    deck = g.deck
     
-    return jsonify(stats_list)
+    def build() -> Response:
+        return jsonify({
+            "summary": with_accuracy(deck.stats_aggregate.summary()),
+            "categories": {
+                category: with_accuracy(summary)
+                for category, summary in deck.stats_aggregate.categories().items()
+            }
+        })
+    
+    with deck.data_lock:
+        return conditional_response(stats_etag(deck), build)
 
 # 카테고리 목록 API
-@app.route('/api/categories', methods=['GET'])
+@deck_route('/categories', methods=['GET'])
 def get_categories():
-    """모든 카테고리 목록 가져오기"""
-    categories = set()
-    for word_data in vocabulary.values():
-        category = word_data.get("category", "").strip()
-        if category:
-            categories.add(category)
+    """
+    모든 카테고리 목록 가져오기 (카테고리 인덱스 사용)
+    
+    Query Parameters:
+        counts: '1'이면 [{"name": 카테고리, "count": 단어 수}] 형식으로 반환
+    """
+    deck = g.deck
+    
+    def build() -> Response:
+        categories_list = deck.category_index.categories()
+        if request.args.get('counts') == '1':
+            counts = deck.category_index.counts()
+            return jsonify([
+                {"name": category, "count": counts.get(category, 0)}
+                for category in categories_list
+            ])
+        return jsonify(categories_list)
+    
+    with deck.data_lock:
+        return conditional_response(words_etag(deck), build)
+
+def parse_event_version(value: Optional[str]) -> Optional[int]:
+    """Last-Event-ID / since 값 해석 (없거나 숫자가 아니면 None)"""
+    try:
+        return int(value) if value else None
+    except ValueError:
+        return None
+
+def stream_events(deck: Deck, version: Optional[int]):
+    """
+    변경 이벤트 SSE 제너레이터
+    
+    version 이후의 이벤트를 먼저 보내고(다시 연결), 'ready' 뒤에는 새 이벤트를 기다려 보냅니다.
+    다른 워커의 변경은 요청이 없어도 EVENTS_POLL_INTERVAL마다 저장소 버전을 확인해 가져옵니다.
+    EVENTS_STREAM_SECONDS가 지나면 끝내고, 브라우저가 Last-Event-ID로 다시 연결합니다.
+    """
+    try:
+        yield f"retry: {EVENTS_RETRY_MS}\n\n"
+        if version is not None:
+            backlog = deck.change_feed.since(version)
+            if backlog is None:
+                yield format_sse("reset", {"version": deck.change_feed.version})
+                version = None
+            else:
+                for event in backlog:
+                    yield format_sse("change", event, event["v"])
+                    version = event["v"]
+        if version is None:
+            version = deck.change_feed.version
+        yield format_sse("ready", {"version": version}, version)
+        
+        deadline = time.monotonic() + EVENTS_STREAM_SECONDS
+        last_sent = time.monotonic()
+        while time.monotonic() < deadline:
+            deck.refresh_if_changed()
+            events = deck.change_feed.wait_since(version, EVENTS_POLL_INTERVAL)
+            if events is None:
+                # 워커가 전체를 다시 불러와 이어 보낼 수 없음
+                version = deck.change_feed.version
+                yield format_sse("reset", {"version": version}, version)
+                last_sent = time.monotonic()
+                continue
+            for event in events:
+                yield format_sse("change", event, event["v"])
+                version = event["v"]
+            if events:
+                last_sent = time.monotonic()
+            elif time.monotonic() - last_sent >= EVENTS_HEARTBEAT_SECONDS:
+                yield ": ping\n\n"
+                last_sent = time.monotonic()
+    finally:
+        deck.change_feed.close_stream()
+
+# 변경 이벤트 스트림 API (Server-Sent Events)
+@deck_route('/events', methods=['GET'])
+def get_events():
+    """
+    단어 추가/수정/삭제, 통계 변경 이벤트 스트림
+    
+    Headers / Query Parameters:
+        Last-Event-ID 또는 since: 마지막으로 받은 이벤트 번호 (그 이후부터 보냄)
+        
+    Returns:
+        text/event-stream: 'change' 이벤트(vocab_events.py 형식), 'ready', 'reset'(전체를 다시 불러올 것)
+        동시 스트림이 EVENTS_MAX_STREAMS를 넘으면 503 (클라이언트는 /api/changes로 확인)
+    """
+    deck = g.deck
+    version = parse_event_version(request.headers.get('Last-Event-ID') or request.args.get('since'))
+    if not deck.change_feed.open_stream():
+        response = jsonify({"success": False, "message": "이벤트 스트림이 너무 많습니다."})
+        response.status_code = 503
+        response.headers['Retry-After'] = str(EVENTS_RETRY_MS // 1000)
+        return response
     
-    # 빈 카테고리도 포함 (카테고리 없음)
-    categories_list = sorted(list(categories))
-    return jsonify(categories_list)
+    response = Response(stream_events(deck, version), mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'  # Nginx 버퍼링 끄기
+    return response
+
+# 변경 사항 조회 API (다시 연결 / 스트림을 쓸 수 없을 때)
+@deck_route('/changes', methods=['GET'])
+def get_changes():
+    """
+    since 번호 이후의 변경 이벤트
+    
+    Query Parameters:
+        since: 마지막으로 받은 이벤트 번호 (필수)
+        
+    Returns:
+        JSON: {"version": 마지막 이벤트 번호, "events": [...]},
+              너무 오래된 번호면 {"version", "events": [], "reset": true} (전체를 다시 불러올 것)
+    """
+    version = parse_event_version(request.args.get('since'))
+    if version is None:
+        return jsonify({"success": False, "message": "since는 숫자여야 합니다."}), 400
+    
+    change_feed = g.deck.change_feed
+    events = change_feed.since(version)
+    if events is None:
+        return jsonify({"version": change_feed.version, "events": [], "reset": True})
+    return jsonify({"version": events[-1]["v"] if events else version, "events": events})
+
+def is_admin_request() -> bool:
+    """X-Admin-Token 헤더가 ADMIN_TOKEN과 같은지 (토큰이 없으면 항상 False)"""
+    token = request.headers.get('X-Admin-Token', '')
+    return bool(ADMIN_TOKEN) and hmac.compare_digest(token.encode(), ADMIN_TOKEN.encode())
+
+def admin_error() -> Optional[Tuple[Response, int]]:
+    """관리자 API 권한 확인 (문제가 없으면 None)"""
+    if not ADMIN_TOKEN:
+        return jsonify({"success": False, "message": "관리자 기능이 꺼져 있습니다 (ADMIN_TOKEN 미설정)."}), 404
+    if not is_admin_request():
+        return jsonify({"success": False, "message": "관리자 토큰이 올바르지 않습니다."}), 403
+    return None
+
+# 프로파일링 API (관리자)
+@app.route('/api/admin/profile', methods=['POST'])
+def start_profile():
+    """
+    샘플링 프로파일 구간 시작
+    
+    Request Body:
+        {
+            "seconds": 기록할 시간 (기본 30, 최대 300),
+            "format": "collapsed" (기본) or "pstats",
+            "include_idle": 대기 중인 스레드도 셀지 (기본 false),
+            "all_workers": 다른 워커도 같은 구간을 기록할지 (기본 true, 요청 처리 전에 1초 간격으로 확인)
+        }
+        
+    Returns:
+        JSON: 이 워커의 프로파일러 상태 (409: 이미 기록 중)
+    """
+    error = admin_error()
+    if error is not None:
+        return error
+    data = request.get_json(silent=True) or {}
+    fmt = data.get('format', 'collapsed')
+    if fmt not in PROFILE_FORMATS:
+        return jsonify({"success": False, "message": f"format은 {', '.join(PROFILE_FORMATS)} 중 하나여야 합니다."}), 400
+    try:
+        seconds = float(data.get('seconds', PROFILE_DEFAULT_SECONDS))
+    except (TypeError, ValueError):
+        return jsonify({"success": False, "message": "seconds는 숫자여야 합니다."}), 400
+    include_idle = bool(data.get('include_idle', False))
+    
+    if not profiler.start(seconds, fmt, include_idle):
+        return jsonify({"success": False, "message": "이미 프로파일을 기록 중입니다.", "profiler": profiler.status()}), 409
+    if data.get('all_workers', True):
+        try:
+            profile_trigger.publish(f"{os.getpid()}-{profiler.started_at}", profiler.until, fmt, include_idle)
+        except OSError as e:
+            logger.error(f"프로파일 요청 파일 기록 실패: {e}")
+    logger.info(f"프로파일 기록 시작: {profiler.until - profiler.started_at:.0f}초, {fmt}")
+    return jsonify({"success": True, "pid": os.getpid(), "profiler": profiler.status()})
+
+@app.route('/api/admin/profile', methods=['GET'])
+def get_profiles():
+    """이 워커의 프로파일러 상태와 저장된 결과 파일 목록 (모든 워커 공용 폴더)"""
+    error = admin_error()
+    if error is not None:
+        return error
+    return jsonify({"success": True, "pid": os.getpid(), "profiler": profiler.status(),
+                    "files": profiler.list_files()})
+
+@app.route('/api/admin/profile/<name>', methods=['GET'])
+def download_profile(name: str):
+    """결과 파일 내려받기"""
+    error = admin_error()
+    if error is not None:
+        return error
+    return send_from_directory(PROFILE_DIR, name, as_attachment=True)
+
+# 단어장 목록 API
+@app.route('/api/decks', methods=['GET'])
+def get_decks():
+    """
+    이름 있는 단어장 목록 (DECKS_DIR의 하위 폴더)
+    
+    Returns:
+        JSON: {"decks": [{"id", "loaded"}], "cache": 이 워커의 단어장 캐시 상태}
+    """
+    return jsonify({
+        "decks": [{"id": deck_id, "loaded": decks.is_loaded(deck_id)} for deck_id in list_deck_ids(DECKS_DIR)],
+        "cache": decks.status()
+    })
+
+@app.route('/api/decks', methods=['POST'])
+def create_deck():
+    """
+    단어장 만들기 (사용자 또는 주제마다 하나)
+    
+    Request Body:
+        {"id": "단어장 ID"} (소문자, 숫자, -, _ 64자까지)
+        
+    Returns:
+        JSON: {"success": true, "id", "api": 이 단어장의 API 경로} (409: 이미 있음)
+    """
+    data = request.get_json(silent=True) or {}
+    deck_id = str(data.get('id', '')).strip().lower()
+    if deck_id == DEFAULT_DECK or not is_valid_deck_id(deck_id):
+        return jsonify({"success": False, "message": "단어장 ID는 소문자, 숫자, -, _로 된 64자 이하여야 합니다."}), 400
+    try:
+        os.makedirs(deck_directory(DECKS_DIR, deck_id))
+    except FileExistsError:
+        return jsonify({"success": False, "message": f"'{deck_id}' 단어장이 이미 존재합니다."}), 409
+    except OSError as e:
+        logger.error(f"단어장 폴더 생성 실패: {e}")
+        return jsonify({"success": False, "message": "단어장을 만들 수 없습니다."}), 500
+    logger.info(f"단어장 생성: {deck_id}")
+    return jsonify({"success": True, "id": deck_id, "api": f"/api/decks/{deck_id}"})
+
+@app.route('/api/decks/<deck_id>', methods=['GET'])
+def get_deck():
+    """단어장 하나의 상태 (불러오지 않았으면 불러옴)"""
+    deck, error = open_deck_for_request(g.deck_id)
+    if error is not None:
+        return error
+    return jsonify({"success": True, "id": g.deck_id, **deck_status(deck)})
+
+def deck_status(deck: Deck) -> Dict:
+    """단어장의 데이터 캐시 상태 (불러오기 시간, 변경 반영 횟수 등)"""
+    return {
+        "snapshot_format": deck.storage.snapshot_format(),
+        "word_count": len(deck.vocabulary),
+        "stats_count": len(deck.quiz_stats),
+        "memory_bytes": deck.memory_bytes(),
+        "cache": deck.cache_stats,
+        "write_behind": deck.write_behind_status(),
+        "events": deck.change_feed.status()
+    }
+
+# 상태 확인 API
+@app.route('/api/status', methods=['GET'])
+def get_status():
+    """워커와 기본 단어장의 데이터 캐시 상태 (불러오기 시간, 변경 반영 횟수 등)"""
+    return jsonify(dict(
+        deck_status(decks.default),
+        pid=os.getpid(),
+        storage=STORAGE_BACKEND,
+        server_mode="async" if ASYNC_MODE else "sync",
+        decks=decks.status(),
+        metrics={"enabled": metrics_enabled(), "multiprocess": is_multiprocess()},
+        profiler=profiler.status()
+    ))
+
+@app.route('/metrics', methods=['GET'])
+def get_metrics():
+    """
+    Prometheus 지표 (gunicorn 워커 전체 합계)
+    
+    Returns:
+        text/plain: Prometheus 텍스트 형식, prometheus_client가 없으면 503
+    """
+    if not metrics_enabled():
+        return jsonify({"success": False, "message": "prometheus_client가 설치되지 않았습니다."}), 503
+    # 이 워커가 메모리에 둔 모든 단어장의 합계
+    sizes: Dict[str, int] = {}
+    loaded = decks.loaded()
+    for deck in loaded:
+        for name, size in deck.index_sizes().items():
+            sizes[name] = sizes.get(name, 0) + size
+    sizes["decks_loaded"] = len(loaded)
+    set_index_sizes(sizes)
+    decks.status()  # 단어장 캐시 크기 지표 갱신
+    body, content_type = render_metrics()
+    return Response(body, content_type=content_type, headers={'Cache-Control': 'no-store'})
 
 def start_server(port: int = None) -> None:
     """
@@ -627,18 +1687,18 @@ def start_server(port: int = None) -> None:
     logger.info("="*60)
     logger.info("영어 단어장 웹 애플리케이션 시작!")
     logger.info("="*60)
-    logger.info(f"단어 개수: {len(vocabulary)}개")
-    logger.info(f"통계 기록: {len(quiz_stats)}개")
+    logger.info(f"단어 개수: {len(decks.default.vocabulary)}개")
+    logger.info(f"통계 기록: {len(decks.default.quiz_stats)}개")
     logger.info(f"모드: {'프로덕션' if is_production else '개발'}")
     logger.info(f"접속 주소: http://{host}:{port}")
     logger.info("="*60)
     
     app.run(debug=debug_mode, host=host, port=port, use_reloader=False)
 
+# import 시점에 데이터 로드 (gunicorn 워커 및 직접 실행 모두)
+init_data()
+
 if __name__ == '__main__':
-    # 프로그램 시작 시 데이터 로드
-    load_data()
-    
     try:
         # Railway 등 프로덕션 환경에서는 PORT 환경 변수 사용
         # None을 전달하면 start_server 함수 내에서 환경 변수 확인